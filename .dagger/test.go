@@ -32,6 +32,7 @@ func (m *RaMcp) Test(
 				"uv.lock",
 				"packages/",
 				"src/",
+				"benchmarks/",
 				"README.md",
 				"LICENSE",
 			},
@@ -40,6 +41,8 @@ func (m *RaMcp) Test(
 
 	output, err := container.
 		WithExec([]string{"uv", "run", "pytest", "--tb=short", "-q"}).
+		// Guard the server cold start: fails if a heavy dependency is imported eagerly again.
+		WithExec([]string{"uv", "run", "python", "-m", "benchmarks.import_time", "check", "--runs", "1"}).
 		Stdout(ctx)
 
 	if err != nil {
@@ -0,0 +1,8 @@
+"""Offline LanceDB search benchmark over synthetic, production-scale dataset tables.
+
+Usage:
+    uv run python -m benchmarks.dataset_search run [--scale 1.0] [--output results.json]
+    uv run python -m benchmarks.dataset_search compare BASE.json NEW.json
+
+See docs/development/benchmarks.md.
+"""
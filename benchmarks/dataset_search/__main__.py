@@ -0,0 +1,100 @@
+"""Command line for the dataset search benchmark: ``run`` and ``compare``."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+from .runner import TABLE_NAMES, compare, rows_at_scale, run_benchmark
+
+
+DEFAULT_DATA_DIR = Path("data/bench")
+DEFAULT_RESULTS_DIR = Path("bench-results")
+
+
+def _run(args: argparse.Namespace) -> int:
+    tables = args.tables or TABLE_NAMES
+    print("Rows: " + ", ".join(f"{t}={rows_at_scale(t, args.scale):,}" for t in tables))
+    result = run_benchmark(
+        args.data_dir,
+        scale=args.scale,
+        seed=args.seed,
+        repeat=args.repeat,
+        warmup=args.warmup,
+        display_text=not args.no_display_text,
+        tables=tables,
+        label=args.label,
+        rebuild=args.rebuild,
+    )
+
+    output = args.output
+    if output is None:
+        commit = (result["git"]["commit"] or "nogit")[:12]
+        output = DEFAULT_RESULTS_DIR / f"{result['created'].replace(':', '')}-{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2, ensure_ascii=False))
+
+    print(f"\n{'query':<32} {'hits':>7} {'cold':>9} {'p50':>9} {'p99':>9} {'format':>9}  (ms)")
+    for name, q in result["queries"].items():
+        print(f"{name:<32} {q['total_hits']:>7} {q['cold_ms']:>9.2f} {q['search_ms']['p50']:>9.2f} {q['search_ms']['p99']:>9.2f} {q['format_ms']['p50']:>9.2f}")
+    print(f"\nsearch p50 geomean: {result['summary']['search_p50_geomean_ms']} ms")
+    print(f"Results written to {output}")
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    base = json.loads(args.base.read_text())
+    new = json.loads(args.new.read_text())
+    deltas, warnings = compare(base, new, metrics=args.metrics)
+
+    print(f"{'query':<32} {'metric':>6} {'base':>9} {'new':>9} {'change':>8}")
+    regressions = 0
+    for delta in deltas:
+        flag = ""
+        if delta.regressed(args.threshold, args.floor_ms):
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"{delta.name:<32} {delta.metric:>6} {delta.base_ms:>9.2f} {delta.new_ms:>9.2f} {delta.ratio - 1:>+8.1%}{flag}")
+    for warning in warnings:
+        print(f"warning: {warning}")
+    print(f"\n{regressions} regression(s) beyond {args.threshold:.0%} and {args.floor_ms} ms")
+    return 1 if regressions else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.dataset_search", description="Offline LanceDB search benchmark on synthetic dataset tables")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="Build (or reuse) the synthetic tables and time the query mix")
+    run.add_argument("--scale", type=float, default=1.0, help="Fraction of production row counts (default: 1.0; e.g. 0.01 for a quick run)")
+    run.add_argument("--seed", type=int, default=20_240_611, help="Data generator seed")
+    run.add_argument("--repeat", type=int, default=20, help="Timed calls per query (default: 20)")
+    run.add_argument("--warmup", type=int, default=3, help="Discarded calls per query before timing (default: 3)")
+    run.add_argument("--tables", nargs="+", choices=TABLE_NAMES, default=None, help="Only build and time these tables")
+    run.add_argument("--no-display-text", action="store_true", help="Ingest without precomputed display text (formatters render live)")
+    run.add_argument("--data-dir", type=Path, default=DEFAULT_DATA_DIR, help=f"LanceDB directory for the synthetic tables (default: {DEFAULT_DATA_DIR})")
+    run.add_argument("--rebuild", action="store_true", help="Regenerate tables even if the cached ones match")
+    run.add_argument("--label", default=None, help="Free-form label stored in the results (e.g. 'lancedb 0.35 bump')")
+    run.add_argument("--output", type=Path, default=None, help=f"Results JSON path (default: {DEFAULT_RESULTS_DIR}/<time>-<commit>.json)")
+    run.set_defaults(func=_run)
+
+    cmp = sub.add_parser("compare", help="Compare two result files; exit 1 on regressions")
+    cmp.add_argument("base", type=Path, help="Baseline results JSON")
+    cmp.add_argument("new", type=Path, help="Candidate results JSON")
+    cmp.add_argument("--threshold", type=float, default=0.15, help="Relative slowdown that counts as a regression (default: 0.15)")
+    cmp.add_argument("--floor-ms", type=float, default=0.5, help="Ignore slowdowns smaller than this many ms (default: 0.5)")
+    cmp.add_argument(
+        "--metrics", nargs="+", default=["p50", "p99"], choices=["min", "mean", "p50", "p90", "p99", "max"], help="Search-time statistics to compare"
+    )
+    cmp.set_defaults(func=_compare)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""The fixed query mix.
+
+Names are stable identifiers: results are compared across commits by name, so a
+query is never edited in place — add a new one (and retire the old) instead.
+Every term and filter value comes from the generator's vocabularies, so each
+query hits the same rows on every machine for a given scale and seed.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(frozen=True)
+class BenchQuery:
+    """One benchmark search: a table's search method called with these arguments."""
+
+    name: str
+    table: str
+    keyword: str
+    filters: dict[str, Any] = field(default_factory=dict)
+    offset: int = 0
+    limit: int = 25
+
+    def params(self) -> dict[str, Any]:
+        """JSON-friendly description recorded next to the timings."""
+        return {"keyword": self.keyword, "filters": self.filters, "offset": self.offset, "limit": self.limit}
+
+
+QUERIES: list[BenchQuery] = [
+    # --- DDS Födelse (largest table) ---
+    BenchQuery("fodelse.common_surname", "fodelse", "Andersson"),
+    BenchQuery("fodelse.name_pair", "fodelse", "Johan Lindberg"),
+    BenchQuery("fodelse.tail_parish", "fodelse", "Glanshammar"),
+    BenchQuery("fodelse.no_match", "fodelse", "Xylofon"),
+    BenchQuery("fodelse.filter_parish", "fodelse", "Andersson", {"forsamling": "Klara"}),
+    BenchQuery("fodelse.filter_county_sex", "fodelse", "Johansson", {"lan": "Kopparbergs", "kon": "K"}),
+    BenchQuery("fodelse.filter_decade", "fodelse", "Andersson", {"datum_from": "1850-01-01", "datum_till": "1859-12-31"}),
+    BenchQuery("fodelse.deep_offset", "fodelse", "Andersson", offset=5_000),
+    BenchQuery("fodelse.last_page", "fodelse", "Andersson", offset=9_975),
+    # --- DDS Döda ---
+    BenchQuery("doda.common_cause", "doda", "Lungsot"),
+    BenchQuery("doda.occupation_surname", "doda", "Bonde Persson"),
+    BenchQuery("doda.filter_county_decade", "doda", "Lungsot", {"lan": "Stockholms", "datum_from": "1870-01-01", "datum_till": "1879-12-31"}),
+    BenchQuery("doda.filter_cause", "doda", "Johansson", {"dodsorsak": "koppor"}),
+    BenchQuery("doda.deep_offset", "doda", "Ålderdom", offset=5_000),
+    # --- DDS Vigsel ---
+    BenchQuery("vigsel.common_surname", "vigsel", "Johansson"),
+    BenchQuery("vigsel.filter_parish", "vigsel", "Eriksson", {"forsamling": "Mora"}),
+    BenchQuery("vigsel.deep_offset", "vigsel", "Johansson", offset=5_000),
+    # --- Wincars ---
+    BenchQuery("wincars.common_make", "wincars", "Volvo"),
+    BenchQuery("wincars.make_town", "wincars", "Saab Sundsvall"),
+    BenchQuery("wincars.filter_type", "wincars", "Volvo", {"typ": "LB"}),
+    BenchQuery("wincars.filter_domicile", "wincars", "Saab", {"hemvist": "Umeå"}),
+    BenchQuery("wincars.filter_make", "wincars", "Sundsvall", {"fabrikat": "scania"}),
+    BenchQuery("wincars.deep_offset", "wincars", "Volvo", offset=5_000),
+    # --- Sjömanshus Liggare ---
+    BenchQuery("liggare.common_rank", "liggare", "Matros"),
+    BenchQuery("liggare.filter_destination", "liggare", "Matros", {"destination": "London"}),
+    BenchQuery("liggare.filter_rank", "liggare", "Göteborg", {"befattning": "Styrman"}),
+    BenchQuery("liggare.filter_ship", "liggare", "Andersson", {"fartyg": "Hoppet"}),
+    BenchQuery("liggare.deep_offset", "liggare", "Matros", offset=5_000),
+    # --- Sjömanshus Matrikel ---
+    BenchQuery("matrikel.common_surname", "matrikel", "Pettersson"),
+    BenchQuery("matrikel.filter_house", "matrikel", "Andersson", {"sjoemanshus": "Karlskrona"}),
+    BenchQuery("matrikel.deep_offset", "matrikel", "Andersson", offset=5_000),
+]
@@ -0,0 +1,328 @@
+"""Build the synthetic tables, time the query mix, and compare result files."""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import lancedb
+
+from ra_mcp_dataset_lib import RenderRecord, SearchResult
+from ra_mcp_dds_lib.ingest import ingest_doda, ingest_fodelse, ingest_vigsel
+from ra_mcp_dds_lib.search_operations import DDSSearch
+from ra_mcp_dds_mcp import formatter as dds_formatter
+from ra_mcp_sjomanshus_lib.ingest import ingest_liggare, ingest_matrikel
+from ra_mcp_sjomanshus_lib.search_operations import SjomanshusSearch
+from ra_mcp_sjomanshus_mcp import formatter as sjomanshus_formatter
+from ra_mcp_wincars_lib.ingest import ingest_wincars
+from ra_mcp_wincars_lib.search_operations import WincarsSearch
+from ra_mcp_wincars_mcp import formatter as wincars_formatter
+
+from ..stats import summarize
+from .queries import QUERIES, BenchQuery
+from .synth import GENERATOR_VERSION, PRODUCTION_ROWS, WRITERS
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+
+logger = logging.getLogger("ra_mcp.bench")
+
+RESULT_SCHEMA = 1
+MANIFEST = "bench_manifest.json"
+
+
+@dataclass(frozen=True)
+class _TableSpec:
+    """How one benchmark table is ingested, searched and formatted."""
+
+    ingest: Callable[..., Any]
+    # DDS and Wincars ingest every *.csv in a directory; the others take one file.
+    ingests_directory: bool
+    search: Callable[[lancedb.DBConnection], Callable[..., SearchResult]]
+    format: Callable[[SearchResult], str]
+    renderer: RenderRecord
+
+
+_TABLES: dict[str, _TableSpec] = {
+    "fodelse": _TableSpec(
+        ingest_fodelse, True, lambda db: DDSSearch(db).search_fodelse, dds_formatter.format_fodelse_results, dds_formatter.DISPLAY_RENDERERS["fodelse"]
+    ),
+    "doda": _TableSpec(ingest_doda, True, lambda db: DDSSearch(db).search_doda, dds_formatter.format_doda_results, dds_formatter.DISPLAY_RENDERERS["doda"]),
+    "vigsel": _TableSpec(
+        ingest_vigsel, True, lambda db: DDSSearch(db).search_vigsel, dds_formatter.format_vigsel_results, dds_formatter.DISPLAY_RENDERERS["vigsel"]
+    ),
+    "wincars": _TableSpec(
+        ingest_wincars, True, lambda db: WincarsSearch(db).search, wincars_formatter.format_wincars_results, wincars_formatter.DISPLAY_RENDERERS["wincars"]
+    ),
+    "liggare": _TableSpec(
+        ingest_liggare,
+        False,
+        lambda db: SjomanshusSearch(db).search_liggare,
+        sjomanshus_formatter.format_liggare_results,
+        sjomanshus_formatter.DISPLAY_RENDERERS["liggare"],
+    ),
+    "matrikel": _TableSpec(
+        ingest_matrikel,
+        False,
+        lambda db: SjomanshusSearch(db).search_matrikel,
+        sjomanshus_formatter.format_matrikel_results,
+        sjomanshus_formatter.DISPLAY_RENDERERS["matrikel"],
+    ),
+}
+
+TABLE_NAMES = list(_TABLES)
+
+
+def rows_at_scale(table: str, scale: float) -> int:
+    """Row count for ``table`` at ``scale`` (1.0 = production size)."""
+    return max(1, round(PRODUCTION_ROWS[table] * scale))
+
+
+# --- table build ---------------------------------------------------------------------
+
+
+def _table_key(table: str, scale: float, seed: int, display_text: bool) -> dict[str, Any]:
+    return {"generator": GENERATOR_VERSION, "rows": rows_at_scale(table, scale), "seed": seed, "display_text": display_text}
+
+
+def _read_manifest(data_dir: Path) -> dict[str, Any]:
+    path = data_dir / MANIFEST
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def build_tables(
+    data_dir: Path,
+    *,
+    scale: float,
+    seed: int,
+    display_text: bool = True,
+    tables: Sequence[str] = TABLE_NAMES,
+    rebuild: bool = False,
+) -> dict[str, dict[str, Any]]:
+    """Generate and ingest every table in ``tables`` that is missing or stale.
+
+    A table is reused when the manifest records the same generator version, row
+    count, seed and display-text setting, so repeated runs (and runs on other
+    commits) skip the multi-minute build. CSVs are written to a scratch directory
+    under ``data_dir`` and removed after ingest.
+
+    Args:
+        data_dir: LanceDB directory for the benchmark tables (created if missing).
+        scale: Fraction of production row counts to generate.
+        seed: Base seed; each table derives its own stream from it.
+        display_text: Ingest with the formatters' renderers, as the ingest scripts do.
+        tables: Subset of :data:`TABLE_NAMES` to build.
+        rebuild: Rebuild even when the cached table matches.
+
+    Returns:
+        Per-table ``rows``, ``generate_seconds`` and ``ingest_seconds`` (the values
+        recorded when the table was built).
+    """
+    data_dir.mkdir(parents=True, exist_ok=True)
+    db = lancedb.connect(data_dir)
+    manifest = _read_manifest(data_dir)
+    existing = set(db.list_tables().tables)
+
+    for table in tables:
+        key = _table_key(table, scale, seed, display_text)
+        cached = manifest.get(table, {})
+        if not rebuild and table in existing and cached.get("key") == key:
+            logger.info("Reusing %s (%d rows)", table, key["rows"])
+            continue
+
+        spec = _TABLES[table]
+        rng = random.Random(f"{seed}:{table}")
+        with tempfile.TemporaryDirectory(dir=data_dir) as scratch:
+            csv_dir = Path(scratch) / table
+            logger.info("Generating %d synthetic %s rows ...", key["rows"], table)
+            started = time.perf_counter()
+            csv_path = WRITERS[table](csv_dir, key["rows"], rng)
+            generated = time.perf_counter()
+            logger.info("Ingesting %s ...", table)
+            source = csv_dir if spec.ingests_directory else csv_path
+            if display_text:
+                spec.ingest(db, source, render_record=spec.renderer)
+            else:
+                spec.ingest(db, source)
+            ingested = time.perf_counter()
+
+        manifest[table] = {"key": key, "generate_seconds": round(generated - started, 3), "ingest_seconds": round(ingested - generated, 3)}
+        (data_dir / MANIFEST).write_text(json.dumps(manifest, indent=2))
+
+    return {table: {"rows": manifest[table]["key"]["rows"], **{k: v for k, v in manifest[table].items() if k != "key"}} for table in tables}
+
+
+# --- timing --------------------------------------------------------------------------
+
+
+def _time_ms(fn: Callable[[], Any]) -> tuple[float, Any]:
+    started = time.perf_counter_ns()
+    value = fn()
+    return (time.perf_counter_ns() - started) / 1e6, value
+
+
+def run_query(db: lancedb.DBConnection, query: BenchQuery, *, repeat: int, warmup: int) -> dict[str, Any]:
+    """Time one query: a cold first call, ``warmup`` discarded calls, ``repeat`` timed calls."""
+    spec = _TABLES[query.table]
+    search = spec.search(db)
+
+    def call() -> SearchResult:
+        return search(query.keyword, limit=query.limit, offset=query.offset, **query.filters)
+
+    cold_ms, result = _time_ms(call)
+    for _ in range(warmup):
+        call()
+    search_ms: list[float] = []
+    format_ms: list[float] = []
+    for _ in range(repeat):
+        elapsed, result = _time_ms(call)
+        search_ms.append(elapsed)
+        elapsed, _ = _time_ms(lambda result=result: spec.format(result))
+        format_ms.append(elapsed)
+
+    return {
+        "table": query.table,
+        "params": query.params(),
+        # The data fingerprint: equal across commits unless the search semantics changed.
+        "total_hits": result.total_hits,
+        "returned": len(result.records),
+        "cold_ms": round(cold_ms, 4),
+        "search_ms": summarize(search_ms),
+        "format_ms": summarize(format_ms),
+    }
+
+
+def _git_revision() -> dict[str, Any]:
+    git = shutil.which("git")
+    if git is None:
+        return {"commit": None, "dirty": None}
+    try:
+        commit = subprocess.run([git, "rev-parse", "HEAD"], capture_output=True, text=True, check=True, timeout=10).stdout.strip()
+        status = subprocess.run([git, "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True, check=True, timeout=30).stdout
+    except (OSError, subprocess.SubprocessError):
+        return {"commit": None, "dirty": None}
+    return {"commit": commit, "dirty": bool(status.strip())}
+
+
+def _package_version(name: str) -> str | None:
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return None
+
+
+def _environment() -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "packages": {name: _package_version(name) for name in ("lancedb", "pylance", "pyarrow", "tantivy")},
+    }
+
+
+def run_benchmark(
+    data_dir: Path,
+    *,
+    scale: float = 1.0,
+    seed: int = 20_240_611,
+    repeat: int = 20,
+    warmup: int = 3,
+    display_text: bool = True,
+    tables: Sequence[str] = TABLE_NAMES,
+    label: str | None = None,
+    rebuild: bool = False,
+) -> dict[str, Any]:
+    """Build (or reuse) the tables and time every query on them.
+
+    Returns:
+        The result document written by ``run``: environment and git revision,
+        the run configuration, per-table build info, and per-query timings keyed
+        by the stable query name.
+    """
+    build = build_tables(data_dir, scale=scale, seed=seed, display_text=display_text, tables=tables, rebuild=rebuild)
+    db = lancedb.connect(data_dir)
+    results: dict[str, Any] = {}
+    for query in QUERIES:
+        if query.table not in tables:
+            continue
+        logger.info("Timing %s", query.name)
+        results[query.name] = run_query(db, query, repeat=repeat, warmup=warmup)
+
+    p50s = [r["search_ms"]["p50"] for r in results.values() if r["search_ms"]["p50"] > 0]
+    return {
+        "schema": RESULT_SCHEMA,
+        "created": datetime.now(UTC).isoformat(timespec="seconds"),
+        "label": label,
+        "git": _git_revision(),
+        "environment": _environment(),
+        "config": {"scale": scale, "seed": seed, "repeat": repeat, "warmup": warmup, "display_text": display_text, "generator": GENERATOR_VERSION},
+        "tables": build,
+        "summary": {"queries": len(results), "search_p50_geomean_ms": round(math.exp(statistics.fmean(math.log(p) for p in p50s)), 4) if p50s else None},
+        "queries": results,
+    }
+
+
+# --- comparison ----------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class Delta:
+    """One query's change between two result files."""
+
+    name: str
+    metric: str
+    base_ms: float
+    new_ms: float
+
+    @property
+    def ratio(self) -> float:
+        return self.new_ms / self.base_ms if self.base_ms else math.inf
+
+    def regressed(self, threshold: float, floor_ms: float) -> bool:
+        """Slower by more than ``threshold`` (relative) *and* ``floor_ms`` (absolute noise floor)."""
+        return self.ratio > 1 + threshold and self.new_ms - self.base_ms > floor_ms
+
+
+def compare(base: dict[str, Any], new: dict[str, Any], *, metrics: Sequence[str] = ("p50", "p99")) -> tuple[list[Delta], list[str]]:
+    """Pair up the queries two result files share.
+
+    Returns:
+        The per-query, per-metric search-time deltas, and warnings about anything
+        that makes the comparison unsound (different scale/seed/generator, or a
+        query whose ``total_hits`` changed — i.e. it no longer measures the same work).
+    """
+    warnings = [
+        f"config.{key} differs: {base['config'].get(key)} vs {new['config'].get(key)}"
+        for key in ("scale", "seed", "generator", "display_text")
+        if base["config"].get(key) != new["config"].get(key)
+    ]
+
+    deltas: list[Delta] = []
+    for name, before in base["queries"].items():
+        after = new["queries"].get(name)
+        if after is None:
+            warnings.append(f"{name}: missing from the new results")
+            continue
+        if before["total_hits"] != after["total_hits"]:
+            warnings.append(f"{name}: total_hits changed {before['total_hits']} -> {after['total_hits']}")
+        deltas.extend(Delta(name, metric, before["search_ms"][metric], after["search_ms"][metric]) for metric in metrics)
+    return deltas, warnings
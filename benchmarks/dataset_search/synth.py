@@ -0,0 +1,528 @@
+"""Deterministic synthetic CSVs in the upstream Riksarkivet formats.
+
+Each writer produces a semicolon-delimited, latin-1 file with the exact header the
+lib's ``from_csv_row`` reads, so the benchmark tables are built by the real ingest
+functions rather than by a shortcut that could drift from them. Values are drawn
+from Swedish vocabularies with a Zipf-like rank distribution — a handful of very
+common names, parishes and occupations, then a long tail — so full-text queries
+see the posting-list skew of the real registers (``Andersson`` matches a large
+share of rows, a tail parish only a few hundred).
+"""
+
+from __future__ import annotations
+
+import csv
+import itertools
+import random
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+
+# Bumped whenever generated content changes, so cached tables are rebuilt.
+GENERATOR_VERSION = 1
+
+# Production-scale row counts (scale=1.0): ~2.5M DDS, ~1.5M Wincars, ~688K Sjömanshus.
+PRODUCTION_ROWS: dict[str, int] = {
+    "fodelse": 1_150_000,
+    "doda": 850_000,
+    "vigsel": 500_000,
+    "wincars": 1_500_000,
+    "liggare": 460_000,
+    "matrikel": 228_000,
+}
+
+# --- vocabularies ----------------------------------------------------------------
+# Ordered most-common first: the Zipf sampler weights rank r by 1 / r**s.
+
+MALE_NAMES = [
+    "Johan", "Carl", "Erik", "Anders", "Per", "Lars", "Nils", "Olof", "Gustaf", "Karl",
+    "Jonas", "Magnus", "Sven", "Petter", "Jöns", "Måns", "Hans", "Isak", "Anton", "August",
+    "Fredrik", "Axel", "Oskar", "Daniel", "Jakob", "Mats", "Pål", "Henrik", "Gabriel", "Adolf",
+    "Johannes", "Abraham", "Lorens", "Mikael", "Elias", "Samuel", "Zakarias", "Wilhelm", "Gottfrid", "Bengt",
+]  # fmt: skip
+FEMALE_NAMES = [
+    "Anna", "Maria", "Brita", "Kajsa", "Karin", "Stina", "Greta", "Lisa", "Elin", "Ingrid",
+    "Johanna", "Christina", "Catharina", "Sara", "Ulrika", "Hedvig", "Helena", "Emma", "Hilda", "Mathilda",
+    "Margareta", "Elisabet", "Charlotta", "Gertrud", "Sofia", "Lovisa", "Carolina", "Ebba", "Märta", "Kerstin",
+]  # fmt: skip
+_SURNAME_ROOTS = [
+    "Lind", "Sjö", "Å", "Holm", "Lund", "Ström", "Fors", "Berg", "Nord", "Hed",
+    "Wik", "Ö", "Ek", "Sand", "Dahl", "Lil", "Stor", "Björk", "Gran", "Rosen",
+    "Eng", "Hag", "Ny", "Söder", "Väster", "Öster", "Malm", "Sten", "Åker", "Blom",
+]  # fmt: skip
+_SURNAME_SUFFIXES = ["berg", "ström", "gren", "qvist", "lund", "man", "ling", "bäck", "dahl", "blad"]
+# Patronymics dominate the historical registers; a long tail of farm/soldier names follows.
+SURNAMES = [f"{name}sson" if not name.endswith("s") else f"{name}son" for name in MALE_NAMES[:20]] + [
+    root + suffix for root, suffix in itertools.product(_SURNAME_ROOTS, _SURNAME_SUFFIXES)
+]
+COUNTIES = [
+    "Stockholms", "Uppsala", "Östergötlands", "Malmöhus", "Göteborgs och Bohus", "Älvsborgs", "Skaraborgs", "Kopparbergs",
+    "Värmlands", "Örebro", "Västmanlands", "Gävleborgs", "Västernorrlands", "Jönköpings", "Kalmar", "Kristianstads",
+    "Södermanlands", "Kronobergs", "Hallands", "Blekinge", "Västerbottens", "Jämtlands", "Norrbottens", "Gotlands",
+]  # fmt: skip
+_PLACE_PREFIXES = ["", "Norr", "Söder", "Öster", "Väster", "Stora ", "Lilla ", "Övre ", "Nedre "]
+_PLACE_ROOTS = [
+    "Mora", "Leksand", "Rättvik", "Orsa", "Ljusdal", "Alfta", "Bollnäs", "Tuna", "Vika", "Enviken",
+    "Sala", "Tierp", "Alunda", "Österåker", "Värmdö", "Knivsta", "Gryt", "Tjällmo", "Kvillinge", "Skeda",
+    "Hallsberg", "Kumla", "Glanshammar", "Fellingsbro", "Asker", "Bro", "Sunne", "Fryksände", "Ekshärad", "Norra Råda",
+]  # fmt: skip
+# A few big city parishes, then ~270 rural ones: the parish filter column's real skew.
+PARISHES = ["Klara", "Katarina", "Maria Magdalena", "Jakob", "Hedvig Eleonora", "Adolf Fredrik", "Uppsala domkyrko", "Domkyrko"] + [
+    prefix + (root if not prefix or prefix.endswith(" ") else root.lower()) for root, prefix in itertools.product(_PLACE_ROOTS, _PLACE_PREFIXES)
+]
+OCCUPATIONS = [
+    "Bonde", "Torpare", "Dräng", "Piga", "Arbetare", "Hemmansägare", "Soldat", "Inhyses", "Backstugusittare", "Skomakare",
+    "Smed", "Skräddare", "Snickare", "Båtsman", "Bruksarbetare", "Sjöman", "Handlande", "Mjölnare", "Rättare", "Kolare",
+    "Fiskare", "Murare", "Målare", "Gästgivare", "Klockare", "Länsman", "Kyrkoherde", "Kapellan", "Organist", "Bokhållare",
+]  # fmt: skip
+CAUSES_OF_DEATH = [
+    "Ålderdom", "Lungsot", "Bröstfeber", "Slag", "Kikhosta", "Mässling", "Koppor", "Rödsot", "Frossa", "Vattusot",
+    "Nerfeber", "Barnsbörd", "Okänd", "Drunknad", "Hetsig feber", "Tvinsot", "Kräfta", "Magplåga", "Halssjuka", "Olyckshändelse",
+]  # fmt: skip
+CAUSE_CLASSES = ["Infektionssjukdomar", "Ålderssvaghet", "Andningsorganen", "Cirkulationsorganen", "Yttre orsaker", "Okänd orsak"]
+RELATIONS = ["Fader", "Moder", "Make", "Maka", "Son", "Dotter"]
+CIVIL_STATUS = ["Ogift", "Gift", "Änkling", "Änka"]
+NOTES = [
+    "Tvilling", "Oäkta", "Nöddöpt", "Född död", "Inflyttad", "Utflyttad till Amerika", "Se bilaga",
+    "Död samma dag", "Fattighjon", "Begravd i tysthet", "Vigd i hemmet", "Lysning uppskjuten",
+]  # fmt: skip
+# Norrland domiciles first (Wincars is the Norrland register), then the shared place tail.
+TOWNS = [
+    "Sundsvall", "Umeå", "Luleå", "Östersund", "Gävle", "Härnösand", "Örnsköldsvik", "Skellefteå", "Piteå", "Kiruna",
+    "Boden", "Hudiksvall", "Söderhamn", "Sollefteå", "Kramfors", "Lycksele", "Haparanda", "Kalix", "Gällivare", "Sandviken",
+]  # fmt: skip
+WINCARS_MAKES = [
+    "Volvo PV 444", "Volvo L 475", "Saab 93", "Volvo Amazon", "Volkswagen 1200", "Ford Anglia", "Chevrolet Bel Air", "Scania-Vabis L 51",
+    "Opel Rekord", "Husqvarna 250", "Monark 125", "Crescent 250", "Mercedes-Benz 180", "Fiat 600", "Austin A40", "Morris Minor",
+    "Plymouth Savoy", "Dodge Kingsway", "Buick Special", "Albin 20", "Bolinder-Munktell BM 35", "Ferguson TE 20", "DKW F 89", "Simca Aronde",
+]  # fmt: skip
+WINCARS_TYPES = ["PB", "LB", "MC", "SL", "TR", "BS"]
+NORRLAND_LETTERS = ["X", "Y", "Z", "AC", "BD"]
+SHIP_TYPES = ["Brigg", "Skonare", "Bark", "Galeas", "Ångare", "Fullriggare", "Slup", "Jakt"]
+SHIP_NAMES = [
+    "Hoppet", "Fortuna", "Svea", "Freja", "Nordstjernan", "Carolina", "Maria", "Enigheten", "Förtröstan", "Oscar",
+    "Wasa", "Amalia", "Neptunus", "Concordia", "Dygden", "Fäderneslandet", "Gustaf", "Aurora", "Elida", "Nornan",
+]  # fmt: skip
+PORTS = [
+    "Göteborg", "Stockholm", "Karlskrona", "Gävle", "Kalmar", "Malmö", "Helsingborg", "Visby", "Västervik", "Norrköping",
+    "Uddevalla", "Strömstad", "Karlshamn", "Sölvesborg", "Ystad", "Landskrona", "Marstrand", "Oskarshamn", "Söderhamn", "Härnösand",
+]  # fmt: skip
+DESTINATIONS = [
+    "Östersjön", "Nordsjön", "London", "Hamburg", "Medelhavet", "Lissabon", "Riga", "Danzig", "Petersburg", "Lübeck",
+    "Westindien", "Brasilien", "Amsterdam", "Newcastle", "Cadiz", "Archangelsk",
+]  # fmt: skip
+RANKS = ["Matros", "Lättmatros", "Jungman", "Kock", "Styrman", "Timmerman", "Eldare", "Maskinist", "Skeppare", "Kajutvakt", "Båtsman", "Konstapel"]
+SIGN_OFF_REASONS = ["Hemförlovad", "Avmönstrad", "Rymd", "Död", "Sjukdom", "Annat fartyg", "Kvarstannad i utrikes ort"]
+SEAMENS_HOUSES = PORTS[:12]
+
+
+# --- sampling ----------------------------------------------------------------------
+
+
+class ZipfSampler:
+    """Draw values with rank-based weights ``1 / rank**exponent`` (rank 1 = first)."""
+
+    def __init__(self, values: Sequence[str], exponent: float = 1.0) -> None:
+        self._values = list(values)
+        self._cum_weights = list(itertools.accumulate(1.0 / (rank**exponent) for rank in range(1, len(values) + 1)))
+
+    def draw(self, rng: random.Random, k: int) -> list[str]:
+        """``k`` independent draws."""
+        return rng.choices(self._values, cum_weights=self._cum_weights, k=k)
+
+
+def _dates(rng: random.Random, k: int, start_year: int, end_year: int) -> list[str]:
+    # Later decades are better covered, as in the digitised registers.
+    return [f"{int(rng.triangular(start_year, end_year, end_year)):04d}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}" for _ in range(k)]
+
+
+def _sparse(rng: random.Random, values: list[str], fill_rate: float) -> list[str]:
+    """Blank out most of an optional column with the upstream ``NULL`` sentinel."""
+    return [v if rng.random() < fill_rate else "NULL" for v in values]
+
+
+def _write(path: Path, header: list[str], columns: dict[str, list[str]], rows: int) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="latin-1", newline="") as f:
+        writer = csv.writer(f, delimiter=";", lineterminator="\n")
+        writer.writerow(header)
+        blank = [""] * rows
+        writer.writerows(zip(*(columns.get(name, blank) for name in header), strict=True))
+    return path
+
+
+_male = ZipfSampler(MALE_NAMES, 0.9)
+_female = ZipfSampler(FEMALE_NAMES, 0.9)
+_surname = ZipfSampler(SURNAMES, 1.05)
+_county = ZipfSampler(COUNTIES, 0.6)
+_parish = ZipfSampler(PARISHES, 1.0)
+_occupation = ZipfSampler(OCCUPATIONS, 1.1)
+_cause = ZipfSampler(CAUSES_OF_DEATH, 1.0)
+_note = ZipfSampler(NOTES, 1.0)
+_town = ZipfSampler(TOWNS + PARISHES, 1.05)
+
+
+def _refs(rng: random.Random, k: int) -> tuple[list[str], list[str], list[str]]:
+    """Reference code, volume and image id columns (C-series church books)."""
+    archives = [f"SE/{rng.choice(('SSA', 'ULA', 'VALA', 'HLA', 'GLA', 'LLA'))}/{rng.randint(10000, 13999)}" for _ in range(k)]
+    volumes = [f"C:{rng.randint(1, 30)}" for _ in range(k)]
+    images = [f"C{rng.randint(1, 99_999):07d}_{rng.randint(1, 400):05d}" for _ in range(k)]
+    return archives, volumes, images
+
+
+def write_fodelse(directory: Path, rows: int, rng: random.Random) -> Path:
+    """Födelse (birth) CSV in the DDS ``Fodda`` layout."""
+    header = [
+        "Postid",
+        "Forsamling",
+        "Lan",
+        "Datum",
+        "Fornamn",
+        "Kon",
+        "Far_fornamn",
+        "Far_efternamn",
+        "Far_yrke",
+        "Far_ort",
+        "Mor_fornamn",
+        "Mor_efternamn",
+        "Mor_yrke",
+        "Fodelseort",
+        "Dopvittne",
+        "Anm",
+        "Referenskod",
+        "Volym",
+        "BildID",
+    ]
+    sexes = rng.choices(["M", "K"], k=rows)
+    boys, girls = iter(_male.draw(rng, rows)), iter(_female.draw(rng, rows))
+    father_surnames = _surname.draw(rng, rows)
+    refs, volumes, images = _refs(rng, rows)
+    columns = {
+        "Postid": [str(i) for i in range(1, rows + 1)],
+        "Forsamling": _parish.draw(rng, rows),
+        "Lan": _county.draw(rng, rows),
+        "Datum": _dates(rng, rows, 1700, 1900),
+        "Fornamn": [next(boys) if sex == "M" else next(girls) for sex in sexes],
+        "Kon": sexes,
+        "Far_fornamn": _male.draw(rng, rows),
+        "Far_efternamn": father_surnames,
+        "Far_yrke": _occupation.draw(rng, rows),
+        "Far_ort": _sparse(rng, _town.draw(rng, rows), 0.3),
+        "Mor_fornamn": _female.draw(rng, rows),
+        "Mor_efternamn": _sparse(rng, father_surnames, 0.6),
+        "Mor_yrke": _sparse(rng, _occupation.draw(rng, rows), 0.1),
+        "Fodelseort": _sparse(rng, _town.draw(rng, rows), 0.5),
+        "Dopvittne": _sparse(rng, [f"{m} {s}" for m, s in zip(_male.draw(rng, rows), _surname.draw(rng, rows), strict=True)], 0.3),
+        "Anm": _sparse(rng, _note.draw(rng, rows), 0.08),
+        "Referenskod": refs,
+        "Volym": volumes,
+        "BildID": images,
+    }
+    return _write(directory / "fodelse.csv", header, columns, rows)
+
+
+def write_doda(directory: Path, rows: int, rng: random.Random) -> Path:
+    """Döda (death) CSV in the DDS ``Doda`` layout."""
+    header = [
+        "PostID",
+        "Forsamling",
+        "Lan",
+        "Datum",
+        "Fornamn",
+        "Efternamn",
+        "Yrke",
+        "Hemort",
+        "Kon",
+        "Civilstand",
+        "Alder",
+        "Dodsorsak",
+        "Dodsorsak_klassificerat",
+        "Anhorig_fornamn",
+        "Anhorig_efternamn",
+        "Anhorig_yrke",
+        "Anhorig_relation",
+        "Anm",
+        "Referenskod",
+        "Volym",
+        "BildID",
+    ]
+    sexes = rng.choices(["M", "K"], k=rows)
+    men, women = iter(_male.draw(rng, rows)), iter(_female.draw(rng, rows))
+    refs, volumes, images = _refs(rng, rows)
+    columns = {
+        "PostID": [str(i) for i in range(1, rows + 1)],
+        "Forsamling": _parish.draw(rng, rows),
+        "Lan": _county.draw(rng, rows),
+        "Datum": _dates(rng, rows, 1700, 1900),
+        "Fornamn": [next(men) if sex == "M" else next(women) for sex in sexes],
+        "Efternamn": _surname.draw(rng, rows),
+        "Yrke": _sparse(rng, _occupation.draw(rng, rows), 0.6),
+        "Hemort": _sparse(rng, _town.draw(rng, rows), 0.5),
+        "Kon": sexes,
+        "Civilstand": rng.choices(CIVIL_STATUS, weights=[5, 6, 2, 2], k=rows),
+        "Alder": [str(min(int(rng.expovariate(1 / 35)), 104)) for _ in range(rows)],
+        "Dodsorsak": _sparse(rng, _cause.draw(rng, rows), 0.7),
+        "Dodsorsak_klassificerat": _sparse(rng, rng.choices(CAUSE_CLASSES, k=rows), 0.4),
+        "Anhorig_fornamn": _sparse(rng, _male.draw(rng, rows), 0.4),
+        "Anhorig_efternamn": _sparse(rng, _surname.draw(rng, rows), 0.4),
+        "Anhorig_yrke": _sparse(rng, _occupation.draw(rng, rows), 0.3),
+        "Anhorig_relation": _sparse(rng, rng.choices(RELATIONS, k=rows), 0.4),
+        "Anm": _sparse(rng, _note.draw(rng, rows), 0.05),
+        "Referenskod": refs,
+        "Volym": volumes,
+        "BildID": images,
+    }
+    return _write(directory / "doda.csv", header, columns, rows)
+
+
+def write_vigsel(directory: Path, rows: int, rng: random.Random) -> Path:
+    """Vigsel (marriage) CSV in the DDS ``Vigslar`` layout."""
+    header = [
+        "Postid",
+        "Forsamling",
+        "Lan",
+        "Datum",
+        "Brudgum_fornamn",
+        "Brudgum_efternamn",
+        "Brudgum_yrke",
+        "Brudgum_hemort",
+        "Brudgum_civilstand",
+        "Brudgum_alder",
+        "Brud_fornamn",
+        "Brud_efternamn",
+        "Brud_yrke",
+        "Brud_hemort",
+        "Brud_Alder",
+        "Anm",
+        "Referenskod",
+        "Volym",
+        "BildID",
+    ]
+    refs, volumes, images = _refs(rng, rows)
+    columns = {
+        "Postid": [str(i) for i in range(1, rows + 1)],
+        "Forsamling": _parish.draw(rng, rows),
+        "Lan": _county.draw(rng, rows),
+        "Datum": _dates(rng, rows, 1700, 1900),
+        "Brudgum_fornamn": _male.draw(rng, rows),
+        "Brudgum_efternamn": _surname.draw(rng, rows),
+        "Brudgum_yrke": _occupation.draw(rng, rows),
+        "Brudgum_hemort": _town.draw(rng, rows),
+        "Brudgum_civilstand": _sparse(rng, rng.choices(["Ogift", "Änkling"], weights=[8, 1], k=rows), 0.5),
+        "Brudgum_alder": [str(rng.randint(19, 55)) for _ in range(rows)],
+        "Brud_fornamn": _female.draw(rng, rows),
+        "Brud_efternamn": _surname.draw(rng, rows),
+        "Brud_yrke": _sparse(rng, ["Piga"] * rows, 0.4),
+        "Brud_hemort": _town.draw(rng, rows),
+        "Brud_Alder": [str(rng.randint(17, 48)) for _ in range(rows)],
+        "Anm": _sparse(rng, _note.draw(rng, rows), 0.05),
+        "Referenskod": refs,
+        "Volym": volumes,
+        "BildID": images,
+    }
+    return _write(directory / "vigsel.csv", header, columns, rows)
+
+
+def write_wincars(directory: Path, rows: int, rng: random.Random) -> Path:
+    """Wincars (Norrland vehicle register) CSV in the upstream layout."""
+    header = [
+        "NREG",
+        "TYP",
+        "FABRIKAT",
+        "AAR",
+        "FREG",
+        "MREG",
+        "TREG",
+        "CNR",
+        "MNR",
+        "STATUS",
+        "ANTAG",
+        "AVREG",
+        "HEMVIST",
+        "ANM",
+        "SIGNUM",
+        "VOL",
+        "S1",
+        "PLATS2",
+        "ARKISKOD",
+    ]
+    makes = ZipfSampler(WINCARS_MAKES, 1.1).draw(rng, rows)
+    years = [rng.randint(1916, 1972) for _ in range(rows)]
+    columns = {
+        "NREG": [f"{rng.choice(NORRLAND_LETTERS)}{rng.randint(1, 99_999)}" for _ in range(rows)],
+        "TYP": rng.choices(WINCARS_TYPES, weights=[60, 15, 12, 6, 5, 2], k=rows),
+        "FABRIKAT": makes,
+        "AAR": [str(y) for y in years],
+        "FREG": _sparse(rng, [f"{rng.choice(NORRLAND_LETTERS)}{rng.randint(1, 9_999)}" for _ in range(rows)], 0.2),
+        "MREG": _sparse(rng, [f"{''.join(rng.choices('ABCDEFGHJKLMNOPRSTUWXYZ', k=3))}{rng.randint(100, 999)}" for _ in range(rows)], 0.3),
+        "TREG": ["NULL"] * rows,
+        "CNR": [str(rng.randint(100_000, 9_999_999)) for _ in range(rows)],
+        "MNR": _sparse(rng, [f"M{rng.randint(10_000, 999_999)}" for _ in range(rows)], 0.6),
+        "STATUS": rng.choices(["A", "S", "U"], weights=[3, 6, 1], k=rows),
+        "ANTAG": [f"{y}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}" for y in years],
+        "AVREG": _sparse(rng, [f"{y + rng.randint(2, 20)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}" for y in years], 0.7),
+        "HEMVIST": _town.draw(rng, rows),
+        "ANM": _sparse(rng, rng.choices(["Importerad från Norge", "Ombyggd", "Skrotad", "Avställd", "Ägarbyte", "Stulen"], k=rows), 0.05),
+        "SIGNUM": [f"F{rng.randint(1, 9)}" for _ in range(rows)],
+        "VOL": [str(rng.randint(1, 400)) for _ in range(rows)],
+        "ARKISKOD": [f"SE/RA/{rng.randint(730_000, 739_999)}" for _ in range(rows)],
+    }
+    return _write(directory / "wincars.csv", header, columns, rows)
+
+
+def _seamen(rng: random.Random, rows: int) -> dict[str, list[str]]:
+    """Columns shared by the Liggare and Matrikel layouts."""
+    houses = ZipfSampler(SEAMENS_HOUSES, 0.9).draw(rng, rows)
+    return {
+        "ID": [str(i) for i in range(1, rows + 1)],
+        "Sid": [str(rng.randint(1, 600)) for _ in range(rows)],
+        "Foernamn": _male.draw(rng, rows),
+        "Efternamn1": _surname.draw(rng, rows),
+        "Efternamn2": _sparse(rng, _surname.draw(rng, rows), 0.05),
+        "Foedelsedat": _dates(rng, rows, 1780, 1910),
+        "Foedelseplats": _town.draw(rng, rows),
+        "Foedelsefoers": [f"{p} församling" for p in _parish.draw(rng, rows)],
+        "Hemplats": _town.draw(rng, rows),
+        "Hemfoers": [f"{p} församling" for p in _parish.draw(rng, rows)],
+        "Sjoemanshus": houses,
+        "Inskrivnr": [str(rng.randint(1, 20_000)) for _ in range(rows)],
+        "Orsak": _sparse(rng, ZipfSampler(SIGN_OFF_REASONS).draw(rng, rows), 0.6),
+        "Anm": _sparse(rng, _note.draw(rng, rows), 0.03),
+        "Volym": [f"Vol {rng.randint(1, 80)}" for _ in range(rows)],
+        "Sida": [str(rng.randint(1, 600)) for _ in range(rows)],
+        "Arkiv": [f"{h} sjömanshus" for h in houses],
+        "Arkisnr": [f"SE/{rng.choice(('GLA', 'KrA', 'SSA', 'VALA'))}/{rng.randint(1000, 9999)}" for _ in range(rows)],
+    }
+
+
+def write_liggare(directory: Path, rows: int, rng: random.Random) -> Path:
+    """Sjömanshus Liggare (muster roll) CSV in the upstream layout."""
+    header = [
+        "ID",
+        "Sid",
+        "Foernamn",
+        "Efternamn1",
+        "Efternamn2",
+        "Foedelsedat",
+        "Aalder",
+        "Foedelseplats",
+        "Foedelsefoers",
+        "FSCBkod",
+        "Hemplats",
+        "Hemfoers",
+        "HSCBkod",
+        "Civilstaand",
+        "Sjoemanshus",
+        "Inskrivnr",
+        "Hyra_Loen",
+        "Valuta",
+        "Betaltid",
+        "Befattning_Yrke",
+        "Befattningskod",
+        "Paamoenstort",
+        "Paamoenstkod",
+        "Paamoenstdat",
+        "Avmoenstort",
+        "Avmoenstkod",
+        "Avmoenstdat",
+        "Orsak",
+        "Anm",
+        "Fartyg",
+        "Typ",
+        "Regnr",
+        "Svaara_Laester",
+        "Nylaester",
+        "Registerton",
+        "Hemmahamn",
+        "Destination",
+        "Redare",
+        "Kapten",
+        "Oevrigt",
+        "Volym",
+        "Sida",
+        "Arkiv",
+        "Arkisnr",
+    ]
+    ship_types = ZipfSampler(SHIP_TYPES).draw(rng, rows)
+    ports = ZipfSampler(PORTS, 0.9)
+    columns = _seamen(rng, rows) | {
+        "Aalder": [str(rng.randint(14, 60)) for _ in range(rows)],
+        "Civilstaand": rng.choices(CIVIL_STATUS[:2], weights=[3, 1], k=rows),
+        "Befattning_Yrke": ZipfSampler(RANKS, 1.1).draw(rng, rows),
+        "Paamoenstort": ports.draw(rng, rows),
+        "Paamoenstdat": _dates(rng, rows, 1800, 1930),
+        "Avmoenstort": ports.draw(rng, rows),
+        "Avmoenstdat": _dates(rng, rows, 1800, 1930),
+        "Fartyg": [
+            f"{t}en {n}" if t in ("Brigg", "Bark", "Galeas", "Slup", "Jakt") else f"{t} {n}"
+            for t, n in zip(ship_types, ZipfSampler(SHIP_NAMES, 0.8).draw(rng, rows), strict=True)
+        ],
+        "Typ": ship_types,
+        "Hemmahamn": ports.draw(rng, rows),
+        "Destination": ZipfSampler(DESTINATIONS).draw(rng, rows),
+        "Redare": [f"{m[0]}. {s}" for m, s in zip(_male.draw(rng, rows), _surname.draw(rng, rows), strict=True)],
+        "Kapten": [f"{m[0]}. {s}" for m, s in zip(_male.draw(rng, rows), _surname.draw(rng, rows), strict=True)],
+        "Oevrigt": _sparse(rng, rng.choices(["Första resan", "Förhyrd i utrikes ort", "Återkom"], k=rows), 0.05),
+    }
+    return _write(directory / "liggare.csv", header, columns, rows)
+
+
+def write_matrikel(directory: Path, rows: int, rng: random.Random) -> Path:
+    """Sjömanshus Matrikel (register) CSV in the upstream layout."""
+    header = [
+        "ID",
+        "Sid",
+        "Foernamn",
+        "Efternamn1",
+        "Efternamn2",
+        "Foedelsedat",
+        "Foedelseplats",
+        "Foedelsefoers",
+        "FSCBkod",
+        "Hemplats",
+        "Hemfoers",
+        "HSCBkod",
+        "Nyhemplats",
+        "Nyhemfoers",
+        "NyHSCBkod",
+        "Flyttdat",
+        "Far",
+        "Mor",
+        "Sjoemanshus",
+        "Inskrivnr",
+        "Inskrivdat",
+        "Avfoerdort",
+        "Avfoerddat",
+        "Orsak",
+        "Anm",
+        "Nyttsjoehus",
+        "Nyttinskrivnr",
+        "Oevrigt",
+        "Volym",
+        "Sida",
+        "Arkiv",
+        "Arkisnr",
+    ]
+    columns = _seamen(rng, rows) | {
+        "Far": [f"{m} {s}" for m, s in zip(_male.draw(rng, rows), _surname.draw(rng, rows), strict=True)],
+        "Mor": [f"{f} {s}" for f, s in zip(_female.draw(rng, rows), _surname.draw(rng, rows), strict=True)],
+        "Inskrivdat": _dates(rng, rows, 1800, 1930),
+        "Avfoerdort": _sparse(rng, ZipfSampler(PORTS).draw(rng, rows), 0.3),
+        "Avfoerddat": _sparse(rng, _dates(rng, rows, 1800, 1940), 0.3),
+    }
+    return _write(directory / "matrikel.csv", header, columns, rows)
+
+
+# table name -> CSV writer; DDS and Wincars ingest a directory, the others a file.
+WRITERS: dict[str, Callable[[Path, int, random.Random], Path]] = {
+    "fodelse": write_fodelse,
+    "doda": write_doda,
+    "vigsel": write_vigsel,
+    "wincars": write_wincars,
+    "liggare": write_liggare,
+    "matrikel": write_matrikel,
+}
@@ -0,0 +1,143 @@
+"""Import-time benchmark and guard for the server cold start.
+
+Each scenario runs a statement in a fresh interpreter under ``python -X importtime``
+and parses the per-module report from stderr: total import time, the slowest
+modules, and whether any of the heavy dependencies that must stay lazy
+(lancedb, pyarrow, pandas, gradio_client, label_studio_sdk, textual) were
+imported. ``check`` exits non-zero if one was, or if a scenario exceeds
+``--budget-ms``; CI runs it so that a new top-level import of a heavy package
+does not slip back in unnoticed.
+
+    uv run python -m benchmarks.import_time                 # report
+    uv run python -m benchmarks.import_time check           # report + guard
+    uv run python -m benchmarks.import_time check --budget-ms 5000 --output bench-results/imports.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+
+# Packages that are slow to import and are only needed once a tool actually uses them.
+HEAVY_PACKAGES = ("lancedb", "pyarrow", "pandas", "gradio_client", "label_studio_sdk", "textual")
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    statement: str
+
+
+SCENARIOS = (
+    Scenario("server.import", "import ra_mcp_server.server"),
+    Scenario("cli.import", "import ra_mcp_server.cli.app"),
+    Scenario(
+        "server.setup_search",
+        "from ra_mcp_server.server import create_server, setup_server; setup_server(create_server(['search']), ['search'])",
+    ),
+    Scenario(
+        "server.setup_all",
+        "from ra_mcp_server.server import AVAILABLE_MODULES, create_server, setup_server; m = list(AVAILABLE_MODULES); setup_server(create_server(m), m)",
+    ),
+)
+
+# "import time:      self [us] |  cumulative | imported package" — nesting is the indent of the name.
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """One line of the ``-X importtime`` report."""
+
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(report: str) -> list[ImportRecord]:
+    """Parse the stderr of ``python -X importtime``; non-report lines are ignored."""
+    records = []
+    for line in report.splitlines():
+        match = _LINE.match(line)
+        if match is not None:
+            self_us, cumulative_us, indent, name = match.groups()
+            records.append(ImportRecord(name, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return records
+
+
+def total_ms(records: list[ImportRecord]) -> float:
+    """Total import time: the sum of the top-level imports' cumulative times."""
+    return sum(r.cumulative_us for r in records if r.depth == 0) / 1000
+
+
+def heavy_imports(records: list[ImportRecord], packages: tuple[str, ...] = HEAVY_PACKAGES) -> list[str]:
+    """Which of *packages* were imported (the top-level package name, not submodules)."""
+    imported = {r.name for r in records}
+    return [package for package in packages if package in imported]
+
+
+def _run_once(scenario: Scenario) -> list[ImportRecord]:
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", scenario.statement], capture_output=True, text=True, check=False)
+    report = completed.stderr or ""
+    if completed.returncode != 0:
+        raise RuntimeError(f"{scenario.name} failed:\n{report[-2000:]}")
+    return parse_importtime(report)
+
+
+def run_scenario(scenario: Scenario, runs: int = 3, top: int = 10) -> dict:
+    """Run *scenario* *runs* times in fresh interpreters; timings are the fastest run's."""
+    best = min((_run_once(scenario) for _ in range(max(runs, 1))), key=total_ms)
+    slowest = sorted(best, key=lambda r: r.self_us, reverse=True)[:top]
+    return {
+        "statement": scenario.statement,
+        "total_ms": round(total_ms(best), 1),
+        "modules": len(best),
+        "heavy_imports": heavy_imports(best),
+        "slowest_self": [asdict(r) for r in slowest],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.import_time", description="Import-time benchmark and guard for the server cold start")
+    parser.add_argument("command", nargs="?", choices=["report", "check"], default="report")
+    parser.add_argument("--scenario", action="append", choices=[s.name for s in SCENARIOS], help="Run only these scenarios (repeatable)")
+    parser.add_argument("--runs", type=int, default=3, help="Interpreter runs per scenario; the fastest counts (default: 3)")
+    parser.add_argument("--top", type=int, default=10, help="How many of the slowest modules to list (default: 10)")
+    parser.add_argument("--budget-ms", type=float, default=None, help="check: fail if a scenario's total import time exceeds this")
+    parser.add_argument("--output", type=Path, default=None, help="Write the results as JSON")
+    args = parser.parse_args(argv)
+
+    scenarios = [s for s in SCENARIOS if not args.scenario or s.name in args.scenario]
+    results = {s.name: run_scenario(s, runs=args.runs, top=args.top) for s in scenarios}
+
+    failures = []
+    for name, result in results.items():
+        print(f"\n{name}: {result['total_ms']:.0f} ms, {result['modules']} modules")
+        for record in result["slowest_self"]:
+            print(f"  {record['self_us'] / 1000:>8.1f} ms  {record['name']}")
+        if result["heavy_imports"]:
+            print(f"  heavy imports: {', '.join(result['heavy_imports'])}")
+            failures.append(f"{name} imports {', '.join(result['heavy_imports'])}")
+        if args.budget_ms is not None and result["total_ms"] > args.budget_ms:
+            failures.append(f"{name} took {result['total_ms']:.0f} ms (budget {args.budget_ms:.0f} ms)")
+
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"\nResults written to {args.output}")
+
+    if args.command == "check" and failures:
+        print("\nImport-time check failed:\n  " + "\n  ".join(failures))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,9 @@
+"""Offline stand-in for the Riksarkivet upstreams, and a load generator for the MCP endpoint.
+
+Usage:
+    uv run python -m benchmarks.mock_upstream serve [--port 8765] [--latency 120:0.5] [--error-rate 0.01]
+    RA_MCP_UPSTREAM_URL=http://127.0.0.1:8765 uv run ra serve --port 7860
+    uv run python -m benchmarks.mock_upstream load --url http://localhost:7860/mcp [--concurrency 16] [--duration 60]
+
+See docs/development/benchmarks.md.
+"""
@@ -0,0 +1,99 @@
+"""Command line for the mock upstream: ``serve`` and ``load``."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from .app import Faults, Latency, MockConfig, create_app
+from .load import DEFAULT_MIX, parse_mix, run_load
+
+
+def _host_latency(spec: str) -> tuple[str, Latency]:
+    host, _, latency = spec.partition("=")
+    return host, Latency.parse(latency)
+
+
+def _serve(args: argparse.Namespace) -> int:
+    import uvicorn
+
+    config = MockConfig(
+        latency=args.latency,
+        host_latency=dict(args.host_latency),
+        faults=Faults(error_rate=args.error_rate, error_statuses=tuple(args.error_status), stall_rate=args.stall_rate, stall_seconds=args.stall_seconds),
+        seed=args.seed,
+        recordings=args.recordings,
+    )
+    print(f"Mock upstream on http://{args.host}:{args.port} — point the server at it with:")
+    print(f"  RA_MCP_UPSTREAM_URL=http://{args.host}:{args.port} uv run ra serve --port 7860")
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+    return 0
+
+
+def _load(args: argparse.Namespace) -> int:
+    result = asyncio.run(
+        run_load(
+            args.url,
+            concurrency=args.concurrency,
+            requests=args.requests,
+            duration=args.duration,
+            mix=args.mix,
+            seed=args.seed,
+            upstream=args.upstream,
+        )
+    )
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(result, indent=2, ensure_ascii=False))
+
+    print(f"{result['overall']['calls']} calls in {result['elapsed_s']} s — {result['throughput_rps']} calls/s, {result['overall']['errors']} errors\n")
+    print(f"{'tool':<22} {'calls':>6} {'errors':>6} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}  (ms)")
+    for tool, block in {**result["tools"], "overall": result["overall"]}.items():
+        latency = block["latency_ms"] or dict.fromkeys(("p50", "p90", "p99", "max"), 0.0)
+        print(
+            f"{tool:<22} {block['calls']:>6} {block['errors']:>6} {latency['p50']:>9.1f} {latency['p90']:>9.1f} {latency['p99']:>9.1f} {latency['max']:>9.1f}"
+        )
+    if "upstream" in result:
+        print(f"\nupstream requests: {result['upstream']['requests']}  injected errors: {result['upstream']['errors']}")
+    return 1 if result["overall"]["calls"] and result["overall"]["errors"] == result["overall"]["calls"] else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.mock_upstream", description="Offline Riksarkivet stand-in and MCP load generator")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    serve = sub.add_parser("serve", help="Run the mock upstream (set RA_MCP_UPSTREAM_URL on the MCP server to use it)")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--latency", type=Latency.parse, default=Latency(), help="Per-request latency: MEDIAN_MS or MEDIAN_MS:SIGMA (lognormal). Default: 0")
+    serve.add_argument(
+        "--host-latency", type=_host_latency, action="append", default=[], help="Per-host override, e.g. sok.riksarkivet.se=300:0.8 (repeatable)"
+    )
+    serve.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with an error status (default: 0)")
+    serve.add_argument("--error-status", type=int, nargs="+", default=[503], help="Statuses to draw injected errors from (default: 503)")
+    serve.add_argument("--stall-rate", type=float, default=0.0, help="Share of requests that hang before answering (default: 0)")
+    serve.add_argument("--stall-seconds", type=float, default=65.0, help="How long a stalled request hangs (default: 65, past the client timeout)")
+    serve.add_argument("--seed", type=int, default=0, help="Seed for latency and fault draws")
+    serve.add_argument("--recordings", type=Path, default=None, help="Directory of recorded responses served in preference to synthetic ones")
+    serve.set_defaults(func=_serve)
+
+    load = sub.add_parser("load", help="Drive an MCP HTTP endpoint and report throughput and latency percentiles")
+    load.add_argument("--url", default="http://localhost:7860/mcp", help="MCP endpoint (default: http://localhost:7860/mcp)")
+    load.add_argument("--concurrency", type=int, default=8, help="Virtual users, one MCP session each (default: 8)")
+    load.add_argument("--duration", type=float, default=30.0, help="Seconds to run (default: 30)")
+    load.add_argument("--requests", type=int, default=None, help="Stop after this many calls in total")
+    load.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX, help="Weighted tool mix, e.g. search_transcribed=5,browse_document=3,tora_search_tora=1")
+    load.add_argument("--seed", type=int, default=0, help="Seed for the call sequences")
+    load.add_argument("--upstream", default=None, help="Mock upstream URL; its request/error counters are added to the report")
+    load.add_argument("--output", type=Path, default=None, help="Write the result JSON here")
+    load.set_defaults(func=_load)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,464 @@
+"""ASGI stand-in for the Riksarkivet upstreams.
+
+Routes mirror what ``ra_mcp_common.upstream`` produces when
+``RA_MCP_UPSTREAM_URL`` points here: ``/{host}{path}``. Every response is
+synthetic and deterministic in the request (the same search or page always
+returns the same body), shaped like the live API so the real clients parse it:
+
+- ``data.riksarkivet.se/api/records`` — Search API JSON (``RecordsResponse``)
+- ``oai-pmh.riksarkivet.se/OAI`` — OAI-PMH ``GetRecord`` with an EAD record
+- ``lbiiif.riksarkivet.se/arkis!{id}/manifest`` and ``/collection/arkiv/{pid}`` — IIIF v3
+- ``sok.riksarkivet.se/dokument/alto/...`` — ALTO v4 page XML (404 past the last page)
+- ``tora.entryscape.net/store/sparql`` — SPARQL JSON results
+
+A recordings directory, if configured, takes precedence: ``{dir}/{host}{path}``
+(or ``...{path}?{sorted query}`` for query-addressed endpoints) is served as is.
+Latency is drawn per request from a lognormal distribution, optionally per host,
+and a configurable share of requests fail with an error status or stall.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import math
+import mimetypes
+import random
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlencode
+from xml.sax.saxutils import escape, quoteattr
+
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from ..dataset_search.synth import COUNTIES, PARISHES, TOWNS
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from starlette.requests import Request
+
+
+# Running words for synthetic transcriptions — early-modern court protocol register.
+_PROTOCOL_WORDS = [
+    "och", "att", "som", "till", "med", "hafwer", "uthi", "then", "thet", "sampt", "effter", "förmedelst", "Rätten",
+    "Tingz", "Häradzhöfding", "Nämbden", "Kongl", "May:tz", "befallning", "protocoll", "bonde", "hustru", "dräng",
+    "piga", "sochn", "gården", "tilstodh", "nekade", "wittnen", "eedh", "bötter", "daler", "Silfwermynt", "öre",
+    "skuld", "arf", "testamente", "trolldom", "Blåkulla", "stöld", "slagsmåhl", "ransakning", "dom", "afsades",
+]  # fmt: skip
+_TITLES = ["Domböcker", "Protokoll", "Mantalslängder", "Bouppteckningar", "Husförhörslängder", "Räkenskaper", "Brevkoncept", "Kyrkoböcker"]
+
+_JSON_HOSTS = {"data.riksarkivet.se", "lbiiif.riksarkivet.se", "tora.entryscape.net"}
+_TORA_NAME = re.compile(r'LCASE\(\?name\) = LCASE\("([^"]*)"\)')
+
+
+@dataclass(frozen=True)
+class Latency:
+    """Per-request latency: lognormal around ``median_ms`` with shape ``sigma`` (0 = fixed)."""
+
+    median_ms: float = 0.0
+    sigma: float = 0.0
+
+    @classmethod
+    def parse(cls, spec: str) -> Latency:
+        """``"120"`` (fixed 120 ms) or ``"120:0.6"`` (lognormal, median 120 ms, sigma 0.6)."""
+        median, _, sigma = spec.partition(":")
+        return cls(float(median), float(sigma or 0.0))
+
+    def draw(self, rng: random.Random) -> float:
+        """One latency sample, in seconds."""
+        if self.median_ms <= 0:
+            return 0.0
+        if self.sigma <= 0:
+            return self.median_ms / 1000
+        return rng.lognormvariate(math.log(self.median_ms), self.sigma) / 1000
+
+
+@dataclass(frozen=True)
+class Faults:
+    """Injected failures: ``error_rate`` of requests get one of ``error_statuses``; ``stall_rate`` hang."""
+
+    error_rate: float = 0.0
+    error_statuses: tuple[int, ...] = (503,)
+    stall_rate: float = 0.0
+    stall_seconds: float = 65.0
+
+
+@dataclass
+class MockConfig:
+    """Behaviour of the mock upstream."""
+
+    latency: Latency = field(default_factory=Latency)
+    host_latency: dict[str, Latency] = field(default_factory=dict)
+    faults: Faults = field(default_factory=Faults)
+    seed: int = 0
+    recordings: Path | None = None
+
+
+@dataclass
+class MockStats:
+    """Counters served at ``/_mock/stats``."""
+
+    requests: Counter[str] = field(default_factory=Counter)
+    errors: Counter[str] = field(default_factory=Counter)
+    stalls: Counter[str] = field(default_factory=Counter)
+    recorded: Counter[str] = field(default_factory=Counter)
+
+    def as_dict(self) -> dict[str, dict[str, int]]:
+        return {name: dict(getattr(self, name)) for name in ("requests", "errors", "stalls", "recorded")}
+
+
+# --- deterministic synthesis ---
+
+
+def _rng(*parts: object) -> random.Random:
+    """A generator seeded by the request, so identical requests get identical bodies."""
+    return random.Random(hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=16).digest())
+
+
+def manifest_id_for(reference_code: str) -> str:
+    """The ``R`` + 7-digit manifest id a reference code is digitised as."""
+    digest = int.from_bytes(hashlib.blake2b(reference_code.encode(), digest_size=8).digest())
+    return f"R{digest % 10_000_000:07d}"
+
+
+def page_count_for(manifest_id: str) -> int:
+    """Pages in a synthetic volume (20-400)."""
+    return 20 + _rng("pages", manifest_id).randrange(381)
+
+
+def _reference_code(rng: random.Random) -> str:
+    return f"SE/{rng.choice(['RA', 'ULA', 'GLA', 'VALA', 'HLA'])}/{rng.randrange(10_000, 999_999)}/{rng.randint(1, 60):02d}"
+
+
+def _sentence(rng: random.Random, words: int, term: str | None = None) -> str:
+    tokens = rng.choices(_PROTOCOL_WORDS, k=words)
+    if term:
+        tokens[rng.randrange(words)] = f"<em>{term}</em>"
+    return " ".join(tokens)
+
+
+def records_payload(params: dict[str, str]) -> dict[str, Any]:
+    """A Search API ``/api/records`` page for these query parameters."""
+    transcribed = params.get("transcribed_text")
+    term = transcribed or params.get("text") or params.get("name") or params.get("place") or ""
+    limit = int(params.get("limit", 50))
+    offset = int(params.get("offset", 0))
+    query_key = (term.lower(), params.get("only_digitised_materials"), params.get("year_min"), params.get("year_max"), params.get("sort", "relevance"))
+    total = 0 if "nomatch" in term.lower() else int(10 ** _rng("total", *query_key).uniform(0.5, 3.8))
+
+    items = []
+    words = term.strip("*~\"'0123456789").split()
+    highlight = words[0] if words else None
+    for position in range(offset, min(offset + limit, total)):
+        rng = _rng("record", *query_key, position)
+        reference_code = _reference_code(rng)
+        manifest_id = manifest_id_for(reference_code)
+        start_year = rng.randint(1550, 1900)
+        record_id = hashlib.blake2b(reference_code.encode(), digest_size=11).hexdigest()
+        item: dict[str, Any] = {
+            "id": record_id,
+            "objectType": "Record",
+            "type": rng.choice(["Volume", "Volume", "Dossier"]),
+            "caption": f"{rng.choice(_TITLES)} {start_year}",
+            "metadata": {
+                "referenceCode": reference_code,
+                "date": f"{start_year} - {start_year + rng.randint(0, 10)}",
+                "hierarchy": [{"caption": f"{rng.choice(PARISHES)} {rng.choice(['häradsrätt', 'kyrkoarkiv', 'rådhusrätt'])}"}],
+                "archivalInstitution": [{"caption": "Riksarkivet i Stockholm/Täby"}],
+                "note": _sentence(rng, 8),
+                "onlyDigitisedMaterials": True,
+            },
+            "_links": {
+                "self": f"https://data.riksarkivet.se/archive/{record_id}",
+                "html": f"https://sok.riksarkivet.se/arkiv/{record_id}",
+                "image": [f"https://lbiiif.riksarkivet.se/arkis!{manifest_id}/manifest"],
+            },
+        }
+        if transcribed:
+            pages = page_count_for(manifest_id)
+            hits = rng.randint(1, 25)
+            item["transcribedText"] = {
+                "numTotal": hits,
+                "snippets": [
+                    {
+                        "text": _sentence(rng, rng.randint(12, 30), highlight),
+                        "score": 0,
+                        "pages": [{"id": f"_{rng.randint(1, pages):05d}", "width": 4789, "height": 3691}],
+                    }
+                    for _ in range(min(hits, 5))
+                ],
+            }
+        items.append(item)
+    return {"totalHits": total, "hits": len(items), "offset": offset, "items": items}
+
+
+def oai_record_xml(identifier: str) -> str:
+    """An OAI-PMH ``GetRecord`` response with the EAD fields OAIPMHClient reads."""
+    rng = _rng("oai", identifier)
+    manifest_id = manifest_id_for(identifier)
+    start_year = rng.randint(1550, 1900)
+    title = f"{rng.choice(_TITLES)} {start_year}--{start_year + rng.randint(0, 10)}"
+    return f"""<?xml version="1.0" encoding="utf-8"?>
+<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">
+  <responseDate>2026-01-01T00:00:00Z</responseDate>
+  <request verb="GetRecord" identifier={quoteattr(identifier)} metadataPrefix="oai_ape_ead">https://oai-pmh.riksarkivet.se/OAI</request>
+  <GetRecord>
+    <record>
+      <header>
+        <identifier>{escape(identifier)}</identifier>
+        <datestamp>2025-03-27T16:21:42.223Z</datestamp>
+      </header>
+      <metadata>
+        <ead xmlns="urn:isbn:1-931666-22-9" xmlns:xlink="http://www.w3.org/1999/xlink">
+          <archdesc level="fonds">
+            <did>
+              <unitid>{escape(identifier)}</unitid>
+              <unittitle>{escape(title)}</unittitle>
+              <unitdate>{start_year}</unitdate>
+              <repository>Riksarkivet</repository>
+              <dao xlink:role="TEXT" xlink:href="https://sok.riksarkivet.se/bildvisning/{manifest_id}?partner=ape"/>
+              <dao xlink:role="MANIFEST" xlink:href="https://lbiiif.riksarkivet.se/arkis!{manifest_id}/manifest"/>
+            </did>
+            <scopecontent><p>{escape(_sentence(rng, 10))}</p></scopecontent>
+          </archdesc>
+        </ead>
+      </metadata>
+    </record>
+  </GetRecord>
+</OAI-PMH>
+"""
+
+
+def oai_error_xml(code: str, message: str) -> str:
+    return f"""<?xml version="1.0" encoding="utf-8"?>
+<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/"><error code={quoteattr(code)}>{escape(message)}</error></OAI-PMH>
+"""
+
+
+def manifest_payload(manifest_id: str) -> dict[str, Any]:
+    """A IIIF v3 manifest with one canvas (image + ALTO seeAlso) per page."""
+    canvases = []
+    for page in range(1, page_count_for(manifest_id) + 1):
+        page_id = f"{manifest_id}_{page:05d}"
+        canvases.append(
+            {
+                "id": f"https://lbiiif.riksarkivet.se/arkis!{page_id}/canvas",
+                "type": "Canvas",
+                "label": {"none": [str(page)]},
+                "width": 4789,
+                "height": 3691,
+                "items": [
+                    {
+                        "type": "AnnotationPage",
+                        "items": [
+                            {
+                                "type": "Annotation",
+                                "motivation": "painting",
+                                "body": {
+                                    "id": f"https://lbiiif.riksarkivet.se/arkis!{page_id}/full/max/0/default.jpg",
+                                    "type": "Image",
+                                    "format": "image/jpeg",
+                                },
+                            }
+                        ],
+                    }
+                ],
+                "seeAlso": [
+                    {
+                        "id": f"https://sok.riksarkivet.se/dokument/alto/{manifest_id[:4]}/{manifest_id}/{page_id}.xml",
+                        "type": "ALTO",
+                        "format": "application/xml",
+                    }
+                ],
+            }
+        )
+    return {
+        "@context": "http://iiif.io/api/presentation/3/context.json",
+        "id": f"https://lbiiif.riksarkivet.se/arkis!{manifest_id}/manifest",
+        "type": "Manifest",
+        "label": {"sv": [f"{_rng('title', manifest_id).choice(_TITLES)} ({manifest_id})"]},
+        "items": canvases,
+    }
+
+
+def collection_payload(pid: str) -> dict[str, Any]:
+    """A IIIF v3 collection listing one to three volume manifests."""
+    rng = _rng("collection", pid)
+    volumes = [pid] + [f"{pid}_{n}" for n in range(1, rng.randint(1, 3))]
+    return {
+        "@context": "http://iiif.io/api/presentation/3/context.json",
+        "id": f"https://lbiiif.riksarkivet.se/collection/arkiv/{pid}",
+        "type": "Collection",
+        "label": {"sv": [f"{rng.choice(_TITLES)} ({pid})"]},
+        "items": [
+            {"id": f"https://lbiiif.riksarkivet.se/arkis!{manifest_id_for(v)}/manifest", "type": "Manifest", "label": {"sv": [f"Volym {i}"]}}
+            for i, v in enumerate(volumes, start=1)
+        ],
+    }
+
+
+def alto_xml(page_id: str) -> str:
+    """ALTO v4 for one page: ~25-40 lines of running text; about one page in twenty is blank."""
+    rng = _rng("alto", page_id)
+    lines = [] if rng.random() < 0.05 else range(rng.randint(25, 40))
+    text_lines = []
+    for n in lines:
+        vpos = 200 + n * 90
+        words = rng.choices(_PROTOCOL_WORDS, k=rng.randint(5, 11))
+        strings = "".join(
+            f'<String HPOS="{400 + i * 180}" VPOS="{vpos}" WIDTH="170" HEIGHT="70" CONTENT={quoteattr(word)} WC="{rng.uniform(0.5, 1):.2f}"/>'
+            for i, word in enumerate(words)
+        )
+        text_lines.append(f'<TextLine HPOS="400" VPOS="{vpos}" WIDTH="{len(words) * 180}" HEIGHT="80" ID="{page_id}_line{n}">{strings}</TextLine>')
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<alto xmlns="http://www.loc.gov/standards/alto/ns-v4#">
+  <Description><MeasurementUnit>pixel</MeasurementUnit></Description>
+  <Layout>
+    <Page WIDTH="4789" HEIGHT="3691" ID="{page_id}">
+      <PrintSpace HPOS="334" VPOS="192" WIDTH="4154" HEIGHT="3307">
+        <TextBlock HPOS="334" VPOS="192" WIDTH="2066" HEIGHT="3059" ID="{page_id}_region0">{"".join(text_lines)}</TextBlock>
+      </PrintSpace>
+    </Page>
+  </Layout>
+</alto>
+"""
+
+
+def sparql_payload(query: str) -> dict[str, Any]:
+    """SPARQL JSON results: one to three settlements for a TORA name search, nothing otherwise."""
+    variables = ["place", "name", "lat", "long", "accuracy", "parish", "municipality", "county", "province"]
+    match = _TORA_NAME.search(query)
+    if not match:
+        return {"head": {"vars": []}, "results": {"bindings": []}}
+    name = match.group(1)
+    rng = _rng("tora", name.lower())
+    bindings = []
+    for _ in range(rng.randint(1, 3)):
+        county = rng.choice(COUNTIES)
+        values = {
+            "place": f"https://data.riksarkivet.se/tora/{rng.randrange(1, 60_000)}",
+            "name": name,
+            "lat": f"{rng.uniform(55.4, 67.5):.5f}",
+            "long": f"{rng.uniform(11.2, 23.8):.5f}",
+            "accuracy": f"https://data.riksarkivet.se/tora/coordinateaccuracy/{rng.choice(['high', 'low'])}",
+            "parish": rng.choice(PARISHES),
+            "municipality": rng.choice(TOWNS),
+            "county": f"{county} län",
+            "province": county,
+        }
+        bindings.append({var: {"type": "literal", "value": values[var]} for var in variables})
+    return {"head": {"vars": variables}, "results": {"bindings": bindings}}
+
+
+# --- ASGI app ---
+
+
+def _xml(body: str, status: int = 200) -> Response:
+    return Response(body, status_code=status, media_type="application/xml")
+
+
+async def _records(request: Request) -> Response:
+    return JSONResponse(records_payload(dict(request.query_params)))
+
+
+async def _oai(request: Request) -> Response:
+    params = request.query_params
+    if params.get("verb") != "GetRecord":
+        return _xml(oai_error_xml("badVerb", "Only GetRecord is mocked"))
+    identifier = params.get("identifier")
+    if not identifier:
+        return _xml(oai_error_xml("badArgument", "identifier is required"))
+    return _xml(oai_record_xml(identifier))
+
+
+async def _manifest(request: Request) -> Response:
+    return JSONResponse(manifest_payload(request.path_params["manifest"].removeprefix("arkis!")))
+
+
+async def _collection(request: Request) -> Response:
+    return JSONResponse(collection_payload(request.path_params["pid"]))
+
+
+async def _alto(request: Request) -> Response:
+    page_id = request.path_params["filename"].removesuffix(".xml")
+    manifest_id, _, page = page_id.rpartition("_")
+    if not page.isdigit() or not 1 <= int(page) <= page_count_for(manifest_id):
+        return Response("Not Found", status_code=404)
+    return _xml(alto_xml(page_id))
+
+
+async def _sparql(request: Request) -> Response:
+    query = (await request.form()).get("query") if request.method == "POST" else request.query_params.get("query")
+    return Response(json.dumps(sparql_payload(str(query or ""))), media_type="application/sparql-results+json")
+
+
+class _Upstream:
+    """Wraps each synthetic handler with recordings, latency and fault injection, and counts requests."""
+
+    def __init__(self, config: MockConfig) -> None:
+        self.config = config
+        self.stats = MockStats()
+        self._rng = random.Random(config.seed)
+
+    def route(self, host: str, path: str, handler: Callable[[Request], Awaitable[Response]], methods: list[str] | None = None) -> Route:
+        async def endpoint(request: Request) -> Response:
+            self.stats.requests[host] += 1
+            await asyncio.sleep(self.config.host_latency.get(host, self.config.latency).draw(self._rng))
+            faults = self.config.faults
+            if faults.stall_rate and self._rng.random() < faults.stall_rate:
+                self.stats.stalls[host] += 1
+                await asyncio.sleep(faults.stall_seconds)
+            if faults.error_rate and self._rng.random() < faults.error_rate:
+                self.stats.errors[host] += 1
+                return Response("injected upstream error", status_code=self._rng.choice(faults.error_statuses))
+            return self._recording(host, request) or await handler(request)
+
+        return Route(f"/{host}{path}", endpoint, methods=methods)
+
+    def _recording(self, host: str, request: Request) -> Response | None:
+        """The recorded response for this request, if the recordings directory has one."""
+        if self.config.recordings is None:
+            return None
+        root = self.config.recordings.resolve()
+        relative = request.url.path.lstrip("/")
+        candidates = [relative]
+        if request.query_params:
+            candidates.insert(0, f"{relative}?{urlencode(sorted(request.query_params.multi_items()))}")
+        for candidate in candidates:
+            path = (root / candidate).resolve()
+            if path.is_relative_to(root) and path.is_file():
+                self.stats.recorded[host] += 1
+                media_type = mimetypes.guess_type(path.name)[0] or ("application/json" if host in _JSON_HOSTS else "application/xml")
+                return Response(path.read_bytes(), media_type=media_type)
+        return None
+
+
+def create_app(config: MockConfig | None = None) -> Starlette:
+    """Build the mock upstream app."""
+    upstream = _Upstream(config or MockConfig())
+
+    async def mock_stats(_request: Request) -> Response:
+        return JSONResponse(upstream.stats.as_dict())
+
+    app = Starlette(
+        routes=[
+            Route("/_mock/stats", mock_stats),
+            upstream.route("data.riksarkivet.se", "/api/records", _records),
+            upstream.route("oai-pmh.riksarkivet.se", "/OAI", _oai),
+            upstream.route("lbiiif.riksarkivet.se", "/collection/arkiv/{pid}", _collection),
+            upstream.route("lbiiif.riksarkivet.se", "/{manifest}/manifest", _manifest),
+            upstream.route("sok.riksarkivet.se", "/dokument/alto/{prefix}/{volume}/{filename}", _alto),
+            upstream.route("tora.entryscape.net", "/store/sparql", _sparql, methods=["GET", "POST"]),
+        ]
+    )
+    app.state.config = upstream.config
+    app.state.stats = upstream.stats
+    return app
@@ -0,0 +1,163 @@
+"""Load generator for the MCP HTTP endpoint.
+
+Each virtual user opens its own MCP session (as separate chat clients would, so
+per-session state such as search dedup behaves as in production) and calls tools
+back to back, drawn from a weighted mix, until the request budget or the
+duration runs out. Reports throughput plus per-tool latency percentiles and
+error counts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+import httpx
+from fastmcp import Client
+
+from ..dataset_search.synth import PARISHES, SURNAMES
+from ..stats import summarize
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from fastmcp import FastMCP
+
+
+_KEYWORDS = ["trolldom", "Stockholm", "stöld", "testamente", "Blåkulla", "bouppteckning", "präst~1", "silfver*", "skuld", "nomatch"]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A tool call the load generator can make, with an argument generator."""
+
+    tool: str
+    arguments: Callable[[random.Random], dict[str, Any]]
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "search_transcribed": Scenario("search_transcribed", lambda rng: {"keyword": rng.choice(_KEYWORDS), "offset": rng.choice([0, 0, 0, 50]), "dedup": False}),
+    "search_metadata": Scenario("search_metadata", lambda rng: {"keyword": rng.choice(PARISHES), "offset": 0, "dedup": False}),
+    "browse_document": Scenario(
+        "browse_document",
+        lambda rng: {
+            "reference_code": f"SE/RA/{rng.randrange(10_000, 999_999)}/{rng.randint(1, 60):02d}",
+            "pages": f"{(start := rng.randint(1, 15))}-{start + rng.randint(0, 4)}",
+            "dedup": False,
+        },
+    ),
+    "tora_search_tora": Scenario("tora_search_tora", lambda rng: {"name": rng.choice(SURNAMES).removesuffix("son")}),
+}
+
+DEFAULT_MIX = {"search_transcribed": 5.0, "search_metadata": 2.0, "browse_document": 3.0}
+
+
+def parse_mix(spec: str) -> dict[str, float]:
+    """``"search_transcribed=5,browse_document=3"`` → ``{"search_transcribed": 5.0, ...}``."""
+    mix: dict[str, float] = {}
+    for part in spec.split(","):
+        tool, _, weight = part.strip().partition("=")
+        if tool not in SCENARIOS:
+            raise ValueError(f"Unknown tool {tool!r} (known: {', '.join(SCENARIOS)})")
+        mix[tool] = float(weight or 1.0)
+    return mix
+
+
+@dataclass
+class _Sample:
+    tool: str
+    ms: float
+    ok: bool
+
+
+async def run_load(
+    target: str | FastMCP,
+    *,
+    concurrency: int = 8,
+    requests: int | None = None,
+    duration: float | None = 30.0,
+    mix: Mapping[str, float] = DEFAULT_MIX,
+    seed: int = 0,
+    upstream: str | None = None,
+) -> dict[str, Any]:
+    """Drive the MCP server at *target* and summarise the calls.
+
+    Args:
+        target: MCP endpoint URL (e.g. ``http://localhost:7860/mcp``) or an in-process server.
+        concurrency: Virtual users, each with its own session.
+        requests: Stop after this many calls in total (``None`` = no limit).
+        duration: Stop after this many seconds (``None`` = no limit).
+        mix: Relative weight per scenario name (see ``SCENARIOS``).
+        seed: Seed for the per-user call sequences.
+        upstream: Mock upstream base URL; its ``/_mock/stats`` are fetched into the result.
+
+    Returns:
+        A JSON-serialisable result: config, elapsed time, throughput, and per-tool
+        and overall call counts, errors and latency percentiles (ms).
+
+    Raises:
+        ValueError: If neither ``requests`` nor ``duration`` bounds the run.
+    """
+    if requests is None and duration is None:
+        raise ValueError("Bound the run with requests and/or duration")
+    tools = list(mix)
+    weights = [mix[t] for t in tools]
+    samples: list[_Sample] = []
+    issued = 0
+    started = time.perf_counter()
+    deadline = started + duration if duration is not None else None
+
+    def _take() -> bool:
+        nonlocal issued
+        if deadline is not None and time.perf_counter() >= deadline:
+            return False
+        if requests is not None and issued >= requests:
+            return False
+        issued += 1
+        return True
+
+    async def user(index: int) -> None:
+        rng = random.Random(f"{seed}:{index}")
+        async with Client(target) as client:
+            while _take():
+                scenario = SCENARIOS[rng.choices(tools, weights)[0]]
+                call_started = time.perf_counter_ns()
+                try:
+                    result = await client.call_tool(scenario.tool, scenario.arguments(rng), raise_on_error=False)
+                    ok = not result.is_error
+                except Exception:
+                    ok = False
+                samples.append(_Sample(scenario.tool, (time.perf_counter_ns() - call_started) / 1e6, ok))
+
+    await asyncio.gather(*(user(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    by_tool: dict[str, list[_Sample]] = defaultdict(list)
+    for sample in samples:
+        by_tool[sample.tool].append(sample)
+
+    def _block(group: list[_Sample]) -> dict[str, Any]:
+        return {
+            "calls": len(group),
+            "errors": sum(not s.ok for s in group),
+            "latency_ms": summarize([s.ms for s in group]) if group else None,
+        }
+
+    result: dict[str, Any] = {
+        "created": datetime.now(UTC).isoformat(timespec="seconds"),
+        "config": {"concurrency": concurrency, "requests": requests, "duration": duration, "mix": dict(mix), "seed": seed},
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(samples) / elapsed, 2) if elapsed else 0.0,
+        "overall": _block(samples),
+        "tools": {tool: _block(group) for tool, group in sorted(by_tool.items())},
+    }
+    if upstream:
+        async with httpx.AsyncClient() as http:
+            result["upstream"] = (await http.get(f"{upstream.rstrip('/')}/_mock/stats")).json()
+    return result
@@ -0,0 +1,167 @@
+"""Per-call CPU time of read_pdf_page, before and after the precomputed page texts.
+
+"before" re-implements what the tool did on every call until
+``ra_mcp_pdf_mcp.pages``: strip the HTML of every block on the requested pages.
+"after" serves the same calls from ``page_texts``. Both run over a synthetic
+guide shaped like the real ones (a few hundred pages, a couple of dozen blocks
+each) and read the same random pages. The one-time cost of building the texts
+and the memory they hold are reported separately.
+
+    uv run python -m benchmarks.pdf_pages
+    uv run python -m benchmarks.pdf_pages --pages 500 --calls 5000 --output bench-results/pdf-pages.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from ra_mcp_pdf_mcp.pages import forget_page_texts, page_texts
+from ra_mcp_pdf_mcp.search import html_to_text
+
+from .stats import summarize
+
+
+_WORDS = ["kung", "riksdag", "kansli", "rådet", "landskap", "socken", "härad", "domstol", "protokoll", "bönder", "adel", "präst", "skatt", "fogde", "län"]
+
+
+def synth_guide(pages: int, blocks: int, seed: int) -> list[dict]:
+    """DataLab-style pages: headers and footers, section headers, paragraphs with inline markup, figures."""
+    rng = random.Random(seed)
+
+    def paragraph() -> str:
+        words = [rng.choice(_WORDS) for _ in range(rng.randint(40, 120))]
+        for i in range(0, len(words), 9):
+            words[i] = f"<b>{words[i]}</b>" if i % 2 else f"<i>{words[i]}</i>"
+        return f"<p>{' '.join(words)}</p>"
+
+    def block(index: int) -> dict:
+        if index == 0:
+            block_type, html = "PageHeader", "<p>Riksarkivet</p>"
+        elif index == blocks - 1:
+            block_type, html = "PageFooter", f"<p>{rng.randint(1, 500)}</p>"
+        elif index % 8 == 1:
+            block_type, html = "SectionHeader", f"<h2>{rng.choice(_WORDS).capitalize()} och {rng.choice(_WORDS)}</h2>"
+        elif index % 11 == 5:
+            block_type, html = "Figure", ""
+        else:
+            block_type, html = "Text", paragraph()
+        top = 40 + index * 30
+        return {"html": html, "bbox": [72.0, top, 523.5, top + 28], "block_type": block_type}
+
+    return [{"page": p, "bbox": [0, 0, 595, 842], "children": [block(i) for i in range(blocks)]} for p in range(pages)]
+
+
+def legacy_read_pdf_page(all_pages: list[dict], page: int, count: int) -> str:
+    output_parts: list[str] = []
+    for i in range(count):
+        page_idx = page - 1 + i
+        if page_idx < 0 or page_idx >= len(all_pages):
+            break
+        lines: list[str] = []
+        for block in all_pages[page_idx].get("children", []):
+            html = block.get("html", "")
+            if not html:
+                continue
+            block_type = block.get("block_type", "")
+            text = html_to_text(html)
+            if not text:
+                continue
+            if block_type == "SectionHeader":
+                lines.append(f"\n## {text}")
+            elif block_type in ("PageHeader", "PageFooter"):
+                continue
+            else:
+                lines.append(text)
+        page_text = "\n\n".join(lines).strip()
+        if page_text:
+            output_parts.append(f"--- Page {page_idx + 1}/{len(all_pages)} ---\n\n{page_text}")
+    return "\n\n".join(output_parts)
+
+
+def store_read_pdf_page(url: str, raw: list[dict], page: int, count: int) -> str:
+    all_pages = page_texts(url, raw)
+    output_parts = [
+        f"--- Page {index + 1}/{len(all_pages)} ---\n\n{all_pages[index]}"
+        for index in range(page - 1, min(page - 1 + count, len(all_pages)))
+        if all_pages[index]
+    ]
+    return "\n\n".join(output_parts)
+
+
+def _cpu_ms(calls: list[Callable[[], object]]) -> list[float]:
+    samples = []
+    for call in calls:
+        start = time.process_time_ns()
+        call()
+        samples.append((time.process_time_ns() - start) / 1e6)
+    return samples
+
+
+def run(pages: int, blocks: int, calls: int, seed: int) -> dict:
+    raw = synth_guide(pages, blocks, seed)
+    url = "bench://guide"
+    rng = random.Random(seed)
+    reads = [(rng.randint(1, pages), rng.randint(1, 5)) for _ in range(calls)]
+
+    # The outputs must not change; only the work per call does.
+    for page, count in reads[:50]:
+        if store_read_pdf_page(url, raw, page, count) != legacy_read_pdf_page(raw, page, count):
+            raise RuntimeError(f"read_pdf_page output differs for page={page} count={count}")
+
+    start = time.process_time_ns()
+    texts = page_texts("bench://build", raw)
+    build_ms = (time.process_time_ns() - start) / 1e6
+    forget_page_texts("bench://build")
+
+    results = {
+        "read_pdf_page": {
+            "before": summarize(_cpu_ms([lambda p=p, c=c: legacy_read_pdf_page(raw, p, c) for p, c in reads])),
+            "after": summarize(_cpu_ms([lambda p=p, c=c: store_read_pdf_page(url, raw, p, c) for p, c in reads])),
+        },
+    }
+    forget_page_texts(url)
+    return {
+        "pages": pages,
+        "blocks_per_page": blocks,
+        "calls": calls,
+        "store_build_ms": round(build_ms, 2),
+        # Held on top of the raw pages, which blocks_cache keeps either way.
+        "store_kb": round((sys.getsizeof(texts) + sum(sys.getsizeof(text) for text in texts)) / 1024, 1),
+        "raw_json_kb": round(len(json.dumps(raw)) / 1024, 1),
+        "cpu_ms": results,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.pdf_pages", description="Per-call CPU time of read_pdf_page, before and after the precomputed page texts"
+    )
+    parser.add_argument("--pages", type=int, default=255, help="pages in the synthetic guide")
+    parser.add_argument("--blocks", type=int, default=24, help="blocks per page")
+    parser.add_argument("--calls", type=int, default=2000, help="calls per tool and variant")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", type=Path, help="also write the results as JSON")
+    args = parser.parse_args()
+
+    result = run(args.pages, args.blocks, args.calls, args.seed)
+    print(f"{result['pages']} pages x {result['blocks_per_page']} blocks; texts built once in {result['store_build_ms']} ms")
+    print(f"texts hold {result['store_kb']} KB (the raw JSON is {result['raw_json_kb']} KB)")
+    print(f"\n{'tool':<16} {'variant':<8} {'p50':>9} {'p90':>9} {'p99':>9}  (CPU ms per call)")
+    for tool, variants in result["cpu_ms"].items():
+        for variant, summary in variants.items():
+            print(f"{tool:<16} {variant:<8} {summary['p50']:>9.4f} {summary['p90']:>9.4f} {summary['p99']:>9.4f}")
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(result, indent=2))
+        print(f"\nResults written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,124 @@
+"""CPU time and peak memory of formatting one dataset search page, before and after RecordPage.
+
+"before" is what the dataset searches did until they kept pages columnar:
+materialise the whole ranked set with ``to_pylist()``, slice the page, then
+``.get()`` each field per record. "page dicts" converts only the page to dicts,
+the cheapest dict path. "after" wraps the page's Arrow slice in a
+``RecordPage``. All three render through the same court-mcp shaped
+``render_record`` and ``format_results``.
+
+The ranked set is synthetic: ``--ranked`` rows of the rendered fields plus two
+wide text columns a real table carries but the formatter never shows. Peak
+memory is the tracemalloc peak of one formatted page, i.e. Python allocations;
+Arrow's own buffers are not included.
+
+    uv run python -m benchmarks.record_page
+    uv run python -m benchmarks.record_page --ranked 10000 --page 50 --output bench-results/record-page.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+
+from ra_mcp_common.formatting import append_if, truncate_text
+from ra_mcp_dataset_lib import RecordPage, SearchResult, format_results
+
+from .stats import summarize
+
+
+_FIELDS = ["id", "fnamn", "enamn", "titel", "roll", "socken", "plats", "datum", "arende", "anteckning"]
+
+
+def render(rec: Mapping[str, Any], lines: list[str]) -> None:
+    """A typical dataset render_record (court-mcp shape): ten .get() reads."""
+    lines.append(f"--- Domboksregister {rec.get('id', '?')} ---")
+    name = " ".join(p for p in (rec.get("fnamn", ""), rec.get("enamn", "")) if p)
+    append_if(lines, "Name", name)
+    for label, field in (("Title", "titel"), ("Role", "roll"), ("Parish", "socken"), ("Place", "plats"), ("Date", "datum"), ("Case", "arende")):
+        append_if(lines, label, rec.get(field, ""))
+    anteckning = rec.get("anteckning", "")
+    if anteckning:
+        lines.append(f"Note: {truncate_text(anteckning, 150)}")
+    lines.append("")
+
+
+def synth_ranked(ranked: int) -> pa.Table:
+    """A ranked FTS result set of *ranked* rows."""
+    rows = [
+        {
+            **{field: f"{field} värde {i}" for field in _FIELDS},
+            "searchable_text": f"hästar och hästen i socknen nummer {i} " * 20,
+            "fulltext": f"rättegång om hästen {i} " * 40,
+        }
+        for i in range(ranked)
+    ]
+    return pa.Table.from_pylist(rows)
+
+
+def _format(records: RecordPage | list[dict[str, Any]], total: int, page: int) -> str:
+    return format_results(SearchResult(records=records, total_hits=total, keyword="häst", offset=0, limit=page), label="Domboksregister", render_record=render)
+
+
+def variants(table: pa.Table, page: int) -> dict[str, Callable[[], str]]:
+    return {
+        "before": lambda: _format(table.to_pylist()[:page], table.num_rows, page),
+        "page dicts": lambda: _format(table.slice(0, page).to_pylist(), table.num_rows, page),
+        "after": lambda: _format(RecordPage(table.slice(0, page)), table.num_rows, page),
+    }
+
+
+def _measure(fmt: Callable[[], str], repeats: int) -> dict:
+    cpu_ms = []
+    for _ in range(repeats):
+        start = time.process_time_ns()
+        fmt()
+        cpu_ms.append((time.process_time_ns() - start) / 1e6)
+    tracemalloc.start()
+    fmt()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"cpu_ms": summarize(cpu_ms), "peak_mb": round(peak / 2**20, 2)}
+
+
+def run(ranked: int, page: int, repeats: int) -> dict:
+    table = synth_ranked(ranked)
+    paths = variants(table, page)
+    if len({fmt() for fmt in paths.values()}) != 1:
+        raise RuntimeError("the formatting paths rendered different text")
+    return {"ranked": ranked, "page": page, **{name: _measure(fmt, repeats) for name, fmt in paths.items()}}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.record_page",
+        description="CPU time and peak memory of formatting one dataset search page, before and after RecordPage",
+    )
+    parser.add_argument("--ranked", type=int, default=2000, help="rows in the ranked result set")
+    parser.add_argument("--page", type=int, default=100, help="records formatted (the page size)")
+    parser.add_argument("--repeats", type=int, default=20, help="formatted pages per variant for the CPU timings")
+    parser.add_argument("--output", type=Path, help="also write the results as JSON")
+    args = parser.parse_args()
+
+    result = run(args.ranked, args.page, args.repeats)
+    print(f"page of {result['page']} from {result['ranked']} ranked rows")
+    print(f"\n{'variant':<11} {'cpu p50':>9} {'cpu p90':>9} {'peak MB':>9}")
+    for variant in ("before", "page dicts", "after"):
+        summary = result[variant]
+        print(f"{variant:<11} {summary['cpu_ms']['p50']:>9.2f} {summary['cpu_ms']['p90']:>9.2f} {summary['peak_mb']:>9.2f}")
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(result, indent=2))
+        print(f"\nResults written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
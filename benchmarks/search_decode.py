@@ -0,0 +1,125 @@
+"""CPU time and peak memory of decoding one search response, before and after validating from bytes.
+
+"before" is what ``SearchClient.search`` did until it validated the body
+directly: ``json.loads`` the whole body into dicts, build ``RecordsResponse``
+from them, then cut every record's snippets down to
+``max_snippets_per_record``. "after" is the current path: one
+``RecordsResponse.model_validate_json`` call on the bytes, with the snippet
+limit passed as validation context so dropped snippets never become models.
+
+The response is synthetic but shaped like ``/api/records``: records copied
+from the search-lib test fixture, each with ``--snippets`` snippets (the first
+with regions and highlights, like the real API). Peak memory is the
+tracemalloc peak of one decode, i.e. Python allocations; the JSON parser's own
+buffers are not included.
+
+    uv run python -m benchmarks.search_decode
+    uv run python -m benchmarks.search_decode --records 1000 --snippets 30 --output bench-results/search-decode.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from ra_mcp_search_lib.models import RecordsResponse
+
+from .stats import summarize
+
+
+_FIXTURE = Path(__file__).resolve().parent.parent / "packages/libs/search-lib/tests/fixtures/search_response.json"
+
+
+def synth_response(records: int, snippets: int) -> bytes:
+    """A /api/records body with *records* items of *snippets* snippets each."""
+    template = json.loads(_FIXTURE.read_text())
+    first = template["items"][0]
+    items = []
+    for i in range(records):
+        item = copy.deepcopy(first)
+        item["id"] = f"rec{i:05d}"
+        item["metadata"]["referenceCode"] = f"SE/RA/BENCH/{i}"
+        base = item["transcribedText"]["snippets"]
+        item["transcribedText"]["snippets"] = [
+            {**copy.deepcopy(base[j % len(base)]), "pages": [{"id": f"_{j + 1:05d}", "width": 4789, "height": 3691}]} for j in range(snippets)
+        ]
+        item["transcribedText"]["numTotal"] = snippets * 2
+        items.append(item)
+    return json.dumps({**template, "items": items, "hits": records, "totalHits": records * 10}).encode()
+
+
+def decode_before(body: bytes, max_snippets: int | None) -> RecordsResponse:
+    response = RecordsResponse.model_validate(json.loads(body))
+    if max_snippets is not None:
+        for record in response.items:
+            if record.transcribed_text and record.transcribed_text.snippets:
+                record.transcribed_text.snippets = record.transcribed_text.snippets[:max_snippets]
+    return response
+
+
+def decode_after(body: bytes, max_snippets: int | None) -> RecordsResponse:
+    return RecordsResponse.model_validate_json(body, context={"max_snippets_per_record": max_snippets})
+
+
+def _measure(decode: Callable[[], RecordsResponse], repeats: int) -> dict:
+    cpu_ms = []
+    for _ in range(repeats):
+        start = time.process_time_ns()
+        decode()
+        cpu_ms.append((time.process_time_ns() - start) / 1e6)
+    tracemalloc.start()
+    decode()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"cpu_ms": summarize(cpu_ms), "peak_mb": round(peak / 2**20, 2)}
+
+
+def run(records: int, snippets: int, max_snippets: int | None, repeats: int) -> dict:
+    body = synth_response(records, snippets)
+    if decode_before(body, max_snippets) != decode_after(body, max_snippets):
+        raise RuntimeError("the two decode paths produced different responses")
+    return {
+        "records": records,
+        "snippets_per_record": snippets,
+        "max_snippets_per_record": max_snippets,
+        "body_mb": round(len(body) / 2**20, 2),
+        "before": _measure(lambda: decode_before(body, max_snippets), repeats),
+        "after": _measure(lambda: decode_after(body, max_snippets), repeats),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.search_decode",
+        description="CPU time and peak memory of decoding one search response, before and after validating from bytes",
+    )
+    parser.add_argument("--records", type=int, default=1000, help="records in the response (MAX_LIMIT is 1000)")
+    parser.add_argument("--snippets", type=int, default=20, help="snippets per record in the response")
+    parser.add_argument("--max-snippets", type=int, default=3, help="max_snippets_per_record (0 for unlimited)")
+    parser.add_argument("--repeats", type=int, default=20, help="decodes per variant for the CPU timings")
+    parser.add_argument("--output", type=Path, help="also write the results as JSON")
+    args = parser.parse_args()
+
+    result = run(args.records, args.snippets, args.max_snippets or None, args.repeats)
+    print(
+        f"{result['records']} records x {result['snippets_per_record']} snippets, {result['body_mb']} MB body, "
+        f"max_snippets_per_record={result['max_snippets_per_record']}"
+    )
+    print(f"\n{'variant':<8} {'cpu p50':>9} {'cpu p90':>9} {'peak MB':>9}")
+    for variant in ("before", "after"):
+        summary = result[variant]
+        print(f"{variant:<8} {summary['cpu_ms']['p50']:>9.2f} {summary['cpu_ms']['p90']:>9.2f} {summary['peak_mb']:>9.2f}")
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(result, indent=2))
+        print(f"\nResults written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
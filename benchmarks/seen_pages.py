@@ -0,0 +1,157 @@
+"""CPU time per call and memory of the search dedup state, before and after SeenPages.
+
+"before" is what ``search_transcribed`` did until ``ra_mcp_common.seen_pages``:
+load ``seen_search`` from the session state store (a py-key-value
+``MemoryStore``, which keeps values as JSON), merge the shown pages of each
+displayed document with ``sorted(set(...))``, and put the whole dict back.
+"after" updates the session's ``SeenPages`` in place. Both start from a session
+that already tracks ``--documents`` documents and then record ``--calls`` result
+pages of ``--shown`` documents each. A third of the shown documents are already
+tracked, like a researcher paging back over earlier hits.
+
+Memory is what tracemalloc sees each path retain for the final state: the
+MemoryStore entry (its JSON string) before, the SeenPages after. ``nbytes`` is
+SeenPages' own estimate, which its byte budget is checked against.
+
+    uv run python -m benchmarks.seen_pages
+    uv run python -m benchmarks.seen_pages --documents 5000 --calls 500 --output bench-results/seen-pages.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import time
+import tracemalloc
+from pathlib import Path
+
+from key_value.aio.stores.memory import MemoryStore
+
+from ra_mcp_common.seen_pages import SeenPages
+
+from .stats import summarize
+
+
+def synth_calls(documents: int, calls: int, shown: int, seed: int) -> tuple[dict[str, list[int]], list[list[tuple[str, list[int]]]]]:
+    """A session's existing state, and the (reference code, pages) shown by each later call."""
+    rng = random.Random(seed)
+
+    def pages() -> list[int]:
+        return sorted(rng.sample(range(1, 800), rng.randint(1, 3)))
+
+    existing = {f"SE/RA/{i}": pages() for i in range(documents)}
+    fresh = iter(range(documents, documents + calls * shown))
+    batches = [[(f"SE/RA/{rng.randrange(documents)}" if rng.random() < 1 / 3 else f"SE/RA/{next(fresh)}", pages()) for _ in range(shown)] for _ in range(calls)]
+    return existing, batches
+
+
+async def legacy_call(store: MemoryStore, batch: list[tuple[str, list[int]]]) -> None:
+    entry = await store.get("session:seen_search")
+    seen: dict[str, list[int]] = entry["value"] if entry else {}
+    for reference_code, pages in batch:
+        existing = set(seen.get(reference_code, []))
+        existing.update(pages)
+        seen[reference_code] = sorted(existing)
+    await store.put("session:seen_search", {"value": seen})
+
+
+def compact_call(seen: SeenPages, batch: list[tuple[str, list[int]]]) -> None:
+    for reference_code, pages in batch:
+        seen.add(reference_code, pages)
+
+
+async def run(documents: int, calls: int, shown: int, seed: int) -> dict:
+    existing, batches = synth_calls(documents, calls, shown, seed)
+    store = MemoryStore()
+    await store.put("session:seen_search", {"value": existing})
+    seen = SeenPages(max_bytes=1 << 30)
+    for reference_code, pages in existing.items():
+        seen.add(reference_code, pages)
+
+    before: list[float] = []
+    after: list[float] = []
+    for batch in batches:
+        start = time.process_time_ns()
+        await legacy_call(store, batch)
+        before.append((time.process_time_ns() - start) / 1e6)
+        start = time.process_time_ns()
+        compact_call(seen, batch)
+        after.append((time.process_time_ns() - start) / 1e6)
+
+    entry = await store.get("session:seen_search")
+    legacy = entry["value"] if entry else {}
+    if {code: set(pages) for code, pages in legacy.items()} != {code: set(pages) for code, pages in seen.items()}:
+        raise RuntimeError("the two paths recorded different pages")
+    documents_at_end, nbytes = len(seen), seen.nbytes()
+    before_kb, after_kb = await retained_kb(legacy)
+    return {
+        "documents_at_start": documents,
+        "documents_at_end": documents_at_end,
+        "calls": calls,
+        "shown_per_call": shown,
+        "cpu_ms": {"before": summarize(before), "after": summarize(after)},
+        "state_kb": {"before": before_kb, "after": after_kb, "after_nbytes": round(nbytes / 1024, 1)},
+    }
+
+
+async def retained_kb(state: dict[str, list[int]]) -> tuple[float, float]:
+    """KB tracemalloc sees retained by each path holding *state*, built from fresh objects.
+
+    The reference codes are renamed (same length) so that SeenPages cannot reuse
+    the strings ``run`` already interned and leave them out of the count.
+    """
+    encoded = json.dumps(state).replace("SE/RA/", "SE/RM/")
+    sizes = []
+    for build in (_build_legacy, _build_compact):
+        tracemalloc.start()
+        fresh = json.loads(encoded)
+        held = await build(fresh)
+        del fresh
+        sizes.append(round(tracemalloc.get_traced_memory()[0] / 1024, 1))
+        tracemalloc.stop()
+        del held
+    return sizes[0], sizes[1]
+
+
+async def _build_legacy(state: dict[str, list[int]]) -> MemoryStore:
+    store = MemoryStore()
+    await store.put("session:seen_search", {"value": state})
+    return store
+
+
+async def _build_compact(state: dict[str, list[int]]) -> SeenPages:
+    seen = SeenPages(max_bytes=1 << 30)
+    for reference_code, pages in state.items():
+        seen.add(reference_code, pages)
+    return seen
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.seen_pages", description="CPU time per call and memory of the search dedup state, before and after SeenPages"
+    )
+    parser.add_argument("--documents", type=int, default=3000, help="documents the session tracks before the first measured call")
+    parser.add_argument("--calls", type=int, default=300, help="measured search calls")
+    parser.add_argument("--shown", type=int, default=25, help="documents shown per call")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", type=Path, help="also write the results as JSON")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args.documents, args.calls, args.shown, args.seed))
+    print(f"{result['documents_at_start']} → {result['documents_at_end']} documents tracked over {result['calls']} calls of {result['shown_per_call']}")
+    print(f"\n{'variant':<8} {'p50':>9} {'p90':>9} {'p99':>9}  (CPU ms per call)")
+    for variant, summary in result["cpu_ms"].items():
+        print(f"{variant:<8} {summary['p50']:>9.3f} {summary['p90']:>9.3f} {summary['p99']:>9.3f}")
+    state = result["state_kb"]
+    print(f"\nstate retained: {state['before']} KB before, {state['after']} KB after (nbytes estimate {state['after_nbytes']} KB)")
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(result, indent=2))
+        print(f"\nResults written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
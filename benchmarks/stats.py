@@ -0,0 +1,27 @@
+"""Latency summaries shared by the benchmarks."""
+
+from __future__ import annotations
+
+import statistics
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+def summarize(samples_ms: Sequence[float]) -> dict[str, float]:
+    """min / mean / p50 / p90 / p99 / max of a list of millisecond timings."""
+    ordered = sorted(samples_ms)
+    if len(ordered) == 1:
+        only = round(ordered[0], 4)
+        return {"min": only, "mean": only, "p50": only, "p90": only, "p99": only, "max": only}
+    cuts = statistics.quantiles(ordered, n=100, method="inclusive")
+    return {
+        "min": round(ordered[0], 4),
+        "mean": round(statistics.fmean(ordered), 4),
+        "p50": round(cuts[49], 4),
+        "p90": round(cuts[89], 4),
+        "p99": round(cuts[98], 4),
+        "max": round(ordered[-1], 4),
+    }
@@ -7,7 +7,7 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from ra_mcp_dataset_lib import build_fts_index
+from ra_mcp_dataset_lib import RenderRecord, add_display_text, build_fts_index
 
 from .config import BOLAG_TABLE, STYRELSE_TABLE
 from .models import AktiebolagRecord, StyrelseRecord
@@ -72,6 +72,9 @@ def ingest_aktiebolag(
     db: lancedb.DBConnection,
     bolag_path: str | Path,
     styrelse_path: str | Path,
+    *,
+    render_bolag: RenderRecord | None = None,
+    render_styrelse: RenderRecord | None = None,
 ) -> tuple[lancedb.table.Table, lancedb.table.Table]:
     """Ingest Aktiebolag and Styrelsemedlemmar into LanceDB tables with FTS indexes.
 
@@ -82,6 +85,9 @@ def ingest_aktiebolag(
         db: LanceDB database connection.
         bolag_path: Path to AKTIEBOLAG.txt (semicolon-delimited, latin-1).
         styrelse_path: Path to STYRELSEMEDLEMMAR.txt (semicolon-delimited, latin-1).
+        render_bolag: Optional company renderer (the formatter's ``render_record``); when given,
+            each record's display block is precomputed into the ``display_text`` column.
+        render_styrelse: Optional board-member renderer, as ``render_bolag``.
 
     Returns:
         Tuple of (bolag_table, styrelse_table).
@@ -120,6 +126,8 @@ def ingest_aktiebolag(
 
     logger.info("Parsed %d Aktiebolag records", len(bolag_records))
 
+    if render_bolag is not None:
+        add_display_text(bolag_records, render_bolag)
     bolag_table = db.create_table(BOLAG_TABLE, data=bolag_records, mode="overwrite")
     bolag_table = build_fts_index(db, BOLAG_TABLE)
 
@@ -144,6 +152,8 @@ def ingest_aktiebolag(
 
     logger.info("Parsed %d Styrelse records", len(styrelse_records))
 
+    if render_styrelse is not None:
+        add_display_text(styrelse_records, render_styrelse)
     styrelse_table = db.create_table(STYRELSE_TABLE, data=styrelse_records, mode="overwrite")
     styrelse_table = build_fts_index(db, STYRELSE_TABLE)
 
@@ -0,0 +1,113 @@
+"""
+Registry of the process-level caches, for inspection and invalidation.
+
+Modules that keep a cache register it once at import with a stats callback and
+an invalidate callback (either may be sync or async)::
+
+    register_cache("pdf.bytes", stats=pdf_cache.stats, invalidate=pdf_cache.invalidate)
+
+The server's ``/admin/caches`` route reads :func:`cache_stats` and calls
+:func:`invalidate_cache`. Invalidation takes an exact key, a prefix ending in
+``*``, or ``None`` for everything; :func:`key_matches` implements that rule for
+callbacks.
+"""
+
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+
+logger = logging.getLogger("ra_mcp.cache_registry")
+
+
+@dataclass
+class CacheStats:
+    """A snapshot of one cache. Counters a cache does not track stay ``None``."""
+
+    entries: int
+    bytes: int | None = None
+    hits: int | None = None
+    misses: int | None = None
+    evictions: int | None = None
+    # Hottest (or, for plain LRUs, most recently used) keys first: {"key": ..., "hits": ..., ...}
+    top_keys: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def hit_ratio(self) -> float | None:
+        """``hits / (hits + misses)``, or None when not tracked or nothing was looked up yet."""
+        if self.hits is None or self.misses is None or not self.hits + self.misses:
+            return None
+        return self.hits / (self.hits + self.misses)
+
+    def as_dict(self) -> dict[str, Any]:
+        """JSON-ready form, including the hit ratio."""
+        return asdict(self) | {"hit_ratio": self.hit_ratio}
+
+
+type StatsCallback = Callable[[], CacheStats | Awaitable[CacheStats]]
+type InvalidateCallback = Callable[[str | None], int | Awaitable[int]]
+
+
+@dataclass(frozen=True)
+class _Registration:
+    stats: StatsCallback
+    invalidate: InvalidateCallback
+
+
+_caches: dict[str, _Registration] = {}
+
+
+def register_cache(name: str, *, stats: StatsCallback, invalidate: InvalidateCallback) -> None:
+    """Register (or replace) the cache called *name*."""
+    _caches[name] = _Registration(stats, invalidate)
+    logger.debug("Registered cache %s", name)
+
+
+def unregister_cache(name: str) -> None:
+    """Forget *name*; unknown names are ignored."""
+    _caches.pop(name, None)
+
+
+def registered_caches() -> list[str]:
+    """Names of the registered caches, sorted."""
+    return sorted(_caches)
+
+
+async def cache_stats(name: str) -> CacheStats:
+    """Current statistics of *name*.
+
+    Raises:
+        KeyError: If no cache is registered under *name*.
+    """
+    stats = _caches[name].stats()
+    return stats if isinstance(stats, CacheStats) else await stats
+
+
+async def invalidate_cache(name: str, key: str | None = None) -> int:
+    """Drop *key* (exact, or a prefix ending in ``*``) or every entry from *name*.
+
+    Returns:
+        The number of entries removed.
+
+    Raises:
+        KeyError: If no cache is registered under *name*.
+    """
+    result = _caches[name].invalidate(key)
+    removed = result if isinstance(result, int) else await result
+    logger.info("Invalidated %d entries of cache %s (key=%s)", removed, name, key or "*")
+    return removed
+
+
+def key_matches(key: str, pattern: str | None) -> bool:
+    """Whether *key* is selected by an invalidation *pattern* (see module docstring)."""
+    if pattern is None:
+        return True
+    if pattern.endswith("*"):
+        return key.startswith(pattern[:-1])
+    return key == pattern
+
+
+def matching_keys(keys: Iterable[str], pattern: str | None) -> list[str]:
+    """The subset of *keys* selected by *pattern*."""
+    return [key for key in keys if key_matches(key, pattern)]
@@ -0,0 +1,221 @@
+"""
+Record/replay cassette for upstream HTTP traffic.
+
+A cassette is a single SQLite file holding request → response pairs (status,
+headers, zlib-compressed body and the time the response took). It plugs in as
+an httpx transport, so everything above it — HTTPClient's retries, logging and
+telemetry — runs unchanged:
+
+- ``record``: every request goes to the network and its response is stored
+  (overwriting an earlier recording of the same request).
+- ``replay``: responses come from the cassette only; a request that was never
+  recorded raises ``CassetteMiss``. No network access.
+- ``auto``: replay what was recorded, record the rest.
+
+Replay can reproduce the recorded latency, scaled by ``latency_scale``
+(0 = serve immediately, 1 = as recorded).
+
+Requests are matched on method, URL (query parameters in sorted order) and
+body, not on headers. Configure the shared clients with
+``RA_MCP_CASSETTE=<path>`` and ``RA_MCP_CASSETTE_MODE`` /
+``RA_MCP_CASSETTE_LATENCY_SCALE``, or pass a ``Cassette`` to ``HTTPClient``.
+The transport runs its SQLite lookups and writes in a worker thread, off the
+event loop.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal
+from urllib.parse import parse_qsl, urlencode
+
+import httpx
+
+from ra_mcp_common.settings import settings
+from ra_mcp_common.telemetry import get_meter
+
+
+logger = logging.getLogger("ra_mcp.cassette")
+
+_meter = get_meter("ra_mcp.cassette")
+_lookup_counter = _meter.create_counter("ra_mcp.http.cassette", unit="{request}", description="Cassette outcomes (hit, miss, recorded)")
+
+type CassetteMode = Literal["record", "replay", "auto"]
+
+# Not meaningful on replay: connection management, per-response dates/cookies, and the
+# encoding/length of the original wire body (the stored body is already decoded).
+_DROPPED_HEADERS = frozenset(
+    {"connection", "keep-alive", "transfer-encoding", "content-encoding", "content-length", "date", "set-cookie", "age", "alt-svc", "server-timing"}
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS interactions (
+    key TEXT PRIMARY KEY,
+    method TEXT NOT NULL,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    elapsed REAL NOT NULL,
+    recorded_at REAL NOT NULL
+)
+"""
+
+
+class CassetteMiss(httpx.TransportError):
+    """A replay-mode request that is not in the cassette."""
+
+
+@dataclass(frozen=True)
+class Interaction:
+    """One recorded request → response pair."""
+
+    method: str
+    url: str
+    status: int
+    headers: list[tuple[str, str]]
+    body: bytes
+    elapsed: float  # seconds from sending the request to the full body
+    recorded_at: float
+
+
+def request_key(method: str, url: httpx.URL | str, body: bytes = b"") -> str:
+    """Stable identity of a request: method, URL with sorted query, and body digest."""
+    url = httpx.URL(url)
+    query = urlencode(sorted(parse_qsl(url.query.decode(), keep_blank_values=True)))
+    canonical = f"{method.upper()} {url.copy_with(query=query.encode() or None)}"
+    if body:
+        canonical += f" {hashlib.sha256(body).hexdigest()}"
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class Cassette:
+    """SQLite-backed store of recorded interactions.
+
+    Args:
+        path: Cassette file; created (with parent directories) if missing.
+        mode: ``record``, ``replay`` or ``auto`` (see module docstring).
+        latency_scale: On replay, sleep ``elapsed * latency_scale`` before answering.
+    """
+
+    def __init__(self, path: Path | str, *, mode: CassetteMode = "replay", latency_scale: float = 0.0):
+        self.path = Path(path)
+        self.mode: CassetteMode = mode
+        self.latency_scale = latency_scale
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(_SCHEMA)
+        self._db.commit()
+
+    def get(self, key: str) -> Interaction | None:
+        """The interaction recorded under *key*, if any."""
+        with self._lock:
+            row = self._db.execute("SELECT method, url, status, headers, body, elapsed, recorded_at FROM interactions WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        method, url, status, headers, body, elapsed, recorded_at = row
+        return Interaction(method, url, status, [tuple(h) for h in json.loads(headers)], zlib.decompress(body), elapsed, recorded_at)
+
+    def put(self, key: str, interaction: Interaction) -> None:
+        """Store *interaction* under *key*, replacing any earlier recording."""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO interactions VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    interaction.method,
+                    interaction.url,
+                    interaction.status,
+                    json.dumps(interaction.headers),
+                    zlib.compress(interaction.body, 6),
+                    interaction.elapsed,
+                    interaction.recorded_at,
+                ),
+            )
+            self._db.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM interactions").fetchone()[0]
+
+    def transport(self, inner: httpx.AsyncBaseTransport | None = None) -> "CassetteTransport":
+        """An httpx transport recording through / replaying from this cassette."""
+        return CassetteTransport(self, inner or httpx.AsyncHTTPTransport())
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._db.close()
+
+
+class CassetteTransport(httpx.AsyncBaseTransport):
+    """httpx transport that records to or replays from a ``Cassette``."""
+
+    def __init__(self, cassette: Cassette, inner: httpx.AsyncBaseTransport):
+        self.cassette = cassette
+        self.inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        key = request_key(request.method, request.url, body)
+
+        if self.cassette.mode != "record":
+            interaction = await asyncio.to_thread(self.cassette.get, key)
+            if interaction is not None:
+                _lookup_counter.add(1, {"cassette.outcome": "hit"})
+                if self.cassette.latency_scale > 0:
+                    await asyncio.sleep(interaction.elapsed * self.cassette.latency_scale)
+                return httpx.Response(
+                    interaction.status, headers=interaction.headers, content=interaction.body, request=request, extensions={"cassette": "hit"}
+                )
+            if self.cassette.mode == "replay":
+                _lookup_counter.add(1, {"cassette.outcome": "miss"})
+                raise CassetteMiss(f"No recorded response for {request.method} {request.url} in {self.cassette.path}", request=request)
+
+        started = time.perf_counter()
+        response = await self.inner.handle_async_request(request)
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        elapsed = time.perf_counter() - started
+
+        headers = [(name, value) for name, value in response.headers.multi_items() if name.lower() not in _DROPPED_HEADERS]
+        await asyncio.to_thread(
+            self.cassette.put, key, Interaction(request.method, str(request.url), response.status_code, headers, content, elapsed, time.time())
+        )
+        _lookup_counter.add(1, {"cassette.outcome": "recorded"})
+        logger.debug("Recorded %s %s (%d, %.3fs)", request.method, request.url, response.status_code, elapsed)
+        return httpx.Response(response.status_code, headers=headers, content=content, request=request, extensions={"cassette": "recorded"})
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+_shared: Cassette | None = None
+
+
+def configured_cassette() -> Cassette | None:
+    """The cassette named by ``RA_MCP_CASSETTE`` (one shared instance), or None."""
+    global _shared
+    if settings.cassette is None:
+        return None
+    if _shared is None or _shared.path != settings.cassette:
+        _shared = Cassette(settings.cassette, mode=settings.cassette_mode, latency_scale=settings.cassette_latency_scale)
+        logger.info("HTTP cassette %s in %s mode", settings.cassette, settings.cassette_mode)
+    return _shared
+
+
+def cassette_transport(inner: httpx.AsyncBaseTransport) -> httpx.AsyncBaseTransport:
+    """Wrap *inner* in the configured cassette, or return it unchanged when none is set."""
+    cassette = configured_cassette()
+    return cassette.transport(inner) if cassette is not None else inner
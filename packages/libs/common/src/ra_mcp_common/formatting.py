@@ -115,3 +115,40 @@ def highlight_keyword_markdown(text_content: str, search_keyword: str) -> str:
         return text_content
     keyword_pattern = re.compile(re.escape(search_keyword), re.IGNORECASE)
     return keyword_pattern.sub(lambda match: f"**{match.group()}**", text_content)
+
+
+# Response sizes are estimated at four characters per token, the estimate the
+# tools' max_response_tokens parameters have always used.
+CHARS_PER_TOKEN = 4
+
+
+class TokenBudget:
+    """The part of a response's token budget left while it is rendered record by record.
+
+    A formatter renders each record into its own list of lines and keeps it
+    only if ``fits()`` says so. Once a record does not fit, the formatter stops
+    and reports how many records it left out. Records are never cut in half,
+    and nothing past the budget is rendered. The first record always fits, so a
+    page never comes back empty because one record is large.
+    ``max_tokens=None`` means no limit.
+    """
+
+    def __init__(self, max_tokens: int | None = None):
+        self.remaining = None if max_tokens is None else max_tokens * CHARS_PER_TOKEN
+        self._records = 0
+
+    def charge(self, lines: list[str]) -> None:
+        """Count lines that are always part of the response (headers, footers) against the budget."""
+        if self.remaining is not None:
+            self.remaining -= sum(len(line) + 1 for line in lines)
+
+    def fits(self, lines: list[str]) -> bool:
+        """Whether one more record's *lines* fit; if so they are counted against the budget."""
+        self._records += 1
+        if self.remaining is None:
+            return True
+        size = sum(len(line) + 1 for line in lines)
+        if size > self.remaining and self._records > 1:
+            return False
+        self.remaining -= size
+        return True
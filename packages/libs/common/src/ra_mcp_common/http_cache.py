@@ -0,0 +1,255 @@
+"""
+Shared cache of upstream HTTP responses.
+
+A single SQLite file (WAL mode) of successful ``GET`` responses, plugged in as
+an httpx transport like the cassette. Several server processes can open the
+same file, which is how ``ra serve --workers N`` lets its workers share
+manifests, ALTO pages and search responses instead of each fetching and caching
+its own copy.
+
+Only ``200`` responses to ``GET`` requests without a body are stored, and not
+when the upstream says ``Cache-Control: no-store`` or ``private``. Entries
+expire ``ttl`` seconds after they were stored. Once the file holds more than
+``max_bytes`` of (compressed) bodies, the least recently used entries are
+dropped. Hits only note when an entry was used; those times are written in one
+batch with the next store (or every ``_TOUCH_BATCH`` hits). The byte total is
+kept as a running count and re-read from the file only when it goes over
+``max_bytes``, since other processes evict too.
+
+The transport, ``stats`` and ``invalidate`` run every SQLite call in a worker
+thread, off the event loop.
+
+Configure the shared clients with ``RA_MCP_HTTP_CACHE=<path>`` plus
+``RA_MCP_HTTP_CACHE_TTL`` / ``RA_MCP_HTTP_CACHE_MAX_MB``, or wrap a transport
+with ``HTTPCache.transport``.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+
+import httpx
+
+from ra_mcp_common.cache_registry import CacheStats, key_matches, register_cache
+from ra_mcp_common.cassette import request_key
+from ra_mcp_common.settings import settings
+from ra_mcp_common.telemetry import get_meter
+
+
+logger = logging.getLogger("ra_mcp.http_cache")
+
+_meter = get_meter("ra_mcp.http_cache")
+_lookup_counter = _meter.create_counter("ra_mcp.http.cache", unit="{request}", description="Shared HTTP cache outcomes (hit, miss, stored)")
+
+# Not meaningful on a cached response: connection management, per-response dates/cookies,
+# and the encoding/length of the original wire body (the stored body is already decoded).
+_DROPPED_HEADERS = frozenset(
+    {"connection", "keep-alive", "transfer-encoding", "content-encoding", "content-length", "date", "set-cookie", "age", "alt-svc", "server-timing"}
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    used_at REAL NOT NULL
+)
+"""
+
+# Hits whose used_at times are held in memory before they are written out.
+_TOUCH_BATCH = 64
+
+
+def _cacheable(response: httpx.Response) -> bool:
+    directives = {part.strip().lower() for part in response.headers.get("cache-control", "").split(",")}
+    return response.status_code == 200 and not directives & {"no-store", "private"}
+
+
+class HTTPCache:
+    """SQLite-backed response cache that several processes can share.
+
+    Args:
+        path: Cache file; created (with parent directories) if missing.
+        ttl: Seconds a stored response is served.
+        max_bytes: Bound on the stored (compressed) body bytes.
+    """
+
+    def __init__(self, path: Path | str, *, ttl: float = 300, max_bytes: int = 512 * 1024 * 1024):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Other processes write to the same file; wait for their locks instead of failing.
+        self._db = sqlite3.connect(self.path, check_same_thread=False, timeout=10)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(_SCHEMA)
+        self._db.commit()
+        self._bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        # key -> last hit time, not yet written to used_at
+        self._touched: dict[str, float] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> tuple[list[tuple[str, str]], bytes] | None:
+        """Headers and body stored under *key*, unless missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT headers, body FROM responses WHERE key = ? AND expires_at > ?", (key, now)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touched[key] = now
+            if len(self._touched) >= _TOUCH_BATCH:
+                self._flush_touched()
+                self._db.commit()
+        headers, body = row
+        return [tuple(h) for h in json.loads(headers)], zlib.decompress(body)
+
+    def put(self, key: str, url: str, headers: list[tuple[str, str]], body: bytes) -> None:
+        """Store a response under *key*, then trim the file back to ``max_bytes``."""
+        compressed = zlib.compress(body, 6)
+        now = time.time()
+        with self._lock:
+            self._touched.pop(key, None)
+            self._flush_touched()
+            previous = self._db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, url, json.dumps(headers), compressed, len(compressed), now + self.ttl, now),
+            )
+            self._bytes += len(compressed) - (previous[0] if previous else 0)
+            self._evict(now)
+            self._db.commit()
+
+    def _flush_touched(self) -> None:
+        """Write the pending hit times to ``used_at`` (the caller commits)."""
+        if self._touched:
+            self._db.executemany("UPDATE responses SET used_at = ? WHERE key = ?", [(used_at, key) for key, used_at in self._touched.items()])
+            self._touched.clear()
+
+    def _evict(self, now: float) -> None:
+        """Drop expired rows, then least recently used ones while over the byte bound."""
+        expired = self._db.execute("DELETE FROM responses WHERE expires_at <= ? RETURNING size", (now,)).fetchall()
+        removed = len(expired)
+        self._bytes -= sum(size for (size,) in expired)
+        if self._bytes > self.max_bytes:
+            # Other processes sharing the file store and evict too; count before dropping anything.
+            self._bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY used_at").fetchall():
+                if self._bytes <= self.max_bytes:
+                    break
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._bytes -= size
+                removed += 1
+        if removed:
+            self.evictions += removed
+            logger.debug("HTTP cache evicted %d responses (%d bytes held)", removed, self._bytes)
+
+    async def stats(self) -> CacheStats:
+        """Registry snapshot; entries and bytes cover every process sharing the file."""
+        return await asyncio.to_thread(self._stats)
+
+    def _stats(self) -> CacheStats:
+        with self._lock:
+            self._flush_touched()
+            self._db.commit()
+            entries, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            recent = self._db.execute("SELECT url FROM responses ORDER BY used_at DESC LIMIT 10").fetchall()
+        return CacheStats(
+            entries=entries, bytes=size, hits=self.hits, misses=self.misses, evictions=self.evictions, top_keys=[{"key": url} for (url,) in recent]
+        )
+
+    async def invalidate(self, pattern: str | None = None) -> int:
+        """Drop responses whose URL matches *pattern* (exact URL, ``prefix*`` or everything)."""
+        return await asyncio.to_thread(self._invalidate, pattern)
+
+    def _invalidate(self, pattern: str | None) -> int:
+        with self._lock:
+            rows = [(url, size) for url, size in self._db.execute("SELECT url, size FROM responses").fetchall() if key_matches(url, pattern)]
+            self._db.executemany("DELETE FROM responses WHERE url = ?", [(url,) for url, _ in rows])
+            self._db.commit()
+            self._bytes -= sum(size for _, size in rows)
+        return len(rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def transport(self, inner: httpx.AsyncBaseTransport | None = None) -> "HTTPCacheTransport":
+        """An httpx transport serving from / storing into this cache."""
+        return HTTPCacheTransport(self, inner or httpx.AsyncHTTPTransport())
+
+    def close(self) -> None:
+        """Write pending hit times and close the SQLite connection."""
+        with self._lock:
+            self._flush_touched()
+            self._db.commit()
+            self._db.close()
+
+
+class HTTPCacheTransport(httpx.AsyncBaseTransport):
+    """httpx transport that answers cached ``GET`` requests from an ``HTTPCache``."""
+
+    def __init__(self, cache: HTTPCache, inner: httpx.AsyncBaseTransport):
+        self.cache = cache
+        self.inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        if request.method != "GET" or body:
+            return await self.inner.handle_async_request(request)
+
+        key = request_key(request.method, request.url)
+        cached = await asyncio.to_thread(self.cache.get, key)
+        if cached is not None:
+            _lookup_counter.add(1, {"http_cache.outcome": "hit"})
+            headers, content = cached
+            return httpx.Response(200, headers=headers, content=content, request=request, extensions={"http_cache": "hit"})
+        _lookup_counter.add(1, {"http_cache.outcome": "miss"})
+
+        response = await self.inner.handle_async_request(request)
+        if not _cacheable(response):
+            return response
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        headers = [(name, value) for name, value in response.headers.multi_items() if name.lower() not in _DROPPED_HEADERS]
+        await asyncio.to_thread(self.cache.put, key, str(request.url), headers, content)
+        _lookup_counter.add(1, {"http_cache.outcome": "stored"})
+        return httpx.Response(response.status_code, headers=headers, content=content, request=request, extensions={"http_cache": "stored"})
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+_shared: HTTPCache | None = None
+
+
+def configured_http_cache() -> HTTPCache | None:
+    """The cache file named by ``RA_MCP_HTTP_CACHE`` (one shared instance per process), or None."""
+    global _shared
+    if settings.http_cache is None:
+        return None
+    if _shared is None or _shared.path != settings.http_cache:
+        _shared = HTTPCache(settings.http_cache, ttl=settings.http_cache_ttl, max_bytes=settings.http_cache_max_mb * 1024 * 1024)
+        register_cache("http", stats=_shared.stats, invalidate=_shared.invalidate)
+        logger.info("Shared HTTP cache %s (ttl=%ss)", settings.http_cache, settings.http_cache_ttl)
+    return _shared
+
+
+def http_cache_transport(inner: httpx.AsyncBaseTransport) -> httpx.AsyncBaseTransport:
+    """Wrap *inner* in the configured HTTP cache, or return it unchanged when none is set."""
+    cache = configured_http_cache()
+    return cache.transport(inner) if cache is not None else inner
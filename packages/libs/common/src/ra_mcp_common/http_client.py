@@ -6,6 +6,13 @@ Environment variables for debugging:
 - RA_MCP_LOG_API: Enable API logging to file (ra_mcp_api.log)
 - RA_MCP_LOG_LEVEL: Set logging level (DEBUG, INFO, WARNING, ERROR)
 - RA_MCP_TIMEOUT: Override default timeout in seconds
+
+For offline load testing and reproducible benchmarks:
+- RA_MCP_UPSTREAM_URL: Send Riksarkivet requests to a stand-in server (see ra_mcp_common.upstream)
+- RA_MCP_CASSETTE / RA_MCP_CASSETTE_MODE: Record or replay upstream traffic (see ra_mcp_common.cassette)
+
+For multi-process serving:
+- RA_MCP_HTTP_CACHE: Share cached upstream responses between processes (see ra_mcp_common.http_cache)
 """
 
 import asyncio
@@ -13,13 +20,19 @@ import contextlib
 import json
 import logging
 import time
+from collections.abc import Callable
+from typing import TypeVar, overload
 from urllib.parse import urlparse
 
 import httpx
 from opentelemetry.trace import SpanKind, StatusCode
+from pydantic import ValidationError
 
+from ra_mcp_common.cassette import Cassette, configured_cassette
+from ra_mcp_common.http_cache import HTTPCache, configured_http_cache
 from ra_mcp_common.settings import settings
 from ra_mcp_common.telemetry import get_meter, get_tracer, mark_exception_logged, record_span_exception
+from ra_mcp_common.upstream import upstream_url
 
 
 logger = logging.getLogger("ra_mcp.http_client")
@@ -29,6 +42,8 @@ _RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
 _DEFAULT_MAX_RETRIES = 3
 _DEFAULT_BACKOFF_BASE = 0.5
 
+T = TypeVar("T")
+
 
 class HTTPClient:
     """Centralized async HTTP client using httpx with comprehensive logging and retry."""
@@ -44,7 +59,24 @@ class HTTPClient:
         read_timeout: float = 30.0,
         write_timeout: float = 10.0,
         pool_timeout: float = 5.0,
+        cassette: Cassette | None = None,
+        http_cache: HTTPCache | None = None,
     ):
+        """
+        Args:
+            user_agent: User-Agent header; defaults to ``ra-mcp/<version>``.
+            max_retries: Attempts per request on transient errors.
+            backoff_base: First retry delay in seconds, doubled per attempt.
+            http2: Negotiate HTTP/2 (needs the ``http2`` extra).
+            connect_timeout: Connect timeout in seconds.
+            read_timeout: Read timeout in seconds.
+            write_timeout: Write timeout in seconds.
+            pool_timeout: Seconds to wait for a pooled connection.
+            cassette: Record to / replay from this cassette; defaults to the one
+                configured by ``RA_MCP_CASSETTE``, if any.
+            http_cache: Serve repeated GETs from this shared cache; defaults to the
+                one configured by ``RA_MCP_HTTP_CACHE``, if any.
+        """
         if user_agent is None:
             from importlib.metadata import version
 
@@ -53,12 +85,26 @@ class HTTPClient:
         self.max_retries = max_retries
         self.backoff_base = backoff_base
 
+        limits = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+        self.cassette = cassette if cassette is not None else configured_cassette()
+        self.http_cache = http_cache if http_cache is not None else configured_http_cache()
+        # A cassette and the HTTP cache sit below the retry/telemetry logic as the client's
+        # transport, so replayed and cached responses go through exactly the same handling
+        # as live ones. The HTTP cache is outermost: a cached response never reaches the cassette.
+        transport: httpx.AsyncBaseTransport | None = None
+        if self.cassette is not None or self.http_cache is not None:
+            transport = httpx.AsyncHTTPTransport(limits=limits, http2=http2)
+            if self.cassette is not None:
+                transport = self.cassette.transport(transport)
+            if self.http_cache is not None:
+                transport = self.http_cache.transport(transport)
         self._client = httpx.AsyncClient(
             headers={"User-Agent": user_agent},
             timeout=httpx.Timeout(connect=connect_timeout, read=read_timeout, write=write_timeout, pool=pool_timeout),
-            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            limits=limits,
             follow_redirects=True,
             http2=http2,
+            transport=transport,
         )
 
         # Telemetry
@@ -79,9 +125,11 @@ class HTTPClient:
         Raises on non-retryable errors or after all retries exhausted.
         """
         last_exception: Exception = Exception("All retries exhausted")
+        # Logs and telemetry keep the logical upstream URL; only the wire request is rerouted.
+        target = upstream_url(url)
         for attempt in range(self.max_retries):
             try:
-                response = await self._client.request(method, url, params=params, headers=headers, timeout=timeout)
+                response = await self._client.request(method, target, params=params, headers=headers, timeout=timeout)
                 if response.status_code in _RETRYABLE_STATUS_CODES:
                     wait = self.backoff_base * (2**attempt)
                     logger.warning("Retryable status %d from %s, attempt %d/%d, waiting %.1fs", response.status_code, url, attempt + 1, self.max_retries, wait)
@@ -116,13 +164,25 @@ class HTTPClient:
                 continue
         raise last_exception
 
+    @overload
+    async def get_json(
+        self, url: str, params: dict[str, str | int] | None = None, timeout: int = 30, headers: dict[str, str] | None = None, *, decode: None = None
+    ) -> dict: ...
+
+    @overload
+    async def get_json(
+        self, url: str, params: dict[str, str | int] | None = None, timeout: int = 30, headers: dict[str, str] | None = None, *, decode: Callable[[bytes], T]
+    ) -> T: ...
+
     async def get_json(
         self,
         url: str,
         params: dict[str, str | int] | None = None,
         timeout: int = 30,
         headers: dict[str, str] | None = None,
-    ) -> dict:
+        *,
+        decode: Callable[[bytes], T] | None = None,
+    ) -> dict | T:
         """
         Make a GET request and return JSON response.
 
@@ -131,15 +191,19 @@ class HTTPClient:
             params: Query parameters
             timeout: Request timeout in seconds (can be overridden by RA_MCP_TIMEOUT env var)
             headers: Additional headers
+            decode: Parse the body bytes with this instead of ``json.loads``, e.g. a
+                Pydantic ``model_validate_json`` that builds models without the
+                intermediate dicts
 
         Returns:
-            Parsed JSON response
+            Parsed JSON response (whatever *decode* returns, when given)
 
         Raises:
             TimeoutError: On request timeout
             httpx.HTTPStatusError: On non-success HTTP status code
             httpx.ConnectError: On network connection error
             json.JSONDecodeError: On invalid JSON response
+            pydantic.ValidationError: When a Pydantic *decode* rejects the body
         """
         # Global timeout override (RA_MCP_TIMEOUT), useful for Hugging Face
         if settings.timeout is not None:
@@ -184,7 +248,7 @@ class HTTPClient:
                 logger.debug("Received %d bytes", content_size)
 
                 logger.debug("Parsing JSON...")
-                result = json.loads(content)
+                result = json.loads(content) if decode is None else decode(content)
 
                 duration = time.perf_counter() - start_time
                 logger.info("✓ GET JSON %s - %.3fs - %d bytes - 200 OK", url, duration, content_size)
@@ -221,7 +285,7 @@ class HTTPClient:
                 self._error_counter.add(1, {**metric_attrs, "error.type": "HTTPStatusError"})
                 raise
 
-            except (httpx.ConnectError, json.JSONDecodeError) as e:
+            except (httpx.ConnectError, json.JSONDecodeError, ValidationError) as e:
                 duration = time.perf_counter() - start_time
                 error_type = type(e).__name__
                 logger.error("✗ GET JSON %s - %.3fs - %s: %s", url, duration, error_type, e)
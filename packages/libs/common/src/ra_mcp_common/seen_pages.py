@@ -0,0 +1,218 @@
+"""
+Pages a session has already been shown, for search and browse dedup.
+
+search_transcribed, search_metadata and browse_document skip or stub what the
+session has already seen. They used to keep that in the session state store as
+``dict[str, list[int]]`` under ``seen_search`` / ``seen_browse``. Every call
+loaded the whole dict, rebuilt the page list of each document it showed with
+``sorted(set(...))``, and wrote the whole dict back, serialized. A long
+research session tracks thousands of documents, so every call paid for all of
+them.
+
+:func:`session_seen` keeps the same information in the worker's memory. That is
+safe because sessions stay on the worker that created them (see
+``ra_mcp_server.workers``). The state is updated in place:
+
+- the pages of each document as run-length bytes: varints for the gap before
+  each run of consecutive pages and its length, so pages 1-40 cost two bytes
+  and a scattered hit two or three;
+- reference codes interned with ``sys.intern``, so a document shown to many
+  sessions keeps one key string;
+- at most ``MAX_SESSION_BYTES`` per session and kind of tool (the least
+  recently shown documents are dropped first, with a log line the first time);
+- a session is forgotten once it has not been used for ``SESSION_TTL``
+  seconds, the lifetime FastMCP gave the session state this replaces. There is
+  no cap on the number of sessions: each one is bounded on its own.
+
+A call only touches the documents it shows, and nothing is serialized.
+"""
+
+import logging
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping, Set
+
+from ra_mcp_common.cache_registry import CacheStats, key_matches, register_cache
+
+
+logger = logging.getLogger("ra_mcp.seen_pages")
+
+# About 2,000 documents at the usual one to three pages each (see nbytes).
+MAX_SESSION_BYTES = 256 * 1024
+SESSION_TTL = 86_400
+# Estimated cost of one document's dict entry, on top of its key and page runs.
+_ENTRY_BYTES = 40
+
+
+def _runs(pages: Iterable[int]) -> list[tuple[int, int]]:
+    """Sorted, merged (first page, count) runs of *pages*; negative page numbers are ignored."""
+    runs: list[tuple[int, int]] = []
+    for page in sorted(set(pages)):
+        if page < 0:
+            continue
+        if runs and runs[-1][0] + runs[-1][1] == page:
+            runs[-1] = (runs[-1][0], runs[-1][1] + 1)
+        else:
+            runs.append((page, 1))
+    return runs
+
+
+def _encode(runs: list[tuple[int, int]]) -> bytes:
+    """Runs as varints: the gap since the previous run's end, then the run's length."""
+    out = bytearray()
+    end = 0
+    for first, count in runs:
+        for value in (first - end, count):
+            while value >= 0x80:
+                out.append(value & 0x7F | 0x80)
+                value >>= 7
+            out.append(value)
+        end = first + count
+    return bytes(out)
+
+
+def _decode(data: bytes) -> list[tuple[int, int]]:
+    values: list[int] = []
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if byte < 0x80:
+            values.append(value)
+            value = shift = 0
+    runs: list[tuple[int, int]] = []
+    end = 0
+    for gap, count in zip(values[::2], values[1::2], strict=True):
+        runs.append((end + gap, count))
+        end += gap + count
+    return runs
+
+
+class PageSet(Set[int]):
+    """A read-only set of page numbers, decoded from run-length form."""
+
+    __slots__ = ("runs",)
+
+    def __init__(self, runs: list[tuple[int, int]] | None = None):
+        self.runs = runs or []
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[int]) -> "PageSet":
+        return cls(_runs(pages))
+
+    def __contains__(self, page: object) -> bool:
+        return isinstance(page, int) and any(first <= page < first + count for first, count in self.runs)
+
+    def __iter__(self) -> Iterator[int]:
+        for first, count in self.runs:
+            yield from range(first, first + count)
+
+    def __len__(self) -> int:
+        return sum(count for _, count in self.runs)
+
+    def __repr__(self) -> str:
+        return f"PageSet({list(self)})"
+
+
+def _entry_size(reference_code: str, runs: bytes) -> int:
+    return sys.getsizeof(reference_code) + sys.getsizeof(runs) + _ENTRY_BYTES
+
+
+class SeenPages(Mapping[str, PageSet]):
+    """Reference code → pages shown, for one session and one kind of tool.
+
+    Args:
+        max_bytes: Memory budget (see :meth:`nbytes`); the least recently shown
+            documents are dropped first once it is exceeded.
+    """
+
+    def __init__(self, max_bytes: int = MAX_SESSION_BYTES):
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self.used_at = time.monotonic()
+        self._pages: dict[str, bytes] = {}
+        self._bytes = sys.getsizeof(self._pages)
+
+    def __getitem__(self, reference_code: str) -> PageSet:
+        return PageSet(_decode(self._pages[reference_code]))
+
+    def __contains__(self, reference_code: object) -> bool:
+        return reference_code in self._pages
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._pages)
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def add(self, reference_code: str, pages: Iterable[int] = ()) -> None:
+        """Record *pages* of *reference_code* as shown; with no pages, just the document."""
+        previous = self._pages.pop(reference_code, None)
+        if previous is None:
+            reference_code = sys.intern(reference_code)
+            runs = _encode(_runs(pages))
+        else:
+            self._bytes -= _entry_size(reference_code, previous)
+            runs = _encode(_runs([*PageSet(_decode(previous)), *pages]))
+        self._pages[reference_code] = runs
+        self._bytes += _entry_size(reference_code, runs)
+        while self._bytes > self.max_bytes and len(self._pages) > 1:
+            oldest = next(iter(self._pages))
+            self._bytes -= _entry_size(oldest, self._pages.pop(oldest))
+            if not self.evictions:
+                logger.info("Dedup state reached %d bytes; forgetting the least recently shown documents", self.max_bytes)
+            self.evictions += 1
+
+    def nbytes(self) -> int:
+        """Approximate memory held: the reference code keys, the encoded page runs and a dict entry for each."""
+        return self._bytes
+
+
+# (session id, kind) → its pages, least recently used first
+_sessions: OrderedDict[tuple[str, str], SeenPages] = OrderedDict()
+_expired_sessions = 0
+
+
+def session_seen(session_id: str, kind: str) -> SeenPages:
+    """The pages *session_id* has been shown by *kind* of tool (``"search"`` or ``"browse"``), created empty on first use.
+
+    Sessions unused for ``SESSION_TTL`` seconds are forgotten first.
+    """
+    global _expired_sessions
+    now = time.monotonic()
+    while _sessions:
+        oldest = next(iter(_sessions.values()))
+        if now - oldest.used_at < SESSION_TTL:
+            break
+        _sessions.popitem(last=False)
+        _expired_sessions += 1
+    key = (session_id, kind)
+    seen = _sessions.get(key)
+    if seen is None:
+        seen = _sessions[key] = SeenPages()
+    else:
+        _sessions.move_to_end(key)
+    seen.used_at = now
+    return seen
+
+
+def _seen_stats() -> CacheStats:
+    recent = [{"key": f"{session_id}:{kind}", "documents": len(seen)} for (session_id, kind), seen in reversed(_sessions.items())]
+    return CacheStats(
+        entries=len(_sessions),
+        bytes=sum(seen.nbytes() for seen in _sessions.values()),
+        evictions=_expired_sessions + sum(seen.evictions for seen in _sessions.values()),
+        top_keys=recent[:10],
+    )
+
+
+def _invalidate_seen(pattern: str | None) -> int:
+    """Forget the sessions whose ``session_id:kind`` matches *pattern*."""
+    keys = [key for key in _sessions if key_matches(f"{key[0]}:{key[1]}", pattern)]
+    for key in keys:
+        del _sessions[key]
+    return len(keys)
+
+
+register_cache("session.seen_pages", stats=_seen_stats, invalidate=_invalidate_seen)
@@ -8,7 +8,9 @@ component.
 """
 
 from pathlib import Path
+from typing import Literal
 
+from pydantic import SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -33,6 +35,32 @@ class Settings(BaseSettings):
     stage_only: str = ""
     # None = "no global override"; callers keep their own per-request timeout.
     timeout: int | None = None
+    # Stand-in upstream for offline load testing (e.g. "http://127.0.0.1:8765"). When set,
+    # requests to the Riksarkivet hosts go to ``{upstream_url}/{host}{path}`` instead —
+    # see ra_mcp_common.upstream and benchmarks/mock_upstream. None = live upstreams.
+    upstream_url: str | None = None
+    # Record/replay cassette for upstream HTTP traffic (see ra_mcp_common.cassette): a SQLite
+    # file of recorded responses. "record" hits the network and stores, "replay" serves only
+    # from the file, "auto" replays hits and records misses. latency_scale > 0 re-applies the
+    # recorded response time on replay (1.0 = as recorded).
+    cassette: Path | None = None
+    cassette_mode: Literal["record", "replay", "auto"] = "replay"
+    cassette_latency_scale: float = 0.0
+    # Shared cache of upstream GET responses (see ra_mcp_common.http_cache): a SQLite file
+    # several worker processes can open at once. None = no HTTP cache.
+    http_cache: Path | None = None
+    http_cache_ttl: float = 300
+    http_cache_max_mb: int = 512
+    # Shared backend for the viewer/PDF/SBL view state (see ra_mcp_common.state_store):
+    # "sqlite:///path/state.sqlite" (or a bare path), the only shared backend. None = each
+    # process keeps its views in memory.
+    state_store: str | None = None
+    # Directory of the PDF viewer's on-disk PDF cache (see ra_mcp_pdf_mcp.cache.DiskPDFCache).
+    # None = "ra-mcp-pdf-cache" in the system temp directory, shared by all local workers.
+    pdf_cache_dir: Path | None = None
+    # Bearer token for the /admin/* HTTP routes (cache statistics and invalidation).
+    # None = admin routes answer 404.
+    admin_token: SecretStr | None = None
 
 
 settings = Settings()
@@ -0,0 +1,251 @@
+"""
+Revisioned view state on a pluggable py-key-value store.
+
+The viewer, PDF and SBL apps keep per-view state that their iframes poll. By
+default each process keeps it in a py-key-value ``MemoryStore``, which breaks
+as soon as several replicas serve one deployment: a ``get_viewer_state`` poll
+that lands on another pod finds nothing. ``RA_MCP_STATE_STORE`` moves the
+state into a ``SQLiteStore`` file that several processes can open at once:
+``sqlite:///path/state.sqlite`` (or a bare path) on a volume every replica
+mounts, or the workers of ``ra serve --workers``. It is the only shared
+backend: others (Redis, ...) would need an atomic compare-and-set of their own
+to be safe across processes, so ``open_backend`` rejects them.
+
+Every entry carries a revision that each write bumps. ``compare_and_set``
+only writes if the entry is still at the revision the caller read, so a
+poller clearing one-shot commands and a tool mutating the same view cannot
+silently overwrite each other; the loser re-reads and retries. ``SQLiteStore``
+makes it atomic across processes; for a process-local backend such as the
+default ``MemoryStore`` an ``asyncio.Lock`` makes it atomic within the process,
+which is all such a store needs.
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol, SupportsFloat, runtime_checkable
+
+from ra_mcp_common.settings import settings
+
+
+class StateConflictError(RuntimeError):
+    """A view kept changing underneath a write; the caller gave up retrying."""
+
+
+class KeyValueStore(Protocol):
+    """The part of py-key-value's ``AsyncKeyValue`` protocol used here."""
+
+    async def get(self, key: str, *, collection: str | None = None) -> dict[str, Any] | None: ...
+
+    async def put(self, key: str, value: Mapping[str, Any], *, collection: str | None = None, ttl: SupportsFloat | None = None) -> None: ...
+
+    async def delete(self, key: str, *, collection: str | None = None) -> bool: ...
+
+
+@runtime_checkable
+class _AtomicCompareAndSet(Protocol):
+    async def compare_and_set(
+        self, key: str, value: Mapping[str, Any], *, expected_revision: int, collection: str | None = None, ttl: SupportsFloat | None = None
+    ) -> bool: ...
+
+
+@dataclass(frozen=True)
+class Revisioned:
+    """A stored value and the revision it was read at."""
+
+    value: dict[str, Any]
+    revision: int
+
+
+class StateStore:
+    """One collection of revisioned JSON values in a py-key-value backend.
+
+    Values are stored as ``{"revision": n, "value": {...}}``; revision 0 means
+    "absent". Entries expire ``ttl`` seconds after their last write.
+
+    Args:
+        backend: ``SQLiteStore``, or a process-local py-key-value store such as ``MemoryStore``.
+        collection: Collection the values live in.
+        ttl: Seconds an entry lives after its last write (None = no expiry).
+    """
+
+    def __init__(self, backend: KeyValueStore, collection: str, *, ttl: float | None = None):
+        self.backend = backend
+        self.collection = collection
+        self.ttl = ttl
+        self._lock = asyncio.Lock()
+
+    async def load(self, key: str) -> Revisioned | None:
+        """The value under *key* with its revision, or None."""
+        stored = await self.backend.get(key, collection=self.collection)
+        if not stored:
+            return None
+        return Revisioned(value=stored["value"], revision=stored["revision"])
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """The value under *key*, or None."""
+        entry = await self.load(key)
+        return entry.value if entry is not None else None
+
+    async def compare_and_set(self, key: str, value: Mapping[str, Any], *, revision: int) -> int | None:
+        """Store *value* if *key* is still at *revision* (0 = absent).
+
+        Returns:
+            The new revision, or None if another writer got there first.
+        """
+        stored = {"revision": revision + 1, "value": dict(value)}
+        if isinstance(self.backend, _AtomicCompareAndSet):
+            swapped = await self.backend.compare_and_set(key, stored, expected_revision=revision, collection=self.collection, ttl=self.ttl)
+            return revision + 1 if swapped else None
+        async with self._lock:
+            current = await self.load(key)
+            if (current.revision if current is not None else 0) != revision:
+                return None
+            await self.backend.put(key, stored, collection=self.collection, ttl=self.ttl)
+        return revision + 1
+
+    async def put(self, key: str, value: Mapping[str, Any], *, attempts: int = 5) -> int:
+        """Store *value* whatever the current revision; returns the new revision."""
+        for _ in range(attempts):
+            current = await self.load(key)
+            revision = await self.compare_and_set(key, value, revision=current.revision if current is not None else 0)
+            if revision is not None:
+                return revision
+        raise StateConflictError(f"{self.collection}/{key} kept changing during {attempts} write attempts")
+
+    async def delete(self, key: str) -> bool:
+        """Remove *key*; returns whether it existed."""
+        return await self.backend.delete(key, collection=self.collection)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    collection TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires_at REAL,
+    PRIMARY KEY (collection, key)
+)
+"""
+
+
+class SQLiteStore:
+    """py-key-value compatible store in a SQLite file, with an atomic ``compare_and_set``.
+
+    WAL mode and a write lock taken for the whole read-compare-write make it
+    safe for several processes sharing the file. ``":memory:"`` gives a
+    private in-process store.
+
+    Args:
+        path: Database file (parent directories are created) or ``":memory:"``.
+        default_collection: Collection used when a call passes none.
+    """
+
+    def __init__(self, path: Path | str, *, default_collection: str = "default"):
+        self.path = path
+        self.default_collection = default_collection
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Autocommit mode: transactions are opened explicitly with BEGIN IMMEDIATE.
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=10, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(_SCHEMA)
+
+    def _read(self, collection: str, key: str, now: float) -> dict[str, Any] | None:
+        row = self._db.execute(
+            "SELECT value FROM entries WHERE collection = ? AND key = ? AND (expires_at IS NULL OR expires_at > ?)", (collection, key, now)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _write(self, collection: str, key: str, value: Mapping[str, Any], ttl: SupportsFloat | None, now: float) -> None:
+        expires_at = now + float(ttl) if ttl is not None else None
+        self._db.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)", (collection, key, json.dumps(value), expires_at))
+        self._db.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+
+    def _get(self, collection: str, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            return self._read(collection, key, time.time())
+
+    def _put(self, collection: str, key: str, value: Mapping[str, Any], ttl: SupportsFloat | None) -> None:
+        with self._lock:
+            self._write(collection, key, value, ttl, time.time())
+
+    def _delete(self, collection: str, key: str) -> bool:
+        with self._lock:
+            return self._db.execute("DELETE FROM entries WHERE collection = ? AND key = ?", (collection, key)).rowcount > 0
+
+    def _compare_and_set(self, collection: str, key: str, value: Mapping[str, Any], expected_revision: int, ttl: SupportsFloat | None) -> bool:
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                current = self._read(collection, key, now)
+                if (current["revision"] if current else 0) != expected_revision:
+                    self._db.execute("ROLLBACK")
+                    return False
+                self._write(collection, key, value, ttl, now)
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return True
+
+    # The async API runs each call in a worker thread: a write can wait up to the
+    # connection timeout for another process's lock, which must not stall the event loop.
+
+    async def get(self, key: str, *, collection: str | None = None) -> dict[str, Any] | None:
+        return await asyncio.to_thread(self._get, collection or self.default_collection, key)
+
+    async def put(self, key: str, value: Mapping[str, Any], *, collection: str | None = None, ttl: SupportsFloat | None = None) -> None:
+        await asyncio.to_thread(self._put, collection or self.default_collection, key, value, ttl)
+
+    async def delete(self, key: str, *, collection: str | None = None) -> bool:
+        return await asyncio.to_thread(self._delete, collection or self.default_collection, key)
+
+    async def compare_and_set(
+        self, key: str, value: Mapping[str, Any], *, expected_revision: int, collection: str | None = None, ttl: SupportsFloat | None = None
+    ) -> bool:
+        """Write *value* if the stored entry's ``revision`` field is *expected_revision* (0 = absent)."""
+        return await asyncio.to_thread(self._compare_and_set, collection or self.default_collection, key, value, expected_revision, ttl)
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._db.close()
+
+
+def is_shared(backend: KeyValueStore) -> bool:
+    """Whether other processes can write to *backend*: a ``SQLiteStore`` file rather than process memory."""
+    return isinstance(backend, SQLiteStore) and backend.path != ":memory:"
+
+
+def open_backend(url: str) -> KeyValueStore:
+    """A store for an ``RA_MCP_STATE_STORE`` value: a ``sqlite://`` URL or a bare path.
+
+    Raises:
+        ValueError: For any other URL scheme (``redis://``, ...), which has no
+            cross-process compare-and-set here.
+    """
+    scheme, separator, _ = url.partition("://")
+    if separator and scheme != "sqlite":
+        raise ValueError(f"RA_MCP_STATE_STORE supports sqlite:///path/state.sqlite (or a bare path) only, got {scheme}://...")
+    return SQLiteStore(url.removeprefix("sqlite://"))
+
+
+_shared: dict[str, KeyValueStore] = {}
+
+
+def state_backend(default: Callable[[], KeyValueStore]) -> KeyValueStore:
+    """The backend named by ``RA_MCP_STATE_STORE`` (one per process), or ``default()`` when unset."""
+    url = settings.state_store
+    if not url:
+        return default()
+    if url not in _shared:
+        _shared[url] = open_backend(url)
+    return _shared[url]
@@ -0,0 +1,47 @@
+"""
+Upstream routing: point every Riksarkivet call at a stand-in server.
+
+With ``RA_MCP_UPSTREAM_URL`` unset (the default) URLs pass through unchanged.
+When it is set — e.g. to the mock upstream in ``benchmarks/mock_upstream`` —
+requests to the known upstream hosts are rewritten to
+``{RA_MCP_UPSTREAM_URL}/{host}{path}?{query}``, so one local server can stand
+in for the Search API, OAI-PMH, IIIF, ALTO and the TORA SPARQL endpoint without
+touching each library's base-URL constants. Other hosts (HuggingFace, HTR
+space, arbitrary viewer URLs) are never rewritten.
+"""
+
+from urllib.parse import urlsplit
+
+from ra_mcp_common.settings import settings
+
+
+UPSTREAM_HOSTS = frozenset(
+    {
+        "data.riksarkivet.se",
+        "oai-pmh.riksarkivet.se",
+        "lbiiif.riksarkivet.se",
+        "sok.riksarkivet.se",
+        "tora.entryscape.net",
+    }
+)
+
+
+def upstream_url(url: str) -> str:
+    """Route *url* to the configured stand-in upstream, if any.
+
+    Args:
+        url: Absolute URL of an upstream request.
+
+    Returns:
+        The rewritten URL when ``settings.upstream_url`` is set and *url* targets
+        one of ``UPSTREAM_HOSTS``; otherwise *url* unchanged.
+    """
+    base = settings.upstream_url
+    if not base:
+        return url
+    parts = urlsplit(url)
+    host = parts.hostname or ""
+    if host not in UPSTREAM_HOSTS:
+        return url
+    rewritten = f"{base.rstrip('/')}/{host}{parts.path}"
+    return f"{rewritten}?{parts.query}" if parts.query else rewritten
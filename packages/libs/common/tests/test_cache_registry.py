@@ -0,0 +1,58 @@
+"""Tests for the shared cache registry behind /admin/caches."""
+
+import pytest
+
+from ra_mcp_common.cache_registry import (
+    CacheStats,
+    cache_stats,
+    invalidate_cache,
+    key_matches,
+    register_cache,
+    registered_caches,
+    unregister_cache,
+)
+
+
+@pytest.fixture
+def registered():
+    yield
+    unregister_cache("sync")
+    unregister_cache("async")
+
+
+def test_key_matches():
+    assert key_matches("a", None)
+    assert key_matches("tool:1", "tool:*")
+    assert not key_matches("other:1", "tool:*")
+    assert key_matches("tool:1", "tool:1")
+    assert not key_matches("tool:12", "tool:1")
+
+
+def test_hit_ratio():
+    assert CacheStats(entries=0).hit_ratio is None
+    assert CacheStats(entries=0, hits=0, misses=0).hit_ratio is None
+    assert CacheStats(entries=1, hits=1, misses=3).as_dict()["hit_ratio"] == 0.25
+
+
+async def test_sync_and_async_callbacks(registered):
+    dropped: list[str | None] = []
+
+    async def async_stats() -> CacheStats:
+        return CacheStats(entries=2, bytes=10)
+
+    async def async_invalidate(pattern: str | None) -> int:
+        dropped.append(pattern)
+        return 2
+
+    register_cache("sync", stats=lambda: CacheStats(entries=1), invalidate=lambda pattern: 1)
+    register_cache("async", stats=async_stats, invalidate=async_invalidate)
+
+    assert {"sync", "async"} <= set(registered_caches())
+    assert (await cache_stats("sync")).entries == 1
+    assert (await cache_stats("async")).bytes == 10
+    assert await invalidate_cache("sync", "k") == 1
+    assert await invalidate_cache("async") == 2
+    assert dropped == [None]
+
+    with pytest.raises(KeyError):
+        await cache_stats("missing")
@@ -0,0 +1,156 @@
+"""Tests for the record/replay cassette and its HTTPClient integration."""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from ra_mcp_common import cassette as cassette_module
+from ra_mcp_common.cassette import Cassette, CassetteMiss, request_key
+from ra_mcp_common.http_client import HTTPClient
+from ra_mcp_common.settings import settings
+
+
+URL = "https://data.riksarkivet.se/api/records"
+
+
+@pytest.fixture
+def tape(tmp_path):
+    def _open(mode, latency_scale=0.0):
+        return Cassette(tmp_path / "upstream.sqlite", mode=mode, latency_scale=latency_scale)
+
+    return _open
+
+
+# ---------------------------------------------------------------------------
+# request_key
+# ---------------------------------------------------------------------------
+
+
+def test_request_key_ignores_query_order():
+    assert request_key("GET", f"{URL}?a=1&b=2") == request_key("get", f"{URL}?b=2&a=1")
+
+
+def test_request_key_distinguishes_method_query_and_body():
+    keys = {
+        request_key("GET", f"{URL}?a=1"),
+        request_key("GET", f"{URL}?a=2"),
+        request_key("POST", f"{URL}?a=1"),
+        request_key("POST", f"{URL}?a=1", b"query=x"),
+    }
+    assert len(keys) == 4
+
+
+# ---------------------------------------------------------------------------
+# record → replay through HTTPClient
+# ---------------------------------------------------------------------------
+
+
+@respx.mock(assert_all_called=True)
+async def test_record_then_replay_without_network(respx_mock, tape):
+    payload = {"totalHits": 1, "items": []}
+    route = respx_mock.get(URL, params={"text": "trolldom"}).mock(
+        return_value=httpx.Response(200, json=payload, headers={"X-Upstream": "yes", "Date": "Mon, 01 Jan 2024 00:00:00 GMT"})
+    )
+
+    recorder = HTTPClient(cassette=tape("record"))
+    try:
+        assert await recorder.get_json(URL, params={"text": "trolldom"}) == payload
+    finally:
+        await recorder.aclose()
+    assert route.call_count == 1
+
+    cassette = tape("replay")
+    assert len(cassette) == 1
+    replayer = HTTPClient(cassette=cassette)
+    try:
+        response = await replayer._client.get(URL, params={"text": "trolldom"})
+        assert await replayer.get_json(URL, params={"text": "trolldom"}) == payload
+    finally:
+        await replayer.aclose()
+
+    assert route.call_count == 1  # replay never touched the network
+    assert response.status_code == 200
+    assert response.headers["x-upstream"] == "yes"
+    assert "date" not in response.headers
+    assert response.extensions["cassette"] == "hit"
+
+
+async def test_replay_miss_raises(tape):
+    client = HTTPClient(cassette=tape("replay"), max_retries=1)
+    try:
+        with pytest.raises(CassetteMiss, match="No recorded response"):
+            await client.get_json(URL, params={"text": "unrecorded"})
+    finally:
+        await client.aclose()
+
+
+@respx.mock(assert_all_called=True)
+async def test_recorded_status_is_replayed(respx_mock, tape):
+    respx_mock.get(f"{URL}/missing").mock(return_value=httpx.Response(404, text="gone"))
+    recorder = HTTPClient(cassette=tape("record"))
+    try:
+        assert await recorder.get_content(f"{URL}/missing") is None
+    finally:
+        await recorder.aclose()
+
+    cassette = tape("replay")
+    interaction = cassette.get(request_key("GET", f"{URL}/missing"))
+    assert interaction is not None
+    assert interaction.status == 404
+    assert interaction.body == b"gone"
+    assert interaction.elapsed >= 0
+
+
+@respx.mock(assert_all_called=False)
+async def test_auto_mode_records_misses_and_replays_hits(respx_mock, tape):
+    route = respx_mock.get(URL).mock(return_value=httpx.Response(200, json={"n": 1}))
+    client = HTTPClient(cassette=tape("auto"))
+    try:
+        await client.get_json(URL, params={"text": "a"})
+        await client.get_json(URL, params={"text": "a"})
+        await client.get_json(URL, params={"text": "b"})
+    finally:
+        await client.aclose()
+    assert route.call_count == 2
+
+
+async def test_replay_reproduces_scaled_latency(tape, monkeypatch):
+    cassette = tape("replay", latency_scale=0.5)
+    key = request_key("GET", URL)
+    cassette.put(key, cassette_module.Interaction("GET", URL, 200, [("content-type", "application/json")], b"{}", 0.2, 0.0))
+
+    slept: list[float] = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+        await real_sleep(0)
+
+    monkeypatch.setattr(cassette_module.asyncio, "sleep", fake_sleep)
+    client = HTTPClient(cassette=cassette)
+    try:
+        assert await client.get_json(URL) == {}
+    finally:
+        await client.aclose()
+    assert slept == [pytest.approx(0.1)]
+
+
+# ---------------------------------------------------------------------------
+# configuration
+# ---------------------------------------------------------------------------
+
+
+def test_configured_cassette_follows_settings(tmp_path, monkeypatch):
+    monkeypatch.setattr(cassette_module, "_shared", None)
+    monkeypatch.setattr(settings, "cassette", None)
+    assert cassette_module.configured_cassette() is None
+    assert HTTPClient().cassette is None
+
+    monkeypatch.setattr(settings, "cassette", tmp_path / "c.sqlite")
+    monkeypatch.setattr(settings, "cassette_mode", "auto")
+    configured = cassette_module.configured_cassette()
+    assert configured is not None
+    assert configured.mode == "auto"
+    assert HTTPClient().cassette is configured
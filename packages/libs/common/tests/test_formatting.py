@@ -3,6 +3,7 @@
 import pytest
 
 from ra_mcp_common.formatting import (
+    TokenBudget,
     format_error_message,
     format_example_browse_command,
     highlight_keyword_markdown,
@@ -225,3 +226,28 @@ def test_highlight_keyword_markdown_multiple_occurrences():
 def test_highlight_keyword_markdown_special_regex_chars():
     result = highlight_keyword_markdown("value is (test)", "(test)")
     assert result == "value is **(test)**"
+
+
+# ---------------------------------------------------------------------------
+# TokenBudget
+# ---------------------------------------------------------------------------
+
+
+def test_token_budget_stops_at_the_first_record_that_does_not_fit():
+    budget = TokenBudget(max_tokens=10)  # 40 characters
+    budget.charge(["header"])  # 7 characters with its newline
+    assert budget.fits(["x" * 19])
+    assert not budget.fits(["x" * 19])
+    assert budget.fits(["short"])  # a later, smaller record can still fit
+
+
+def test_token_budget_always_fits_the_first_record():
+    budget = TokenBudget(max_tokens=1)
+    assert budget.fits(["x" * 1000])
+    assert not budget.fits(["x"])
+
+
+def test_token_budget_without_limit():
+    budget = TokenBudget()
+    budget.charge(["x" * 10_000])
+    assert all(budget.fits(["x" * 10_000]) for _ in range(100))
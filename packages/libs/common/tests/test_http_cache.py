@@ -0,0 +1,128 @@
+"""Tests for the shared HTTP response cache and its HTTPClient integration."""
+
+import httpx
+import pytest
+
+from ra_mcp_common import http_cache as http_cache_module
+from ra_mcp_common.cache_registry import registered_caches, unregister_cache
+from ra_mcp_common.http_cache import HTTPCache
+from ra_mcp_common.http_client import HTTPClient
+from ra_mcp_common.settings import settings
+
+
+URL = "https://lbiiif.riksarkivet.se/arkis!R0001216/manifest"
+
+
+def _upstream(calls: list[httpx.Request], status_code: int = 200, headers: dict[str, str] | None = None) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(status_code, headers=headers, json={"n": len(calls)})
+
+    return httpx.MockTransport(handler)
+
+
+async def test_second_get_is_served_from_the_cache(tmp_path):
+    calls: list[httpx.Request] = []
+    cache = HTTPCache(tmp_path / "http.sqlite")
+    async with httpx.AsyncClient(transport=cache.transport(_upstream(calls))) as client:
+        first = await client.get(URL, params={"b": "2", "a": "1"})
+        second = await client.get(URL, params={"a": "1", "b": "2"})
+
+    assert len(calls) == 1
+    assert second.json() == first.json() == {"n": 1}
+    assert first.extensions["http_cache"] == "stored"
+    assert second.extensions["http_cache"] == "hit"
+    assert second.headers["content-type"] == "application/json"
+    assert (await cache.stats()).hits == 1
+
+
+async def test_processes_sharing_the_file_share_entries(tmp_path):
+    calls: list[httpx.Request] = []
+    path = tmp_path / "http.sqlite"
+    async with httpx.AsyncClient(transport=HTTPCache(path).transport(_upstream(calls))) as worker_a:
+        await worker_a.get(URL)
+    async with httpx.AsyncClient(transport=HTTPCache(path).transport(_upstream(calls))) as worker_b:
+        response = await worker_b.get(URL)
+
+    assert len(calls) == 1
+    assert response.extensions["http_cache"] == "hit"
+
+
+@pytest.mark.parametrize(
+    ("method", "response_kwargs"),
+    [
+        ("POST", {}),
+        ("GET", {"status_code": 404}),
+        ("GET", {"headers": {"Cache-Control": "no-store"}}),
+    ],
+)
+async def test_uncacheable_requests_always_reach_upstream(tmp_path, method, response_kwargs):
+    calls: list[httpx.Request] = []
+    cache = HTTPCache(tmp_path / "http.sqlite")
+    async with httpx.AsyncClient(transport=cache.transport(_upstream(calls, **response_kwargs))) as client:
+        await client.request(method, URL)
+        await client.request(method, URL)
+    assert len(calls) == 2
+    assert len(cache) == 0
+
+
+async def test_entries_expire_and_least_recently_used_are_evicted(tmp_path):
+    calls: list[httpx.Request] = []
+    cache = HTTPCache(tmp_path / "http.sqlite", ttl=0)
+    async with httpx.AsyncClient(transport=cache.transport(_upstream(calls))) as client:
+        await client.get(URL)
+        await client.get(URL)
+    assert len(calls) == 2
+
+    body = bytes(range(100))  # incompressible: ~110 bytes stored, so two entries fit in 250
+    bounded = HTTPCache(tmp_path / "bounded.sqlite", max_bytes=250)
+    bounded.put("k0", f"{URL}/0", [], body)
+    bounded.put("k1", f"{URL}/1", [], body)
+    bounded.get("k0")  # k1 is now the least recently used
+    bounded.put("k2", f"{URL}/2", [], body)
+    assert bounded.get("k1") is None
+    assert bounded.get("k0") is not None
+    assert bounded.get("k2") is not None
+    assert (await bounded.stats()).evictions == 1
+
+
+async def test_hits_batch_their_used_at_writes_and_the_byte_total_is_kept_running(tmp_path):
+    cache = HTTPCache(tmp_path / "http.sqlite")
+    cache.put("a", f"{URL}/1", [], b"1" * 50)
+    cache.put("b", f"{URL}/2", [], b"2" * 50)
+    stored_at = dict(cache._db.execute("SELECT key, used_at FROM responses").fetchall())
+
+    assert cache.get("a") is not None
+    assert dict(cache._db.execute("SELECT key, used_at FROM responses").fetchall()) == stored_at  # nothing written on the hit
+    assert (await cache.stats()).top_keys[0]["key"] == f"{URL}/1"  # written before reporting
+
+    cache.put("b", f"{URL}/2", [], b"replaced")
+    await cache.invalidate(f"{URL}/1")
+    assert cache._bytes == (await cache.stats()).bytes
+
+
+async def test_invalidate_matches_urls(tmp_path):
+    cache = HTTPCache(tmp_path / "http.sqlite")
+    cache.put("a", f"{URL}/1", [], b"1")
+    cache.put("b", f"{URL}/2", [], b"2")
+    cache.put("c", "https://data.riksarkivet.se/api/records", [], b"3")
+
+    assert await cache.invalidate(f"{URL}/*") == 2
+    assert [entry["key"] for entry in (await cache.stats()).top_keys] == ["https://data.riksarkivet.se/api/records"]
+    assert await cache.invalidate(None) == 1
+
+
+async def test_http_client_uses_the_configured_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_cache_module, "_shared", None)
+    monkeypatch.setattr(settings, "http_cache", None)
+    assert HTTPClient().http_cache is None
+
+    monkeypatch.setattr(settings, "http_cache", tmp_path / "http.sqlite")
+    client = HTTPClient()
+    try:
+        assert client.http_cache is http_cache_module.configured_http_cache()
+        assert isinstance(client._client._transport, http_cache_module.HTTPCacheTransport)
+        assert "http" in registered_caches()
+    finally:
+        await client.aclose()
+        unregister_cache("http")
@@ -6,6 +6,7 @@ import logging
 import httpx
 import pytest
 import respx
+from pydantic import BaseModel, ValidationError
 
 from ra_mcp_common.http_client import (
     _DEFAULT_BACKOFF_BASE,
@@ -63,6 +64,19 @@ async def test_get_json_success(respx_mock):
     assert result == payload
 
 
+@respx.mock(assert_all_called=False)
+async def test_get_json_decodes_the_body_with_decode(respx_mock):
+    respx_mock.get("https://api.example.com/data").mock(return_value=httpx.Response(200, json={"total": 3}))
+
+    client = HTTPClient()
+    try:
+        result = await client.get_json("https://api.example.com/data", decode=lambda body: body)
+    finally:
+        await client.aclose()
+
+    assert result == b'{"total":3}'
+
+
 @respx.mock(assert_all_called=False)
 async def test_get_json_with_params(respx_mock):
     respx_mock.get("https://api.example.com/search").mock(return_value=httpx.Response(200, json={"q": "test"}))
@@ -135,6 +149,24 @@ async def test_get_json_invalid_json_raises(respx_mock):
         await client.aclose()
 
 
+class _Body(BaseModel):
+    items: list[int]
+
+
+@respx.mock(assert_all_called=False)
+async def test_get_json_decode_validation_error_is_a_decode_error(respx_mock, caplog):
+    respx_mock.get("https://api.example.com/shape").mock(return_value=httpx.Response(200, json={"items": "none"}))
+
+    client = HTTPClient()
+    try:
+        with caplog.at_level(logging.ERROR, logger="ra_mcp.http_client"), pytest.raises(ValidationError):
+            await client.get_json("https://api.example.com/shape", decode=_Body.model_validate_json)
+    finally:
+        await client.aclose()
+    assert "ValidationError" in caplog.text
+    assert "Unexpected error" not in caplog.text
+
+
 @respx.mock(assert_all_called=False)
 async def test_get_json_non_200_raises(respx_mock):
     respx_mock.get("https://api.example.com/err").mock(return_value=httpx.Response(403, text="Forbidden"))
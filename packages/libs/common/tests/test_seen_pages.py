@@ -0,0 +1,66 @@
+"""Tests for the per-session seen pages behind search and browse dedup."""
+
+from ra_mcp_common import seen_pages as seen_pages_module
+from ra_mcp_common.cache_registry import cache_stats, invalidate_cache
+from ra_mcp_common.seen_pages import PageSet, SeenPages, session_seen
+
+
+def test_page_set_is_a_set_of_page_numbers():
+    pages = PageSet.from_pages([7, 3, 3, 120])
+    assert list(pages) == [3, 7, 120]
+    assert len(pages) == 3
+    assert 7 in pages and 8 not in pages and -1 not in pages
+    assert pages == {3, 7, 120}
+    assert not PageSet()
+
+
+def test_add_merges_pages_into_what_was_seen():
+    seen = SeenPages()
+    seen.add("SE/RA/1", [5, 6])
+    seen.add("SE/RA/1", [6, 40])
+    seen.add("SE/RA/2")  # metadata-only document: tracked with no pages
+
+    assert seen["SE/RA/1"] == {5, 6, 40}
+    assert "SE/RA/2" in seen and not seen["SE/RA/2"]
+    assert seen.get("SE/RA/3") is None
+    assert len(seen) == 2
+
+
+def test_least_recently_shown_documents_are_dropped_over_the_byte_budget():
+    probe = SeenPages()
+    probe.add("a", [1])
+    probe.add("b", [1, 2])
+    seen = SeenPages(max_bytes=probe.nbytes())  # room for two such documents
+    seen.add("a", [1])
+    seen.add("b", [1])
+    seen.add("a", [2])  # shown again: now the most recent
+    seen.add("c", [1])
+
+    assert list(seen) == ["a", "c"]
+    assert seen["a"] == {1, 2}
+    assert seen.evictions == 1
+    assert seen.nbytes() <= seen.max_bytes
+
+
+async def test_sessions_are_kept_apart_and_registered():
+    search = session_seen("s1", "search")
+    search.add("SE/RA/1", [5])
+    assert session_seen("s1", "search") is search
+    assert not session_seen("s1", "browse")
+    assert not session_seen("s2", "search")
+
+    stats = await cache_stats("session.seen_pages")
+    assert stats.entries >= 3
+    assert {"key": "s1:search", "documents": 1} in stats.top_keys
+
+    assert await invalidate_cache("session.seen_pages", "s1:*") == 2
+    assert not session_seen("s1", "search")
+
+
+def test_sessions_expire_after_the_session_ttl(monkeypatch):
+    session_seen("idle", "search").add("SE/RA/1", [5])
+    monkeypatch.setattr(seen_pages_module, "SESSION_TTL", 0)
+    session_seen("active", "search")
+    monkeypatch.undo()
+
+    assert not session_seen("idle", "search")  # forgotten, like the session state it replaced
@@ -0,0 +1,112 @@
+"""Tests for the revisioned view-state store and its SQLite backend."""
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from ra_mcp_common import state_store as state_store_module
+from ra_mcp_common.settings import settings
+from ra_mcp_common.state_store import SQLiteStore, StateConflictError, StateStore, open_backend, state_backend
+
+
+async def test_compare_and_set_rejects_stale_revisions(tmp_path):
+    store = StateStore(SQLiteStore(tmp_path / "state.sqlite"), "views")
+    assert await store.load("v1") is None
+
+    assert await store.compare_and_set("v1", {"page": 1}, revision=0) == 1
+    assert await store.compare_and_set("v1", {"page": 2}, revision=0) is None  # someone created it first
+    assert await store.compare_and_set("v1", {"page": 2}, revision=1) == 2
+    assert await store.compare_and_set("v1", {"page": 3}, revision=1) is None  # stale read
+
+    entry = await store.load("v1")
+    assert entry is not None
+    assert (entry.value, entry.revision) == ({"page": 2}, 2)
+
+
+async def test_processes_sharing_the_file_see_each_others_writes(tmp_path):
+    path = tmp_path / "state.sqlite"
+    replica_a = StateStore(SQLiteStore(path), "views")
+    replica_b = StateStore(SQLiteStore(path), "views")
+
+    await replica_a.put("v1", {"page": 1})
+    entry = await replica_b.load("v1")
+    assert entry is not None
+    assert entry.value == {"page": 1}
+
+    await replica_a.put("v1", {"page": 2})
+    assert await replica_b.compare_and_set("v1", {"page": 9}, revision=entry.revision) is None
+    assert await replica_b.get("v1") == {"page": 2}
+
+
+async def test_concurrent_writers_each_win_exactly_once(tmp_path):
+    stores = [StateStore(SQLiteStore(tmp_path / "state.sqlite"), "views") for _ in range(4)]
+    await stores[0].put("counter", {"n": 0})
+
+    async def increment(store: StateStore) -> None:
+        while True:
+            entry = await store.load("counter")
+            assert entry is not None
+            if await store.compare_and_set("counter", {"n": entry.value["n"] + 1}, revision=entry.revision) is not None:
+                return
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*(increment(store) for store in stores for _ in range(5)))
+    assert await stores[0].get("counter") == {"n": 20}
+
+
+async def test_a_write_waiting_for_another_process_does_not_block_the_event_loop(tmp_path):
+    path = tmp_path / "state.sqlite"
+    store = SQLiteStore(path)
+    other_process = sqlite3.connect(path, isolation_level=None)
+    other_process.execute("BEGIN IMMEDIATE")  # holds the write lock
+
+    write = asyncio.create_task(store.compare_and_set("v1", {"revision": 1}, expected_revision=0))
+    await asyncio.sleep(0.1)  # the loop keeps running while the write waits
+    assert not write.done()
+
+    other_process.execute("COMMIT")
+    assert await write is True
+    other_process.close()
+
+
+async def test_entries_expire_and_collections_are_separate(tmp_path):
+    backend = SQLiteStore(tmp_path / "state.sqlite")
+    views = StateStore(backend, "views", ttl=0)
+    sessions = StateStore(backend, "sessions")
+
+    await views.put("k", {"view": 1})
+    await sessions.put("k", {"session": 1})
+    assert await views.get("k") is None
+    assert await sessions.get("k") == {"session": 1}
+    assert await sessions.delete("k") is True
+    assert await sessions.delete("k") is False
+
+
+async def test_put_gives_up_when_the_entry_keeps_changing(tmp_path, monkeypatch):
+    store = StateStore(SQLiteStore(":memory:"), "views")
+
+    async def always_stale(*_args: object, **_kwargs: object) -> None:
+        return None
+
+    monkeypatch.setattr(store, "compare_and_set", always_stale)
+    with pytest.raises(StateConflictError):
+        await store.put("v1", {"page": 1})
+
+
+def test_backend_is_chosen_by_setting(tmp_path, monkeypatch):
+    monkeypatch.setattr(state_store_module, "_shared", {})
+    monkeypatch.setattr(settings, "state_store", None)
+    default = SQLiteStore(":memory:")
+    assert state_backend(lambda: default) is default
+
+    monkeypatch.setattr(settings, "state_store", f"sqlite://{tmp_path}/state.sqlite")
+    shared = state_backend(lambda: default)
+    assert isinstance(shared, SQLiteStore)
+    assert shared.path == f"{tmp_path}/state.sqlite"
+    assert state_backend(lambda: default) is shared  # one backend per process
+
+    assert isinstance(open_backend(str(tmp_path / "bare.sqlite")), SQLiteStore)
+    # No other backend has a compare-and-set that is atomic across processes.
+    with pytest.raises(ValueError, match="sqlite"):
+        open_backend("redis://localhost:6379/0")
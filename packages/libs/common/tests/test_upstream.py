@@ -0,0 +1,52 @@
+"""Tests for upstream routing (RA_MCP_UPSTREAM_URL)."""
+
+import httpx
+import pytest
+import respx
+
+from ra_mcp_common.http_client import HTTPClient
+from ra_mcp_common.settings import settings
+from ra_mcp_common.upstream import upstream_url
+
+
+@pytest.fixture
+def mock_upstream(monkeypatch):
+    monkeypatch.setattr(settings, "upstream_url", "http://127.0.0.1:8765/")
+
+
+def test_passthrough_when_unset():
+    url = "https://data.riksarkivet.se/api/records?text=trolldom"
+    assert upstream_url(url) == url
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://data.riksarkivet.se/api/records", "http://127.0.0.1:8765/data.riksarkivet.se/api/records"),
+        ("https://oai-pmh.riksarkivet.se/OAI?verb=GetRecord", "http://127.0.0.1:8765/oai-pmh.riksarkivet.se/OAI?verb=GetRecord"),
+        ("https://lbiiif.riksarkivet.se/arkis!R0001203/manifest", "http://127.0.0.1:8765/lbiiif.riksarkivet.se/arkis!R0001203/manifest"),
+        ("https://tora.entryscape.net/store/sparql", "http://127.0.0.1:8765/tora.entryscape.net/store/sparql"),
+    ],
+)
+def test_rewrites_upstream_hosts(mock_upstream, url, expected):
+    assert upstream_url(url) == expected
+
+
+def test_other_hosts_are_not_rewritten(mock_upstream):
+    url = "https://huggingface.co/datasets/Riksarkivet/x/resolve/main/a.pdf"
+    assert upstream_url(url) == url
+
+
+@respx.mock(assert_all_called=True)
+async def test_http_client_sends_to_stand_in(mock_upstream, respx_mock):
+    route = respx_mock.get("http://127.0.0.1:8765/data.riksarkivet.se/api/records", params={"text": "trolldom"})
+    route.mock(return_value=httpx.Response(200, json={"totalHits": 0, "items": []}))
+
+    client = HTTPClient()
+    try:
+        result = await client.get_json("https://data.riksarkivet.se/api/records", params={"text": "trolldom"})
+    finally:
+        await client.aclose()
+
+    assert result == {"totalHits": 0, "items": []}
+    assert route.called
@@ -7,7 +7,7 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from ra_mcp_dataset_lib import build_fts_index, build_scalar_indexes
+from ra_mcp_dataset_lib import RenderRecord, add_display_text, build_fts_index, build_scalar_indexes
 
 from .config import DOMBOKSREGISTER_TABLE, MEDELSTAD_TABLE
 from .models import DomboksregisterRecord, MedelstadRecord
@@ -53,6 +53,8 @@ def ingest_domboksregister(
     db: lancedb.DBConnection,
     person_csv: str | Path,
     paragraf_csv: str | Path,
+    *,
+    render_record: RenderRecord | None = None,
 ) -> lancedb.table.Table:
     """Ingest Domboksregister CSVs into a LanceDB table with FTS index.
 
@@ -63,6 +65,7 @@ def ingest_domboksregister(
         db: LanceDB database connection.
         person_csv: Path to Person.csv (semicolon-delimited, latin-1, quoted fields).
         paragraf_csv: Path to Paragraf.csv (semicolon-delimited, latin-1, quoted fields).
+        render_record: Precomputes the ``display_text`` column; see :func:`ra_mcp_dataset_lib.add_display_text`.
 
     Returns:
         The created LanceDB table.
@@ -94,6 +97,8 @@ def ingest_domboksregister(
 
     logger.info("Parsed %d Domboksregister records", len(records))
 
+    if render_record is not None:
+        add_display_text(records, render_record)
     db.create_table(DOMBOKSREGISTER_TABLE, data=records, mode="overwrite")
     build_fts_index(db, DOMBOKSREGISTER_TABLE)
     # datum is a range filter -> BTree.
@@ -104,6 +109,8 @@ def ingest_medelstad(
     db: lancedb.DBConnection,
     person_csv: str | Path,
     maal_csv: str | Path,
+    *,
+    render_record: RenderRecord | None = None,
 ) -> lancedb.table.Table:
     """Ingest Medelstad CSVs into a LanceDB table with FTS index.
 
@@ -114,6 +121,7 @@ def ingest_medelstad(
         db: LanceDB database connection.
         person_csv: Path to personposter.csv (semicolon-delimited, latin-1).
         maal_csv: Path to maal.csv (semicolon-delimited, latin-1).
+        render_record: Precomputes the ``display_text`` column; see :func:`ra_mcp_dataset_lib.add_display_text`.
 
     Returns:
         The created LanceDB table.
@@ -145,6 +153,8 @@ def ingest_medelstad(
 
     logger.info("Parsed %d Medelstad records", len(records))
 
+    if render_record is not None:
+        add_display_text(records, render_record)
     db.create_table(MEDELSTAD_TABLE, data=records, mode="overwrite")
     build_fts_index(db, MEDELSTAD_TABLE)
     # ting_dag is a range filter -> BTree.
@@ -1,18 +1,27 @@
 """Shared LanceDB spine for the ra-mcp dataset libraries."""
 
 from ra_mcp_dataset_lib.search import (
+    DISPLAY_CHECK_SAMPLE,
+    DISPLAY_TEXT_COLUMN,
     MAX_TOTAL_COUNT,
+    RecordPage,
+    RenderRecord,
     SearchResult,
+    add_display_text,
     any_of,
     at_least,
     at_most,
     build_fts_index,
     build_scalar_indexes,
+    check_display_text,
     combine,
     equals,
     format_results,
     get_lancedb,
     lancedb_fts_search,
+    register_display_renderers,
+    render_display_text,
+    render_records,
     require_keyword,
     require_ordered_range,
     text_contains,
@@ -20,18 +29,27 @@ from ra_mcp_dataset_lib.search import (
 
 
 __all__ = [
+    "DISPLAY_CHECK_SAMPLE",
+    "DISPLAY_TEXT_COLUMN",
     "MAX_TOTAL_COUNT",
+    "RecordPage",
+    "RenderRecord",
     "SearchResult",
+    "add_display_text",
     "any_of",
     "at_least",
     "at_most",
     "build_fts_index",
     "build_scalar_indexes",
+    "check_display_text",
     "combine",
     "equals",
     "format_results",
     "get_lancedb",
     "lancedb_fts_search",
+    "register_display_renderers",
+    "render_display_text",
+    "render_records",
     "require_keyword",
     "require_ordered_range",
     "text_contains",
@@ -12,18 +12,22 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from collections.abc import Callable, Sequence
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, overload
 
-from lancedb.index import FTS, Bitmap, BTree
 from opentelemetry.trace import SpanKind, StatusCode
-from pydantic import BaseModel
+from pydantic import BaseModel, GetCoreSchemaHandler
+from pydantic_core import core_schema
 
+from ra_mcp_common.cache_registry import CacheStats, matching_keys, register_cache
+from ra_mcp_common.formatting import TokenBudget
 from ra_mcp_common.telemetry import get_meter, get_tracer, mark_span_error, record_span_exception
 
 
 if TYPE_CHECKING:
     import lancedb
+    import pyarrow as pa
+    from lancedb.table import Table
 
 
 logger = logging.getLogger("ra_mcp.lancedb")
@@ -46,11 +50,137 @@ MAX_TOTAL_COUNT = 10_000
 _connections: dict[str, lancedb.DBConnection] = {}
 _connections_lock = threading.Lock()
 
+# Column holding each record's pre-rendered display block (see add_display_text).
+DISPLAY_TEXT_COLUMN = "display_text"
+# Rows re-rendered per table, once per process, before its stored display text is trusted.
+DISPLAY_CHECK_SAMPLE = 50
+
+# Token budget of one formatted result page (format_results), as search_transcribed's default.
+MAX_RESULT_TOKENS = 15_000
+
+# A dataset's per-record renderer: appends one record's display lines to ``lines``.
+type RenderRecord = Callable[[Mapping[str, Any], list[str]], None]
+
+_display_renderers: dict[str, RenderRecord] = {}
+_display_verified: dict[tuple[str, str], bool] = {}
+_display_lock = threading.Lock()
+
+
+class RecordPage(Sequence[Mapping[str, Any]]):
+    """One page of search matches kept as an Arrow table, read as a sequence of records.
+
+    The spine used to materialise every match (up to :data:`MAX_TOTAL_COUNT`) as a
+    Python dict just to slice a 25-row page out of them. A ``RecordPage`` wraps the
+    zero-copy Arrow slice instead: a column is converted to Python values once, in
+    one vectorised ``to_pylist()`` pass, the first time any record reads that field.
+    Fields the formatter never touches (``searchable_text``, long biography text)
+    are never converted at all.
+
+    Each item is a read-only :class:`~collections.abc.Mapping` view of one row, so
+    the per-dataset ``render_record`` functions keep using ``rec.get("field", "")``
+    and ``rec["field"]`` unchanged.
+    """
+
+    __slots__ = ("_columns", "_table")
+
+    def __init__(self, table: pa.Table) -> None:
+        self._table = table
+        self._columns: dict[str, list[Any]] = {}
+
+    @property
+    def table(self) -> pa.Table:
+        """The underlying Arrow page."""
+        return self._table
+
+    @property
+    def column_names(self) -> list[str]:
+        """Field names present on every record of the page."""
+        return self._table.column_names
+
+    def column(self, name: str) -> list[Any]:
+        """Return the Python values of column ``name``, converting it on first use.
+
+        Raises:
+            KeyError: if the page has no such column.
+        """
+        values = self._columns.get(name)
+        if values is None:
+            if name not in self._table.column_names:
+                raise KeyError(name)
+            values = self._table.column(name).to_pylist()
+            self._columns[name] = values
+        return values
+
+    def to_pylist(self) -> list[dict[str, Any]]:
+        """Materialise the page as plain dicts (for serialisation or mutation)."""
+        return self._table.to_pylist()
+
+    def __len__(self) -> int:
+        return self._table.num_rows
+
+    @overload
+    def __getitem__(self, index: int) -> Mapping[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Mapping[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> Mapping[str, Any] | list[Mapping[str, Any]]:
+        if isinstance(index, slice):
+            return [_RecordView(self, i) for i in range(len(self))[index]]
+        position: int = index + len(self) if index < 0 else index
+        if not 0 <= position < len(self):
+            raise IndexError("record index out of range")
+        return _RecordView(self, position)
+
+    def __iter__(self) -> Iterator[Mapping[str, Any]]:
+        for i in range(len(self)):
+            yield _RecordView(self, i)
+
+    def __repr__(self) -> str:
+        return f"RecordPage(rows={len(self)}, columns={self.column_names})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: type[Any], handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        # Accept only a RecordPage as-is (no per-row coercion into dicts, which would
+        # undo the point) and serialise it as the plain list of dicts it stands for.
+        return core_schema.is_instance_schema(cls, serialization=core_schema.plain_serializer_function_ser_schema(lambda page: page.to_pylist()))
+
+
+class _RecordView(Mapping[str, Any]):
+    """Read-only mapping view of row ``index`` of a :class:`RecordPage`."""
+
+    __slots__ = ("_index", "_page")
+
+    def __init__(self, page: RecordPage, index: int) -> None:
+        self._page = page
+        self._index = index
+
+    def __getitem__(self, key: str) -> object:
+        return self._page.column(key)[self._index]
+
+    def __contains__(self, key: object) -> bool:
+        # Answer from the schema; the Mapping default would convert the column.
+        return key in self._page.column_names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._page.column_names)
+
+    def __len__(self) -> int:
+        return len(self._page.column_names)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
 
 class SearchResult(BaseModel):
-    """One page of a dataset full-text search plus the total match count."""
+    """One page of a dataset full-text search plus the total match count.
+
+    ``records`` is a columnar :class:`RecordPage` when the page comes from
+    :func:`lancedb_fts_search`, or a plain list of dicts when built by hand (tests,
+    fixtures). Both read the same way: iterate, index, ``len()`` and ``rec.get()``.
+    """
 
-    records: list[dict[str, Any]]
+    records: RecordPage | list[dict[str, Any]]
     total_hits: int
     keyword: str
     offset: int
@@ -75,7 +205,23 @@ def get_lancedb(uri: str) -> lancedb.DBConnection:
     return conn
 
 
-def build_fts_index(db: lancedb.DBConnection, table_name: str, column: str = "searchable_text") -> lancedb.table.Table:
+def _connection_cache_stats() -> CacheStats:
+    return CacheStats(entries=len(_connections), top_keys=[{"key": uri} for uri in sorted(_connections)])
+
+
+def _drop_connections(pattern: str | None) -> int:
+    """Forget cached connections; the next ``get_lancedb`` call reconnects (e.g. after a dataset was replaced)."""
+    with _connections_lock:
+        uris = matching_keys(_connections, pattern)
+        for uri in uris:
+            del _connections[uri]
+    return len(uris)
+
+
+register_cache("lancedb.connections", stats=_connection_cache_stats, invalidate=_drop_connections)
+
+
+def build_fts_index(db: lancedb.DBConnection, table_name: str, column: str = "searchable_text") -> Table:
     """Build (or replace) a Swedish full-text index on ``table_name.column``.
 
     ``FTS(language="Swedish")`` applies Swedish stemming + stop-words so inflected
@@ -87,6 +233,8 @@ def build_fts_index(db: lancedb.DBConnection, table_name: str, column: str = "se
     does not see it and would fail a full-text search, so ingest should return
     *this* handle rather than its pre-index one.
     """
+    from lancedb.index import FTS
+
     table = db.open_table(table_name)
     # max_token_length is raised from the lancedb default of 40: long Swedish
     # compound words (common in historical administrative/legal text) would
@@ -101,7 +249,7 @@ def build_scalar_indexes(
     *,
     btree: Sequence[str] = (),
     bitmap: Sequence[str] = (),
-) -> lancedb.table.Table:
+) -> Table:
     """Build scalar indexes on the columns a dataset filters on, so ``.where()``
     predicate push-down is an index lookup instead of a full scan of the column
     over (often remote) object storage.
@@ -122,6 +270,8 @@ def build_scalar_indexes(
     the on-disk dataset, so this belongs in the ingest/publish path (indexes bake
     into the next snapshot), never against already-published live data.
     """
+    from lancedb.index import Bitmap, BTree
+
     table = db.open_table(table_name)
     for column in btree:
         table.create_index(column, config=BTree(), replace=True)
@@ -130,6 +280,106 @@ def build_scalar_indexes(
     return table
 
 
+# --- precomputed display text -------------------------------------------------
+# Dataset rows never change after ingest, yet every search used to rebuild the
+# same per-record text in the formatter. A dataset can instead declare its
+# render_record at ingest time: each record's block is rendered once and stored in
+# the DISPLAY_TEXT_COLUMN, the search projects only that column (plus the score),
+# and formatting becomes a join of precomputed strings. The formatter module also
+# registers the same renderer, so the spine can check — once per table per process
+# — that the stored text still matches what the live formatter would produce, and
+# fall back to live rendering when the data predates a formatter change.
+#
+# Wiring, per dataset: the formatter module maps each table name to its
+# render_record in a DISPLAY_RENDERERS dict and passes it to
+# register_display_renderers at import. The lib's ingest functions take that
+# renderer as an optional ``render_record`` keyword and hand it to
+# add_display_text; the ingest script looks it up in DISPLAY_RENDERERS. Without a
+# renderer the column stays empty and the search renders live.
+
+
+def render_display_text(rec: Mapping[str, Any], render_record: RenderRecord) -> str | None:
+    """Render one record's display block as a single string (``None`` if it renders no lines)."""
+    lines: list[str] = []
+    render_record(rec, lines)
+    return "\n".join(lines) if lines else None
+
+
+def add_display_text(records: list[dict[str, Any]], render_record: RenderRecord) -> None:
+    """Store each record's rendered block in :data:`DISPLAY_TEXT_COLUMN` (ingest-time).
+
+    Call on the flat ingest records just before ``create_table``, with the same
+    ``render_record`` the dataset's formatter passes to :func:`format_results`.
+    """
+    for rec in records:
+        rec[DISPLAY_TEXT_COLUMN] = render_display_text(rec, render_record)
+
+
+def register_display_renderers(renderers: Mapping[str, RenderRecord]) -> None:
+    """Declare each table's live renderer so its stored display text can be verified.
+
+    Called by the dataset formatter modules at import with their
+    ``DISPLAY_RENDERERS`` (table name -> ``render_record``). Without a registration
+    the search never trusts (or returns) the stored column for that table.
+    """
+    with _display_lock:
+        for table_name, render_record in renderers.items():
+            _display_renderers[table_name] = render_record
+            # A different renderer invalidates any earlier verdict for this table.
+            for key in [k for k in _display_verified if k[1] == table_name]:
+                del _display_verified[key]
+
+
+def check_display_text(
+    db: lancedb.DBConnection,
+    table_name: str,
+    render_record: RenderRecord,
+    *,
+    sample: int = DISPLAY_CHECK_SAMPLE,
+) -> list[int]:
+    """Consistency check: re-render the first ``sample`` rows with the live renderer.
+
+    Returns the positions (within the sample) whose stored :data:`DISPLAY_TEXT_COLUMN`
+    differs from ``render_record``'s output — empty when the stored rendering is
+    current. A table without the column reports every sampled row as a mismatch.
+    """
+    rows = db.open_table(table_name).search().limit(sample).to_list()
+    return [i for i, row in enumerate(rows) if row.get(DISPLAY_TEXT_COLUMN) != render_display_text(row, render_record)]
+
+
+def _display_projection(db: lancedb.DBConnection, table: Table, table_name: str) -> list[str] | None:
+    """Columns a search should fetch: only the stored display text when it is verified.
+
+    ``None`` (every column) for a table without a display column. When the column
+    exists but cannot be trusted — no registered renderer, or the check found stale
+    rows — it is left out instead, so the formatter renders live from the raw fields.
+    """
+    names = table.schema.names
+    if DISPLAY_TEXT_COLUMN not in names:
+        return None
+    renderer = _display_renderers.get(table_name)
+    if renderer is None:
+        return [*(n for n in names if n != DISPLAY_TEXT_COLUMN), "_score"]
+    key = (str(getattr(db, "uri", id(db))), table_name)
+    verified = _display_verified.get(key)
+    if verified is None:
+        stale = check_display_text(db, table_name, renderer)
+        verified = not stale
+        if stale:
+            logger.warning(
+                "Stored %s in '%s' differs from the live formatter (%d of %d sampled rows); rendering live",
+                DISPLAY_TEXT_COLUMN,
+                table_name,
+                len(stale),
+                DISPLAY_CHECK_SAMPLE,
+            )
+        with _display_lock:
+            _display_verified[key] = verified
+    if verified:
+        return [DISPLAY_TEXT_COLUMN, "_score"]
+    return [*(n for n in names if n != DISPLAY_TEXT_COLUMN), "_score"]
+
+
 def lancedb_fts_search(
     db: lancedb.DBConnection,
     table_name: str,
@@ -152,6 +402,13 @@ def lancedb_fts_search(
     between queries, so per-query offsets drop and duplicate rows. Slicing one
     ranked set gives both a real ``total_hits`` and stable, gap-free pagination.
 
+    The ranked set stays an Arrow table: the total is its row count and the page is
+    a zero-copy slice, returned as a columnar :class:`RecordPage`. Only the page's
+    fields that are actually rendered are ever converted to Python objects. For a
+    table ingested with a verified :data:`DISPLAY_TEXT_COLUMN` the query projects
+    just that column (plus the relevance score), so neither the fetch nor the
+    formatter touches the raw fields at all.
+
     Raises:
         ValueError: if ``keyword`` is empty or whitespace.
     """
@@ -168,6 +425,9 @@ def lancedb_fts_search(
 
     table = db.open_table(table_name)
     query: Any = table.search(keyword, query_type="fts")
+    columns = _display_projection(db, table, table_name)
+    if columns is not None:
+        query = query.select(columns)
     if where:
         query = query.where(where)
     # The tables are built once (create_table + create_index) and never appended
@@ -185,7 +445,7 @@ def lancedb_fts_search(
     with _tracer.start_as_current_span(f"search {table_name}", kind=SpanKind.CLIENT, attributes=span_attrs) as span:
         start = time.perf_counter()
         try:
-            matches = query.limit(MAX_TOTAL_COUNT).to_list()
+            matches = query.limit(MAX_TOTAL_COUNT).to_arrow()
         except Exception as e:
             span.set_status(StatusCode.ERROR, f"{type(e).__name__}: {e}")
             record_span_exception(logger, e)  # also sets error.type on the span
@@ -196,8 +456,8 @@ def lancedb_fts_search(
             # and p95/p99 dashboards work, not just a success-only counter.
             _query_duration.record(time.perf_counter() - start, attrs)
             _query_counter.add(1, attrs)
-        total = len(matches)
-        page = matches[offset : offset + limit]
+        total = matches.num_rows
+        page = RecordPage(matches.slice(offset, limit))
         # Behavioural signals: total = how well the data answered this search
         # (0 = unmet demand); returned_rows = the page actually shown.
         span.set_attribute("db.response.total_hits", total)
@@ -313,11 +573,43 @@ def require_ordered_range[T: (int, str)](low: T | None, high: T | None, label: s
     return None
 
 
+def render_records(records: RecordPage | list[dict[str, Any]], render_record: RenderRecord, lines: list[str], budget: TokenBudget | None = None) -> int:
+    """Append each record's display lines to ``lines``; return how many records were appended.
+
+    Joins the precomputed :data:`DISPLAY_TEXT_COLUMN` blocks when the page carries
+    them (a verified, display-projected search), else calls ``render_record`` per
+    record. Either way the output is identical. With a ``budget``, rendering stops
+    before the first record that does not fit (see :class:`TokenBudget`).
+    """
+    if isinstance(records, RecordPage) and DISPLAY_TEXT_COLUMN in records.column_names:
+        # None is stored for a record the renderer emits nothing for: no lines, but still one record.
+        record_blocks: Iterator[list[str]] = ([] if block is None else [block] for block in records.column(DISPLAY_TEXT_COLUMN))
+    else:
+        record_blocks = _render_each(records, render_record)
+    rendered = 0
+    for record_lines in record_blocks:
+        if budget is not None and not budget.fits(record_lines):
+            break
+        lines.extend(record_lines)
+        rendered += 1
+    return rendered
+
+
+def _render_each(records: RecordPage | list[dict[str, Any]], render_record: RenderRecord) -> Iterator[list[str]]:
+    """One record's display lines at a time, rendered only when asked for."""
+    for rec in records:
+        record_lines: list[str] = []
+        render_record(rec, record_lines)
+        yield record_lines
+
+
 def format_results(
     result: SearchResult,
     *,
     label: str,
-    render_record: Callable[[dict[str, Any], list[str]], None],
+    render_record: RenderRecord,
+    tip: str | None = None,
+    max_tokens: int | None = MAX_RESULT_TOKENS,
 ) -> str:
     """Render a dataset :class:`SearchResult` page as the standard plain-text block.
 
@@ -327,21 +619,43 @@ def format_results(
     ``label`` names the dataset in those messages (e.g. ``"SBL"``, ``"Board
     member"``); ``render_record(rec, lines)`` appends one record's lines and is the
     only genuinely per-dataset part.
+
+    For a :class:`RecordPage` each ``rec`` is a row view over the Arrow page, so the
+    fields ``render_record`` reads are converted column-at-a-time (one pass per
+    field for the whole page) instead of building a dict per record. A page that
+    carries precomputed display text is joined as-is (see :func:`render_records`).
+    ``tip`` is an optional closing hint appended after a blank line when there are
+    results (e.g. which view tool opens the original page).
+
+    Records are rendered one at a time against a ``max_tokens`` budget (``None``
+    for no limit). Rendering stops at the first record that would exceed it; the
+    header then counts the records actually shown, and the footer says how many
+    were left out and the offset to continue from.
     """
     if not result.records:
         if result.offset > 0:
             return f"No more {label} results for '{result.keyword}' at offset {result.offset}. Total found: {result.total_hits}"
         return f"No {label} results found for '{result.keyword}'."
 
-    lines: list[str] = [
-        f"{label} search results for '{result.keyword}': showing {len(result.records)} of {result.total_hits} records (offset {result.offset})",
-        "",
-    ]
-    for rec in result.records:
-        render_record(rec, lines)
-
-    next_offset = result.offset + result.limit
-    if next_offset < result.total_hits:
+    def header(shown: int) -> str:
+        return f"{label} search results for '{result.keyword}': showing {shown} of {result.total_hits} records (offset {result.offset})"
+
+    lines: list[str] = [header(len(result.records)), ""]
+    budget = TokenBudget(max_tokens)
+    budget.charge(lines)
+    shown = render_records(result.records, render_record, lines, budget)
+
+    if shown < len(result.records):
+        lines[0] = header(shown)
+        lines.append(
+            f"{len(result.records) - shown} more records on this page were left out to stay within the response token budget. "
+            f"Use offset={result.offset + shown} to continue from here."
+        )
+    elif (next_offset := result.offset + result.limit) < result.total_hits:
         lines.append(f"More results available. Use offset={next_offset} to see the next page.")
 
+    if tip:
+        lines.append("")
+        lines.append(tip)
+
     return "\n".join(lines)
@@ -0,0 +1,69 @@
+"""Formatting a 100-record page from the columnar RecordPage renders the same
+text as the dict paths it replaced (materialise the ranked set with
+``to_list()``, slice, then ``.get()`` per record). Their CPU time and
+allocations are compared in ``benchmarks/record_page``, not here."""
+
+from collections.abc import Mapping
+from typing import Any
+
+import pyarrow as pa
+import pytest
+
+from ra_mcp_common.formatting import append_if, truncate_text
+from ra_mcp_dataset_lib import RecordPage, SearchResult, format_results
+
+
+PAGE = 100
+RANKED = 2_000
+_FIELDS = ["id", "fnamn", "enamn", "titel", "roll", "socken", "plats", "datum", "arende", "anteckning"]
+
+
+def _render(rec: Mapping[str, Any], lines: list[str]) -> None:
+    """A typical dataset render_record (court-mcp shape): ten .get() reads."""
+    lines.append(f"--- Domboksregister {rec.get('id', '?')} ---")
+    name = " ".join(p for p in (rec.get("fnamn", ""), rec.get("enamn", "")) if p)
+    append_if(lines, "Name", name)
+    for label, field in (("Title", "titel"), ("Role", "roll"), ("Parish", "socken"), ("Place", "plats"), ("Date", "datum"), ("Case", "arende")):
+        append_if(lines, label, rec.get(field, ""))
+    anteckning = rec.get("anteckning", "")
+    if anteckning:
+        lines.append(f"Note: {truncate_text(anteckning, 150)}")
+    lines.append("")
+
+
+@pytest.fixture(scope="module")
+def ranked() -> pa.Table:
+    """A ranked FTS result set: the rendered fields plus the wide text columns a
+    real table carries but the formatter never shows."""
+    rows = [
+        {
+            **{field: f"{field} värde {i}" for field in _FIELDS},
+            "searchable_text": f"hästar och hästen i socknen nummer {i} " * 20,
+            "fulltext": f"rättegång om hästen {i} " * 40,
+        }
+        for i in range(RANKED)
+    ]
+    return pa.Table.from_pylist(rows)
+
+
+def _dict_path(ranked: pa.Table) -> str:
+    records = ranked.to_pylist()[:PAGE]
+    return format_results(
+        SearchResult(records=records, total_hits=RANKED, keyword="häst", offset=0, limit=PAGE), label="Domboksregister", render_record=_render
+    )
+
+
+def _page_dict_path(ranked: pa.Table) -> str:
+    records = ranked.slice(0, PAGE).to_pylist()
+    return format_results(
+        SearchResult(records=records, total_hits=RANKED, keyword="häst", offset=0, limit=PAGE), label="Domboksregister", render_record=_render
+    )
+
+
+def _arrow_path(ranked: pa.Table) -> str:
+    page = RecordPage(ranked.slice(0, PAGE))
+    return format_results(SearchResult(records=page, total_hits=RANKED, keyword="häst", offset=0, limit=PAGE), label="Domboksregister", render_record=_render)
+
+
+def test_arrow_and_dict_paths_render_identical_text(ranked):
+    assert _arrow_path(ranked) == _dict_path(ranked) == _page_dict_path(ranked)
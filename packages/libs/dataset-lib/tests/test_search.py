@@ -4,7 +4,11 @@ bugs the audit found (English-stemmed Swedish, fake total_hits, window-and-slice
 pagination) and would fail against the old per-dataset implementation.
 """
 
+from collections.abc import Mapping
+from typing import Any
+
 import lancedb
+import pyarrow as pa
 import pytest
 from opentelemetry import trace
 from opentelemetry.sdk.trace import TracerProvider
@@ -12,16 +16,21 @@ from opentelemetry.sdk.trace.export import SimpleSpanProcessor
 from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
 
 from ra_mcp_dataset_lib import (
+    DISPLAY_TEXT_COLUMN,
+    RecordPage,
     SearchResult,
+    add_display_text,
     any_of,
     at_least,
     at_most,
     build_fts_index,
     build_scalar_indexes,
+    check_display_text,
     combine,
     equals,
     format_results,
     lancedb_fts_search,
+    register_display_renderers,
     require_keyword,
     require_ordered_range,
     text_contains,
@@ -231,7 +240,7 @@ def test_require_keyword(keyword, expect_error):
         assert err is None
 
 
-def _render(rec: dict, lines: list[str]) -> None:
+def _render(rec: Mapping[str, Any], lines: list[str]) -> None:
     lines.append(f"- {rec['name']}")
 
 
@@ -258,8 +267,161 @@ def test_format_results_header_records_and_footer():
     assert lines[-1] == "More results available. Use offset=2 to see the next page."
 
 
+def test_format_results_appends_tip_after_footer():
+    records = [{"name": "Alice"}, {"name": "Bob"}]
+    result = SearchResult(records=records, total_hits=40, keyword="häst", offset=0, limit=2)
+    lines = format_results(result, label="SBL", render_record=_render, tip="Tip: open it.").split("\n")
+    assert lines[-3:] == ["More results available. Use offset=2 to see the next page.", "", "Tip: open it."]
+    # No results → no tip.
+    empty = SearchResult(records=[], total_hits=0, keyword="zzz", offset=0, limit=25)
+    assert "Tip" not in format_results(empty, label="SBL", render_record=_render, tip="Tip: open it.")
+
+
 def test_format_results_no_footer_when_all_shown():
     records = [{"name": "Alice"}]
     result = SearchResult(records=records, total_hits=1, keyword="häst", offset=0, limit=25)
     out = format_results(result, label="SBL", render_record=_render)
     assert "More results available" not in out
+
+
+def test_format_results_stops_at_record_boundary_within_budget():
+    records = [{"name": f"{i}-" + "x" * 400} for i in range(10)]
+    result = SearchResult(records=records, total_hits=40, keyword="häst", offset=20, limit=10)
+    lines = format_results(result, label="SBL", render_record=_render, max_tokens=300).split("\n")
+    shown = [line for line in lines if line.startswith("- ")]
+    assert 0 < len(shown) < 10
+    assert all(line.endswith("x" * 400) for line in shown)  # whole records only
+    assert lines[0] == f"SBL search results for 'häst': showing {len(shown)} of 40 records (offset 20)"
+    assert lines[-1] == (
+        f"{10 - len(shown)} more records on this page were left out to stay within the response token budget. "
+        f"Use offset={20 + len(shown)} to continue from here."
+    )
+
+
+# --- columnar page ------------------------------------------------------------
+
+
+def test_search_returns_columnar_page(db):
+    result = lancedb_fts_search(db, "t", "häst", limit=5, offset=10)
+    assert isinstance(result.records, RecordPage)
+    assert len(result.records) == 5
+    assert result.records.table.num_rows == 5
+    assert result.records.to_pylist() == [dict(r) for r in result.records]
+
+
+def test_record_page_converts_only_the_columns_that_are_read():
+    page = RecordPage(pa.table({"name": ["a", "b"], "searchable_text": ["long", "longer"]}))
+    rows = list(page)
+    assert [r.get("name") for r in rows] == ["a", "b"]
+    assert rows[0].get("missing", "-") == "-"
+    # Membership answers from the schema; neither it nor the reads above touch the text column.
+    assert "searchable_text" in rows[0]
+    assert set(page._columns) == {"name"}
+
+
+def test_record_page_indexing_and_serialisation():
+    page = RecordPage(pa.table({"id": [1, 2, 3]}))
+    assert page[-1]["id"] == 3
+    assert [r["id"] for r in page[1:]] == [2, 3]
+    with pytest.raises(IndexError):
+        page[3]
+    result = SearchResult(records=page, total_hits=3, keyword="k", offset=0, limit=3)
+    assert result.model_dump()["records"] == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+
+def test_format_results_renders_a_record_page_like_dicts():
+    records = [{"name": "Alice"}, {"name": "Bob"}]
+    as_dicts = SearchResult(records=records, total_hits=2, keyword="häst", offset=0, limit=25)
+    as_page = SearchResult(records=RecordPage(pa.Table.from_pylist(records)), total_hits=2, keyword="häst", offset=0, limit=25)
+    assert format_results(as_page, label="SBL", render_record=_render) == format_results(as_dicts, label="SBL", render_record=_render)
+
+
+# --- precomputed display text ---------------------------------------------------
+
+
+def _render_person(rec: Mapping[str, Any], lines: list[str]) -> None:
+    lines.append(f"--- Person {rec.get('id', '?')} ---")
+    lines.append(f"Name: {rec.get('name', '')}")
+    lines.append("")
+
+
+def _render_person_v2(rec: Mapping[str, Any], lines: list[str]) -> None:
+    lines.append(f"--- Person {rec.get('id', '?')} ({rec.get('name', '')}) ---")
+    lines.append("")
+
+
+def _display_db(tmp_path, table_name: str):
+    """``table_name`` ingested with display text under ``_render_person``, plus a
+    ``plain`` twin without it — same rows, so the same ranking — to render live."""
+    conn = lancedb.connect(str(tmp_path / "display"))
+    rows = [{"id": i, "name": f"Anna {i}", "searchable_text": f"hästar nummer {i}"} for i in range(30)]
+    conn.create_table("plain", data=rows, mode="overwrite")
+    build_fts_index(conn, "plain")
+    add_display_text(rows, _render_person)
+    conn.create_table(table_name, data=rows, mode="overwrite")
+    build_fts_index(conn, table_name)
+    return conn
+
+
+def _live(conn, render_record) -> str:
+    return format_results(lancedb_fts_search(conn, "plain", "häst", limit=5, offset=0), label="Person", render_record=render_record)
+
+
+def test_add_display_text_stores_the_rendered_block():
+    rows = [{"id": 1, "name": "Anna"}, {"id": 2}]
+    add_display_text(rows, _render_person)
+    assert rows[0][DISPLAY_TEXT_COLUMN] == "--- Person 1 ---\nName: Anna\n"
+    assert rows[1][DISPLAY_TEXT_COLUMN] == "--- Person 2 ---\nName: \n"
+    # A renderer that emits nothing stores None.
+    add_display_text(rows, lambda rec, lines: None)
+    assert rows[0][DISPLAY_TEXT_COLUMN] is None
+
+
+def test_verified_display_text_is_the_only_column_fetched(tmp_path):
+    conn = _display_db(tmp_path, "display_verified")
+    register_display_renderers({"display_verified": _render_person})
+    assert check_display_text(conn, "display_verified", _render_person) == []
+
+    result = lancedb_fts_search(conn, "display_verified", "häst", limit=5, offset=0)
+    assert isinstance(result.records, RecordPage)
+    assert DISPLAY_TEXT_COLUMN in result.records.column_names
+    assert "name" not in result.records.column_names
+    assert result.total_hits == 30
+    assert format_results(result, label="Person", render_record=_render_person) == _live(conn, _render_person)
+
+
+def test_stale_display_text_falls_back_to_live_rendering(tmp_path, caplog):
+    conn = _display_db(tmp_path, "display_stale")
+    # The formatter changed after ingest: the stored blocks no longer match.
+    register_display_renderers({"display_stale": _render_person_v2})
+    assert check_display_text(conn, "display_stale", _render_person_v2) == list(range(30))
+
+    result = lancedb_fts_search(conn, "display_stale", "häst", limit=5, offset=0)
+    assert isinstance(result.records, RecordPage)
+    assert DISPLAY_TEXT_COLUMN not in result.records.column_names
+    assert "differs from the live formatter" in caplog.text
+    assert format_results(result, label="Person", render_record=_render_person_v2) == _live(conn, _render_person_v2)
+
+
+def test_unregistered_table_never_serves_display_text(tmp_path):
+    conn = _display_db(tmp_path, "display_unregistered")
+    result = lancedb_fts_search(conn, "display_unregistered", "häst", limit=5, offset=0)
+    assert isinstance(result.records, RecordPage)
+    assert DISPLAY_TEXT_COLUMN not in result.records.column_names
+    assert "name" in result.records.column_names
+
+
+def test_empty_display_text_still_counts_as_a_shown_record():
+    def render_named(rec: Mapping[str, Any], lines: list[str]) -> None:
+        if rec.get("name"):
+            lines.append(f"Name: {rec['name']}")
+
+    records = [{"name": "Alice"}, {"name": ""}, {"name": "Bob"}]
+    live = SearchResult(records=records, total_hits=3, keyword="häst", offset=0, limit=3)
+    stored = [dict(rec) for rec in records]
+    add_display_text(stored, render_named)
+    assert stored[1][DISPLAY_TEXT_COLUMN] is None
+    precomputed = RecordPage(pa.Table.from_pylist([{DISPLAY_TEXT_COLUMN: rec[DISPLAY_TEXT_COLUMN]} for rec in stored]))
+    text = format_results(SearchResult(records=precomputed, total_hits=3, keyword="häst", offset=0, limit=3), label="SBL", render_record=render_named)
+    assert "left out" not in text
+    assert text == format_results(live, label="SBL", render_record=render_named)
@@ -7,7 +7,7 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from ra_mcp_dataset_lib import build_fts_index, build_scalar_indexes
+from ra_mcp_dataset_lib import RenderRecord, add_display_text, build_fts_index, build_scalar_indexes
 
 from .config import DODA_TABLE, FODELSE_TABLE, VIGSEL_TABLE
 from .models import DodaRecord, FodelseRecord, VigselRecord
@@ -19,7 +19,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def ingest_fodelse(db: lancedb.DBConnection, csv_dir: str | Path) -> lancedb.table.Table:
+def ingest_fodelse(db: lancedb.DBConnection, csv_dir: str | Path, *, render_record: RenderRecord | None = None) -> lancedb.table.Table:
     """Ingest birth (födelse) CSVs from a directory into a LanceDB table with FTS index.
 
     Reads ALL .csv files from the given directory and concatenates rows into one table.
@@ -27,6 +27,7 @@ def ingest_fodelse(db: lancedb.DBConnection, csv_dir: str | Path) -> lancedb.tab
     Args:
         db: LanceDB database connection.
         csv_dir: Directory containing county CSV files (semicolon-delimited, latin-1 encoded).
+        render_record: Precomputes the ``display_text`` column; see :func:`ra_mcp_dataset_lib.add_display_text`.
 
     Returns:
         The created LanceDB table.
@@ -60,13 +61,15 @@ def ingest_fodelse(db: lancedb.DBConnection, csv_dir: str | Path) -> lancedb.tab
 
     logger.info("Parsed %d Födelse records from %d files", len(records), len(csv_files))
 
+    if render_record is not None:
+        add_display_text(records, render_record)
     db.create_table(FODELSE_TABLE, data=records, mode="overwrite")
     build_fts_index(db, FODELSE_TABLE)
     # datum is a range filter -> BTree.
     return build_scalar_indexes(db, FODELSE_TABLE, btree=["datum"])
 
 
-def ingest_doda(db: lancedb.DBConnection, csv_dir: str | Path) -> lancedb.table.Table:
+def ingest_doda(db: lancedb.DBConnection, csv_dir: str | Path, *, render_record: RenderRecord | None = None) -> lancedb.table.Table:
     """Ingest death (döda) CSVs from a directory into a LanceDB table with FTS index.
 
     Reads ALL .csv files from the given directory and concatenates rows into one table.
@@ -74,6 +77,7 @@ def ingest_doda(db: lancedb.DBConnection, csv_dir: str | Path) -> lancedb.table.
     Args:
         db: LanceDB database connection.
         csv_dir: Directory containing county CSV files (semicolon-delimited, latin-1 encoded).
+        render_record: Precomputes the ``display_text`` column; see :func:`ra_mcp_dataset_lib.add_display_text`.
 
     Returns:
         The created LanceDB table.
@@ -107,13 +111,15 @@ def ingest_doda(db: lancedb.DBConnection, csv_dir: str | Path) -> lancedb.table.
 
     logger.info("Parsed %d Döda records from %d files", len(records), len(csv_files))
 
+    if render_record is not None:
+        add_display_text(records, render_record)
     db.create_table(DODA_TABLE, data=records, mode="overwrite")
     build_fts_index(db, DODA_TABLE)
     # datum is a range filter -> BTree.
     return build_scalar_indexes(db, DODA_TABLE, btree=["datum"])
 
 
-def ingest_vigsel(db: lancedb.DBConnection, csv_dir: str | Path) -> lancedb.table.Table:
+def ingest_vigsel(db: lancedb.DBConnection, csv_dir: str | Path, *, render_record: RenderRecord | None = None) -> lancedb.table.Table:
     """Ingest marriage (vigsel) CSVs from a directory into a LanceDB table with FTS index.
 
     Reads ALL .csv files from the given directory and concatenates rows into one table.
@@ -121,6 +127,7 @@ def ingest_vigsel(db: lancedb.DBConnection, csv_dir: str | Path) -> lancedb.tabl
     Args:
         db: LanceDB database connection.
         csv_dir: Directory containing county CSV files (semicolon-delimited, latin-1 encoded).
+        render_record: Precomputes the ``display_text`` column; see :func:`ra_mcp_dataset_lib.add_display_text`.
 
     Returns:
         The created LanceDB table.
@@ -154,6 +161,8 @@ def ingest_vigsel(db: lancedb.DBConnection, csv_dir: str | Path) -> lancedb.tabl
 
     logger.info("Parsed %d Vigsel records from %d files", len(records), len(csv_files))
 
+    if render_record is not None:
+        add_display_text(records, render_record)
     db.create_table(VIGSEL_TABLE, data=records, mode="overwrite")
     build_fts_index(db, VIGSEL_TABLE)
     # datum is a range filter -> BTree.
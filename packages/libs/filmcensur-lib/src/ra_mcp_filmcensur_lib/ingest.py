@@ -7,7 +7,7 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from ra_mcp_dataset_lib import build_fts_index
+from ra_mcp_dataset_lib import RenderRecord, add_display_text, build_fts_index
 
 from .config import FILMREG_TABLE
 from .models import FilmregRecord
@@ -19,12 +19,13 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def ingest_filmreg(db: lancedb.DBConnection, csv_path: str | Path) -> lancedb.table.Table:
+def ingest_filmreg(db: lancedb.DBConnection, csv_path: str | Path, *, render_record: RenderRecord | None = None) -> lancedb.table.Table:
     """Ingest Filmregistret CSV into a LanceDB table with FTS index.
 
     Args:
         db: LanceDB database connection.
         csv_path: Path to the FILMREG CSV file (semicolon-delimited, latin-1 encoded).
+        render_record: Precomputes the ``display_text`` column; see :func:`ra_mcp_dataset_lib.add_display_text`.
 
     Returns:
         The created LanceDB table.
@@ -52,6 +53,8 @@ def ingest_filmreg(db: lancedb.DBConnection, csv_path: str | Path) -> lancedb.ta
 
     logger.info("Parsed %d Filmreg records", len(records))
 
+    if render_record is not None:
+        add_display_text(records, render_record)
     table = db.create_table(FILMREG_TABLE, data=records, mode="overwrite")
     table = build_fts_index(db, FILMREG_TABLE)
     return table
@@ -7,7 +7,7 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from ra_mcp_dataset_lib import build_fts_index, build_scalar_indexes
+from ra_mcp_dataset_lib import RenderRecord, add_display_text, build_fts_index, build_scalar_indexes
 
 from .config import SBL_TABLE
 from .models import SBLRecord
@@ -19,12 +19,13 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def ingest_sbl(db: lancedb.DBConnection, csv_path: str | Path) -> lancedb.table.Table:
+def ingest_sbl(db: lancedb.DBConnection, csv_path: str | Path, *, render_record: RenderRecord | None = None) -> lancedb.table.Table:
     """Ingest SBL CSV into a LanceDB table with FTS index.
 
     Args:
         db: LanceDB database connection.
         csv_path: Path to the SBL CSV file (semicolon-delimited, latin-1 encoded).
+        render_record: Precomputes the ``display_text`` column; see :func:`ra_mcp_dataset_lib.add_display_text`.
 
     Returns:
         The created LanceDB table.
@@ -52,6 +53,8 @@ def ingest_sbl(db: lancedb.DBConnection, csv_path: str | Path) -> lancedb.table.
 
     logger.info("Parsed %d SBL records", len(records))
 
+    if render_record is not None:
+        add_display_text(records, render_record)
     db.create_table(SBL_TABLE, data=records, mode="overwrite")
     build_fts_index(db, SBL_TABLE)
     # gender is low-cardinality equality -> Bitmap; birth/death years are range
@@ -6,9 +6,10 @@ Provides search client, operations, and models for searching transcribed documen
 
 __version__ = "0.3.0"
 
-from .models import RecordsResponse, SearchRecord, SearchResult
+from .models import RecordsResponse, SearchRecord, SearchResult, YearHistogram
 from .search_client import SearchClient
 from .search_operations import SearchOperations
+from .spelling import expand_spelling
 from .validation import validate_search_query
 
 
@@ -18,5 +19,7 @@ __all__ = [
     "SearchOperations",
     "SearchRecord",
     "SearchResult",
+    "YearHistogram",
+    "expand_spelling",
     "validate_search_query",
 ]
@@ -16,3 +16,22 @@ DEFAULT_MAX_DISPLAY = 20
 # API rejects very large page sizes with an opaque HTTP 400; bounding client-side
 # turns that into a clear message. Callers who need more results paginate via offset.
 MAX_LIMIT = 1000
+
+# Spelling-variant searches (SearchOperations.search_variants): the API has no OR,
+# so each variant is its own /api/records request. MAX_VARIANTS bounds the fan-out
+# of one call; VARIANT_CONCURRENCY bounds how many of those requests are in flight.
+MAX_VARIANTS = 8
+VARIANT_CONCURRENCY = 4
+
+# Year histograms (SearchOperations.year_histogram): one count request per year
+# bucket. Buckets are HISTOGRAM_BUCKET_YEARS[0] (a decade) wide unless that would
+# make more than MAX_HISTOGRAM_BUCKETS, in which case the next wider size is used.
+# Without years from the caller the histogram covers HISTOGRAM_YEAR_MIN..MAX.
+HISTOGRAM_BUCKET_YEARS = (10, 25, 50, 100)
+MAX_HISTOGRAM_BUCKETS = 30
+HISTOGRAM_YEAR_MIN = 1500
+HISTOGRAM_YEAR_MAX = 1999
+HISTOGRAM_CONCURRENCY = 6
+# Bucket counts are cached per keyword, filters and years for this long.
+HISTOGRAM_CACHE_TTL = 6 * 3600
+MAX_HISTOGRAM_CACHE_ENTRIES = 20_000
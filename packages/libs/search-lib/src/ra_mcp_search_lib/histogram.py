@@ -0,0 +1,86 @@
+"""
+Year buckets and the count cache behind SearchOperations.year_histogram.
+
+A histogram issues one count request per bucket, so the same term asked about
+again (the whole range, or a narrower one that lines up with the same buckets)
+should not go back to the API. Buckets therefore start at multiples of their
+width (1650-1659, 1660-1669, ...), clipped to the requested years at both ends,
+and every bucket count is cached under the keyword, the filters and its years
+for HISTOGRAM_CACHE_TTL seconds. The cache holds at most
+MAX_HISTOGRAM_CACHE_ENTRIES counts, the oldest dropped first.
+"""
+
+from __future__ import annotations
+
+import time
+
+from ra_mcp_common.cache_registry import CacheStats, matching_keys, register_cache
+
+from .config import HISTOGRAM_BUCKET_YEARS, HISTOGRAM_CACHE_TTL, MAX_HISTOGRAM_BUCKETS, MAX_HISTOGRAM_CACHE_ENTRIES
+
+
+# key → (monotonic expiry, total hits)
+_counts: dict[str, tuple[float, int]] = {}
+_hits = 0
+_misses = 0
+
+
+def year_buckets(year_min: int, year_max: int, bucket_years: int | None = None) -> tuple[int, list[tuple[int, int]]]:
+    """The bucket width and the (first year, last year) buckets covering *year_min*..*year_max*.
+
+    Args:
+        bucket_years: Bucket width; None picks the narrowest of HISTOGRAM_BUCKET_YEARS
+            that needs at most MAX_HISTOGRAM_BUCKETS buckets.
+
+    Raises:
+        ValueError: If the range is empty or needs more than MAX_HISTOGRAM_BUCKETS buckets.
+    """
+    if year_min > year_max:
+        raise ValueError(f"year_min ({year_min}) must not be after year_max ({year_max})")
+    widths = HISTOGRAM_BUCKET_YEARS if bucket_years is None else (bucket_years,)
+    for width in widths:
+        if width < 1:
+            raise ValueError(f"bucket_years must be at least 1, got {width}")
+        starts = range(year_min - year_min % width, year_max + 1, width)
+        if len(starts) <= MAX_HISTOGRAM_BUCKETS:
+            return width, [(max(start, year_min), min(start + width - 1, year_max)) for start in starts]
+    raise ValueError(f"{year_min}-{year_max} needs more than {MAX_HISTOGRAM_BUCKETS} buckets of {widths[-1]} years; narrow the years or widen the buckets")
+
+
+def count_key(keyword: str, year_min: int, year_max: int, *, transcribed_only: bool, only_digitised: bool, name: str | None, place: str | None) -> str:
+    """Cache key of one bucket count; starts with the normalized keyword, so ``<keyword>:*`` invalidates a term."""
+    scope = "transcribed" if transcribed_only else "digitised" if only_digitised else "all"
+    return f"{' '.join(keyword.lower().split())}:{scope}:{name or ''}:{place or ''}:{year_min}-{year_max}"
+
+
+def cached_count(key: str) -> int | None:
+    """The cached count under *key*, or None if absent or expired."""
+    global _hits, _misses
+    entry = _counts.get(key)
+    if entry is None or entry[0] <= time.monotonic():
+        _misses += 1
+        return None
+    _hits += 1
+    return entry[1]
+
+
+def store_count(key: str, total_hits: int) -> None:
+    """Cache *total_hits* under *key*."""
+    if _counts.pop(key, None) is None and len(_counts) >= MAX_HISTOGRAM_CACHE_ENTRIES:
+        del _counts[next(iter(_counts))]
+    _counts[key] = (time.monotonic() + HISTOGRAM_CACHE_TTL, total_hits)
+
+
+def _year_counts_stats() -> CacheStats:
+    recent = [{"key": key, "total_hits": hits} for key, (_, hits) in list(_counts.items())[-10:][::-1]]
+    return CacheStats(entries=len(_counts), hits=_hits, misses=_misses, top_keys=recent)
+
+
+def _invalidate_year_counts(pattern: str | None) -> int:
+    keys = matching_keys(_counts, pattern)
+    for key in keys:
+        del _counts[key]
+    return len(keys)
+
+
+register_cache("search.year_counts", stats=_year_counts_stats, invalidate=_invalidate_year_counts)
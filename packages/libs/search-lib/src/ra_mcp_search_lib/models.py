@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 
 
 # ============================================================================
@@ -80,6 +80,15 @@ class TranscribedText(BaseModel):
 
     model_config = ConfigDict(populate_by_name=True)
 
+    @field_validator("snippets", mode="before")
+    @classmethod
+    def _limit_snippets(cls, value: object, info: ValidationInfo) -> object:
+        """Drop snippets past ``max_snippets_per_record`` (validation context) before they are validated."""
+        limit = info.context.get("max_snippets_per_record") if info.context else None
+        if limit is not None and isinstance(value, list):
+            return value[:limit]
+        return value
+
 
 class DocumentLinks(BaseModel):
     """Links from API _links field."""
@@ -170,6 +179,7 @@ class SearchResult(BaseModel):
     limit: int  # Maximum results per page (API parameter name)
     offset: int  # Pagination offset (API parameter name)
     max_snippets_per_record: int | None = None  # Client-side snippet limiting (not an API parameter)
+    variant_hits: dict[str, int] | None = None  # Total hits per keyword of a merged variant search
 
     @property
     def items(self) -> list[SearchRecord]:
@@ -189,3 +199,28 @@ class SearchResult(BaseModel):
     def count_snippets(self) -> int:
         """Count total snippets across all records."""
         return self.response.count_snippets()
+
+
+class YearBucket(BaseModel):
+    """Hit count of one year range."""
+
+    year_min: int
+    year_max: int
+    hits: int
+
+
+class YearHistogram(BaseModel):
+    """How the hits for a keyword are spread over time, one bucket per year range.
+
+    The API filters by overlap with a record's date range, so a record dated
+    across a bucket boundary is counted in every bucket it touches.
+    """
+
+    keyword: str
+    bucket_years: int  # Width of the buckets (the first and last may be clipped to the requested years)
+    buckets: list[YearBucket]
+
+    @property
+    def total_hits(self) -> int:
+        """Sum of the bucket counts (an upper bound of the distinct records, see above)."""
+        return sum(bucket.hits for bucket in self.buckets)
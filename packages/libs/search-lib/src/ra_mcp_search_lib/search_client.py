@@ -56,7 +56,7 @@ class SearchClient:
             only_digitised_materials: Limit results to digitised materials (default: True, API default: False)
             limit: Maximum number of records to return
             offset: Pagination offset (API parameter name)
-            max_snippets_per_record: Client-side snippet limiting per record (not sent to API)
+            max_snippets_per_record: Client-side snippet limiting per record (not sent to API); None keeps all, 0 none
             sort: Sort order — one of: relevance, timeAsc, timeDesc, alphaAsc, alphaDesc
             year_min: Filter results to this start year or later
             year_max: Filter results to this end year or earlier
@@ -116,17 +116,17 @@ class SearchClient:
                 if year_max is not None:
                     params["year_max"] = year_max
 
-                response_data = await self.http_client.get_json(SEARCH_API_BASE_URL, params=params, timeout=REQUEST_TIMEOUT)
-
-                # Parse entire API response with Pydantic
-                response = RecordsResponse(**response_data)  # fields provided via **kwargs
-
-                # Apply client-side snippet limiting if requested. Explicit None
-                # check (not truthiness): None means "unlimited", any set positive
-                # value means "limit" — a 0 should never have reached here (callers
-                # bound it to >= 1), and treating 0 as "unlimited" would be wrong.
-                if max_snippets_per_record is not None:
-                    self._limit_snippets(response, max_snippets_per_record)
+                # Validate straight from the body bytes: no intermediate dicts for the whole
+                # (up to MAX_LIMIT records) response, and snippets past max_snippets_per_record
+                # are dropped before they become models. None means "unlimited"; 0 keeps no
+                # snippets (year_histogram's count requests only read totalHits).
+                context = {"max_snippets_per_record": max_snippets_per_record}
+                response = await self.http_client.get_json(
+                    SEARCH_API_BASE_URL,
+                    params=params,
+                    timeout=REQUEST_TIMEOUT,
+                    decode=lambda body: RecordsResponse.model_validate_json(body, context=context),
+                )
 
                 self.logger.info(
                     "✓ Search completed: %d snippets from %d records (%d total)", response.count_snippets(), len(response.items), response.total_hits
@@ -141,13 +141,3 @@ class SearchClient:
                 record_span_exception(self.logger, error)
                 self.logger.error("✗ Search failed: %s: %s", type(error).__name__, error)
                 raise
-
-    def _limit_snippets(self, response: RecordsResponse, max_snippets: int) -> None:
-        """
-        Limit snippets per record (client-side truncation).
-
-        Modifies the response in-place to keep only the first N snippets per record.
-        """
-        for record in response.items:
-            if record.transcribed_text and record.transcribed_text.snippets:
-                record.transcribed_text.snippets = record.transcribed_text.snippets[:max_snippets]
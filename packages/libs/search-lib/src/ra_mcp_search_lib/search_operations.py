@@ -3,15 +3,23 @@ Search operations that can be used by both CLI and MCP interfaces.
 Handles keyword searching.
 """
 
+import asyncio
+import heapq
+import itertools
 import logging
+import re
+from collections.abc import Callable, Iterable
 
 from opentelemetry.trace import StatusCode
 
 from ra_mcp_common.http_client import HTTPClient
 from ra_mcp_common.telemetry import get_meter, get_tracer, record_span_exception
 
-from .models import SearchResult
+from .config import HISTOGRAM_CONCURRENCY, HISTOGRAM_YEAR_MAX, HISTOGRAM_YEAR_MIN, MAX_LIMIT, MAX_VARIANTS, VARIANT_CONCURRENCY
+from .histogram import cached_count, count_key, store_count, year_buckets
+from .models import RecordsResponse, SearchRecord, SearchResult, Snippet, YearBucket, YearHistogram
 from .search_client import SearchClient
+from .spelling import expand_spelling, observe_frequency
 
 
 logger = logging.getLogger("ra_mcp.search_operations")
@@ -108,6 +116,9 @@ class SearchOperations:
                 )
 
                 span.set_attribute("search.total_hits", response.total_hits)
+                if transcribed_only and year_min is None and year_max is None and not name and not place:
+                    # Corpus-wide hits rank this spelling in later expand_spelling() calls
+                    observe_frequency(keyword, response.total_hits)
                 _search_counter.add(1, {"search.type": search_type, "search.status": "success"})
                 _results_histogram.record(response.total_hits, {"search.type": search_type})
                 return SearchResult(response=response, transcribed_text=keyword, limit=limit, offset=offset, max_snippets_per_record=max_snippets_per_record)
@@ -117,6 +128,224 @@ class SearchOperations:
                 _search_counter.add(1, {"search.type": search_type, "search.status": "error"})
                 raise
 
+    async def search_variants(
+        self,
+        keywords: list[str],
+        transcribed_only: bool = True,
+        only_digitised: bool = True,
+        offset: int = 0,
+        limit: int = 10,
+        max_snippets_per_record: int | None = None,
+        sort: str = "relevance",
+        year_min: int | None = None,
+        year_max: int | None = None,
+        name: str | None = None,
+        place: str | None = None,
+        research_context: str | None = None,
+        session_id: str | None = None,
+        max_concurrency: int = VARIANT_CONCURRENCY,
+        spelling_variants: int = 0,
+    ) -> SearchResult:
+        """Search alternative keywords (e.g. spelling variants präst/prest) as one OR query.
+
+        The API has no OR, so every keyword is searched on its own, at most
+        ``max_concurrency`` at a time. Each variant is fetched from the first
+        record through ``offset + limit``, and the rankings are merged by
+        reference code: for ``relevance`` first every variant's top record,
+        then every second, and so on; for the time and title sorts a k-way
+        merge on the record's date or caption, so the merged list stays in
+        that order. A record that several variants find appears once, at its
+        first place, with the union of their snippets. The merged list is then
+        paginated with ``offset`` and ``limit`` like a single search.
+
+        Args:
+            keywords: Alternative search terms; duplicates (ignoring case) are searched once.
+            max_concurrency: Maximum variant requests in flight at once.
+            spelling_variants: Also search up to this many historical spellings of
+                each keyword (see spelling.expand_spelling), as long as the total
+                stays within MAX_VARIANTS.
+            Other arguments are as for search(), applied to every variant.
+
+        Returns:
+            SearchResult over the merged records. ``total_hits`` is the sum of the
+            variants' totals, an upper bound (the API cannot count the union), and
+            ``variant_hits`` holds each variant's own total.
+
+        Raises:
+            ValueError: If no keyword is given, more than MAX_VARIANTS are, or
+                ``offset + limit`` exceeds MAX_LIMIT.
+        """
+        variants: dict[str, str] = {}
+        for keyword in keywords:
+            variants.setdefault(keyword.strip().casefold(), keyword.strip())
+        variants.pop("", None)
+        if not variants:
+            raise ValueError("Must provide at least one keyword")
+        if len(variants) > MAX_VARIANTS:
+            raise ValueError(f"At most {MAX_VARIANTS} keyword variants can be searched at once, got {len(variants)}")
+        if spelling_variants:
+            spellings = [spelling for keyword in list(variants.values()) for spelling in expand_spelling(keyword, spelling_variants)]
+            for spelling in spellings:
+                if len(variants) >= MAX_VARIANTS:
+                    break
+                variants.setdefault(spelling.casefold(), spelling)
+        unique = list(variants.values())
+        if len(unique) == 1:
+            return await self.search(
+                keyword=unique[0],
+                transcribed_only=transcribed_only,
+                only_digitised=only_digitised,
+                offset=offset,
+                limit=limit,
+                max_snippets_per_record=max_snippets_per_record,
+                sort=sort,
+                year_min=year_min,
+                year_max=year_max,
+                name=name,
+                place=place,
+                research_context=research_context,
+                session_id=session_id,
+            )
+        window = offset + limit
+        if window > MAX_LIMIT:
+            raise ValueError(f"offset + limit must be <= {MAX_LIMIT} when searching keyword variants, got {window}")
+
+        with _tracer.start_as_current_span(
+            "SearchOperations.search_variants",
+            attributes={
+                "search.keywords": unique,
+                "search.offset": offset,
+                "search.limit": limit,
+                **({"mcp.session.id": session_id} if session_id else {}),
+            },
+        ) as span:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def search_variant(keyword: str) -> SearchResult:
+                async with semaphore:
+                    return await self.search(
+                        keyword=keyword,
+                        transcribed_only=transcribed_only,
+                        only_digitised=only_digitised,
+                        offset=0,
+                        limit=window,
+                        max_snippets_per_record=max_snippets_per_record,
+                        sort=sort,
+                        year_min=year_min,
+                        year_max=year_max,
+                        name=name,
+                        place=place,
+                        research_context=research_context,
+                        session_id=session_id,
+                    )
+
+            results = await asyncio.gather(*(search_variant(keyword) for keyword in unique))
+
+            merged = _merge_rankings([result.items for result in results], max_snippets_per_record, sort)
+            total_hits = sum(result.total_hits for result in results)
+            page = merged[offset:window]
+            span.set_attribute("search.total_hits", total_hits)
+            span.set_attribute("search.merged_records", len(merged))
+            response = RecordsResponse(items=page, totalHits=total_hits, hits=len(page), offset=offset)
+            return SearchResult(
+                response=response,
+                transcribed_text=" / ".join(unique),
+                limit=limit,
+                offset=offset,
+                max_snippets_per_record=max_snippets_per_record,
+                variant_hits={keyword: result.total_hits for keyword, result in zip(unique, results, strict=True)},
+            )
+
+    async def year_histogram(
+        self,
+        keyword: str,
+        year_min: int | None = None,
+        year_max: int | None = None,
+        bucket_years: int | None = None,
+        transcribed_only: bool = True,
+        only_digitised: bool = True,
+        name: str | None = None,
+        place: str | None = None,
+        session_id: str | None = None,
+        max_concurrency: int = HISTOGRAM_CONCURRENCY,
+    ) -> YearHistogram:
+        """Count the hits for *keyword* per year bucket (decades by default).
+
+        Each bucket is one /api/records request filtered with year_min/year_max
+        that asks for a single record and no snippets and keeps only
+        ``totalHits``. At most ``max_concurrency`` requests are in flight, and
+        bucket counts are cached (see histogram.py), so repeating or narrowing a
+        histogram mostly costs no requests.
+
+        Args:
+            keyword: Search term, as for search().
+            year_min: First year covered (default HISTOGRAM_YEAR_MIN, or year_max if earlier).
+            year_max: Last year covered (default HISTOGRAM_YEAR_MAX, or year_min if later).
+            bucket_years: Bucket width in years; None picks decades, or wider
+                buckets when the range would need more than MAX_HISTOGRAM_BUCKETS.
+            max_concurrency: Maximum count requests in flight at once.
+            Other arguments are as for search().
+
+        Returns:
+            YearHistogram with one bucket per year range, oldest first.
+
+        Raises:
+            ValueError: If the year range is empty or needs too many buckets.
+        """
+        if year_min is None:
+            year_min = HISTOGRAM_YEAR_MIN if year_max is None else min(HISTOGRAM_YEAR_MIN, year_max)
+        if year_max is None:
+            year_max = max(HISTOGRAM_YEAR_MAX, year_min)
+        width, buckets = year_buckets(year_min, year_max, bucket_years)
+
+        with _tracer.start_as_current_span(
+            "SearchOperations.year_histogram",
+            attributes={
+                "search.keyword": keyword,
+                "search.year_min": year_min,
+                "search.year_max": year_max,
+                "search.histogram.buckets": len(buckets),
+                **({"mcp.session.id": session_id} if session_id else {}),
+            },
+        ) as span:
+            semaphore = asyncio.Semaphore(max_concurrency)
+            fetched = 0
+
+            async def count(first: int, last: int) -> int:
+                nonlocal fetched
+                key = count_key(keyword, first, last, transcribed_only=transcribed_only, only_digitised=only_digitised, name=name, place=place)
+                hits = cached_count(key)
+                if hits is None:
+                    async with semaphore:
+                        response = await self.search_api.search(
+                            transcribed_text=keyword if transcribed_only else None,
+                            text=keyword if not transcribed_only else None,
+                            only_digitised_materials=only_digitised,
+                            limit=1,  # the API has no count endpoint; the smallest page carries totalHits
+                            max_snippets_per_record=0,
+                            year_min=first,
+                            year_max=last,
+                            name=name,
+                            place=place,
+                        )
+                    hits = response.total_hits
+                    store_count(key, hits)
+                    fetched += 1
+                return hits
+
+            try:
+                counts = await asyncio.gather(*(count(first, last) for first, last in buckets))
+            except Exception as e:
+                span.set_status(StatusCode.ERROR, f"{type(e).__name__}: {e}")
+                record_span_exception(logger, e)
+                raise
+            span.set_attribute("search.histogram.requests", fetched)
+            return YearHistogram(
+                keyword=keyword,
+                bucket_years=width,
+                buckets=[YearBucket(year_min=first, year_max=last, hits=hits) for (first, last), hits in zip(buckets, counts, strict=True)],
+            )
+
     async def search_transcribed(
         self,
         keyword: str,
@@ -141,3 +370,74 @@ class SearchOperations:
         return await self.search(
             keyword=keyword, transcribed_only=True, only_digitised=True, offset=offset, limit=limit, max_snippets_per_record=max_snippets_per_record
         )
+
+
+def _snippet_key(snippet: Snippet) -> tuple[tuple[str, ...], str]:
+    return tuple(page.id for page in snippet.pages), snippet.text
+
+
+_YEAR = re.compile(r"\d{4}")
+
+
+def _year_key(latest: bool) -> Callable[[SearchRecord], tuple[bool, int]]:
+    """Sort key on the earliest (or latest) year of a record's date; undated records sort last."""
+
+    def key(record: SearchRecord) -> tuple[bool, int]:
+        years = [int(year) for year in _YEAR.findall(record.metadata.date or "")]
+        if not years:
+            return (not latest, 0)
+        return (latest, max(years) if latest else min(years))
+
+    return key
+
+
+def _caption_key(descending: bool) -> Callable[[SearchRecord], tuple[bool, str]]:
+    """Sort key on a record's caption, case-insensitively; uncaptioned records sort last."""
+
+    def key(record: SearchRecord) -> tuple[bool, str]:
+        return (descending, record.caption.casefold()) if record.caption else (not descending, "")
+
+    return key
+
+
+# API sort value → (key of the order each variant's records come in, whether it is descending)
+_SORT_KEYS: dict[str, tuple[Callable[[SearchRecord], tuple], bool]] = {
+    "timeAsc": (_year_key(latest=False), False),
+    "timeDesc": (_year_key(latest=True), True),
+    "alphaAsc": (_caption_key(descending=False), False),
+    "alphaDesc": (_caption_key(descending=True), True),
+}
+
+
+def _ordered(rankings: list[list[SearchRecord]], sort: str) -> Iterable[SearchRecord]:
+    """Every variant's records in merged order: by rank for relevance, else a k-way merge on the sort key."""
+    if sort in _SORT_KEYS:
+        key, descending = _SORT_KEYS[sort]
+        return heapq.merge(*rankings, key=key, reverse=descending)
+    return (record for rank in itertools.zip_longest(*rankings) for record in rank if record is not None)
+
+
+def _merge_rankings(rankings: list[list[SearchRecord]], max_snippets_per_record: int | None, sort: str = "relevance") -> list[SearchRecord]:
+    """Merge per-variant rankings in *sort* order, merging records that share a reference code.
+
+    The first occurrence of a record keeps its place; later ones only add the
+    snippets it does not have yet. Merged snippets are kept in page order.
+    Each variant's own order is kept: the API's sort key is approximated from
+    the record's date or caption only to interleave the variants.
+    """
+    merged: dict[str, SearchRecord] = {}
+    for record in _ordered(rankings, sort):
+        key = record.metadata.reference_code or record.id
+        first = merged.setdefault(key, record)
+        if first is record or record.transcribed_text is None:
+            continue
+        if first.transcribed_text is None:
+            first.transcribed_text = record.transcribed_text
+            continue
+        known = {_snippet_key(snippet) for snippet in first.transcribed_text.snippets}
+        added = [snippet for snippet in record.transcribed_text.snippets if _snippet_key(snippet) not in known]
+        if added:
+            snippets = sorted(first.transcribed_text.snippets + added, key=lambda snippet: [page.id for page in snippet.pages])
+            first.transcribed_text.snippets = snippets if max_snippets_per_record is None else snippets[:max_snippets_per_record]
+        first.transcribed_text.num_total = max(first.transcribed_text.num_total, record.transcribed_text.num_total, len(first.transcribed_text.snippets))
+    return list(merged.values())
@@ -0,0 +1,162 @@
+"""
+Historical Swedish spelling variants for search keywords.
+
+Transcriptions keep the orthography of their time: 'prest' for 'präst',
+'silfver' for 'silver', 'qvinna' for 'kvinna', 'thing' and 'medh' for 'ting'
+and 'med'. The search API matches spellings literally, so a search for the
+modern form misses most of the older pages. expand_spelling() rewrites a
+keyword with the old-orthography rules below and returns the spellings it
+produces, the ones most frequent in the corpus first.
+
+The rules apply both ways. Where a rule that applies everywhere would swamp
+the result with spellings nobody wrote, it is limited to certain positions:
+
+- f / v / fv / w after a vowel, l or r (silfver, hafva, lefwa); v / w at the start
+  of a word and after an initial h (wara, hwad)
+- e / ä (prest, hexa)
+- kv / qv / qw (qvinna)
+- th / t at the start of a word (thing); dh / d at the start or the end (dhe, medh)
+- doubled consonants (kyrckia, alltid); a final l, m, n, s or t is doubled only
+  in words of one syllable (mann, skall, sitt); ck / k after a vowel, l, n or r
+  (kyrcka, tacka)
+- ij / i (tijd, frij); i becomes ij only in words of one syllable that end in
+  it or in one consonant after it
+
+At most MAX_EDITS rewrites are combined in one spelling. Tokens with wildcard
+or fuzzy syntax (troll*, st?ckholm, präst~1) are left as they are, since they
+already cover their own variants.
+
+Corpus frequency is the total hits the search API reported for a spelling.
+SearchOperations records it with observe_frequency() after every transcribed
+search. Spellings seen that way rank by their hits, and unseen ones come after
+them, fewest rewrites first. The rules are compiled at import and the rewrites
+of a keyword are memoized, so a repeated keyword only costs the ranking.
+"""
+
+from __future__ import annotations
+
+import itertools
+import re
+from functools import lru_cache
+
+from ra_mcp_common.cache_registry import CacheStats, matching_keys, register_cache
+
+
+MAX_EDITS = 2
+MAX_FREQUENCIES = 100_000
+
+_LETTER = "a-zåäö"
+_VOWEL = "aeiouyåäö"
+_CONSONANT = "bcdfghjklmnpqrstvwxz"
+
+# (pattern, replacement templates); a template may refer to the match's groups.
+_RULES: tuple[tuple[re.Pattern[str], tuple[str, ...]], ...] = tuple(
+    (re.compile(pattern), replacements)
+    for pattern, replacements in (
+        (rf"(?<=[{_VOWEL}lr])(?:fv|fw|f|v|w)", ("f", "v", "fv", "w")),
+        (r"\b[vw]|(?<=\bh)[vw]", ("v", "w")),
+        (r"[eä]", ("e", "ä")),
+        (r"kv|qv|qw", ("kv", "qv", "qw")),
+        (r"\bth", ("t",)),
+        (r"\bt(?!h)", ("th",)),
+        (r"\bdh|dh\b", ("d",)),
+        (rf"\bd(?!h)|(?<=[{_LETTER}])d\b", ("dh",)),
+        (r"([bdfgklmnprst])\1", (r"\1",)),
+        (rf"(?:(?<=\b[{_VOWEL}])|(?<=\b[{_CONSONANT}][{_VOWEL}])|(?<=\b[{_CONSONANT}]{{2}}[{_VOWEL}]))([lmnst])\b", (r"\1\1",)),
+        (r"ck", ("k",)),
+        (rf"(?<=[{_VOWEL}lnr])k(?!k)", ("ck",)),
+        (r"ij", ("i",)),
+        (rf"(?:(?<=\b[{_CONSONANT}])|(?<=\b[{_CONSONANT}]{{2}}))i(?=[{_CONSONANT}]?\b)", ("ij",)),
+    )
+)
+_SEARCH_SYNTAX = re.compile(r"[*?~]")
+
+_frequencies: dict[str, int] = {}
+
+
+def _sites(word: str, offset: int) -> list[tuple[int, int, tuple[str, ...]]]:
+    """Non-overlapping rewrite sites of one lowercase word: (start, end, replacements), left to right."""
+    found: dict[tuple[int, int], dict[str, None]] = {}
+    for pattern, templates in _RULES:
+        for match in pattern.finditer(word):
+            replacements = found.setdefault((match.start() + offset, match.end() + offset), {})
+            replacements.update((match.expand(template), None) for template in templates if match.expand(template) != match.group())
+    sites: list[tuple[int, int, tuple[str, ...]]] = []
+    for (start, end), replacements in sorted(found.items(), key=lambda item: (item[0][0], -item[0][1])):
+        if replacements and (not sites or start >= sites[-1][1]):
+            sites.append((start, end, tuple(replacements)))
+    return sites
+
+
+@lru_cache(maxsize=4096)
+def _rewrites(keyword: str) -> tuple[tuple[str, int], ...]:
+    """Every spelling of a normalized *keyword* within MAX_EDITS rewrites, with its rewrite count, fewest first."""
+    sites: list[tuple[int, int, tuple[str, ...]]] = []
+    for token in re.finditer(r"\S+", keyword):
+        if not _SEARCH_SYNTAX.search(token.group()):
+            sites.extend(_sites(token.group(), token.start()))
+    spellings = {keyword: 0}
+    for edits in range(1, MAX_EDITS + 1):
+        for chosen in itertools.combinations(sites, edits):
+            for replacements in itertools.product(*(site[2] for site in chosen)):
+                parts: list[str] = []
+                last = 0
+                for (start, end, _), replacement in zip(chosen, replacements, strict=True):
+                    parts += (keyword[last:start], replacement)
+                    last = end
+                parts.append(keyword[last:])
+                spellings.setdefault("".join(parts), edits)
+    del spellings[keyword]
+    return tuple(sorted(spellings.items(), key=lambda item: (item[1], item[0])))
+
+
+def _normalize(keyword: str) -> str:
+    return " ".join(keyword.lower().split())
+
+
+def expand_spelling(keyword: str, limit: int | None = 3) -> list[str]:
+    """Historical spellings of *keyword*, most frequent in the corpus first (lowercase, *keyword* itself excluded).
+
+    Spellings the search API reported hits for come first, by hits; spellings
+    it reported no hits for are dropped; the rest follow, fewest rewrites first.
+
+    Args:
+        keyword: Search keyword; every plain token is rewritten, wildcard and fuzzy tokens are kept.
+        limit: Maximum number of spellings to return (None for all).
+    """
+    frequent: list[tuple[int, str]] = []
+    unseen: list[str] = []
+    for spelling, _ in _rewrites(_normalize(keyword)):
+        hits = _frequencies.get(spelling)
+        if hits is None:
+            unseen.append(spelling)
+        elif hits:
+            frequent.append((-hits, spelling))
+    ranked = [spelling for _, spelling in sorted(frequent)] + unseen
+    return ranked if limit is None else ranked[:limit]
+
+
+def observe_frequency(keyword: str, total_hits: int) -> None:
+    """Record how many hits the search API reported for *keyword*, to rank it as a spelling variant."""
+    key = _normalize(keyword)
+    if _frequencies.pop(key, None) is None and len(_frequencies) >= MAX_FREQUENCIES:
+        del _frequencies[next(iter(_frequencies))]
+    _frequencies[key] = total_hits
+
+
+def _spelling_cache_stats() -> CacheStats:
+    info = _rewrites.cache_info()
+    hottest = sorted(_frequencies.items(), key=lambda item: -item[1])[:10]
+    return CacheStats(entries=info.currsize, hits=info.hits, misses=info.misses, top_keys=[{"key": term, "total_hits": hits} for term, hits in hottest])
+
+
+def _invalidate_spelling(pattern: str | None) -> int:
+    """Forget recorded frequencies matching *pattern*; the memoized rewrites are rebuilt on demand."""
+    terms = matching_keys(_frequencies, pattern)
+    for term in terms:
+        del _frequencies[term]
+    _rewrites.cache_clear()
+    return len(terms)
+
+
+register_cache("search.spelling", stats=_spelling_cache_stats, invalidate=_invalidate_spelling)
@@ -0,0 +1,46 @@
+"""Tests for the year buckets and bucket count cache behind year_histogram."""
+
+import pytest
+
+import ra_mcp_search_lib.histogram as _histogram_mod
+from ra_mcp_search_lib.histogram import cached_count, count_key, store_count, year_buckets
+
+
+@pytest.fixture(autouse=True)
+def _fresh_counts(monkeypatch):
+    monkeypatch.setattr(_histogram_mod, "_counts", {})
+
+
+def test_decade_buckets_are_aligned_and_clipped():
+    width, buckets = year_buckets(1655, 1682)
+    assert width == 10
+    assert buckets == [(1655, 1659), (1660, 1669), (1670, 1679), (1680, 1682)]
+
+
+def test_long_ranges_get_wider_buckets():
+    width, buckets = year_buckets(1500, 1999)
+    assert width == 25
+    assert len(buckets) == 20
+    assert buckets[0] == (1500, 1524) and buckets[-1] == (1975, 1999)
+
+
+@pytest.mark.parametrize(
+    ("year_min", "year_max", "bucket_years", "match"),
+    [(1700, 1600, None, "must not be after"), (1000, 1999, 10, "more than 30 buckets"), (1700, 1710, 0, "at least 1")],
+)
+def test_year_buckets_rejects_bad_ranges(year_min, year_max, bucket_years, match):
+    with pytest.raises(ValueError, match=match):
+        year_buckets(year_min, year_max, bucket_years)
+
+
+def test_counts_are_cached_until_they_expire(monkeypatch):
+    key = count_key(" Trolldom ", 1660, 1669, transcribed_only=True, only_digitised=True, name=None, place=None)
+    assert key.startswith("trolldom:")
+    assert cached_count(key) is None
+
+    store_count(key, 42)
+    assert cached_count(key) == 42
+
+    monkeypatch.setattr(_histogram_mod, "HISTOGRAM_CACHE_TTL", -1)
+    store_count(key, 42)
+    assert cached_count(key) is None
@@ -1,11 +1,14 @@
 """Tests for search API client with mocked HTTP."""
 
+import json
+
 import httpx
 import pytest
 import respx
 
 from ra_mcp_common.http_client import HTTPClient
 from ra_mcp_search_lib.config import SEARCH_API_BASE_URL
+from ra_mcp_search_lib.models import RecordsResponse
 from ra_mcp_search_lib.search_client import SearchClient
 
 
@@ -104,6 +107,17 @@ async def test_search_snippet_limiting(respx_mock, search_response_json):
     assert len(result.items[0].transcribed_text.snippets) == 1
 
 
+def test_snippets_past_the_limit_are_dropped_while_validating(search_response_json):
+    body = json.dumps(search_response_json)
+    limited = RecordsResponse.model_validate_json(body, context={"max_snippets_per_record": 2})
+    full = RecordsResponse.model_validate_json(body)
+
+    assert limited.items[0].transcribed_text is not None
+    assert full.items[0].transcribed_text is not None
+    assert limited.items[0].transcribed_text.snippets == full.items[0].transcribed_text.snippets[:2]
+    assert limited.count_snippets() < full.count_snippets()
+
+
 @respx.mock(assert_all_called=False)
 async def test_search_count_snippets(respx_mock, search_response_json):
     respx_mock.get(SEARCH_API_BASE_URL).mock(return_value=httpx.Response(200, json=search_response_json))
@@ -1,9 +1,12 @@
 """Tests for search operations with mocked client."""
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+import ra_mcp_search_lib.histogram as histogram
+import ra_mcp_search_lib.spelling as spelling
 from ra_mcp_common.http_client import HTTPClient
 from ra_mcp_search_lib.models import Metadata, PageInfo, RecordsResponse, SearchRecord, Snippet, TranscribedText
 from ra_mcp_search_lib.search_operations import SearchOperations
@@ -112,3 +115,185 @@ async def test_search_with_filters():
     assert call_kwargs["name"] == "Gertrud"
     assert call_kwargs["place"] == "Mora"
     assert call_kwargs["sort"] == "timeAsc"
+
+
+def _record(ref: str, *pages: str, num_total: int = 1, date: str | None = None) -> SearchRecord:
+    return SearchRecord(
+        id=ref,
+        objectType="Record",
+        caption=ref,
+        metadata=Metadata(referenceCode=ref, date=date),
+        transcribedText=TranscribedText(numTotal=num_total, snippets=[Snippet(text=f"{ref} {page}", pages=[PageInfo(id=page)]) for page in pages]),
+    )
+
+
+async def test_search_variants_merges_by_reference_code_and_unions_snippets():
+    ops = SearchOperations(HTTPClient())
+    responses = {
+        "präst": RecordsResponse(totalHits=30, items=[_record("SE/A", "_00003", num_total=4), _record("SE/B", "_00001")]),
+        "prest": RecordsResponse(totalHits=12, items=[_record("SE/C", "_00002"), _record("SE/A", "_00001", "_00003", num_total=2)]),
+    }
+
+    async def search(**kwargs):
+        return responses[kwargs["transcribed_text"]]
+
+    with patch.object(ops.search_api, "search", side_effect=search) as mock_search:
+        result = await ops.search_variants(["präst", "prest", "PRÄST"], offset=0, limit=10)
+
+    assert mock_search.call_count == 2  # the case-insensitive duplicate is searched once
+    assert [record.id for record in result.items] == ["SE/A", "SE/C", "SE/B"]  # interleaved by rank
+    merged = result.items[0].transcribed_text
+    assert merged is not None
+    assert [snippet.pages[0].id for snippet in merged.snippets] == ["_00001", "_00003"]
+    assert merged.num_total == 4
+    assert result.total_hits == 42
+    assert result.variant_hits == {"präst": 30, "prest": 12}
+    assert result.keyword == "präst / prest"
+
+
+async def test_search_variants_paginates_the_merged_list():
+    ops = SearchOperations(HTTPClient())
+    responses = {
+        "silver": RecordsResponse(totalHits=3, items=[_record(f"SE/S/{i}", "_00001") for i in range(3)]),
+        "silfver": RecordsResponse(totalHits=2, items=[_record("SE/S/0", "_00002"), _record("SE/F/1", "_00001")]),
+    }
+
+    async def search(**kwargs):
+        return responses[kwargs["transcribed_text"]]
+
+    with patch.object(ops.search_api, "search", side_effect=search) as mock_search:
+        result = await ops.search_variants(["silver", "silfver"], offset=2, limit=2)
+
+    # Each variant is fetched from the start through offset + limit
+    assert {(call.kwargs["offset"], call.kwargs["limit"]) for call in mock_search.call_args_list} == {(0, 4)}
+    # Merged order: S/0, S/1, F/1, S/2 → the second page of two
+    assert [record.id for record in result.items] == ["SE/F/1", "SE/S/2"]
+    assert result.offset == 2
+
+
+@pytest.mark.parametrize(
+    ("sort", "expected"),
+    [
+        ("timeAsc", ["SE/B", "SE/C", "SE/A", "SE/D", "SE/U"]),
+        ("timeDesc", ["SE/D", "SE/A", "SE/C", "SE/B", "SE/U"]),
+    ],
+)
+async def test_search_variants_merges_time_sorted_rankings_in_date_order(sort, expected):
+    ops = SearchOperations(HTTPClient())
+    dates = {"SE/A": "1700 - 1710", "SE/B": "1650", "SE/C": "1690 - 1695", "SE/D": "1720 - 1750", "SE/U": None}
+    records = {ref: _record(ref, "_00001", date=date) for ref, date in dates.items()}
+    # What the API returns for each variant, already in the requested order
+    in_order = {
+        "timeAsc": {"präst": ["SE/B", "SE/A", "SE/U"], "prest": ["SE/C", "SE/A", "SE/D"]},
+        "timeDesc": {"präst": ["SE/A", "SE/B", "SE/U"], "prest": ["SE/D", "SE/A", "SE/C"]},
+    }[sort]
+
+    async def search(**kwargs):
+        refs = in_order[kwargs["transcribed_text"]]
+        return RecordsResponse(totalHits=len(refs), items=[records[ref].model_copy(deep=True) for ref in refs])
+
+    with patch.object(ops.search_api, "search", side_effect=search):
+        result = await ops.search_variants(["präst", "prest"], offset=0, limit=10, sort=sort)
+
+    assert [record.id for record in result.items] == expected
+
+
+async def test_search_variants_caps_concurrent_requests():
+    ops = SearchOperations(HTTPClient())
+    in_flight = peak = 0
+
+    async def search(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return RecordsResponse(totalHits=1, items=[_record(kwargs["transcribed_text"], "_00001")])
+
+    with patch.object(ops.search_api, "search", side_effect=search):
+        result = await ops.search_variants([f"term{i}" for i in range(6)], limit=10, max_concurrency=2)
+
+    assert peak == 2
+    assert len(result.items) == 6
+
+
+async def test_search_variants_with_one_keyword_is_a_plain_search():
+    ops = SearchOperations(HTTPClient())
+
+    with patch.object(ops.search_api, "search", new_callable=AsyncMock, return_value=_make_records_response()) as mock_search:
+        result = await ops.search_variants([" trolldom ", "Trolldom"], offset=20, limit=10)
+
+    assert mock_search.call_args[1]["offset"] == 20
+    assert result.variant_hits is None
+
+
+@pytest.mark.parametrize(
+    ("keywords", "offset", "match"),
+    [([], 0, "at least one"), ([f"t{i}" for i in range(9)], 0, "At most 8"), (["a", "b"], 995, "offset \\+ limit")],
+)
+async def test_search_variants_rejects_unbounded_fan_out(keywords, offset, match):
+    with pytest.raises(ValueError, match=match):
+        await SearchOperations(HTTPClient()).search_variants(keywords, offset=offset, limit=10)
+
+
+async def test_search_variants_adds_historical_spellings(monkeypatch):
+    monkeypatch.setattr(spelling, "_frequencies", {})
+    ops = SearchOperations(HTTPClient())
+    searched: list[str] = []
+
+    async def search(**kwargs):
+        searched.append(kwargs["transcribed_text"])
+        return RecordsResponse(totalHits=len(searched), items=[])
+
+    with patch.object(ops.search_api, "search", side_effect=search):
+        result = await ops.search_variants(["präst", "kvinna"], limit=10, spelling_variants=2)
+
+    assert searched[:2] == ["präst", "kvinna"]
+    assert sorted(searched[2:]) == ["kvina", "prest", "qvinna"]
+    assert result.variant_hits is not None
+    assert list(result.variant_hits) == ["präst", "kvinna", *searched[2:]]
+    # Every unfiltered transcribed search records its hits to rank later expansions
+    assert set(spelling._frequencies) == set(searched)
+
+
+async def test_year_histogram_counts_each_bucket_concurrently(monkeypatch):
+    monkeypatch.setattr(histogram, "_counts", {})
+    ops = SearchOperations(HTTPClient())
+    calls: list[dict] = []
+    in_flight = peak = 0
+
+    async def search(**kwargs):
+        nonlocal in_flight, peak
+        calls.append(kwargs)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return RecordsResponse(totalHits=kwargs["year_min"] - 1600, items=[])
+
+    with patch.object(ops.search_api, "search", side_effect=search):
+        result = await ops.year_histogram("trolldom", year_min=1600, year_max=1649, max_concurrency=2)
+
+    assert peak == 2
+    assert result.bucket_years == 10
+    assert [(b.year_min, b.year_max, b.hits) for b in result.buckets] == [
+        (1600, 1609, 0),
+        (1610, 1619, 10),
+        (1620, 1629, 20),
+        (1630, 1639, 30),
+        (1640, 1649, 40),
+    ]
+    assert result.total_hits == 100
+    assert {(call["limit"], call["max_snippets_per_record"], call["transcribed_text"]) for call in calls} == {(1, 0, "trolldom")}
+
+
+async def test_year_histogram_reuses_cached_bucket_counts(monkeypatch):
+    monkeypatch.setattr(histogram, "_counts", {})
+    ops = SearchOperations(HTTPClient())
+
+    with patch.object(ops.search_api, "search", new_callable=AsyncMock, return_value=RecordsResponse(totalHits=7, items=[])) as mock_search:
+        await ops.year_histogram("trolldom", year_min=1600, year_max=1649)
+        narrowed = await ops.year_histogram("Trolldom", year_min=1620, year_max=1639)
+
+    assert mock_search.call_count == 5  # the second histogram's decades were all cached
+    assert [bucket.hits for bucket in narrowed.buckets] == [7, 7]
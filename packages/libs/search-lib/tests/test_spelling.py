@@ -0,0 +1,83 @@
+"""Tests for the historical Swedish spelling variant expansion."""
+
+import pytest
+
+import ra_mcp_search_lib.spelling as _spelling_mod
+from ra_mcp_search_lib.spelling import expand_spelling, observe_frequency
+
+
+@pytest.fixture(autouse=True)
+def _fresh_frequencies(monkeypatch):
+    monkeypatch.setattr(_spelling_mod, "_frequencies", {})
+
+
+@pytest.mark.parametrize(
+    ("keyword", "spelling"),
+    [
+        pytest.param("präst", "prest", id="e-ä"),
+        pytest.param("silver", "silfver", id="v-fv"),
+        pytest.param("vara", "wara", id="initial-v-w"),
+        pytest.param("hwad", "hvad", id="hw-hv"),
+        pytest.param("kvinna", "qvinna", id="kv-qv"),
+        pytest.param("thing", "ting", id="th-t"),
+        pytest.param("med", "medh", id="final-d-dh"),
+        pytest.param("man", "mann", id="double-final-consonant"),
+        pytest.param("skall", "skal", id="single-final-consonant"),
+        pytest.param("kyrka", "kyrcka", id="k-ck"),
+        pytest.param("tijd", "tid", id="ij-i"),
+        pytest.param("fri", "frij", id="final-i-ij"),
+        pytest.param("vin", "wijn", id="two-rules"),
+    ],
+)
+def test_old_orthography_rules(keyword, spelling):
+    assert spelling in expand_spelling(keyword, limit=None)
+    assert keyword in expand_spelling(spelling, limit=None)  # every rule works both ways
+
+
+def test_rules_are_limited_to_their_positions():
+    spellings = expand_spelling("stockholm kvinna skal", limit=None)
+    assert not [spelling for spelling in spellings if "sck" in spelling or "kfinna" in spelling or "stockholmm" in spelling]
+    assert all(spelling.count(" ") == 2 for spelling in spellings)
+    # Doubled consonants are collapsed anywhere, but only a monosyllable's last one is doubled
+    assert "altid" in expand_spelling("alltid", limit=None)
+    assert "alltid" not in expand_spelling("altid", limit=None)
+    assert "ridijt" not in expand_spelling("ridit", limit=None)
+
+
+def test_at_most_two_rewrites_are_combined():
+    assert "silfvär" in expand_spelling("silver", limit=None)
+    assert "sillfvär" not in expand_spelling("silver", limit=None)
+
+
+def test_wildcard_and_fuzzy_tokens_are_kept():
+    assert expand_spelling("präst~1 kyrka", limit=None) == ["präst~1 kyrcka"]
+    assert expand_spelling("tr?lldom", limit=None) == []
+
+
+def test_spellings_rank_by_observed_corpus_frequency():
+    unranked = expand_spelling("silver", limit=None)
+    observe_frequency("silwer", 3)
+    observe_frequency("Silfver", 120)
+    observe_frequency("silfer", 0)
+
+    ranked = expand_spelling("silver", limit=None)
+    assert ranked[:2] == ["silfver", "silwer"]
+    assert "silfer" not in ranked  # the API reported no hits for it
+    assert ranked[2:] == [spelling for spelling in unranked if spelling not in {"silfver", "silwer", "silfer"}]
+    assert expand_spelling("SILVER ", limit=1) == ["silfver"]
+
+
+def test_rewrites_are_memoized():
+    _spelling_mod._rewrites.cache_clear()
+    expand_spelling("trolldom")
+    expand_spelling("Trolldom")
+    info = _spelling_mod._rewrites.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+
+def test_frequencies_are_bounded(monkeypatch):
+    monkeypatch.setattr(_spelling_mod, "MAX_FREQUENCIES", 2)
+    for term in ("a", "b", "a", "c"):
+        observe_frequency(term, 1)
+    assert list(_spelling_mod._frequencies) == ["a", "c"]
+    assert _spelling_mod._invalidate_spelling("a") == 1
@@ -7,7 +7,7 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from ra_mcp_dataset_lib import build_fts_index
+from ra_mcp_dataset_lib import RenderRecord, add_display_text, build_fts_index
 
 from .config import FIRA_TABLE, JUDA_TABLE
 from .models import RITNING_FIELDNAMES, JudaRecord, RitningRecord
@@ -43,12 +43,15 @@ def _load_lookup(path: str | Path) -> dict[str, str]:
 def ingest_juda(
     db: lancedb.DBConnection,
     csv_dir: str | Path,
+    *,
+    render_record: RenderRecord | None = None,
 ) -> lancedb.table.Table:
     """Ingest JUDA CSV files (JDA*.csv) into a LanceDB table with FTS index.
 
     Args:
         db: LanceDB database connection.
         csv_dir: Directory containing JDA90.csv, JDA91.csv, JDA92.csv.
+        render_record: Precomputes the ``display_text`` column; see :func:`ra_mcp_dataset_lib.add_display_text`.
 
     Returns:
         The created LanceDB table.
@@ -84,6 +87,8 @@ def ingest_juda(
 
     logger.info("Parsed %d JUDA records", len(records))
 
+    if render_record is not None:
+        add_display_text(records, render_record)
     table = db.create_table(JUDA_TABLE, data=records, mode="overwrite")
     table = build_fts_index(db, JUDA_TABLE)
     return table
@@ -96,6 +101,7 @@ def ingest_ritningar(
     *,
     dkod_path: str | Path | None = None,
     sakg_path: str | Path | None = None,
+    render_record: RenderRecord | None = None,
 ) -> lancedb.table.Table:
     """Ingest FIRA and SIRA CSV files into a single LanceDB table with FTS index.
 
@@ -109,6 +115,7 @@ def ingest_ritningar(
         sira_dir: Directory containing SIRA_*.csv files (headerless).
         dkod_path: Optional path to DKOD lookup CSV (KOD;KODFOERKLARING).
         sakg_path: Optional path to SAKG lookup CSV (KOD;KODFOERKLARING).
+        render_record: Precomputes the ``display_text`` column; see :func:`ra_mcp_dataset_lib.add_display_text`.
 
     Returns:
         The created LanceDB table.
@@ -171,6 +178,8 @@ def ingest_ritningar(
 
     logger.info("Total drawing records: %d", len(records))
 
+    if render_record is not None:
+        add_display_text(records, render_record)
     table = db.create_table(FIRA_TABLE, data=records, mode="overwrite")
     table = build_fts_index(db, FIRA_TABLE)
     return table
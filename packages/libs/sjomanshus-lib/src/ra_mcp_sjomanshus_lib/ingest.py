@@ -7,7 +7,7 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from ra_mcp_dataset_lib import build_fts_index
+from ra_mcp_dataset_lib import RenderRecord, add_display_text, build_fts_index
 
 from .config import LIGGARE_TABLE, MATRIKEL_TABLE
 from .models import LiggareRecord, MatrikelRecord
@@ -19,12 +19,13 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def ingest_liggare(db: lancedb.DBConnection, csv_path: str | Path) -> lancedb.table.Table:
+def ingest_liggare(db: lancedb.DBConnection, csv_path: str | Path, *, render_record: RenderRecord | None = None) -> lancedb.table.Table:
     """Ingest Liggare CSV into a LanceDB table with FTS index.
 
     Args:
         db: LanceDB database connection.
         csv_path: Path to the Liggare CSV file (semicolon-delimited, latin-1 encoded).
+        render_record: Precomputes the ``display_text`` column; see :func:`ra_mcp_dataset_lib.add_display_text`.
 
     Returns:
         The created LanceDB table.
@@ -52,17 +53,20 @@ def ingest_liggare(db: lancedb.DBConnection, csv_path: str | Path) -> lancedb.ta
 
     logger.info("Parsed %d Liggare records", len(records))
 
+    if render_record is not None:
+        add_display_text(records, render_record)
     table = db.create_table(LIGGARE_TABLE, data=records, mode="overwrite")
     table = build_fts_index(db, LIGGARE_TABLE)
     return table
 
 
-def ingest_matrikel(db: lancedb.DBConnection, csv_path: str | Path) -> lancedb.table.Table:
+def ingest_matrikel(db: lancedb.DBConnection, csv_path: str | Path, *, render_record: RenderRecord | None = None) -> lancedb.table.Table:
     """Ingest Matrikel CSV into a LanceDB table with FTS index.
 
     Args:
         db: LanceDB database connection.
         csv_path: Path to the Matrikel CSV file (semicolon-delimited, latin-1 encoded).
+        render_record: Precomputes the ``display_text`` column; see :func:`ra_mcp_dataset_lib.add_display_text`.
 
     Returns:
         The created LanceDB table.
@@ -90,6 +94,8 @@ def ingest_matrikel(db: lancedb.DBConnection, csv_path: str | Path) -> lancedb.t
 
     logger.info("Parsed %d Matrikel records", len(records))
 
+    if render_record is not None:
+        add_display_text(records, render_record)
     table = db.create_table(MATRIKEL_TABLE, data=records, mode="overwrite")
     table = build_fts_index(db, MATRIKEL_TABLE)
     return table
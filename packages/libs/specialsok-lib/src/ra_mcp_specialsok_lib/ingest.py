@@ -7,7 +7,7 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Protocol
 
-from ra_mcp_dataset_lib import build_fts_index
+from ra_mcp_dataset_lib import RenderRecord, add_display_text, build_fts_index
 
 from .config import FANGRULLOR_TABLE, FLYGVAPEN_TABLE, KURHUSET_TABLE, PRESS_TABLE, VIDEO_TABLE
 from .models import (
@@ -45,6 +45,7 @@ def _ingest_simple(
     record_cls: type[CsvRecord],
     *,
     fieldnames: list[str] | None = None,
+    render_record: RenderRecord | None = None,
 ) -> lancedb.table.Table:
     """Generic ingest: read CSV, parse records, create FTS-indexed table.
 
@@ -54,6 +55,7 @@ def _ingest_simple(
         table_name: Name of the LanceDB table to create.
         record_cls: Pydantic model class with from_csv_row and searchable_text.
         fieldnames: Optional list of column names (for header-less CSVs).
+        render_record: Precomputes the ``display_text`` column; see :func:`ra_mcp_dataset_lib.add_display_text`.
 
     Returns:
         The created LanceDB table.
@@ -79,25 +81,28 @@ def _ingest_simple(
 
     logger.info("Parsed %d %s records", len(records), table_name)
 
+    if render_record is not None:
+        add_display_text(records, render_record)
     table = db.create_table(table_name, data=records, mode="overwrite")
     table = build_fts_index(db, table_name)
     return table
 
 
-def ingest_flygvapen(db: lancedb.DBConnection, csv_path: str | Path) -> lancedb.table.Table:
+def ingest_flygvapen(db: lancedb.DBConnection, csv_path: str | Path, *, render_record: RenderRecord | None = None) -> lancedb.table.Table:
     """Ingest Flygvapenhaverier CSV into a LanceDB table with FTS index.
 
     Args:
         db: LanceDB database connection.
         csv_path: Path to the flygvapenhaverier CSV (semicolon-delimited, latin-1).
+        render_record: Precomputes the ``display_text`` column; see :func:`ra_mcp_dataset_lib.add_display_text`.
 
     Returns:
         The created LanceDB table.
     """
-    return _ingest_simple(db, csv_path, FLYGVAPEN_TABLE, FlygvapenRecord)
+    return _ingest_simple(db, csv_path, FLYGVAPEN_TABLE, FlygvapenRecord, render_record=render_record)
 
 
-def ingest_fangrullor(db: lancedb.DBConnection, csv_path: str | Path) -> lancedb.table.Table:
+def ingest_fangrullor(db: lancedb.DBConnection, csv_path: str | Path, *, render_record: RenderRecord | None = None) -> lancedb.table.Table:
     """Ingest Fångrullor CSV into a LanceDB table with FTS index.
 
     The CSV has NO header row. Column names are assigned manually.
@@ -105,47 +110,51 @@ def ingest_fangrullor(db: lancedb.DBConnection, csv_path: str | Path) -> lancedb
     Args:
         db: LanceDB database connection.
         csv_path: Path to the fångrullor CSV (semicolon-delimited, latin-1, no header).
+        render_record: Precomputes the ``display_text`` column; see :func:`ra_mcp_dataset_lib.add_display_text`.
 
     Returns:
         The created LanceDB table.
     """
-    return _ingest_simple(db, csv_path, FANGRULLOR_TABLE, FangrullorRecord, fieldnames=FANGRULLOR_FIELDNAMES)
+    return _ingest_simple(db, csv_path, FANGRULLOR_TABLE, FangrullorRecord, fieldnames=FANGRULLOR_FIELDNAMES, render_record=render_record)
 
 
-def ingest_kurhuset(db: lancedb.DBConnection, csv_path: str | Path) -> lancedb.table.Table:
+def ingest_kurhuset(db: lancedb.DBConnection, csv_path: str | Path, *, render_record: RenderRecord | None = None) -> lancedb.table.Table:
     """Ingest Kurhuset CSV into a LanceDB table with FTS index.
 
     Args:
         db: LanceDB database connection.
         csv_path: Path to the kurhuset CSV (semicolon-delimited, latin-1, Swedish headers).
+        render_record: Precomputes the ``display_text`` column; see :func:`ra_mcp_dataset_lib.add_display_text`.
 
     Returns:
         The created LanceDB table.
     """
-    return _ingest_simple(db, csv_path, KURHUSET_TABLE, KurhusetRecord)
+    return _ingest_simple(db, csv_path, KURHUSET_TABLE, KurhusetRecord, render_record=render_record)
 
 
-def ingest_press(db: lancedb.DBConnection, csv_path: str | Path) -> lancedb.table.Table:
+def ingest_press(db: lancedb.DBConnection, csv_path: str | Path, *, render_record: RenderRecord | None = None) -> lancedb.table.Table:
     """Ingest Presskonferenser CSV into a LanceDB table with FTS index.
 
     Args:
         db: LanceDB database connection.
         csv_path: Path to the presskonferenser CSV (semicolon-delimited, latin-1).
+        render_record: Precomputes the ``display_text`` column; see :func:`ra_mcp_dataset_lib.add_display_text`.
 
     Returns:
         The created LanceDB table.
     """
-    return _ingest_simple(db, csv_path, PRESS_TABLE, PressRecord)
+    return _ingest_simple(db, csv_path, PRESS_TABLE, PressRecord, render_record=render_record)
 
 
-def ingest_video(db: lancedb.DBConnection, csv_path: str | Path) -> lancedb.table.Table:
+def ingest_video(db: lancedb.DBConnection, csv_path: str | Path, *, render_record: RenderRecord | None = None) -> lancedb.table.Table:
     """Ingest Videobutiker CSV into a LanceDB table with FTS index.
 
     Args:
         db: LanceDB database connection.
         csv_path: Path to the videobutiker CSV (semicolon-delimited, latin-1).
+        render_record: Precomputes the ``display_text`` column; see :func:`ra_mcp_dataset_lib.add_display_text`.
 
     Returns:
         The created LanceDB table.
     """
-    return _ingest_simple(db, csv_path, VIDEO_TABLE, VideoRecord)
+    return _ingest_simple(db, csv_path, VIDEO_TABLE, VideoRecord, render_record=render_record)
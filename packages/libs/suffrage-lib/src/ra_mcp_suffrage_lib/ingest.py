@@ -7,7 +7,7 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from ra_mcp_dataset_lib import build_fts_index
+from ra_mcp_dataset_lib import RenderRecord, add_display_text, build_fts_index
 
 from .config import FKPR_TABLE, ROSTRATT_TABLE
 from .models import FKPRRecord, RostrattRecord
@@ -19,7 +19,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def ingest_rostratt(db: lancedb.DBConnection, csv_dir: str | Path) -> lancedb.table.Table:
+def ingest_rostratt(db: lancedb.DBConnection, csv_dir: str | Path, *, render_record: RenderRecord | None = None) -> lancedb.table.Table:
     """Ingest Rösträtt CSVs from a directory into a LanceDB table with FTS index.
 
     Reads ALL .csv files from the given directory and concatenates rows into one table.
@@ -27,6 +27,7 @@ def ingest_rostratt(db: lancedb.DBConnection, csv_dir: str | Path) -> lancedb.ta
     Args:
         db: LanceDB database connection.
         csv_dir: Directory containing county CSV files (semicolon-delimited, latin-1 encoded).
+        render_record: Precomputes the ``display_text`` column; see :func:`ra_mcp_dataset_lib.add_display_text`.
 
     Returns:
         The created LanceDB table.
@@ -60,17 +61,20 @@ def ingest_rostratt(db: lancedb.DBConnection, csv_dir: str | Path) -> lancedb.ta
 
     logger.info("Parsed %d Rösträtt records from %d files", len(records), len(csv_files))
 
+    if render_record is not None:
+        add_display_text(records, render_record)
     table = db.create_table(ROSTRATT_TABLE, data=records, mode="overwrite")
     table = build_fts_index(db, ROSTRATT_TABLE)
     return table
 
 
-def ingest_fkpr(db: lancedb.DBConnection, csv_path: str | Path) -> lancedb.table.Table:
+def ingest_fkpr(db: lancedb.DBConnection, csv_path: str | Path, *, render_record: RenderRecord | None = None) -> lancedb.table.Table:
     """Ingest FKPR CSV into a LanceDB table with FTS index.
 
     Args:
         db: LanceDB database connection.
         csv_path: Path to the FKPR CSV file (semicolon-delimited, latin-1 encoded).
+        render_record: Precomputes the ``display_text`` column; see :func:`ra_mcp_dataset_lib.add_display_text`.
 
     Returns:
         The created LanceDB table.
@@ -98,6 +102,8 @@ def ingest_fkpr(db: lancedb.DBConnection, csv_path: str | Path) -> lancedb.table
 
     logger.info("Parsed %d FKPR records", len(records))
 
+    if render_record is not None:
+        add_display_text(records, render_record)
     table = db.create_table(FKPR_TABLE, data=records, mode="overwrite")
     table = build_fts_index(db, FKPR_TABLE)
     return table
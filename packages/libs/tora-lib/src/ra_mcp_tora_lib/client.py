@@ -11,6 +11,7 @@ from opentelemetry import trace
 from opentelemetry.trace import SpanKind, StatusCode
 
 from ra_mcp_common.telemetry import get_tracer
+from ra_mcp_common.upstream import upstream_url
 
 from .config import SPARQL_ENDPOINT
 from .models import ToraImage, ToraMapSource, ToraPlace
@@ -66,7 +67,7 @@ async def _sparql_post(query: str) -> dict | None:
     ) as span:
         async with httpx.AsyncClient(timeout=30.0) as client:
             response = await client.post(
-                SPARQL_ENDPOINT,
+                upstream_url(SPARQL_ENDPOINT),
                 data={"query": query},
                 headers={
                     "Accept": "application/sparql-results+json",
@@ -7,7 +7,7 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from ra_mcp_dataset_lib import build_fts_index
+from ra_mcp_dataset_lib import RenderRecord, add_display_text, build_fts_index
 
 from .config import WINCARS_TABLE
 from .models import WincarsRecord
@@ -19,7 +19,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def ingest_wincars(db: lancedb.DBConnection, csv_dir: str | Path) -> lancedb.table.Table:
+def ingest_wincars(db: lancedb.DBConnection, csv_dir: str | Path, *, render_record: RenderRecord | None = None) -> lancedb.table.Table:
     """Ingest Wincars vehicle registration CSVs from a directory into a LanceDB table with FTS index.
 
     Reads ALL .csv files from the given directory and concatenates rows into one table.
@@ -27,6 +27,7 @@ def ingest_wincars(db: lancedb.DBConnection, csv_dir: str | Path) -> lancedb.tab
     Args:
         db: LanceDB database connection.
         csv_dir: Directory containing county CSV files (semicolon-delimited, latin-1 encoded).
+        render_record: Precomputes the ``display_text`` column; see :func:`ra_mcp_dataset_lib.add_display_text`.
 
     Returns:
         The created LanceDB table.
@@ -60,6 +61,8 @@ def ingest_wincars(db: lancedb.DBConnection, csv_dir: str | Path) -> lancedb.tab
 
     logger.info("Parsed %d Wincars records from %d files", len(records), len(csv_files))
 
+    if render_record is not None:
+        add_display_text(records, render_record)
     table = db.create_table(WINCARS_TABLE, data=records, mode="overwrite")
     table = build_fts_index(db, WINCARS_TABLE)
     return table
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
+from ra_mcp_aktiebolag_lib.config import BOLAG_TABLE, STYRELSE_TABLE
 from ra_mcp_aktiebolag_lib.search_operations import SearchResult
 from ra_mcp_common.formatting import append_if, truncate_text
-from ra_mcp_dataset_lib import format_results
+from ra_mcp_dataset_lib import RenderRecord, format_results, register_display_renderers
 
 
 # ---------------------------------------------------------------------------
@@ -14,7 +16,7 @@ from ra_mcp_dataset_lib import format_results
 # ---------------------------------------------------------------------------
 
 
-def _format_bolag_record(rec: dict[str, Any], lines: list[str]) -> None:
+def _format_bolag_record(rec: Mapping[str, Any], lines: list[str]) -> None:
     """Format a single Aktiebolag company record into lines."""
     namn = rec.get("bolagets_namn", "?")
     argang = rec.get("argang", "")
@@ -52,7 +54,7 @@ def format_bolag_results(result: SearchResult) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _format_styrelse_record(rec: dict[str, Any], lines: list[str]) -> None:
+def _format_styrelse_record(rec: Mapping[str, Any], lines: list[str]) -> None:
     """Format a single board member record into lines."""
     styrelsemed = rec.get("styrelsemed", "")
     fornamn = rec.get("fornamn", "")
@@ -69,3 +71,11 @@ def _format_styrelse_record(rec: dict[str, Any], lines: list[str]) -> None:
 def format_styrelse_results(result: SearchResult) -> str:
     """Format board member search results as plain text for MCP/LLM consumption."""
     return format_results(result, label="Board member", render_record=_format_styrelse_record)
+
+
+# Table name -> render_record for stored display text; see ra_mcp_dataset_lib.register_display_renderers.
+DISPLAY_RENDERERS: dict[str, RenderRecord] = {
+    BOLAG_TABLE: _format_bolag_record,
+    STYRELSE_TABLE: _format_styrelse_record,
+}
+register_display_renderers(DISPLAY_RENDERERS)
@@ -14,6 +14,7 @@ from ra_mcp_browse_lib.browse_operations import BrowseOperations
 from ra_mcp_browse_lib.models import BrowseResult
 from ra_mcp_common.formatting import format_error_message
 from ra_mcp_common.http_client import default_http_client
+from ra_mcp_common.seen_pages import PageSet, SeenPages, session_seen
 from ra_mcp_common.telemetry import mark_span_error
 
 from .formatter import PlainTextFormatter
@@ -47,6 +48,9 @@ def register_browse_tool(mcp: FastMCP) -> None:
         highlight_term: Annotated[str | None, Field(description="Optional keyword to highlight in the transcription.")] = None,
         max_pages: Annotated[int, Field(description="Maximum pages to retrieve.", ge=1, le=20)] = 20,
         dedup: Annotated[bool, Field(description="Session deduplication. True replaces already-shown pages with stubs; False forces full text.")] = True,
+        max_response_tokens: Annotated[
+            int, Field(description="Maximum tokens in response. Pages past it are left out whole, and the response lists them to browse next.", ge=1000)
+        ] = 15000,
         research_context: Annotated[str | None, Field(description="Brief summary of the user's research goal. Used for telemetry only.")] = None,
         ctx: Context | None = None,
     ) -> str:
@@ -90,10 +94,11 @@ def register_browse_tool(mcp: FastMCP) -> None:
             )
 
             # Load session state for dedup
-            seen_page_numbers: set[int] | None = None
-            if dedup and ctx is not None:
-                seen_browse: dict[str, list[int]] = await ctx.get_state("seen_browse") or {}
-                seen_page_numbers = set(seen_browse.get(reference_code, []))
+            seen_browse: SeenPages | None = None
+            seen_page_numbers: PageSet | None = None
+            if dedup and session_id is not None:
+                seen_browse = session_seen(session_id, "browse")
+                seen_page_numbers = seen_browse.get(reference_code, PageSet())
                 logger.info(
                     "[browse] Dedup state loaded: %d documents tracked, %d pages previously seen for %s",
                     len(seen_browse),
@@ -107,16 +112,13 @@ def register_browse_tool(mcp: FastMCP) -> None:
                     return formatter.format_browse_results(browse_result, highlight_term, seen_page_numbers=seen_page_numbers)
                 return _generate_no_pages_found_message(reference_code)
 
-            result = formatter.format_browse_results(browse_result, highlight_term, seen_page_numbers=seen_page_numbers)
+            result = formatter.format_browse_results(browse_result, highlight_term, seen_page_numbers=seen_page_numbers, max_tokens=max_response_tokens)
 
-            # Update session state with newly shown pages
-            if dedup and ctx is not None:
-                all_pages = set(seen_browse.get(reference_code, []))
-                for context in browse_result.contexts:
-                    all_pages.add(context.page_number)
-                seen_browse[reference_code] = sorted(all_pages)
-                await ctx.set_state("seen_browse", seen_browse)
-                logger.info("[browse] Dedup state saved: %s now has %d pages tracked", reference_code, len(all_pages))
+            # Update session state with newly shown pages (not those left out for the token budget)
+            if seen_browse is not None:
+                omitted = set(formatter.pages_omitted)
+                seen_browse.add(reference_code, (context.page_number for context in browse_result.contexts if context.page_number not in omitted))
+                logger.info("[browse] Dedup state updated: %s now has %d pages tracked", reference_code, len(seen_browse[reference_code]))
 
             return result
 
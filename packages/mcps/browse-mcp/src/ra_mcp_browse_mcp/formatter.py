@@ -2,12 +2,19 @@
 Plain text formatter for MCP/LLM output without any Rich markup.
 """
 
-from ra_mcp_common.formatting import highlight_keyword_markdown, iiif_manifest_to_bildvisaren
+from collections.abc import Set
+
+from ra_mcp_common.formatting import TokenBudget, highlight_keyword_markdown, iiif_manifest_to_bildvisaren
 
 
 class PlainTextFormatter:
     """Formatter that produces plain text without any Rich markup."""
 
+    #: Page numbers the most recent format_browse_results() call left out because
+    #: the next page would have exceeded max_tokens. The caller keeps them out of
+    #: the dedup state, so they are not stubbed when requested again.
+    pages_omitted: tuple[int, ...] = ()
+
     def highlight_search_keyword(self, text_content: str, search_keyword: str) -> str:
         """Highlight search keywords using markdown-style bold."""
         return highlight_keyword_markdown(text_content, search_keyword)
@@ -101,11 +108,33 @@ class PlainTextFormatter:
         if metadata.nad_link:
             lines.append(f"🔗 NAD Link: {metadata.nad_link}")
 
+    def _format_page(self, lines: list[str], context, highlight_term) -> None:
+        """Emit one page's heading, text, and links."""
+        lines.append(f"📄 Page {context.page_number}")
+        lines.append("─" * 40)
+
+        if context.full_text.strip():
+            display_text = context.full_text
+            if highlight_term:
+                display_text = self.highlight_search_keyword(display_text, highlight_term)
+            lines.append(display_text)
+        else:
+            lines.append("(Empty page - no transcribed text)")
+
+        lines.append("")
+        lines.append("🔗 Links:")
+        lines.append(f"  📝 ALTO XML: {context.alto_url}")
+        if context.image_url:
+            lines.append(f"  🖼️  Image: {context.image_url}")
+        if context.bildvisning_url:
+            lines.append(f"  👁️  Bildvisning: {context.bildvisning_url}")
+
     def format_browse_results(
         self,
         browse_result,
         highlight_term=None,
-        seen_page_numbers: set[int] | None = None,
+        seen_page_numbers: Set[int] | None = None,
+        max_tokens: int | None = None,
     ) -> str:
         """
         Format browse results as plain text with emojis for MCP/LLM consumption.
@@ -115,10 +144,13 @@ class PlainTextFormatter:
             highlight_term: Optional term to highlight in text
             seen_page_numbers: Optional set of page numbers already shown in this session.
                                When provided, previously-shown pages get a one-liner stub.
+            max_tokens: Token budget for the response. Rendering stops before the first
+                        page that would exceed it; pages_omitted lists the pages left out.
 
         Returns:
             Formatted plain text browse results
         """
+        self.pages_omitted = ()
         lines: list[str] = []
 
         if self._format_non_digitised_metadata(lines, browse_result):
@@ -142,33 +174,24 @@ class PlainTextFormatter:
         else:
             lines.append(f"📖 Pages loaded: {len(browse_result.contexts)}")
         lines.append("")
+        budget = TokenBudget(max_tokens)
+        budget.charge(lines)
 
-        for context in browse_result.contexts:
+        for idx, context in enumerate(browse_result.contexts):
+            page_lines: list[str] = []
             if context.page_number in seen:
-                lines.append(f"📄 Page {context.page_number} (previously shown in this session)")
-                lines.append("")
-                continue
-
-            lines.append(f"📄 Page {context.page_number}")
-            lines.append("─" * 40)
-
-            if context.full_text.strip():
-                display_text = context.full_text
-                if highlight_term:
-                    display_text = self.highlight_search_keyword(display_text, highlight_term)
-                lines.append(display_text)
+                page_lines.append(f"📄 Page {context.page_number} (previously shown in this session)")
             else:
-                lines.append("(Empty page - no transcribed text)")
-
-            lines.append("")
-            lines.append("🔗 Links:")
-            lines.append(f"  📝 ALTO XML: {context.alto_url}")
-            if context.image_url:
-                lines.append(f"  🖼️  Image: {context.image_url}")
-            if context.bildvisning_url:
-                lines.append(f"  👁️  Bildvisning: {context.bildvisning_url}")
+                self._format_page(page_lines, context, highlight_term)
+            page_lines.append("")
 
-            lines.append("")
+            if not budget.fits(page_lines):
+                self.pages_omitted = tuple(c.page_number for c in browse_result.contexts[idx:])
+                omitted = ",".join(str(page) for page in self.pages_omitted)
+                lines.append(f"📄 Pages {omitted} not shown to stay within the response token budget — browse them with pages='{omitted}'")
+                lines.append("")
+                break
+            lines.extend(page_lines)
 
         lines.append(
             "Tip: Present the original text (quoted), provide a translation in the user's language, and include the bildvisaren link. Note uncertain readings."
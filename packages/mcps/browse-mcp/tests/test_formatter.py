@@ -142,6 +142,19 @@ def test_format_browse_results_multiple_contexts():
     assert "📄 Page 8" in out
 
 
+def test_format_browse_results_stops_at_page_boundary_within_budget():
+    fmt = PlainTextFormatter()
+    contexts = [_page_context(n, text="ord " * 1000) for n in (7, 8, 9)]
+    result = BrowseResult(contexts=contexts, reference_code=REF_CODE, pages_requested="7-9")
+    out = fmt.format_browse_results(result, max_tokens=1500)
+
+    assert "📄 Page 7" in out
+    assert "📄 Page 9" not in out
+    assert 9 in fmt.pages_omitted
+    omitted = ",".join(str(n) for n in fmt.pages_omitted)
+    assert f"pages='{omitted}'" in out
+
+
 def test_format_browse_results_empty_page_text():
     fmt = PlainTextFormatter()
     result = BrowseResult(contexts=[_page_context(3, text="   ")], reference_code=REF_CODE, pages_requested="3")
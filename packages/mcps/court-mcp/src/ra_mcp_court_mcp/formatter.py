@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
 from ra_mcp_common.formatting import append_if, truncate_text
+from ra_mcp_court_lib.config import DOMBOKSREGISTER_TABLE, MEDELSTAD_TABLE
 from ra_mcp_court_lib.search_operations import SearchResult
-from ra_mcp_dataset_lib import format_results
+from ra_mcp_dataset_lib import RenderRecord, format_results, register_display_renderers
 
 
 # ---------------------------------------------------------------------------
@@ -14,7 +16,7 @@ from ra_mcp_dataset_lib import format_results
 # ---------------------------------------------------------------------------
 
 
-def _format_domboksregister_record(rec: dict[str, Any], lines: list[str]) -> None:
+def _format_domboksregister_record(rec: Mapping[str, Any], lines: list[str]) -> None:
     """Format a single Domboksregister record into lines."""
     lines.append(f"--- Domboksregister {rec.get('id', '?')} ---")
 
@@ -45,7 +47,7 @@ def format_domboksregister_results(result: SearchResult) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _format_medelstad_record(rec: dict[str, Any], lines: list[str]) -> None:
+def _format_medelstad_record(rec: Mapping[str, Any], lines: list[str]) -> None:
     """Format a single Medelstad record into lines."""
     lines.append(f"--- Medelstad {rec.get('lopnr', '?')} ---")
 
@@ -78,3 +80,11 @@ def _format_medelstad_record(rec: dict[str, Any], lines: list[str]) -> None:
 def format_medelstad_results(result: SearchResult) -> str:
     """Format Medelstad search results as plain text for MCP/LLM consumption."""
     return format_results(result, label="Medelstad", render_record=_format_medelstad_record)
+
+
+# Table name -> render_record for stored display text; see ra_mcp_dataset_lib.register_display_renderers.
+DISPLAY_RENDERERS: dict[str, RenderRecord] = {
+    DOMBOKSREGISTER_TABLE: _format_domboksregister_record,
+    MEDELSTAD_TABLE: _format_medelstad_record,
+}
+register_display_renderers(DISPLAY_RENDERERS)
@@ -2,18 +2,24 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
 from ra_mcp_common.formatting import append_if, truncate_text
+from ra_mcp_dataset_lib import RenderRecord, format_results, register_display_renderers
+from ra_mcp_dds_lib.config import DODA_TABLE, FODELSE_TABLE, VIGSEL_TABLE
 from ra_mcp_dds_lib.search_operations import SearchResult
 
 
+_VIEW_BILD_TIP = "Tip: Use view_bild with the Bild ID to see the original church book page."
+
+
 # ---------------------------------------------------------------------------
 # Födelse (birth) formatter
 # ---------------------------------------------------------------------------
 
 
-def _format_fodelse_record(rec: dict[str, Any], lines: list[str]) -> None:
+def _format_fodelse_record(rec: Mapping[str, Any], lines: list[str]) -> None:
     """Format a single Födelse record into lines."""
     lines.append(f"--- F\u00f6delse {rec.get('postid', '?')} ---")
 
@@ -55,26 +61,7 @@ def _format_fodelse_record(rec: dict[str, Any], lines: list[str]) -> None:
 
 def format_fodelse_results(result: SearchResult) -> str:
     """Format Födelse search results as plain text for MCP/LLM consumption."""
-    if not result.records:
-        if result.offset > 0:
-            return f"No more F\u00f6delse results for '{result.keyword}' at offset {result.offset}. Total found: {result.total_hits}"
-        return f"No F\u00f6delse results found for '{result.keyword}'."
-
-    lines: list[str] = []
-    lines.append(f"F\u00f6delse search results for '{result.keyword}': showing {len(result.records)} of {result.total_hits} records (offset {result.offset})")
-    lines.append("")
-
-    for rec in result.records:
-        _format_fodelse_record(rec, lines)
-
-    next_offset = result.offset + result.limit
-    if next_offset < result.total_hits:
-        lines.append(f"More results available. Use offset={next_offset} to see the next page.")
-
-    lines.append("")
-    lines.append("Tip: Use view_bild with the Bild ID to see the original church book page.")
-
-    return "\n".join(lines)
+    return format_results(result, label="F\u00f6delse", render_record=_format_fodelse_record, tip=_VIEW_BILD_TIP)
 
 
 # ---------------------------------------------------------------------------
@@ -82,7 +69,7 @@ def format_fodelse_results(result: SearchResult) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _format_doda_record(rec: dict[str, Any], lines: list[str]) -> None:
+def _format_doda_record(rec: Mapping[str, Any], lines: list[str]) -> None:
     """Format a single Döda record into lines."""
     lines.append(f"--- D\u00f6da {rec.get('postid', '?')} ---")
 
@@ -133,26 +120,7 @@ def _format_doda_record(rec: dict[str, Any], lines: list[str]) -> None:
 
 def format_doda_results(result: SearchResult) -> str:
     """Format Döda search results as plain text for MCP/LLM consumption."""
-    if not result.records:
-        if result.offset > 0:
-            return f"No more D\u00f6da results for '{result.keyword}' at offset {result.offset}. Total found: {result.total_hits}"
-        return f"No D\u00f6da results found for '{result.keyword}'."
-
-    lines: list[str] = []
-    lines.append(f"D\u00f6da search results for '{result.keyword}': showing {len(result.records)} of {result.total_hits} records (offset {result.offset})")
-    lines.append("")
-
-    for rec in result.records:
-        _format_doda_record(rec, lines)
-
-    next_offset = result.offset + result.limit
-    if next_offset < result.total_hits:
-        lines.append(f"More results available. Use offset={next_offset} to see the next page.")
-
-    lines.append("")
-    lines.append("Tip: Use view_bild with the Bild ID to see the original church book page.")
-
-    return "\n".join(lines)
+    return format_results(result, label="D\u00f6da", render_record=_format_doda_record, tip=_VIEW_BILD_TIP)
 
 
 # ---------------------------------------------------------------------------
@@ -160,7 +128,7 @@ def format_doda_results(result: SearchResult) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _format_vigsel_record(rec: dict[str, Any], lines: list[str]) -> None:
+def _format_vigsel_record(rec: Mapping[str, Any], lines: list[str]) -> None:
     """Format a single Vigsel record into lines."""
     lines.append(f"--- Vigsel {rec.get('postid', '?')} ---")
 
@@ -215,23 +183,13 @@ def _format_vigsel_record(rec: dict[str, Any], lines: list[str]) -> None:
 
 def format_vigsel_results(result: SearchResult) -> str:
     """Format Vigsel search results as plain text for MCP/LLM consumption."""
-    if not result.records:
-        if result.offset > 0:
-            return f"No more Vigsel results for '{result.keyword}' at offset {result.offset}. Total found: {result.total_hits}"
-        return f"No Vigsel results found for '{result.keyword}'."
+    return format_results(result, label="Vigsel", render_record=_format_vigsel_record, tip=_VIEW_BILD_TIP)
 
-    lines: list[str] = []
-    lines.append(f"Vigsel search results for '{result.keyword}': showing {len(result.records)} of {result.total_hits} records (offset {result.offset})")
-    lines.append("")
-
-    for rec in result.records:
-        _format_vigsel_record(rec, lines)
-
-    next_offset = result.offset + result.limit
-    if next_offset < result.total_hits:
-        lines.append(f"More results available. Use offset={next_offset} to see the next page.")
-
-    lines.append("")
-    lines.append("Tip: Use view_bild with the Bild ID to see the original church book page.")
 
-    return "\n".join(lines)
+# Table name -> render_record for stored display text; see ra_mcp_dataset_lib.register_display_renderers.
+DISPLAY_RENDERERS: dict[str, RenderRecord] = {
+    FODELSE_TABLE: _format_fodelse_record,
+    DODA_TABLE: _format_doda_record,
+    VIGSEL_TABLE: _format_vigsel_record,
+}
+register_display_renderers(DISPLAY_RENDERERS)
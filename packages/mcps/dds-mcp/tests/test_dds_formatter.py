@@ -1,7 +1,18 @@
 """Tests for DDS formatter — verifies bild_id and reference code appear in output."""
 
-from ra_mcp_dds_lib.search_operations import SearchResult
-from ra_mcp_dds_mcp.formatter import format_doda_results, format_fodelse_results, format_vigsel_results
+from pathlib import Path
+
+import lancedb
+import pytest
+
+from ra_mcp_dataset_lib import DISPLAY_TEXT_COLUMN
+from ra_mcp_dds_lib.config import DODA_TABLE, FODELSE_TABLE, VIGSEL_TABLE
+from ra_mcp_dds_lib.ingest import ingest_doda, ingest_fodelse, ingest_vigsel
+from ra_mcp_dds_lib.search_operations import DDSSearch, SearchResult
+from ra_mcp_dds_mcp.formatter import DISPLAY_RENDERERS, format_doda_results, format_fodelse_results, format_vigsel_results
+
+
+LIB_FIXTURES = Path(__file__).parents[3] / "libs" / "dds-lib" / "tests" / "fixtures"
 
 
 def _fodelse_result(**overrides) -> SearchResult:
@@ -126,3 +137,35 @@ def test_vigsel_includes_ref():
 def test_vigsel_includes_viewer_tip():
     text = format_vigsel_results(_vigsel_result())
     assert "view_bild" in text
+
+
+# ---------------------------------------------------------------------------
+# Ingest-time display text
+# ---------------------------------------------------------------------------
+
+
+def _ingest_all(db, *, precompute: bool) -> DDSSearch:
+    def renderer(table):
+        return {"render_record": DISPLAY_RENDERERS[table]} if precompute else {}
+
+    ingest_fodelse(db, LIB_FIXTURES / "fodda", **renderer(FODELSE_TABLE))
+    ingest_doda(db, LIB_FIXTURES / "doda", **renderer(DODA_TABLE))
+    ingest_vigsel(db, LIB_FIXTURES / "vigslar", **renderer(VIGSEL_TABLE))
+    return DDSSearch(db)
+
+
+@pytest.mark.parametrize(
+    ("search_name", "format_fn", "keyword"),
+    [
+        ("search_fodelse", format_fodelse_results, "Lindberg"),
+        ("search_doda", format_doda_results, "Stockholm"),
+        ("search_vigsel", format_vigsel_results, "Stockholm"),
+    ],
+)
+def test_precomputed_display_text_matches_live_formatting(tmp_path, search_name, format_fn, keyword):
+    live = getattr(_ingest_all(lancedb.connect(str(tmp_path / "live")), precompute=False), search_name)(keyword)
+    stored = getattr(_ingest_all(lancedb.connect(str(tmp_path / "stored")), precompute=True), search_name)(keyword)
+    assert DISPLAY_TEXT_COLUMN not in live.records.column_names
+    assert stored.records.column_names[0] == DISPLAY_TEXT_COLUMN
+    assert live.total_hits >= 1
+    assert format_fn(stored) == format_fn(live)
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
 from ra_mcp_common.formatting import append_if
-from ra_mcp_dataset_lib import format_results
+from ra_mcp_dataset_lib import RenderRecord, format_results, register_display_renderers
+from ra_mcp_faltjagare_lib.config import FALTJAGARE_TABLE
 from ra_mcp_faltjagare_lib.search_operations import SearchResult
 
 
-def _format_faltjagare_record(rec: dict[str, Any], lines: list[str]) -> None:
+def _format_faltjagare_record(rec: Mapping[str, Any], lines: list[str]) -> None:
     """Format a single Fältjägare record into lines."""
     soldatnamn = rec.get("soldatnamn", "")
     foernamn = rec.get("foernamn", "")
@@ -63,3 +65,10 @@ def _format_faltjagare_record(rec: dict[str, Any], lines: list[str]) -> None:
 def format_faltjagare_results(result: SearchResult) -> str:
     """Format Fältjägare search results as plain text for MCP/LLM consumption."""
     return format_results(result, label="Fältjägare", render_record=_format_faltjagare_record)
+
+
+# Table name -> render_record for stored display text; see ra_mcp_dataset_lib.register_display_renderers.
+DISPLAY_RENDERERS: dict[str, RenderRecord] = {
+    FALTJAGARE_TABLE: _format_faltjagare_record,
+}
+register_display_renderers(DISPLAY_RENDERERS)
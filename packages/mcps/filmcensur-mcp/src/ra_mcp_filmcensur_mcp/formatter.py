@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
 from ra_mcp_common.formatting import append_if, truncate_text
-from ra_mcp_dataset_lib import format_results
+from ra_mcp_dataset_lib import RenderRecord, format_results, register_display_renderers
+from ra_mcp_filmcensur_lib.config import FILMREG_TABLE
 from ra_mcp_filmcensur_lib.search_operations import SearchResult
 
 
-def _format_filmreg_record(rec: dict[str, Any], lines: list[str]) -> None:
+def _format_filmreg_record(rec: Mapping[str, Any], lines: list[str]) -> None:
     """Format a single Filmreg record into lines."""
     lines.append(f"--- Film {rec.get('granskningsnummer', '?')} ---")
     append_if(lines, "Title", rec.get("titel_org", ""))
@@ -39,3 +41,10 @@ def _format_filmreg_record(rec: dict[str, Any], lines: list[str]) -> None:
 def format_filmreg_results(result: SearchResult) -> str:
     """Format Filmreg search results as plain text for MCP/LLM consumption."""
     return format_results(result, label="Filmreg", render_record=_format_filmreg_record)
+
+
+# Table name -> render_record for stored display text; see ra_mcp_dataset_lib.register_display_renderers.
+DISPLAY_RENDERERS: dict[str, RenderRecord] = {
+    FILMREG_TABLE: _format_filmreg_record,
+}
+register_display_renderers(DISPLAY_RENDERERS)
@@ -10,14 +10,17 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
-from typing import Annotated, Literal
+from typing import TYPE_CHECKING, Annotated, Literal
 
 from fastmcp import Context, FastMCP
 from fastmcp.exceptions import ToolError
-from gradio_client import Client
 from pydantic import BaseModel, Field
 
 
+if TYPE_CHECKING:
+    from gradio_client import Client
+
+
 logger = logging.getLogger("ra_mcp.htr.tools")
 
 HTR_SPACE_URL = os.getenv("HTR_SPACE_URL", "https://riksarkivet-htr-demo.hf.space")
@@ -27,9 +30,15 @@ _client: Client | None = None
 
 
 def _get_client() -> Client:
-    """Return a lazily-initialized Gradio client for the HTR Space."""
+    """Return a lazily-initialized Gradio client for the HTR Space.
+
+    ``gradio_client`` is imported here rather than at module load: it is slow to
+    import and only needed once a transcription is requested.
+    """
     global _client
     if _client is None:
+        from gradio_client import Client
+
         logger.info("Connecting to HTR Space: %s", HTR_SPACE_URL)
         _client = Client(HTR_SPACE_URL)
     return _client
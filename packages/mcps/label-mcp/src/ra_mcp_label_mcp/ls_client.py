@@ -2,13 +2,19 @@
 Label Studio API client for importing tasks.
 
 Uses the official Label Studio SDK which handles both legacy tokens
-and Personal Access Tokens (JWT PATs) transparently.
+and Personal Access Tokens (JWT PATs) transparently. The SDK is imported
+on first use: it pulls in pandas and takes seconds to import, which would
+otherwise be paid by every server start with the label module enabled.
 """
 
+from __future__ import annotations
+
 import logging
+from typing import TYPE_CHECKING
+
 
-from label_studio_sdk import LabelStudio
-from label_studio_sdk.core.api_error import ApiError
+if TYPE_CHECKING:
+    from label_studio_sdk import LabelStudio
 
 
 logger = logging.getLogger("ra_mcp.label.client")
@@ -16,6 +22,8 @@ logger = logging.getLogger("ra_mcp.label.client")
 
 def _get_client(ls_url: str, token: str) -> LabelStudio:
     """Create a Label Studio SDK client."""
+    from label_studio_sdk import LabelStudio
+
     return LabelStudio(base_url=ls_url.rstrip("/"), api_key=token.strip())
 
 
@@ -34,6 +42,8 @@ def import_tasks(tasks: list[dict], ls_url: str, token: str, project_id: int) ->
     Raises:
         RuntimeError: On API errors.
     """
+    from label_studio_sdk.core.api_error import ApiError
+
     try:
         client = _get_client(ls_url, token)
         result = client.projects.import_tasks(id=project_id, request=tasks, return_task_ids=True)  # type: ignore[arg-type]  # SDK accepts plain dicts at runtime
@@ -64,6 +74,8 @@ def assign_tasks(
     Raises:
         RuntimeError: If user not found or API error.
     """
+    from label_studio_sdk.core.api_error import ApiError
+
     try:
         client = _get_client(ls_url, token)
 
@@ -17,13 +17,13 @@ from ra_mcp_label_mcp.ls_client import _get_client, assign_tasks, import_tasks
 
 
 def test_get_client_strips_trailing_slash():
-    with patch("ra_mcp_label_mcp.ls_client.LabelStudio") as mock_cls:
+    with patch("label_studio_sdk.LabelStudio") as mock_cls:
         _get_client("https://ls.example.com/", "tok123")
         mock_cls.assert_called_once_with(base_url="https://ls.example.com", api_key="tok123")
 
 
 def test_get_client_strips_token_whitespace():
-    with patch("ra_mcp_label_mcp.ls_client.LabelStudio") as mock_cls:
+    with patch("label_studio_sdk.LabelStudio") as mock_cls:
         _get_client("https://ls.example.com", "  tok123  ")
         mock_cls.assert_called_once_with(base_url="https://ls.example.com", api_key="tok123")
 
@@ -3,17 +3,40 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import io
+import json
 import logging
+import mmap
+import os
+import tempfile
+import threading
+import time
 from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
 from urllib.parse import urlparse
 
 import httpx
 from opentelemetry import trace
 from opentelemetry.trace import SpanKind
 
+from ra_mcp_common.cache_registry import CacheStats, matching_keys, register_cache
+from ra_mcp_common.settings import settings
+from ra_mcp_common.telemetry import get_meter
+from ra_mcp_pdf_mcp.pages import forget_page_texts
+
 
 logger = logging.getLogger("ra_mcp.pdf.cache")
 _tracer = trace.get_tracer("ra_mcp.pdf.cache")
+_meter = get_meter("ra_mcp.pdf.cache")
+_chunk_counter = _meter.create_counter("ra_mcp.pdf.chunks", unit="{chunk}", description="PDF range chunk reads (hit, miss, shared, prefetch)")
+_first_chunk_duration = _meter.create_histogram(
+    "ra_mcp.pdf.first_chunk.duration", unit="s", description="Time to serve the first read_pdf_bytes chunk of a PDF"
+)
+_full_load_duration = _meter.create_histogram(
+    "ra_mcp.pdf.load.duration", unit="s", description="Time from a PDF's first read_pdf_bytes chunk until its last chunk was served"
+)
 
 
 def _host(url: str) -> str:
@@ -21,10 +44,13 @@ def _host(url: str) -> str:
 
 
 MAX_PDF_SIZE = 200 * 1024 * 1024  # 200 MB — largest single PDF we'll cache
-MAX_PDF_CACHE_BYTES = 512 * 1024 * 1024  # 512 MB total across all cached PDF bytes
+MAX_PDF_CACHE_BYTES = 512 * 1024 * 1024  # 512 MB on disk across all cached PDFs
 MAX_PDF_CACHE_ITEMS = 16
 MAX_BLOCKS_CACHE_ITEMS = 64
 CHUNK_SIZE = 8 * 1024 * 1024  # 8 MB
+MAX_CHUNK_CACHE_BYTES = 128 * 1024 * 1024  # 128 MB of Range-read chunks across all PDFs
+# On-disk PDFs (DiskPDFCache) and, under guide-index/, the persisted guide search index.
+CACHE_DIR = settings.pdf_cache_dir or Path(tempfile.gettempdir()) / "ra-mcp-pdf-cache"
 
 
 def _sizeof(value: object) -> int:
@@ -32,6 +58,10 @@ def _sizeof(value: object) -> int:
     return len(value) if isinstance(value, bytes | bytearray) else 0
 
 
+def _open_for_writing(path: Path) -> io.BufferedWriter:
+    return path.open("wb")
+
+
 class LRUCache[V]:
     """Least-recently-used cache bounded by item count and optional total bytes.
 
@@ -40,39 +70,94 @@ class LRUCache[V]:
     least-recently-used entries once a bound is exceeded — so a long-running
     server can't accumulate PDF bytes without limit (the previous plain dicts
     grew forever, each entry up to MAX_PDF_SIZE).
+
+    ``on_drop`` is called with the key of every entry that is replaced, evicted,
+    invalidated or cleared, for data derived from an entry that must go with it.
     """
 
-    def __init__(self, *, max_items: int, max_bytes: int | None = None) -> None:
+    def __init__(self, *, max_items: int, max_bytes: int | None = None, on_drop: Callable[[str], None] | None = None) -> None:
         self._max_items = max_items
         self._max_bytes = max_bytes
+        self._on_drop = on_drop
         self._store: OrderedDict[str, V] = OrderedDict()
         self._bytes = 0
+        # For the admin cache report: a hit is a read of a cached key, a miss a failed
+        # ``in`` check (the callers always test membership before reading).
+        self._key_hits: dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
     def __contains__(self, key: str) -> bool:
-        return key in self._store
+        found = key in self._store
+        if not found:
+            self.misses += 1
+        return found
 
     def __getitem__(self, key: str) -> V:
         self._store.move_to_end(key)
-        return self._store[key]
+        value = self._store[key]
+        self.hits += 1
+        self._key_hits[key] = self._key_hits.get(key, 0) + 1
+        return value
 
     def __setitem__(self, key: str, value: V) -> None:
         if key in self._store:
             self._bytes -= _sizeof(self._store[key])
             del self._store[key]
+            self._dropped(key)
         self._store[key] = value
         self._bytes += _sizeof(value)
         while self._store and (len(self._store) > self._max_items or (self._max_bytes is not None and self._bytes > self._max_bytes)):
-            _, evicted = self._store.popitem(last=False)
+            evicted_key, evicted = self._store.popitem(last=False)
             self._bytes -= _sizeof(evicted)
+            self._key_hits.pop(evicted_key, None)
+            self._dropped(evicted_key)
+            self.evictions += 1
 
     def __len__(self) -> int:
         return len(self._store)
 
     def clear(self) -> None:
         """Drop all entries and reset the byte total."""
+        keys = list(self._store)
         self._store.clear()
+        for key in keys:
+            self._dropped(key)
+        self._key_hits.clear()
         self._bytes = 0
 
+    def invalidate(self, pattern: str | None = None) -> int:
+        """Drop the entries selected by *pattern* (see ``ra_mcp_common.cache_registry``); returns how many."""
+        keys = matching_keys(self._store, pattern)
+        for key in keys:
+            self._bytes -= _sizeof(self._store.pop(key))
+            self._key_hits.pop(key, None)
+            self._dropped(key)
+        return len(keys)
+
+    def _dropped(self, key: str) -> None:
+        if self._on_drop is not None:
+            self._on_drop(key)
+
+    def stats(self, top: int = 10) -> CacheStats:
+        """Entry count, bytes, counters and the most-read keys."""
+        hottest = sorted(self._key_hits.items(), key=lambda item: item[1], reverse=True)[:top]
+        return CacheStats(
+            entries=len(self._store),
+            bytes=self._bytes,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            top_keys=[{"key": key, "hits": hits} for key, hits in hottest],
+        )
+
+    def get(self, key: str) -> V | None:
+        """``cache[key]``, or None if it is not cached."""
+        if key not in self:
+            return None
+        return self[key]
+
     def keys(self) -> list[str]:
         """Snapshot of the cached keys (does not affect LRU recency)."""
         return list(self._store)
@@ -82,11 +167,266 @@ class LRUCache[V]:
         return list(self._store.items())
 
 
-pdf_cache: LRUCache[bytes] = LRUCache(max_items=MAX_PDF_CACHE_ITEMS, max_bytes=MAX_PDF_CACHE_BYTES)
-blocks_cache: LRUCache[list] = LRUCache(max_items=MAX_BLOCKS_CACHE_ITEMS)  # url → page dicts with structured blocks
+class DiskPDFCache:
+    """Whole PDFs cached as files and read through ``mmap``.
+
+    Replaces an in-memory ``LRUCache[bytes]`` that held up to 512 MB of PDF
+    bodies in the process: every ``read_pdf_bytes`` chunk was then copied
+    out of a Python ``bytes``. Here each PDF is streamed to
+    ``<directory>/<digest>.pdf`` next to a ``<digest>.json`` sidecar with its
+    URL and size, and reads return a ``memoryview`` slice of a read-only
+    mapping, which the base64 encoder consumes without an intermediate copy.
+    Resident memory no longer grows with the number of cached PDFs (mapped
+    pages belong to the OS page cache), and the files outlive a restart.
+
+    The dict-style API matches ``LRUCache``: ``url in cache``, ``cache[url]``
+    (a ``memoryview``), ``cache[url] = data``. Files are written to a
+    temporary name and renamed into place, and an entry is trusted only when
+    the file size equals the size in its sidecar, so several worker processes
+    can share the directory and a torn write is never served. Entries are
+    evicted least recently used first once ``max_items`` or ``max_bytes`` is
+    exceeded; recency survives restarts through the files' mtimes.
+
+    The dict-style API does file I/O (stats, mapping, writing, renaming), so the
+    async code in this module goes through :meth:`has`, :meth:`get`,
+    :meth:`store` and :meth:`store_stream`, which run it in a worker thread.
+
+    Args:
+        directory: Where the files live; created on first use.
+        max_items: Most PDFs kept.
+        max_bytes: Most bytes kept on disk.
+    """
+
+    def __init__(self, directory: Path, *, max_items: int, max_bytes: int) -> None:
+        self.directory = Path(directory)
+        self._max_items = max_items
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, int] = OrderedDict()  # url → size, least recently used first
+        self._maps: dict[str, mmap.mmap] = {}
+        self._loaded = False
+        self._key_hits: dict[str, int] = {}
+        # Held around the index and files; worker threads and the event loop both use them.
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _path(self, url: str, suffix: str) -> Path:
+        return self.directory / (hashlib.sha256(url.encode()).hexdigest()[:32] + suffix)
+
+    def _verified_size(self, sidecar: Path) -> tuple[str, int] | None:
+        """(url, size) from a sidecar whose PDF file is present and complete; removes broken pairs."""
+        try:
+            meta = json.loads(sidecar.read_text())
+            pdf = sidecar.with_suffix(".pdf")
+            if pdf.stat().st_size == meta["size"]:
+                return meta["url"], meta["size"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        sidecar.unlink(missing_ok=True)
+        sidecar.with_suffix(".pdf").unlink(missing_ok=True)
+        return None
+
+    def _load(self) -> None:
+        with self._lock:
+            if not self._loaded:
+                self._load_directory()
+
+    def _load_directory(self) -> None:
+        self._loaded = True
+        self.directory.mkdir(parents=True, exist_ok=True)
+        found = [(sidecar.with_suffix(".pdf").stat().st_mtime, *entry) for sidecar in self.directory.glob("*.json") if (entry := self._verified_size(sidecar))]
+        for _, url, size in sorted(found):
+            self._entries[url] = size
+        self._evict()
+        if self._entries:
+            logger.info("PDF cache: %d files (%d bytes) in %s", len(self._entries), sum(self._entries.values()), self.directory)
+
+    def _evict(self) -> None:
+        while self._entries and (len(self._entries) > self._max_items or sum(self._entries.values()) > self._max_bytes):
+            url, _ = self._entries.popitem(last=False)
+            self._forget(url)
+            self.evictions += 1
+
+    def _forget(self, url: str) -> None:
+        # An open mapping stays valid after the unlink; it is released with its last view.
+        self._maps.pop(url, None)
+        self._key_hits.pop(url, None)
+        self._path(url, ".json").unlink(missing_ok=True)
+        self._path(url, ".pdf").unlink(missing_ok=True)
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            return self._contains(url)
+
+    def _contains(self, url: str) -> bool:
+        self._load()
+        if url not in self._entries:
+            # Another worker sharing the directory may have cached it.
+            entry = self._verified_size(sidecar) if (sidecar := self._path(url, ".json")).exists() else None
+            if entry is None or entry[0] != url:
+                self.misses += 1
+                return False
+            self._entries[url] = entry[1]
+            self._evict()
+        elif url not in self._maps and not self._path(url, ".pdf").exists():
+            del self._entries[url]  # evicted by another worker
+            self.misses += 1
+            return False
+        return url in self._entries
+
+    def __getitem__(self, url: str) -> memoryview:
+        with self._lock:
+            return self._get(url)
+
+    def _get(self, url: str) -> memoryview:
+        self._load()
+        size = self._entries[url]
+        self._entries.move_to_end(url)
+        self.hits += 1
+        self._key_hits[url] = self._key_hits.get(url, 0) + 1
+        if not size:
+            return memoryview(b"")
+        mapped = self._maps.get(url)
+        if mapped is None:
+            path = self._path(url, ".pdf")
+            with path.open("rb") as f:
+                mapped = self._maps[url] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            path.touch()  # recency for the next process that loads the directory
+        return memoryview(mapped)
+
+    def __setitem__(self, url: str, data: bytes) -> None:
+        tmp = self._temp_path()
+        try:
+            tmp.write_bytes(data)
+            self._commit(url, tmp)
+        finally:
+            tmp.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        self._load()
+        return len(self._entries)
+
+    async def has(self, url: str) -> bool:
+        """``url in cache``, in a worker thread."""
+        return await asyncio.to_thread(self.__contains__, url)
+
+    async def get(self, url: str) -> memoryview:
+        """``cache[url]``, in a worker thread (the first read of a PDF maps its file)."""
+        return await asyncio.to_thread(self.__getitem__, url)
+
+    async def store(self, url: str, data: bytes) -> None:
+        """``cache[url] = data``, in a worker thread."""
+        await asyncio.to_thread(self.__setitem__, url, data)
+
+    def _temp_path(self) -> Path:
+        self._load()
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".part")
+        os.close(fd)
+        return Path(tmp)
+
+    def _commit(self, url: str, tmp: Path) -> None:
+        """Move a fully written temporary file into place and record it."""
+        size = tmp.stat().st_size
+        with self._lock:
+            self._maps.pop(url, None)
+            tmp.replace(self._path(url, ".pdf"))
+            meta = self._temp_path()
+            meta.write_text(json.dumps({"url": url, "size": size}))
+            meta.replace(self._path(url, ".json"))
+            self._entries[url] = size
+            self._entries.move_to_end(url)
+            self._evict()
+
+    async def store_stream(self, url: str, chunks: AsyncIterator[bytes], *, expected_size: int | None, max_size: int) -> bool:
+        """Stream *chunks* to disk and cache them under *url*.
+
+        The file is opened, written, committed and removed in worker threads.
+
+        Returns:
+            True if cached; False when the body passed *max_size* or its length
+            differs from *expected_size* (a truncated download), in which case
+            nothing is kept.
+        """
+        tmp = await asyncio.to_thread(self._temp_path)
+        total = 0
+        try:
+            f = await asyncio.to_thread(_open_for_writing, tmp)
+            try:
+                async for chunk in chunks:
+                    total += len(chunk)
+                    if total > max_size:
+                        return False
+                    await asyncio.to_thread(f.write, chunk)
+            finally:
+                await asyncio.to_thread(f.close)
+            if expected_size is not None and total != expected_size:
+                logger.warning("PDF download incomplete (%d of %d bytes): %s", total, expected_size, url)
+                return False
+            await asyncio.to_thread(self._commit, url, tmp)
+            return True
+        finally:
+            await asyncio.to_thread(tmp.unlink, missing_ok=True)
+
+    def clear(self) -> None:
+        """Drop all entries and delete their files."""
+        self._load()
+        with self._lock:
+            for url in list(self._entries):
+                self._forget(url)
+            self._entries.clear()
+
+    def invalidate(self, pattern: str | None = None) -> int:
+        """Drop the entries selected by *pattern* (see ``ra_mcp_common.cache_registry``); returns how many."""
+        self._load()
+        with self._lock:
+            urls = matching_keys(self._entries, pattern)
+            for url in urls:
+                del self._entries[url]
+                self._forget(url)
+        return len(urls)
+
+    def stats(self, top: int = 10) -> CacheStats:
+        """Entry count, bytes on disk, counters and the most-read URLs."""
+        self._load()
+        hottest = sorted(self._key_hits.items(), key=lambda item: item[1], reverse=True)[:top]
+        return CacheStats(
+            entries=len(self._entries),
+            bytes=sum(self._entries.values()),
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            top_keys=[{"key": key, "hits": hits} for key, hits in hottest],
+        )
+
+    def keys(self) -> list[str]:
+        """Snapshot of the cached URLs (does not affect LRU recency)."""
+        self._load()
+        return list(self._entries)
+
+
+pdf_cache = DiskPDFCache(
+    CACHE_DIR,
+    max_items=MAX_PDF_CACHE_ITEMS,
+    max_bytes=MAX_PDF_CACHE_BYTES,
+)
+# url → page dicts with structured blocks; a guide's precomputed page texts go with its entry.
+blocks_cache: LRUCache[list] = LRUCache(max_items=MAX_BLOCKS_CACHE_ITEMS, on_drop=forget_page_texts)
+register_cache("pdf.bytes", stats=pdf_cache.stats, invalidate=pdf_cache.invalidate)
+# Range-read chunks of PDFs not (yet) in pdf_cache, keyed "<url>#<chunk index>", shared by every
+# viewer of the same PDF. chunk_totals remembers each PDF's size so a cached chunk can be served
+# with its totalBytes.
+chunk_cache: LRUCache[bytes] = LRUCache(max_items=MAX_CHUNK_CACHE_BYTES // CHUNK_SIZE * 2, max_bytes=MAX_CHUNK_CACHE_BYTES)
+chunk_totals: LRUCache[int] = LRUCache(max_items=256)
+register_cache("pdf.blocks", stats=blocks_cache.stats, invalidate=blocks_cache.invalidate)
+register_cache("pdf.chunks", stats=chunk_cache.stats, invalidate=chunk_cache.invalidate)
 
 _background_tasks: set[asyncio.Task] = set()
 _inflight_prefetch: set[str] = set()
+_inflight_chunks: dict[str, asyncio.Task[bytes | None]] = {}
+# url → monotonic time its first chunk was read, until its last chunk is (for ra_mcp.pdf.load.duration)
+_loads_started: OrderedDict[str, float] = OrderedDict()
+_MAX_TRACKED_LOADS = 256
 
 # One shared client so the many Range reads a single streamed PDF makes reuse pooled,
 # keep-alive connections instead of a fresh client + TLS handshake per call (mirrors
@@ -98,27 +438,23 @@ _http = httpx.AsyncClient(
 )
 
 
-async def _fetch_pdf_bounded(url: str) -> bytes | None:
-    """GET a full PDF, aborting BEFORE buffering the whole body if it exceeds MAX_PDF_SIZE.
+async def _fetch_pdf_bounded(url: str) -> memoryview | None:
+    """Stream a full PDF into ``pdf_cache``, aborting once it exceeds MAX_PDF_SIZE.
 
-    display_pdf accepts arbitrary URLs, so a non-streaming get() would materialise a
-    hostile/huge body in memory before any size check. This streams instead: rejects up
-    front on a too-large Content-Length, and bails mid-stream once the running total passes
-    the cap. Returns None when the PDF is too large to cache.
+    display_pdf accepts arbitrary URLs, so the body is never buffered whole: a
+    too-large Content-Length is rejected up front, and the download stops once the
+    running total passes the cap. Returns the cached bytes, or None when the PDF is
+    too large (or arrived short of its Content-Length) and was not cached.
     """
     async with _http.stream("GET", url) as resp:
         resp.raise_for_status()
         declared = resp.headers.get("Content-Length")
-        if declared and declared.isdigit() and int(declared) > MAX_PDF_SIZE:
+        expected = int(declared) if declared and declared.isdigit() else None
+        if expected is not None and expected > MAX_PDF_SIZE:
             return None
-        chunks: list[bytes] = []
-        total = 0
-        async for chunk in resp.aiter_bytes():
-            total += len(chunk)
-            if total > MAX_PDF_SIZE:
-                return None
-            chunks.append(chunk)
-        return b"".join(chunks)
+        if not await pdf_cache.store_stream(url, resp.aiter_bytes(), expected_size=expected, max_size=MAX_PDF_SIZE):
+            return None
+    return await pdf_cache.get(url)
 
 
 def json_url_for(pdf_url: str) -> str | None:
@@ -129,8 +465,14 @@ def json_url_for(pdf_url: str) -> str | None:
 
 
 async def preload_all_guides() -> None:
-    """Pre-load structured JSONs for all gallery PDFs (concurrently)."""
+    """Pre-load structured JSONs for all gallery PDFs (concurrently).
+
+    Guides restored from the persisted guide index are not downloaded again.
+    """
     from ra_mcp_pdf_mcp.gallery import GALLERY_ITEMS
+    from ra_mcp_pdf_mcp.guide_index import load_persisted_index
+
+    load_persisted_index(blocks_cache)
 
     async def _one(item: dict) -> None:
         url = item["url"]
@@ -177,19 +519,21 @@ async def _prefetch_inner(url: str) -> None:
     j_url = json_url_for(url)
 
     async def _pdf() -> None:
-        if url in pdf_cache:
+        if await pdf_cache.has(url):
             return
         try:
             data = await _fetch_pdf_bounded(url)
             if data is None:
-                logger.warning("PDF too large to pre-cache (> %d bytes): %s", MAX_PDF_SIZE, url)
+                logger.warning("PDF not pre-cached (larger than %d bytes or incomplete): %s", MAX_PDF_SIZE, url)
                 return
-            pdf_cache[url] = data
             logger.info("pre-cached %d bytes for %s", len(data), url)
         except Exception as e:
             logger.warning("PDF pre-fetch failed for %s: %s", url, e)
 
     async def _json() -> None:
+        from ra_mcp_pdf_mcp.guide_index import load_persisted_index
+
+        load_persisted_index(blocks_cache)
         if not j_url or url in blocks_cache:
             return
         try:
@@ -205,22 +549,26 @@ async def _prefetch_inner(url: str) -> None:
     await asyncio.gather(_pdf(), _json())
 
 
-async def read_pdf_range(url: str, offset: int, length: int) -> tuple[bytes, int]:
-    """Read a byte range from a PDF. Returns (chunk_bytes, total_size).
+def _chunk_key(url: str, index: int) -> str:
+    return f"{url}#{index}"
 
-    Uses HTTP Range requests when supported, falls back to full GET + cache.
-    """
-    if url in pdf_cache:
-        data = pdf_cache[url]
-        return data[offset : offset + length], len(data)
 
+async def _fetch_chunk(url: str, index: int) -> bytes | None:
+    """Range-GET chunk *index* of *url* into ``chunk_cache``.
+
+    Returns None when the server answered with the whole file instead; it is
+    then in ``pdf_cache``.
+
+    Raises:
+        ValueError: If a whole-file answer is larger than MAX_PDF_SIZE.
+    """
     with _tracer.start_as_current_span(
         "fetch pdf range",
         kind=SpanKind.CLIENT,
         attributes={"server.address": _host(url), "url.full": url, "http.request.method": "GET"},
     ):
-        end_byte = offset + length - 1
-        resp = await _http.get(url, headers={"Range": f"bytes={offset}-{end_byte}"})
+        start = index * CHUNK_SIZE
+        resp = await _http.get(url, headers={"Range": f"bytes={start}-{start + CHUNK_SIZE - 1}"})
 
         if resp.status_code == 206:
             content_range = resp.headers.get("Content-Range", "")
@@ -229,7 +577,9 @@ async def read_pdf_range(url: str, offset: int, length: int) -> tuple[bytes, int
                 size_str = content_range.rsplit("/", 1)[-1]
                 if size_str != "*":
                     total = int(size_str)
-            return resp.content, total
+            chunk_cache[_chunk_key(url, index)] = resp.content
+            chunk_totals[url] = total
+            return resp.content
 
         if resp.status_code == 501:
             resp = await _http.get(url)
@@ -241,8 +591,95 @@ async def read_pdf_range(url: str, offset: int, length: int) -> tuple[bytes, int
             if content_length > MAX_PDF_SIZE:
                 msg = f"PDF too large to cache: {content_length} bytes (max {MAX_PDF_SIZE})"
                 raise ValueError(msg)
-            pdf_cache[url] = data
-            return data[offset : offset + length], len(data)
+            await pdf_cache.store(url, data)
+            return None
 
         resp.raise_for_status()
-        return b"", 0  # unreachable
+        return b""  # unreachable
+
+
+async def _read_chunk(url: str, index: int) -> bytes | None:
+    """Chunk *index* of *url* from ``chunk_cache``, joining a fetch of it already in flight."""
+    key = _chunk_key(url, index)
+    if key in chunk_cache:
+        _chunk_counter.add(1, {"outcome": "hit"})
+        return chunk_cache[key]
+    task = _inflight_chunks.get(key)
+    _chunk_counter.add(1, {"outcome": "shared" if task is not None else "miss"})
+    if task is None:
+        task = _inflight_chunks[key] = asyncio.ensure_future(_fetch_chunk(url, index))
+        task.add_done_callback(lambda _: _inflight_chunks.pop(key, None))
+    return await asyncio.shield(task)
+
+
+def _schedule_chunk_prefetch(url: str, index: int) -> None:
+    """Fetch chunk *index* in the background so the viewer's next read finds it ready."""
+    key = _chunk_key(url, index)
+    if key in _inflight_chunks or key in chunk_cache:
+        return
+
+    async def _prefetch_chunk() -> None:
+        try:
+            if await pdf_cache.has(url):
+                return
+            await _read_chunk(url, index)
+            _chunk_counter.add(1, {"outcome": "prefetch"})
+        except Exception as e:
+            logger.debug("chunk %d prefetch failed for %s: %s", index, url, e)
+
+    task = asyncio.create_task(_prefetch_chunk())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def _record_load_timing(url: str, offset: int, end: int, total: int, started: float) -> None:
+    now = time.monotonic()
+    if offset == 0:
+        _first_chunk_duration.record(now - started)
+        _loads_started[url] = started
+        _loads_started.move_to_end(url)
+        while len(_loads_started) > _MAX_TRACKED_LOADS:
+            _loads_started.popitem(last=False)
+    if total and end >= total and (load_started := _loads_started.pop(url, None)) is not None:
+        _full_load_duration.record(now - load_started)
+
+
+async def read_pdf_range(url: str, offset: int, length: int) -> tuple[bytes | memoryview, int]:
+    """Read a byte range from a PDF. Returns (chunk_bytes, total_size).
+
+    A cached PDF is served as a zero-copy ``memoryview`` slice of its mapped
+    file. Otherwise the range is assembled from CHUNK_SIZE-aligned chunks in
+    ``chunk_cache``, fetched with HTTP Range requests on a miss, and the chunk
+    after it is prefetched in the background. A server without Range support
+    answers with the whole file, which is then cached in ``pdf_cache``.
+    """
+    started = time.monotonic()
+    data, total = await _read_range(url, offset, length)
+    _record_load_timing(url, offset, offset + len(data), total, started)
+    return data, total
+
+
+async def _read_range(url: str, offset: int, length: int) -> tuple[bytes | memoryview, int]:
+    if not await pdf_cache.has(url):
+        first, last = offset // CHUNK_SIZE, (offset + max(length, 1) - 1) // CHUNK_SIZE
+        parts: list[bytes] | None = []
+        for index in range(first, last + 1):
+            chunk = await _read_chunk(url, index)
+            if chunk is None:  # the server sent the whole file; it is in pdf_cache now
+                parts = None
+                break
+            parts.append(chunk)
+            if len(chunk) < CHUNK_SIZE:
+                break  # end of file
+        if parts is not None:
+            total = chunk_totals.get(url) or 0
+            if total > (last + 1) * CHUNK_SIZE:
+                _schedule_chunk_prefetch(url, last + 1)
+            data = parts[0] if len(parts) == 1 else b"".join(parts)
+            start = offset - first * CHUNK_SIZE
+            if start == 0 and len(data) <= length:
+                return data, total  # the aligned read the viewer makes: no copy
+            return data[start : start + length], total
+
+    data = await pdf_cache.get(url)
+    return data[offset : offset + length], len(data)
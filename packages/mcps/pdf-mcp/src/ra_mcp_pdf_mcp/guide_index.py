@@ -7,16 +7,37 @@ block is one row that keeps its bbox, so the viewer can still highlight matches
 precisely; the block hits are regrouped back into the per-page ``SearchResult``
 the app already consumes.
 
-The index lives in a process-lifetime in-memory LanceDB (the guides are 3 small
-static documents), rebuilt only when the set of cached guides changes.
+The index is persisted under ``<RA_MCP_PDF_CACHE_DIR>/guide-index/``, keyed by a
+SHA-256 of each guide's block JSON:
+
+- ``blocks/<digest>.json`` — a guide's pages, in the canonical JSON the digest is
+  taken over (so a load can verify it);
+- ``db-<key>/`` — the LanceDB table and its FTS index, ``key`` hashing every
+  (guide URL, digest) pair it was built from;
+- ``manifest.json`` — the guides and database of the current index.
+
+A process restores the guide blocks and the built index from there
+(``load_persisted_index``) instead of downloading every guide JSON and
+re-indexing. The index is rebuilt only when a cached guide's digest differs
+from the indexed one; a database already built for the same set of digests
+(e.g. by another worker) is reused. If the directory is not writable the
+index falls back to a process-lifetime in-memory LanceDB.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
+import os
+import shutil
 import threading
-from typing import TYPE_CHECKING
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from ra_mcp_dataset_lib import build_fts_index, equals, get_lancedb, lancedb_fts_search
+from ra_mcp_pdf_mcp.cache import CACHE_DIR
 from ra_mcp_pdf_mcp.models import MatchedBlock, PageMatch, SearchResult
 from ra_mcp_pdf_mcp.search import _count_occurrences, html_to_text
 
@@ -24,14 +45,40 @@ from ra_mcp_pdf_mcp.search import _count_occurrences, html_to_text
 if TYPE_CHECKING:
     from ra_mcp_pdf_mcp.cache import LRUCache
 
-_GUIDE_DB_URI = "memory://ra-mcp-pdf-guides"
+logger = logging.getLogger("ra_mcp.pdf.guide_index")
+
+_INDEX_DIR = CACHE_DIR / "guide-index"
+_MEMORY_URI = "memory://ra-mcp-pdf-guides"
 _TABLE = "guides"
+_KEEP_DATABASES = 3  # the current database plus the newest older ones another worker may still read
 # Bound the ranked set we regroup into page matches — far above any real guide's
 # match count, and matches the spine's fetch cap semantics.
 _MAX_HITS = 2000
 
 _lock = threading.Lock()
-_indexed: frozenset[str] | None = None
+_indexed: dict[str, str] | None = None  # guide URL → digest of the guides in the current index
+_db_uri = _MEMORY_URI
+_digests: dict[str, tuple[list[dict], str]] = {}  # guide URL → (pages, digest), so unchanged guides are not re-hashed
+_persisted_loaded = False
+
+
+def _canonical(pages: list[dict]) -> bytes:
+    return json.dumps(pages, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode()
+
+
+def _digest(url: str, pages: list[dict]) -> str:
+    known = _digests.get(url)
+    if known is not None and known[0] is pages:
+        return known[1]
+    digest = hashlib.sha256(_canonical(pages)).hexdigest()
+    _digests[url] = (pages, digest)
+    return digest
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}")
+    tmp.write_bytes(data)
+    tmp.replace(path)
 
 
 def _rows(blocks_by_url: dict[str, list[dict]]) -> list[dict]:
@@ -59,34 +106,116 @@ def _rows(blocks_by_url: dict[str, list[dict]]) -> list[dict]:
     return rows
 
 
+def load_persisted_index(blocks_cache: LRUCache[list]) -> int:
+    """Restore the guide blocks and index persisted by an earlier process (once per process).
+
+    Fills ``blocks_cache`` with every persisted guide it does not already hold and
+    points searches at the persisted database. Returns how many guides were
+    restored; 0 when there is no complete, intact persisted index.
+    """
+    global _persisted_loaded, _indexed, _db_uri
+    with _lock:
+        if _persisted_loaded:
+            return 0
+        _persisted_loaded = True
+        try:
+            manifest = json.loads((_INDEX_DIR / "manifest.json").read_text())
+            db_dir = _INDEX_DIR / manifest["db"]
+            guides: dict[str, tuple[list[dict], str]] = {}
+            for url, digest in manifest["guides"].items():
+                raw = (_INDEX_DIR / "blocks" / f"{digest}.json").read_bytes()
+                if hashlib.sha256(raw).hexdigest() != digest:
+                    logger.warning("persisted guide blocks for %s are corrupt; rebuilding", url)
+                    return 0
+                guides[url] = (json.loads(raw), digest)
+            if not db_dir.is_dir():
+                return 0
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug("no persisted guide index in %s: %s", _INDEX_DIR, e)
+            return 0
+        for url, (pages, digest) in guides.items():
+            if url not in blocks_cache:
+                blocks_cache[url] = pages
+                _digests[url] = (pages, digest)
+        _indexed = {url: digest for url, (_, digest) in guides.items()}
+        _db_uri = str(db_dir)
+        logger.info("restored guide index (%d guides) from %s", len(guides), db_dir)
+        return len(guides)
+
+
+def _create(uri: str, rows: list[dict]) -> None:
+    db = get_lancedb(uri)
+    db.create_table(_TABLE, data=rows, mode="overwrite")
+    build_fts_index(db, _TABLE, column="searchable_text")
+
+
+def _prune(current: str, digests: set[str]) -> None:
+    databases = sorted(_INDEX_DIR.glob("db-*"), key=lambda path: path.stat().st_mtime, reverse=True)
+    for old in [path for path in databases if path.name != current][_KEEP_DATABASES - 1 :]:
+        shutil.rmtree(old, ignore_errors=True)
+    for blob in (_INDEX_DIR / "blocks").glob("*.json"):
+        if blob.stem not in digests:
+            blob.unlink(missing_ok=True)
+
+
+def _build(blocks_by_url: dict[str, list[dict]], digests: dict[str, str], rows: list[dict]) -> str:
+    """Build (or reuse) the persisted database for *digests*; returns the URI to search."""
+    key = hashlib.sha256("".join(f"{url}\t{digests[url]}\n" for url in sorted(digests)).encode()).hexdigest()[:24]
+    db_dir = _INDEX_DIR / f"db-{key}"
+    try:
+        if not db_dir.is_dir():
+            # Build under a per-process name and rename, so a crash or a concurrent
+            # worker never leaves a half-built database under the final name.
+            build_dir = _INDEX_DIR / f".build-{os.getpid()}"
+            shutil.rmtree(build_dir, ignore_errors=True)
+            build_dir.parent.mkdir(parents=True, exist_ok=True)
+            _create(str(build_dir), rows)
+            try:
+                build_dir.rename(db_dir)
+            except OSError:
+                shutil.rmtree(build_dir, ignore_errors=True)  # another worker finished first
+            logger.info("built guide index %s (%d blocks)", db_dir.name, len(rows))
+        (_INDEX_DIR / "blocks").mkdir(exist_ok=True)
+        for url, digest in digests.items():
+            blob = _INDEX_DIR / "blocks" / f"{digest}.json"
+            if not blob.exists():
+                _write_atomic(blob, _canonical(blocks_by_url[url]))
+        _write_atomic(_INDEX_DIR / "manifest.json", json.dumps({"guides": digests, "db": db_dir.name}).encode())
+        _prune(db_dir.name, set(digests.values()))
+    except OSError as e:
+        logger.warning("guide index not persisted to %s (%s); keeping it in memory", _INDEX_DIR, e)
+        _create(_MEMORY_URI, rows)
+        return _MEMORY_URI
+    return str(db_dir)
+
+
 def ensure_guide_index(blocks_cache: LRUCache[list]) -> bool:
     """Build/refresh the Swedish-FTS guide index from the cached guide blocks.
 
-    Rebuilds only when the set of cached guide URLs changes (the 3 guides are
-    static, so after preload this is a no-op). Returns True if the index is
-    searchable, False if no guide blocks are cached yet.
+    Rebuilds only when a cached guide's content digest differs from the indexed
+    one, or guides were added or dropped (after ``load_persisted_index`` or one
+    build this is a no-op). Returns True if the index is searchable, False if no
+    guide blocks are cached yet.
     """
-    global _indexed
+    global _indexed, _db_uri
     blocks_by_url = dict(blocks_cache.items())
-    signature = frozenset(blocks_by_url)
     if not blocks_by_url:
         return False
-    if _indexed is not None and signature == _indexed:
+    digests = {url: _digest(url, pages) for url, pages in blocks_by_url.items()}
+    if digests == _indexed:
         return True
     with _lock:
-        if _indexed is not None and signature == _indexed:
+        if digests == _indexed:
             return True
         rows = _rows(blocks_by_url)
         if not rows:
             return False
-        db = get_lancedb(_GUIDE_DB_URI)
-        db.create_table(_TABLE, data=rows, mode="overwrite")
-        build_fts_index(db, _TABLE, column="searchable_text")
-        _indexed = signature
+        _db_uri = _build(blocks_by_url, digests, rows)
+        _indexed = digests
         return True
 
 
-def _regroup_by_page(records: list[dict], term_lower: str) -> SearchResult:
+def _regroup_by_page(records: Sequence[Mapping[str, Any]], term_lower: str) -> SearchResult:
     """Regroup FTS block hits into per-page matches in document order."""
     by_page: dict[int, PageMatch] = {}
     total = 0
@@ -128,7 +257,7 @@ def search_guide_index(term: str, *, guide_url: str | None = None) -> SearchResu
     guides. Matches use Swedish stemming + BM25 ranking; blocks are regrouped by page
     in document order so the viewer highlights them in place.
     """
-    db = get_lancedb(_GUIDE_DB_URI)
+    db = get_lancedb(_db_uri)
     where = equals("guide_url", guide_url) if guide_url else None
     result = lancedb_fts_search(db, _TABLE, term, limit=_MAX_HITS, where=where)
     return _regroup_by_page(result.records, term.lower())
@@ -141,10 +270,10 @@ def search_guides_grouped(term: str) -> dict[str, SearchResult]:
     (N+1). One query over the shared table returns every guide's hits; we bucket the
     records by their guide_url field and regroup each bucket by page.
     """
-    db = get_lancedb(_GUIDE_DB_URI)
+    db = get_lancedb(_db_uri)
     result = lancedb_fts_search(db, _TABLE, term, limit=_MAX_HITS, where=None)
     term_lower = term.lower()
-    by_guide: dict[str, list[dict]] = {}
+    by_guide: dict[str, list[Mapping[str, Any]]] = {}
     for rec in result.records:
         by_guide.setdefault(rec["guide_url"], []).append(rec)
     return {url: _regroup_by_page(recs, term_lower) for url, recs in by_guide.items()}
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 
 class PdfViewerState(BaseModel):
@@ -19,6 +19,11 @@ class PdfViewerState(BaseModel):
     search_term: str = ""
     request_fullscreen: bool = False
 
+    # Store revision and field values this state was loaded at; put_state writes with
+    # compare-and-set against them and re-applies its changes if the view moved on.
+    _revision: int = PrivateAttr(default=0)
+    _stored: dict = PrivateAttr(default_factory=dict)
+
 
 class MatchedBlock(BaseModel):
     """A text block that matched a search term, with exact bounding box."""
@@ -0,0 +1,51 @@
+"""Per-page reading text, precomputed once per loaded guide.
+
+``read_pdf_page`` used to run ``html_to_text`` over every block of every
+requested page on each call. ``page_texts`` makes one pass over a guide's
+pages the first time they are read after ``blocks_cache`` received them, and
+keeps only what ``read_pdf_page`` returns for each page: the reading text, with
+section headers as ``## ``, page headers/footers dropped, and blocks separated
+by blank lines.
+
+The texts of a URL are forgotten whenever ``blocks_cache`` replaces, evicts or
+invalidates its entry (see ``LRUCache``'s ``on_drop``), so they are never stale
+and never keep the raw pages alive. ``get_page_blocks`` serves its overlay from
+the raw blocks, which it returns unchanged.
+"""
+
+from __future__ import annotations
+
+from ra_mcp_pdf_mcp.search import html_to_text
+
+
+_SKIPPED_TYPES = frozenset({"PageHeader", "PageFooter"})
+
+# url → the reading text of each of its pages
+_texts: dict[str, tuple[str, ...]] = {}
+
+
+def page_text(page: dict) -> str:
+    """The reading text of one DataLab page dict (its ``children`` blocks)."""
+    lines: list[str] = []
+    for block in page.get("children", []):
+        block_type = block.get("block_type", "")
+        if block_type in _SKIPPED_TYPES:
+            continue
+        text = html_to_text(block.get("html", ""))
+        if not text:
+            continue
+        lines.append(f"\n## {text}" if block_type == "SectionHeader" else text)
+    return "\n\n".join(lines).strip()
+
+
+def page_texts(url: str, pages: list[dict]) -> tuple[str, ...]:
+    """The reading text of each of *pages*, the ``blocks_cache`` entry of *url*, built on first use."""
+    texts = _texts.get(url)
+    if texts is None:
+        texts = _texts[url] = tuple(page_text(page) for page in pages)
+    return texts
+
+
+def forget_page_texts(url: str) -> None:
+    """Drop the texts of *url*; ``blocks_cache`` calls this when its entry goes."""
+    _texts.pop(url, None)
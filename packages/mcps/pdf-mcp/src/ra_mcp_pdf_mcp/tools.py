@@ -24,10 +24,12 @@ from ra_mcp_pdf_mcp.cache import (
 )
 from ra_mcp_pdf_mcp.guide_index import ensure_guide_index, search_guide_index, search_guides_grouped
 from ra_mcp_pdf_mcp.models import PdfViewerState
+from ra_mcp_pdf_mcp.pages import page_texts
 from ra_mcp_pdf_mcp.state import (
     put_state,
     read_and_consume,
     resolve_state,
+    wait_for_change,
 )
 
 
@@ -35,6 +37,8 @@ logger = logging.getLogger("ra_mcp.pdf.tools")
 
 DIST_DIR = Path(__file__).parent / "dist"
 RESOURCE_URI = "ui://pdf-viewer/mcp-app.html"
+# Longest get_pdf_state long-poll; stays under common MCP host tool-call timeouts.
+MAX_WAIT_SECONDS = 55
 DEFAULT_PDF = "https://huggingface.co/buckets/Riksarkivet/pdfs/resolve/216090389-e30a88-medeltidens-samhalle.pdf?download=true"
 
 
@@ -160,7 +164,15 @@ async def read_pdf_bytes(
 )
 async def get_pdf_state(
     view_id: Annotated[str, Field(description="View ID from the initial tool result.")],
+    since_version: Annotated[int | None, Field(description="Version the viewer already shows; with wait_seconds, wait for a newer one.")] = None,
+    wait_seconds: Annotated[
+        float, Field(description="Long-poll: wait up to this many seconds for the state to move past since_version.", ge=0, le=MAX_WAIT_SECONDS)
+    ] = 0,
 ) -> ToolResult:
+    # Long-poll: answer as soon as a mutation bumps the version instead of the viewer
+    # re-polling every few seconds.
+    if since_version is not None and wait_seconds > 0:
+        await wait_for_change(view_id, since_version, wait_seconds)
     # read_and_consume clears one-shot commands (go_to_page/request_fullscreen) so the
     # client applies them exactly once and a later unrelated mutation can't re-fire them.
     state = await read_and_consume(view_id)
@@ -222,7 +234,7 @@ async def read_pdf_page(
     page: Annotated[int, Field(description="Start page number (1-based).", ge=1)],
     count: Annotated[int, Field(description="Number of pages to read (default 1, max 5).")] = 1,
 ) -> ToolResult:
-    """Return structured text blocks for one or more pages from the cached JSON."""
+    """Return the precomputed text of one or more pages (see pages.page_texts)."""
     if url not in blocks_cache:
         # Try loading on demand for gallery PDFs
         from ra_mcp_pdf_mcp.cache import preload_all_guides
@@ -231,34 +243,12 @@ async def read_pdf_page(
         if url not in blocks_cache:
             return _error_result("PDF not loaded. Use display_pdf first.")
 
-    all_pages = blocks_cache[url]
+    all_pages = page_texts(url, blocks_cache[url])
     count = min(max(count, 1), 5)  # clamp 1-5
-    from ra_mcp_pdf_mcp.search import html_to_text
 
     output_parts: list[str] = []
-    for i in range(count):
-        page_idx = page - 1 + i
-        if page_idx < 0 or page_idx >= len(all_pages):
-            break
-
-        page_data = all_pages[page_idx]
-        lines: list[str] = []
-        for block in page_data.get("children", []):
-            html = block.get("html", "")
-            if not html:
-                continue
-            block_type = block.get("block_type", "")
-            text = html_to_text(html)
-            if not text:
-                continue
-            if block_type == "SectionHeader":
-                lines.append(f"\n## {text}")
-            elif block_type in ("PageHeader", "PageFooter"):
-                continue
-            else:
-                lines.append(text)
-
-        page_text = "\n\n".join(lines).strip()
+    for page_idx in range(page - 1, min(page - 1 + count, len(all_pages))):
+        page_text = all_pages[page_idx]
         if page_text:
             output_parts.append(f"--- Page {page_idx + 1}/{len(all_pages)} ---\n\n{page_text}")
 
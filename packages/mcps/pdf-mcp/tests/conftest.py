@@ -1,20 +1,34 @@
 """Shared fixtures for pdf-mcp tests."""
 
 import pytest
+from key_value.aio.stores.memory import MemoryStore
 
 import ra_mcp_pdf_mcp.cache as _cache_mod
+import ra_mcp_pdf_mcp.guide_index as _guide_index_mod
 import ra_mcp_pdf_mcp.state as _state_mod
+from ra_mcp_common.state_store import StateStore
 
 
 @pytest.fixture(autouse=True)
-def _reset_state():
-    """Reset module-level state between tests."""
-    _state_mod._latest_view_by_session.clear()
-    _cache_mod.pdf_cache.clear()
+def _reset_state(monkeypatch, tmp_path):
+    """Reset module-level state between tests; each test gets its own PDF cache directory."""
+    backend = MemoryStore()
+    monkeypatch.setattr(_state_mod, "_store", StateStore(backend, _state_mod._COL, ttl=_state_mod._TTL))
+    monkeypatch.setattr(_state_mod, "_active_views", StateStore(backend, "pdf_viewer_session", ttl=_state_mod._TTL))
+    monkeypatch.setattr(
+        _cache_mod,
+        "pdf_cache",
+        _cache_mod.DiskPDFCache(tmp_path / "pdf-cache", max_items=_cache_mod.MAX_PDF_CACHE_ITEMS, max_bytes=_cache_mod.MAX_PDF_CACHE_BYTES),
+    )
+    monkeypatch.setattr(_cache_mod, "chunk_cache", _cache_mod.LRUCache(max_items=32, max_bytes=_cache_mod.MAX_CHUNK_CACHE_BYTES))
+    monkeypatch.setattr(_cache_mod, "chunk_totals", _cache_mod.LRUCache(max_items=256))
+    monkeypatch.setattr(_guide_index_mod, "_INDEX_DIR", tmp_path / "guide-index")
+    monkeypatch.setattr(_guide_index_mod, "_indexed", None)
+    monkeypatch.setattr(_guide_index_mod, "_db_uri", _guide_index_mod._MEMORY_URI)
+    monkeypatch.setattr(_guide_index_mod, "_digests", {})
+    monkeypatch.setattr(_guide_index_mod, "_persisted_loaded", False)
     _cache_mod.blocks_cache.clear()
     yield
-    _state_mod._latest_view_by_session.clear()
-    _cache_mod.pdf_cache.clear()
     _cache_mod.blocks_cache.clear()
 
 
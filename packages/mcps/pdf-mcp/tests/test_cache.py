@@ -1,15 +1,21 @@
-"""Tests for ra_mcp_pdf_mcp.cache — the bounded LRU cache and the range-fetch helpers."""
+"""Tests for ra_mcp_pdf_mcp.cache — the bounded LRU cache, the on-disk PDF cache and the range-fetch helpers."""
 
+import asyncio
+import os
+import threading
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
+import respx
 
 import ra_mcp_pdf_mcp.cache as _cache_mod
 from ra_mcp_pdf_mcp.cache import (
     MAX_PDF_SIZE,
+    DiskPDFCache,
     LRUCache,
     json_url_for,
-    pdf_cache,
     read_pdf_range,
 )
 
@@ -38,6 +44,18 @@ def test_access_refreshes_recency():
     assert "b" not in cache
 
 
+def test_on_drop_is_called_for_every_entry_that_goes():
+    dropped: list[str] = []
+    cache: LRUCache[int] = LRUCache(max_items=2, on_drop=dropped.append)
+    cache["a"] = 1
+    cache["b"] = 2
+    cache["a"] = 3  # replaced
+    cache["c"] = 4  # evicts "b"
+    cache.invalidate("c")
+    cache.clear()
+    assert dropped == ["a", "b", "c", "a"]
+
+
 def test_byte_bound_evicts_when_total_exceeds():
     # Two 4-byte entries fit in 8 bytes; a third pushes the oldest out.
     cache: LRUCache[bytes] = LRUCache(max_items=100, max_bytes=8)
@@ -79,6 +97,25 @@ def test_clear_drops_all_entries_and_resets_bytes():
     assert "c" in cache
 
 
+def test_stats_and_invalidate_for_the_admin_report():
+    cache: LRUCache[bytes] = LRUCache(max_items=2)
+    cache["https://x/a.pdf"] = b"aa"
+    cache["https://x/b.pdf"] = b"bbb"
+    for _ in range(2):
+        if "https://x/b.pdf" in cache:
+            cache["https://x/b.pdf"]
+    assert "https://x/missing.pdf" not in cache
+    cache["https://y/c.pdf"] = b"c"  # evicts a.pdf
+
+    stats = cache.stats()
+    assert (stats.entries, stats.bytes, stats.hits, stats.misses, stats.evictions) == (2, 4, 2, 1, 1)
+    assert stats.top_keys == [{"key": "https://x/b.pdf", "hits": 2}]
+
+    assert cache.invalidate("https://x/*") == 1
+    assert cache.keys() == ["https://y/c.pdf"]
+    assert cache.stats().bytes == 1
+
+
 # ── json_url_for ─────────────────────────────────────────────────────
 
 
@@ -117,7 +154,7 @@ def test_json_url_for(url, expected):
 async def test_read_pdf_range_from_cache():
     url = "https://example.com/cached.pdf"
     data = b"0123456789" * 100
-    pdf_cache[url] = data
+    _cache_mod.pdf_cache[url] = data
 
     chunk, total = await read_pdf_range(url, 0, 50)
     assert chunk == data[:50]
@@ -127,7 +164,7 @@ async def test_read_pdf_range_from_cache():
 async def test_read_pdf_range_from_cache_offset():
     url = "https://example.com/cached.pdf"
     data = b"ABCDEFGHIJ"
-    pdf_cache[url] = data
+    _cache_mod.pdf_cache[url] = data
 
     chunk, total = await read_pdf_range(url, 3, 4)
     assert chunk == b"DEFG"
@@ -137,7 +174,7 @@ async def test_read_pdf_range_from_cache_offset():
 async def test_read_pdf_range_from_cache_beyond_end():
     url = "https://example.com/cached.pdf"
     data = b"short"
-    pdf_cache[url] = data
+    _cache_mod.pdf_cache[url] = data
 
     chunk, total = await read_pdf_range(url, 3, 100)
     assert chunk == b"rt"
@@ -169,6 +206,83 @@ async def test_read_pdf_range_http_206_unknown_size():
     assert total == 0
 
 
+# ── chunk cache and read-ahead ───────────────────────────────────────
+
+
+class _Recorder:
+    def __init__(self):
+        self.values: list[float] = []
+
+    def record(self, value: float) -> None:
+        self.values.append(value)
+
+
+@pytest.fixture()
+def ranged_pdf(monkeypatch, respx_mock):
+    """A 10-byte PDF served with Range support in 4-byte chunks; returns the requested ranges."""
+    monkeypatch.setattr(_cache_mod, "CHUNK_SIZE", 4)
+    body = b"0123456789"
+    ranges: list[str] = []
+
+    def _respond(request: httpx.Request) -> httpx.Response:
+        ranges.append(request.headers["Range"])
+        start, end = (int(n) for n in request.headers["Range"].removeprefix("bytes=").split("-"))
+        part = body[start : end + 1]
+        return httpx.Response(206, content=part, headers={"Content-Range": f"bytes {start}-{start + len(part) - 1}/{len(body)}"})
+
+    respx_mock.get("https://example.com/ranged.pdf").mock(side_effect=_respond)
+    return ranges
+
+
+async def _settle() -> None:
+    await asyncio.gather(*_cache_mod._background_tasks)
+
+
+@respx.mock
+async def test_sequential_reads_find_the_next_chunk_prefetched(ranged_pdf):
+    url = "https://example.com/ranged.pdf"
+    assert await read_pdf_range(url, 0, 4) == (b"0123", 10)
+    await _settle()
+    assert ranged_pdf == ["bytes=0-3", "bytes=4-7"]  # chunk 1 fetched ahead
+
+    assert await read_pdf_range(url, 4, 4) == (b"4567", 10)
+    await _settle()
+    assert await read_pdf_range(url, 8, 4) == (b"89", 10)
+    assert ranged_pdf == ["bytes=0-3", "bytes=4-7", "bytes=8-11"]  # every chunk fetched once
+
+
+@respx.mock
+async def test_concurrent_viewers_share_chunk_fetches(ranged_pdf):
+    url = "https://example.com/ranged.pdf"
+    results = await asyncio.gather(*(read_pdf_range(url, 0, 4) for _ in range(3)))
+    await _settle()
+
+    assert results == [(b"0123", 10)] * 3
+    assert ranged_pdf.count("bytes=0-3") == 1
+    assert _cache_mod.chunk_cache.stats().entries == 2
+
+
+@respx.mock
+async def test_unaligned_reads_span_chunks(ranged_pdf):
+    assert await read_pdf_range("https://example.com/ranged.pdf", 2, 5) == (b"23456", 10)
+
+
+@respx.mock
+async def test_first_chunk_and_full_load_times_are_recorded(ranged_pdf, monkeypatch):
+    first_chunk, full_load = _Recorder(), _Recorder()
+    monkeypatch.setattr(_cache_mod, "_first_chunk_duration", first_chunk)
+    monkeypatch.setattr(_cache_mod, "_full_load_duration", full_load)
+    url = "https://example.com/ranged.pdf"
+
+    for offset in (0, 4):
+        await read_pdf_range(url, offset, 4)
+    assert (len(first_chunk.values), len(full_load.values)) == (1, 0)
+    await read_pdf_range(url, 8, 4)
+    await _settle()
+    assert len(full_load.values) == 1
+    assert full_load.values[0] >= first_chunk.values[0]
+
+
 # ── read_pdf_range with full GET (200) ───────────────────────────────
 
 
@@ -183,7 +297,7 @@ async def test_read_pdf_range_http_200_caches():
 
     assert chunk == full_data[10:60]
     assert total == 500
-    assert pdf_cache[url] == full_data
+    assert _cache_mod.pdf_cache[url] == full_data
 
 
 async def test_read_pdf_range_too_large_raises():
@@ -235,15 +349,16 @@ async def test_fetch_pdf_bounded_rejects_oversized_content_length():
     assert result is None
 
 
-async def test_fetch_pdf_bounded_aborts_mid_stream_when_total_exceeds():
+async def test_fetch_pdf_bounded_aborts_mid_stream_when_total_exceeds(monkeypatch):
     # No Content-Length header, but the streamed bytes exceed the cap partway through.
+    monkeypatch.setattr(_cache_mod, "MAX_PDF_SIZE", 10)
     resp = MagicMock()
     resp.headers = {}
     resp.raise_for_status = MagicMock()
 
     async def _big_body():
         # Two chunks whose total exceeds the cap; the second push it over.
-        yield b"x" * (MAX_PDF_SIZE - 1)
+        yield b"x" * 9
         yield b"xx"
 
     resp.aiter_bytes = _big_body
@@ -255,6 +370,8 @@ async def test_fetch_pdf_bounded_aborts_mid_stream_when_total_exceeds():
         result = await _cache_mod._fetch_pdf_bounded("https://example.com/huge.pdf")
 
     assert result is None
+    assert "https://example.com/huge.pdf" not in _cache_mod.pdf_cache
+    assert not list(_cache_mod.pdf_cache.directory.iterdir())  # the partial file is gone
 
 
 async def test_fetch_pdf_bounded_returns_bytes_when_within_limit():
@@ -275,3 +392,127 @@ async def test_fetch_pdf_bounded_returns_bytes_when_within_limit():
         result = await _cache_mod._fetch_pdf_bounded("https://example.com/ok.pdf")
 
     assert result == b"abcdef"
+
+
+async def test_fetch_pdf_bounded_drops_a_truncated_download():
+    resp = MagicMock()
+    resp.headers = {"Content-Length": "10"}
+    resp.raise_for_status = MagicMock()
+
+    async def _short_body():
+        yield b"abc"
+
+    resp.aiter_bytes = _short_body
+    stream_cm = MagicMock()
+    stream_cm.__aenter__ = AsyncMock(return_value=resp)
+    stream_cm.__aexit__ = AsyncMock(return_value=None)
+
+    with patch.object(_cache_mod._http, "stream", MagicMock(return_value=stream_cm)):
+        result = await _cache_mod._fetch_pdf_bounded("https://example.com/cut.pdf")
+
+    assert result is None
+    assert len(_cache_mod.pdf_cache) == 0
+
+
+# ── DiskPDFCache ─────────────────────────────────────────────────────
+
+
+def _disk_cache(directory, *, max_items=16, max_bytes=1024) -> DiskPDFCache:
+    return DiskPDFCache(directory, max_items=max_items, max_bytes=max_bytes)
+
+
+def test_disk_cache_serves_zero_copy_views_of_the_file(tmp_path):
+    cache = _disk_cache(tmp_path)
+    cache["https://x/a.pdf"] = b"%PDF-1.7 body"
+
+    view = cache["https://x/a.pdf"]
+    assert isinstance(view, memoryview)
+    assert view[5:8] == b"1.7"
+    assert view[5:8].obj is view.obj  # slicing shares the mapping, nothing is copied
+
+
+async def test_disk_cache_does_its_file_io_off_the_event_loop(tmp_path):
+    cache = _disk_cache(tmp_path)
+    loop_thread = threading.get_ident()
+    io_threads: list[int] = []
+    replace = Path.replace
+
+    def recording_replace(self, target):
+        io_threads.append(threading.get_ident())
+        return replace(self, target)
+
+    async def chunks():
+        yield b"%PDF"
+        yield b"-1.7"
+
+    with patch.object(Path, "replace", recording_replace):
+        await cache.store("https://x/a.pdf", b"aaaa")
+        assert await cache.store_stream("https://x/b.pdf", chunks(), expected_size=8, max_size=100)
+
+    assert io_threads and loop_thread not in io_threads
+    assert await cache.has("https://x/b.pdf")
+    assert await cache.get("https://x/b.pdf") == b"%PDF-1.7"
+
+
+def test_disk_cache_survives_a_restart(tmp_path):
+    _disk_cache(tmp_path)["https://x/a.pdf"] = b"aaaa"
+
+    restarted = _disk_cache(tmp_path)
+    assert "https://x/a.pdf" in restarted
+    assert restarted["https://x/a.pdf"] == b"aaaa"
+
+
+def test_disk_cache_drops_files_whose_size_does_not_match(tmp_path):
+    cache = _disk_cache(tmp_path)
+    cache["https://x/a.pdf"] = b"aaaa"
+    cache._path("https://x/a.pdf", ".pdf").write_bytes(b"aa")  # torn write
+
+    assert "https://x/a.pdf" not in _disk_cache(tmp_path)
+    assert not list(tmp_path.iterdir())
+
+
+def test_disk_cache_evicts_least_recently_used_by_bytes(tmp_path):
+    cache = _disk_cache(tmp_path, max_bytes=8)
+    cache["https://x/a.pdf"] = b"aaaa"
+    cache["https://x/b.pdf"] = b"bbbb"
+    _ = cache["https://x/a.pdf"]
+    cache["https://x/c.pdf"] = b"cccc"  # evicts b.pdf
+
+    assert cache.keys() == ["https://x/a.pdf", "https://x/c.pdf"]
+    assert len(list(tmp_path.glob("*.pdf"))) == 2
+    assert cache.stats().evictions == 1
+
+
+def test_disk_cache_restart_keeps_recency_order(tmp_path):
+    cache = _disk_cache(tmp_path)
+    cache["https://x/a.pdf"] = b"a"
+    cache["https://x/b.pdf"] = b"b"
+    os.utime(cache._path("https://x/a.pdf", ".pdf"), (0, 0))
+    os.utime(cache._path("https://x/b.pdf", ".pdf"), (10, 10))
+
+    assert _disk_cache(tmp_path).keys() == ["https://x/a.pdf", "https://x/b.pdf"]
+
+
+def test_disk_cache_sees_files_written_by_another_worker(tmp_path):
+    reader = _disk_cache(tmp_path)
+    assert "https://x/a.pdf" not in reader
+    _disk_cache(tmp_path)["https://x/a.pdf"] = b"shared"
+
+    assert "https://x/a.pdf" in reader
+    assert reader["https://x/a.pdf"] == b"shared"
+
+
+def test_disk_cache_invalidate_and_stats(tmp_path):
+    cache = _disk_cache(tmp_path)
+    cache["https://x/a.pdf"] = b"aa"
+    cache["https://y/b.pdf"] = b"bbb"
+    _ = cache["https://y/b.pdf"]
+
+    stats = cache.stats()
+    assert (stats.entries, stats.bytes, stats.hits) == (2, 5, 1)
+    assert stats.top_keys == [{"key": "https://y/b.pdf", "hits": 1}]
+    view = cache["https://y/b.pdf"]
+    assert cache.invalidate("https://y/*") == 1
+    assert bytes(view) == b"bbb"  # a view handed out before the invalidation stays readable
+    assert cache.keys() == ["https://x/a.pdf"]
+    assert len(list(tmp_path.glob("*"))) == 2
@@ -1,7 +1,13 @@
 """Tests for the LanceDB-backed guide search (Swedish FTS + bbox highlighting)."""
 
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+import ra_mcp_pdf_mcp.cache as _cache_mod
 import ra_mcp_pdf_mcp.guide_index as gi
 from ra_mcp_pdf_mcp.cache import LRUCache
+from ra_mcp_pdf_mcp.gallery import GALLERY_ITEMS
 
 
 def _cache(pages_by_url: dict[str, list[dict]]) -> LRUCache:
@@ -98,3 +104,92 @@ def test_no_match_returns_empty():
 def test_empty_cache_is_not_searchable():
     gi._indexed = None
     assert gi.ensure_guide_index(LRUCache(max_items=100)) is False
+
+
+# ── persisted index ──────────────────────────────────────────────────
+
+
+def _restart(monkeypatch) -> None:
+    """Forget the in-process index state, as a fresh process would."""
+    monkeypatch.setattr(gi, "_indexed", None)
+    monkeypatch.setattr(gi, "_db_uri", gi._MEMORY_URI)
+    monkeypatch.setattr(gi, "_digests", {})
+    monkeypatch.setattr(gi, "_persisted_loaded", False)
+
+
+def _no_rebuild(*_args: object) -> None:
+    raise AssertionError("the persisted index should have been reused")
+
+
+def test_restart_restores_blocks_and_index_without_rebuilding(monkeypatch):
+    pages = [_page(0, [_block("kungens kansli", [0, 0, 1, 1])])]
+    gi.ensure_guide_index(_cache({"g://a": pages}))
+    manifest = (gi._INDEX_DIR / "manifest.json").read_text()
+
+    _restart(monkeypatch)
+    monkeypatch.setattr(gi, "_create", _no_rebuild)
+    cache = LRUCache(max_items=100)
+    assert gi.load_persisted_index(cache) == 1
+    assert cache["g://a"] == pages
+    assert gi.ensure_guide_index(cache) is True
+    assert gi.search_guide_index("kung").page_matches[0].blocks[0].bbox == [0, 0, 1, 1]
+    assert (gi._INDEX_DIR / "manifest.json").read_text() == manifest
+
+
+def test_changed_guide_is_reindexed(monkeypatch):
+    gi.ensure_guide_index(_cache({"g://a": [_page(0, [_block("kungens kansli", [0, 0, 1, 1])])]}))
+    first_db = gi._db_uri
+
+    _restart(monkeypatch)
+    cache = _cache({"g://a": [_page(0, [_block("bönder och jordbruk", [0, 0, 1, 1])])]})  # downloaded anew, changed
+    assert gi.load_persisted_index(cache) == 1
+    gi.ensure_guide_index(cache)
+
+    assert gi._db_uri != first_db
+    assert gi.search_guide_index("bönder").total_matches == 1
+    assert gi.search_guide_index("kung").total_matches == 0
+    assert len(list((gi._INDEX_DIR / "blocks").glob("*.json"))) == 1  # the old version's blocks are pruned
+
+
+def test_same_guides_reuse_the_database_another_process_built(monkeypatch):
+    pages = {"g://a": [_page(0, [_block("kungens kansli", [0, 0, 1, 1])])]}
+    gi.ensure_guide_index(_cache(pages))
+    built = gi._db_uri
+
+    _restart(monkeypatch)
+    monkeypatch.setattr(gi, "_create", _no_rebuild)
+    gi.ensure_guide_index(_cache(pages))
+    assert gi._db_uri == built
+
+
+def test_corrupt_blocks_are_not_restored(monkeypatch):
+    gi.ensure_guide_index(_cache({"g://a": [_page(0, [_block("kungens kansli", [0, 0, 1, 1])])]}))
+    blob = next((gi._INDEX_DIR / "blocks").glob("*.json"))
+    blob.write_text("[]")
+
+    _restart(monkeypatch)
+    cache = LRUCache(max_items=100)
+    assert gi.load_persisted_index(cache) == 0
+    assert len(cache) == 0
+
+
+def test_unwritable_directory_falls_back_to_memory(monkeypatch, tmp_path):
+    (tmp_path / "file").write_text("")
+    monkeypatch.setattr(gi, "_INDEX_DIR", tmp_path / "file" / "guide-index")
+    gi.ensure_guide_index(_cache({"g://a": [_page(0, [_block("kungens kansli", [0, 0, 1, 1])])]}))
+    assert gi._db_uri == gi._MEMORY_URI
+    assert gi.search_guide_index("kung").total_matches == 1
+
+
+@pytest.mark.parametrize("persisted", [True, False])
+async def test_preload_skips_downloads_when_a_persisted_index_exists(monkeypatch, persisted):
+    if persisted:
+        gi.ensure_guide_index(_cache({item["url"]: [_page(0, [_block(item["title"], [0, 0, 1, 1])])] for item in GALLERY_ITEMS}))
+        _restart(monkeypatch)
+
+    get = AsyncMock(return_value=AsyncMock(status_code=404))
+    with patch.object(_cache_mod._http, "get", get):
+        await _cache_mod.preload_all_guides()
+
+    assert get.await_count == (0 if persisted else len(GALLERY_ITEMS))
+    assert len(_cache_mod.blocks_cache) == (len(GALLERY_ITEMS) if persisted else 0)
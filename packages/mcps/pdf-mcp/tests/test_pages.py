@@ -0,0 +1,36 @@
+"""Tests for the precomputed per-page text behind read_pdf_page."""
+
+from ra_mcp_pdf_mcp.cache import LRUCache
+from ra_mcp_pdf_mcp.pages import forget_page_texts, page_text, page_texts
+
+
+def test_page_text_is_the_reading_text():
+    text = page_text(
+        {
+            "bbox": [0, 0, 595, 842],
+            "children": [
+                {"html": "<p>Sidhuvud</p>", "bbox": [0, 0, 1, 1], "block_type": "PageHeader"},
+                {"html": "<h2>Kungliga <b>kansliet</b></h2>", "bbox": [72, 100, 400, 130], "block_type": "SectionHeader"},
+                {"html": "<p>Stockholm 1723</p>", "bbox": [72.5, 140, 400, 160], "block_type": "Text"},
+                {"html": "", "bbox": [72, 170, 400, 190], "block_type": "Figure"},
+            ],
+        }
+    )
+
+    assert text == "## Kungliga  kansliet\n\nStockholm 1723"
+
+
+def test_page_texts_are_built_once_and_go_with_their_blocks_cache_entry(sample_pages):
+    blocks: LRUCache[list] = LRUCache(max_items=1, on_drop=forget_page_texts)
+    blocks["g://a"] = sample_pages
+    built = page_texts("g://a", blocks["g://a"])
+    assert len(built) == len(sample_pages)
+    assert page_texts("g://a", blocks["g://a"]) is built
+
+    blocks["g://a"] = [dict(page) for page in sample_pages]  # a re-download replaces the entry
+    rebuilt = page_texts("g://a", blocks["g://a"])
+    assert rebuilt is not built
+
+    blocks["g://b"] = sample_pages  # evicts g://a
+    assert page_texts("g://a", sample_pages) is not rebuilt
+    forget_page_texts("g://a")
@@ -1,12 +1,21 @@
 """Tests for ra_mcp_pdf_mcp.state."""
 
+import asyncio
+
 import pytest
+from key_value.aio.stores.memory import MemoryStore
 
 import ra_mcp_pdf_mcp.state as _state_mod
+from ra_mcp_common.state_store import SQLiteStore, StateStore
 from ra_mcp_pdf_mcp.models import PdfViewerState
 from ra_mcp_pdf_mcp.state import get_active_state, get_state, put_state
 
 
+def _lose_session_pointers() -> None:
+    """Forget every session's active-view pointer, as a transport without stable sessions does."""
+    _state_mod._active_views = StateStore(MemoryStore(), "pdf_viewer_session")
+
+
 async def test_get_state_returns_default_for_unknown_id():
     state = await get_state("nonexistent-id")
     assert state.view_id == "nonexistent-id"
@@ -27,7 +36,7 @@ async def test_put_state_sets_latest_view_id():
     state = PdfViewerState(view_id="view-abc", url="https://example.com/b.pdf")
     await put_state(state)
     # No request context in tests -> the "" (stdio/no-session) bucket.
-    assert _state_mod._latest_view_by_session[""] == "view-abc"
+    assert await _state_mod._active_view_id("") == "view-abc"
 
 
 async def test_resolve_state_prefers_view_id_over_session_pointer():
@@ -37,7 +46,7 @@ async def test_resolve_state_prefers_view_id_over_session_pointer():
     from ra_mcp_pdf_mcp.state import require_state, resolve_state
 
     await put_state(PdfViewerState(view_id="vid-xyz", url="https://example.com/a.pdf"))
-    _state_mod._latest_view_by_session.clear()
+    _lose_session_pointers()
 
     with pytest.raises(LookupError):
         await get_active_state()  # old path — reproduces the bug
@@ -84,7 +93,7 @@ async def test_multiple_views_are_independent():
     retrieved_b = await get_state("view-b")
     assert retrieved_a.title == "A"
     assert retrieved_b.title == "B"
-    assert _state_mod._latest_view_by_session[""] == "view-b"
+    assert await _state_mod._active_view_id("") == "view-b"
 
 
 async def test_active_view_is_isolated_per_session(monkeypatch):
@@ -110,16 +119,13 @@ async def test_get_active_state_raises_and_prunes_after_state_expiry(monkeypatch
     # report false success) — it must prune the pointer and raise.
     monkeypatch.setattr(_state_mod, "_session_key", lambda: "sess-exp")
     await put_state(PdfViewerState(view_id="view-x", url="https://x.pdf", title="X"))
-    assert _state_mod._latest_view_by_session["sess-exp"] == "view-x"
+    assert await _state_mod._active_view_id("sess-exp") == "view-x"
 
-    async def _expired_get(**_kwargs):
-        return None
-
-    monkeypatch.setattr(_state_mod._store, "get", _expired_get)
+    await _state_mod._store.delete("view-x")  # expired
 
     with pytest.raises(LookupError, match="No PDF viewer is open"):
         await get_active_state()
-    assert "sess-exp" not in _state_mod._latest_view_by_session  # dangling pointer pruned
+    assert await _state_mod._active_view_id("sess-exp") == ""  # dangling pointer pruned
 
 
 async def test_read_and_consume_delivers_then_clears_one_shot_commands():
@@ -147,16 +153,106 @@ async def test_read_and_consume_delivers_then_clears_one_shot_commands():
 
 async def test_read_and_consume_returns_default_without_writing_on_miss(monkeypatch):
     # No stored state (expired/never-opened) — return a blank default and do NOT write.
-    async def _empty_get(**_kwargs):
-        return None
-
     writes: list = []
 
-    async def _spy_put(**kwargs):
+    async def _spy_compare_and_set(*_args: object, **kwargs: object) -> None:
         writes.append(kwargs)
 
-    monkeypatch.setattr(_state_mod._store, "get", _empty_get)
-    monkeypatch.setattr(_state_mod._store, "put", _spy_put)
+    monkeypatch.setattr(_state_mod._store, "compare_and_set", _spy_compare_and_set)
     state = await _state_mod.read_and_consume("gone")
     assert state.version == 0
     assert writes == []  # no store write on a miss
+
+
+async def test_mutation_after_a_concurrent_consume_keeps_the_command_consumed():
+    # A tool loads the view while a go_to_page command is still pending, the poller consumes
+    # it, then the tool writes its own change. The write must not resurrect the consumed
+    # command (re-navigating the viewer) nor lose the tool's change.
+    await put_state(PdfViewerState(view_id="v1", url="https://x.pdf", go_to_page=4))
+    loaded = await get_state("v1")
+
+    assert (await _state_mod.read_and_consume("v1")).go_to_page == 4
+
+    loaded.search_term = "häxa"
+    result = await put_state(loaded)
+    stored = await get_state("v1")
+    assert stored.go_to_page == -1
+    assert stored.search_term == "häxa"
+    assert result["version"] == stored.version == 2
+
+
+async def test_views_are_shared_through_a_common_backend(tmp_path, monkeypatch):
+    # Two replicas configured with the same RA_MCP_STATE_STORE: a view opened on one is
+    # polled and mutated on the other.
+    path = tmp_path / "state.sqlite"
+
+    def replica() -> None:
+        backend = SQLiteStore(path)
+        monkeypatch.setattr(_state_mod, "_store", StateStore(backend, _state_mod._COL, ttl=_state_mod._TTL))
+        monkeypatch.setattr(_state_mod, "_active_views", StateStore(backend, "pdf_viewer_session", ttl=_state_mod._TTL))
+
+    replica()
+    await put_state(PdfViewerState(view_id="shared", url="https://x.pdf", title="X"))
+
+    replica()
+    state = await _state_mod.resolve_state("shared")
+    state.go_to_page = 2
+    await put_state(state)
+
+    replica()
+    polled = await _state_mod.read_and_consume("shared")
+    assert (polled.title, polled.go_to_page, polled.version) == ("X", 2, 2)
+    assert (await get_state("shared")).go_to_page == -1
+
+
+async def test_wait_for_change_wakes_on_put_and_times_out_otherwise():
+    await put_state(PdfViewerState(view_id="lp", url="https://x.pdf"))
+    loop = asyncio.get_running_loop()
+
+    started = loop.time()
+    await _state_mod.wait_for_change("lp", since_version=1, timeout=0.2)
+    assert loop.time() - started >= 0.2  # nothing changed: waited out the timeout
+
+    waiting = asyncio.create_task(_state_mod.wait_for_change("lp", since_version=1, timeout=30))
+    await asyncio.sleep(0.05)
+    assert not waiting.done()
+    state = await get_state("lp")
+    state.search_term = "kyrka"
+    await put_state(state)
+    await asyncio.wait_for(waiting, timeout=1)  # woken by the write, not the timeout
+
+    started = loop.time()
+    await _state_mod.wait_for_change("lp", since_version=1, timeout=30)  # already past version 1
+    await _state_mod.wait_for_change("gone", since_version=0, timeout=30)  # no such view
+    assert loop.time() - started < 1
+    assert len(_state_mod._changes) == 0  # events live only while a poll waits
+
+
+async def test_wait_for_change_sees_writes_from_another_replica(tmp_path, monkeypatch):
+    monkeypatch.setattr(_state_mod, "_store", StateStore(SQLiteStore(tmp_path / "state.sqlite"), _state_mod._COL, ttl=_state_mod._TTL))
+    await put_state(PdfViewerState(view_id="lp", url="https://x.pdf"))
+    monkeypatch.setattr(_state_mod, "_RECHECK_SECONDS", 0.05)
+    waiting = asyncio.create_task(_state_mod.wait_for_change("lp", since_version=1, timeout=30))
+    await asyncio.sleep(0.1)
+
+    # Another process writes straight to the shared backend; no local event fires.
+    entry = await _state_mod._store.load("lp")
+    assert entry is not None
+    await _state_mod._store.compare_and_set("lp", entry.value | {"version": 2}, revision=entry.revision)
+    await asyncio.wait_for(waiting, timeout=1)
+
+
+async def test_wait_for_change_does_not_reread_a_process_local_store(monkeypatch):
+    await put_state(PdfViewerState(view_id="lp", url="https://x.pdf"))
+    monkeypatch.setattr(_state_mod, "_RECHECK_SECONDS", 0.01)
+    loads = 0
+    load = _state_mod._load
+
+    async def counting_load(view_id: str):
+        nonlocal loads
+        loads += 1
+        return await load(view_id)
+
+    monkeypatch.setattr(_state_mod, "_load", counting_load)
+    await _state_mod.wait_for_change("lp", since_version=1, timeout=0.2)
+    assert loads == 2  # on entry and at the deadline: only put_state in this process can change it
@@ -3,10 +3,13 @@
 from unittest.mock import AsyncMock, patch
 
 from fastmcp import Client
+from key_value.aio.stores.memory import MemoryStore
 
+import ra_mcp_pdf_mcp.cache as _cache_mod
 import ra_mcp_pdf_mcp.state as _state_mod
+from ra_mcp_common.state_store import StateStore
 from ra_mcp_pdf_mcp import pdf_mcp as mcp
-from ra_mcp_pdf_mcp.cache import blocks_cache, pdf_cache
+from ra_mcp_pdf_mcp.cache import blocks_cache
 
 
 SAMPLE_URL = "https://huggingface.co/buckets/Riksarkivet/pdfs/resolve/test.pdf?download=true"
@@ -140,7 +143,7 @@ async def test_pdf_mutation_with_view_id_survives_session_loss():
             view_id = doc.structured_content["view_id"]
             assert f"view_uuid: {view_id}" in doc.content[0].text  # surfaced for the model
 
-            _state_mod._latest_view_by_session.clear()  # transport loses the pointer
+            _state_mod._active_views = StateStore(MemoryStore(), "pdf_viewer_session")  # transport loses the pointer
 
             no_id = await client.call_tool("pdf_go_to_page", {"page": 3})
             assert "no viewer" in no_id.content[0].text.lower()  # reproduces the bug
@@ -375,7 +378,7 @@ async def test_search_guides_no_matches():
 
 
 async def test_read_pdf_bytes_returns_base64():
-    pdf_cache[SAMPLE_URL] = b"fake-pdf-content-1234567890"
+    _cache_mod.pdf_cache[SAMPLE_URL] = b"fake-pdf-content-1234567890"
 
     async with Client(mcp) as client:
         result = await client.call_tool("read_pdf_bytes", {"url": SAMPLE_URL, "offset": 0})
@@ -390,7 +393,7 @@ async def test_read_pdf_bytes_returns_base64():
 
 async def test_read_pdf_bytes_with_offset():
     data = b"A" * 100
-    pdf_cache[SAMPLE_URL] = data
+    _cache_mod.pdf_cache[SAMPLE_URL] = data
 
     async with Client(mcp) as client:
         result = await client.call_tool("read_pdf_bytes", {"url": SAMPLE_URL, "offset": 50})
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
 from ra_mcp_common.formatting import append_if, truncate_text
-from ra_mcp_dataset_lib import format_results
+from ra_mcp_dataset_lib import RenderRecord, format_results, register_display_renderers
+from ra_mcp_rosenberg_lib.config import ROSENBERG_TABLE
 from ra_mcp_rosenberg_lib.search_operations import SearchResult
 
 
-def _format_rosenberg_record(rec: dict[str, Any], lines: list[str]) -> None:
+def _format_rosenberg_record(rec: Mapping[str, Any], lines: list[str]) -> None:
     """Format a single Rosenberg record into lines."""
     lines.append(f"--- Rosenberg {rec.get('post_id', '?')} ---")
     append_if(lines, "Place", rec.get("plats", ""))
@@ -43,3 +45,10 @@ def _format_rosenberg_record(rec: dict[str, Any], lines: list[str]) -> None:
 def format_rosenberg_results(result: SearchResult) -> str:
     """Format Rosenberg search results as plain text for MCP/LLM consumption."""
     return format_results(result, label="Rosenberg", render_record=_format_rosenberg_record)
+
+
+# Table name -> render_record for stored display text; see ra_mcp_dataset_lib.register_display_renderers.
+DISPLAY_RENDERERS: dict[str, RenderRecord] = {
+    ROSENBERG_TABLE: _format_rosenberg_record,
+}
+register_display_renderers(DISPLAY_RENDERERS)
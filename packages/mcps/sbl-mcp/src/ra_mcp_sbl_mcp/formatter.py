@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
-from ra_mcp_dataset_lib import format_results
+from ra_mcp_dataset_lib import RenderRecord, format_results, register_display_renderers
+from ra_mcp_sbl_lib.config import SBL_TABLE
 from ra_mcp_sbl_lib.search_operations import SearchResult
 
 
@@ -26,7 +28,7 @@ def _format_date(year: int | None, month: int | None, day: int | None, prefix: s
     return date_str
 
 
-def _format_sbl_record(rec: dict[str, Any], lines: list[str]) -> None:
+def _format_sbl_record(rec: Mapping[str, Any], lines: list[str]) -> None:
     """Format a single SBL record into lines."""
     given_name = rec.get("given_name", "")
     surname = rec.get("surname", "")
@@ -89,3 +91,10 @@ def format_sbl_results(result: SearchResult) -> str:
         Formatted plain text string.
     """
     return format_results(result, label="SBL", render_record=_format_sbl_record)
+
+
+# Table name -> render_record for stored display text; see ra_mcp_dataset_lib.register_display_renderers.
+DISPLAY_RENDERERS: dict[str, RenderRecord] = {
+    SBL_TABLE: _format_sbl_record,
+}
+register_display_renderers(DISPLAY_RENDERERS)
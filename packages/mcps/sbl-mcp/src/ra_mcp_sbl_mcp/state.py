@@ -1,26 +1,40 @@
-"""Per-view state for SBL article viewer."""
+"""Per-view state for SBL article viewer.
+
+A view only records which article it shows; get_sbl_state re-reads the row
+through the cached lookup in view_tool. Views live in a
+ra_mcp_common.state_store backend with the same TTL and per-collection bound as
+the viewer and PDF apps: process memory by default, or the store named by
+RA_MCP_STATE_STORE so that a poll answered by another replica still finds the
+view.
+"""
 
 from __future__ import annotations
 
 import uuid
 
+from key_value.aio.stores.memory import MemoryStore
+
+from ra_mcp_common.state_store import StateStore, state_backend
+
 
-_views: dict[str, dict] = {}
+_COL = "sbl_view"
+_TTL = 600  # 10 min
+_views = StateStore(state_backend(lambda: MemoryStore(max_entries_per_collection=64)), _COL, ttl=_TTL)
 
 
-def create_view(article: dict) -> tuple[str, dict]:
-    """Create a new view with a unique ID, store the article, return (view_id, article)."""
+async def create_view(article_id: int) -> str:
+    """Create a new view showing *article_id*; returns its view ID."""
     view_id = uuid.uuid4().hex[:12]
-    _views[view_id] = article
-    return view_id, article
+    await _views.put(view_id, {"article_id": article_id})
+    return view_id
 
 
-def set_article(view_id: str, article: dict) -> dict:
-    """Update the article for a specific view."""
-    _views[view_id] = article
-    return article
+async def set_article(view_id: str, article_id: int) -> None:
+    """Point a view at another article."""
+    await _views.put(view_id, {"article_id": article_id})
 
 
-def get_article(view_id: str) -> dict | None:
-    """Return the article for a specific view."""
-    return _views.get(view_id)
+async def get_article_id(view_id: str) -> int | None:
+    """The article a view shows, or None if the view is unknown or expired."""
+    view = await _views.get(view_id)
+    return view["article_id"] if view else None
@@ -9,6 +9,7 @@ Provides three tools:
 from __future__ import annotations
 
 import logging
+from collections import Counter, OrderedDict
 from pathlib import Path
 from typing import Annotated
 
@@ -18,6 +19,7 @@ from fastmcp.tools import ToolResult
 from mcp import types
 from pydantic import Field
 
+from ra_mcp_common.cache_registry import CacheStats, matching_keys, register_cache
 from ra_mcp_common.telemetry import mark_span_error
 from ra_mcp_dataset_lib import get_lancedb
 from ra_mcp_sbl_lib.config import LANCEDB_URI, SBL_TABLE
@@ -31,12 +33,52 @@ DIST_DIR = Path(__file__).parent / "dist"
 RESOURCE_URI = "ui://sbl-article-viewer/mcp-app.html"
 
 
+MAX_CACHED_ARTICLES = 128
+
+# article_id → row. Views store only the id, so polls, reloads and several views of the
+# same person read one cached row instead of a full biography per view.
+_articles: OrderedDict[int, dict] = OrderedDict()
+_article_lookups: Counter[str] = Counter()
+
+
 def _fetch_article(article_id: int) -> dict | None:
-    """Fetch an SBL article by ID from LanceDB. Returns the row dict or None."""
+    """Fetch an SBL article by ID (cached, least recently used evicted). Returns the row dict or None."""
+    if article_id in _articles:
+        _articles.move_to_end(article_id)
+        _article_lookups["hit"] += 1
+        return _articles[article_id]
+    _article_lookups["miss"] += 1
     db = get_lancedb(LANCEDB_URI)
     table = db.open_table(SBL_TABLE)
     rows = table.search().where(f"article_id = {article_id}").limit(1).to_list()
-    return rows[0] if rows else None
+    if not rows:
+        return None
+    _articles[article_id] = rows[0]
+    if len(_articles) > MAX_CACHED_ARTICLES:
+        _articles.popitem(last=False)
+        _article_lookups["eviction"] += 1
+    return rows[0]
+
+
+def _article_cache_stats() -> CacheStats:
+    recent = [{"key": str(article_id)} for article_id in reversed(_articles)][:10]
+    return CacheStats(
+        entries=len(_articles),
+        hits=_article_lookups["hit"],
+        misses=_article_lookups["miss"],
+        evictions=_article_lookups["eviction"],
+        top_keys=recent,
+    )
+
+
+def _invalidate_articles(pattern: str | None) -> int:
+    keys = matching_keys([str(article_id) for article_id in _articles], pattern)
+    for key in keys:
+        del _articles[int(key)]
+    return len(keys)
+
+
+register_cache("sbl.articles", stats=_article_cache_stats, invalidate=_invalidate_articles)
 
 
 def _article_summary(rec: dict) -> str:
@@ -98,7 +140,7 @@ def register_view_tool(mcp: FastMCP) -> None:
                     content=[types.TextContent(type="text", text=f"No SBL article found with id {article_id}.")],
                 )
 
-            view_id, _ = state.create_view(rec)
+            view_id = await state.create_view(article_id)
             sc = {**rec, "view_id": view_id}
 
             return ToolResult(
@@ -142,7 +184,7 @@ def register_view_tool(mcp: FastMCP) -> None:
                 )
 
             if view_id:
-                state.set_article(view_id, rec)
+                await state.set_article(view_id, article_id)
 
             sc = {**rec, "view_id": view_id}
 
@@ -172,7 +214,15 @@ def register_view_tool(mcp: FastMCP) -> None:
         ] = "",
     ) -> ToolResult:
         """Return the current article for a specific view."""
-        rec = state.get_article(view_id) if view_id else None
+        article_id = await state.get_article_id(view_id) if view_id else None
+        try:
+            rec = _fetch_article(article_id) if article_id is not None else None
+        except Exception as exc:
+            logger.error("get_sbl_state failed: %s: %s", type(exc).__name__, exc, exc_info=True)
+            mark_span_error(f"Failed to load SBL article: {exc!s}")
+            return ToolResult(
+                content=[types.TextContent(type="text", text=f"Error: Failed to load SBL article -- {exc!s}")],
+            )
         if not rec:
             return ToolResult(
                 content=[types.TextContent(type="text", text="No article loaded.")],
@@ -0,0 +1,87 @@
+"""Tests for the SBL viewer state and its cached article lookup."""
+
+from collections import Counter, OrderedDict
+
+import pytest
+from fastmcp import Client
+from key_value.aio.stores.memory import MemoryStore
+
+import ra_mcp_sbl_mcp.state as _state_mod
+import ra_mcp_sbl_mcp.view_tool as _view_mod
+from ra_mcp_common.state_store import StateStore
+from ra_mcp_sbl_mcp import sbl_mcp
+
+
+class _FakeTable:
+    """Answers ``search().where("article_id = N").limit(1).to_list()`` and counts the queries."""
+
+    def __init__(self, rows: dict[int, dict]):
+        self.rows = rows
+        self.queries = 0
+        self._article_id = 0
+
+    def search(self) -> "_FakeTable":
+        return self
+
+    def where(self, clause: str) -> "_FakeTable":
+        self._article_id = int(clause.rsplit("=", 1)[1])
+        return self
+
+    def limit(self, _n: int) -> "_FakeTable":
+        return self
+
+    def to_list(self) -> list[dict]:
+        self.queries += 1
+        row = self.rows.get(self._article_id)
+        return [row] if row else []
+
+
+@pytest.fixture()
+def table(monkeypatch) -> _FakeTable:
+    rows = {n: {"article_id": n, "surname": f"Person {n}", "given_name": "", "occupation": "", "cv": "x" * 10_000} for n in range(1, 200)}
+    fake = _FakeTable(rows)
+
+    class _DB:
+        def open_table(self, _name: str) -> _FakeTable:
+            return fake
+
+    monkeypatch.setattr(_view_mod, "get_lancedb", lambda _uri: _DB())
+    monkeypatch.setattr(_view_mod, "_articles", OrderedDict())
+    monkeypatch.setattr(_view_mod, "_article_lookups", Counter())
+    monkeypatch.setattr(_state_mod, "_views", StateStore(MemoryStore(max_entries_per_collection=64), _state_mod._COL, ttl=_state_mod._TTL))
+    return fake
+
+
+async def test_views_store_only_the_article_id(table):
+    async with Client(sbl_mcp) as client:
+        opened = await client.call_tool("view_sbl_article", {"article_id": 7})
+        view_id = opened.structured_content["view_id"]
+        assert await _state_mod._views.get(view_id) == {"article_id": 7}
+
+        await client.call_tool("load_sbl_article", {"article_id": 8, "view_id": view_id})
+        polled = await client.call_tool("get_sbl_state", {"view_id": view_id})
+
+    assert polled.structured_content["surname"] == "Person 8"
+    assert table.queries == 2  # the poll re-read article 8 from the cache
+
+
+async def test_expired_view_reports_no_article(table):
+    view_id = await _state_mod.create_view(7)
+    await _state_mod._views.delete(view_id)  # what the TTL does
+
+    async with Client(sbl_mcp) as client:
+        polled = await client.call_tool("get_sbl_state", {"view_id": view_id})
+    assert polled.content[0].text == "No article loaded."
+
+
+def test_article_cache_is_bounded(table, monkeypatch):
+    monkeypatch.setattr(_view_mod, "MAX_CACHED_ARTICLES", 3)
+    for article_id in (1, 2, 3, 1, 4):
+        _view_mod._fetch_article(article_id)
+    assert list(_view_mod._articles) == [3, 1, 4]  # 2 was least recently used
+    assert table.queries == 4
+
+    stats = _view_mod._article_cache_stats()
+    assert (stats.entries, stats.hits, stats.misses) == (3, 1, 4)
+    assert _view_mod._invalidate_articles("4") == 1
+    assert _view_mod._fetch_article(999) is None
@@ -2,7 +2,12 @@
 Plain text formatter for MCP/LLM output without any Rich markup.
 """
 
-from ra_mcp_common.formatting import format_error_message, highlight_keyword_markdown, iiif_manifest_to_bildvisaren, page_id_to_number
+from collections.abc import Collection, Mapping
+
+from ra_mcp_common.formatting import TokenBudget, format_error_message, highlight_keyword_markdown, iiif_manifest_to_bildvisaren, page_id_to_number
+
+
+_HISTOGRAM_BAR_WIDTH = 20
 
 
 class PlainTextFormatter:
@@ -14,6 +19,10 @@ class PlainTextFormatter:
     #: instead of AttributeError.
     items_scanned: int = 0
 
+    #: Number of documents the most recent format_search_results() call left out
+    #: because the next one would have exceeded max_tokens.
+    items_omitted: int = 0
+
     def highlight_search_keyword(self, text_content: str, search_keyword: str) -> str:
         """Highlight search keywords using markdown-style bold."""
         return highlight_keyword_markdown(text_content, search_keyword)
@@ -40,6 +49,29 @@ class PlainTextFormatter:
             return f"No more results found for '{search_result.keyword}' at offset {search_result.offset}. Total results: {search_result.total_hits}"
         return f"No results found for '{search_result.keyword}'. make sure to use \"\" "
 
+    def format_year_histogram(self, histogram) -> str:
+        """
+        Format a YearHistogram as one line per bucket with a proportional bar.
+
+        Buckets before the first hit and after the last are left out.
+
+        Args:
+            histogram: YearHistogram from SearchOperations.year_histogram
+
+        Returns:
+            Formatted histogram block
+        """
+        first_year, last_year = histogram.buckets[0].year_min, histogram.buckets[-1].year_max
+        hit_indices = [i for i, bucket in enumerate(histogram.buckets) if bucket.hits]
+        if not hit_indices:
+            return f"📅 Hits by year for '{histogram.keyword}': none between {first_year} and {last_year}"
+        peak = max(bucket.hits for bucket in histogram.buckets)
+        lines = [f"📅 Hits by year for '{histogram.keyword}' ({histogram.bucket_years}-year buckets; a record dated across buckets counts in each):"]
+        for bucket in histogram.buckets[hit_indices[0] : hit_indices[-1] + 1]:
+            bar = "█" * max(1, round(_HISTOGRAM_BAR_WIDTH * bucket.hits / peak)) if bucket.hits else ""
+            lines.append(f"   {bucket.year_min}-{bucket.year_max}: {bucket.hits:>7} {bar}".rstrip())
+        return "\n".join(lines)
+
     def _format_document_header(self, lines: list[str], document) -> None:
         """Emit ref_code, institution, date, and title lines for a document."""
         lines.append(f"📚 Document: {document.metadata.reference_code or document.id}")
@@ -117,7 +149,8 @@ class PlainTextFormatter:
         self,
         search_result,
         maximum_documents_to_display: int = 20,
-        seen_pages: dict[str, list[int]] | None = None,
+        seen_pages: Mapping[str, Collection[int]] | None = None,
+        max_tokens: int | None = None,
     ) -> str:
         """
         Format search results as plain text with emojis for MCP/LLM consumption.
@@ -125,12 +158,15 @@ class PlainTextFormatter:
         Args:
             search_result: SearchResult containing documents and metadata
             maximum_documents_to_display: Maximum number of documents to display
-            seen_pages: Optional dict mapping reference_code to list of already-seen page numbers.
+            seen_pages: Optional mapping of reference_code to the page numbers already seen (e.g. a SeenPages).
                         When provided, documents/snippets that were already shown are compacted or skipped.
+            max_tokens: Token budget for the response. Rendering stops before the first
+                        document that would exceed it; items_omitted says how many were left out.
 
         Returns:
             Formatted plain text search results
         """
+        self.items_omitted = 0
         if not search_result.items:
             self.items_scanned = 0
             return self.format_no_results_message(search_result)
@@ -153,16 +189,20 @@ class PlainTextFormatter:
             lines.append(f"Found {snippet_count} page-level hits across {document_display} volumes")
         else:
             lines.append(f"Found {document_display} volumes matching metadata")
+        if search_result.variant_hits:
+            lines.append("Variants: " + ", ".join(f"{keyword} ({hits} hits)" for keyword, hits in search_result.variant_hits.items()))
         lines.append("")
+        budget = TokenBudget(max_tokens)
+        budget.charge(lines)
 
         # Iterate all items — skipped (deduped) docs don't count against the display limit
         for idx, document in enumerate(search_result.items):
             if displayed_count >= maximum_documents_to_display:
                 break
-            items_scanned = idx + 1
 
             has_snippets = document.transcribed_text and document.transcribed_text.snippets
             if snippet_count > 0 and not has_snippets:
+                items_scanned = idx + 1
                 continue
 
             # Match the key the dedup store is written under (_update_seen_search_state /
@@ -170,34 +210,18 @@ class PlainTextFormatter:
             # fallback, records with a null reference_code never dedup and print "Document: None".
             ref_code = document.metadata.reference_code or document.id
 
-            # --- Dedup logic ---
-            if seen_pages is not None and ref_code in seen_pages:
-                prev_page_nums = set(seen_pages.get(ref_code, []))
-
-                if has_snippets:
-                    new_snippets = [s for s in document.transcribed_text.snippets if any(page_id_to_number(p.id) not in prev_page_nums for p in s.pages)]
-                    if not new_snippets:
-                        skipped_count += 1
-                        continue
-                    lines.append(f"📚 Document: {ref_code} (previously shown — new pages only)")
-                    self._format_compact_snippets(lines, new_snippets, search_result.keyword)
-                    lines.append("")
-                    displayed_count += 1
-                    continue
+            document_lines = self._render_document(document, ref_code, seen_pages, search_result.keyword)
+            if document_lines is None:
+                items_scanned = idx + 1
                 skipped_count += 1
                 continue
 
-            # --- Full rendering ---
+            if not budget.fits(document_lines):
+                self.items_omitted = len(search_result.items) - idx
+                break
+            items_scanned = idx + 1
             displayed_count += 1
-            self._format_document_header(lines, document)
-
-            if not has_snippets:
-                self._format_metadata_fields(lines, document)
-
-            if has_snippets:
-                self._format_document_snippets(lines, document, search_result.keyword)
-
-            lines.append("")
+            lines.extend(document_lines)
 
         if skipped_count > 0:
             lines.append(f"({skipped_count} previously shown document(s) omitted)")
@@ -207,7 +231,12 @@ class PlainTextFormatter:
         self.items_scanned = items_scanned
 
         total_remaining = len(search_result.items) - items_scanned
-        if total_remaining > 0:
+        if self.items_omitted:
+            lines.append(
+                f"... {total_remaining} more documents not shown to stay within the response token budget — "
+                f"use offset={search_result.offset + items_scanned} to continue from here"
+            )
+        elif total_remaining > 0:
             lines.append(f"... and {total_remaining} more documents")
 
         lines.append("")
@@ -215,6 +244,28 @@ class PlainTextFormatter:
 
         return "\n".join(lines)
 
+    def _render_document(self, document, ref_code: str, seen_pages: Mapping[str, Collection[int]] | None, keyword: str) -> list[str] | None:
+        """Render one document's lines, or None if every page of it was already shown."""
+        has_snippets = document.transcribed_text and document.transcribed_text.snippets
+        document_lines: list[str] = []
+        if seen_pages is not None and ref_code in seen_pages:
+            if not has_snippets:
+                return None
+            prev_page_nums = seen_pages[ref_code]
+            new_snippets = [s for s in document.transcribed_text.snippets if any(page_id_to_number(p.id) not in prev_page_nums for p in s.pages)]
+            if not new_snippets:
+                return None
+            document_lines.append(f"📚 Document: {ref_code} (previously shown — new pages only)")
+            self._format_compact_snippets(document_lines, new_snippets, keyword)
+        else:
+            self._format_document_header(document_lines, document)
+            if has_snippets:
+                self._format_document_snippets(document_lines, document, keyword)
+            else:
+                self._format_metadata_fields(document_lines, document)
+        document_lines.append("")
+        return document_lines
+
     def _format_compact_snippets(self, lines: list[str], snippets: list, keyword: str) -> None:
         """Render snippets compactly for a previously-seen document (new pages only)."""
         page_numbers = sorted({page.id for snippet in snippets for page in snippet.pages})
@@ -4,6 +4,7 @@ Search MCP tool for Riksarkivet transcribed documents.
 Provides the search_transcribed tool with pagination and formatting helpers.
 """
 
+import asyncio
 import logging
 import re
 from typing import Annotated
@@ -13,8 +14,9 @@ from pydantic import Field
 
 from ra_mcp_common.formatting import page_id_to_number
 from ra_mcp_common.http_client import default_http_client
+from ra_mcp_common.seen_pages import SeenPages, session_seen
 from ra_mcp_common.telemetry import mark_span_error
-from ra_mcp_search_lib.config import MAX_LIMIT
+from ra_mcp_search_lib.config import MAX_LIMIT, MAX_VARIANTS
 from ra_mcp_search_lib.search_operations import SearchOperations
 from ra_mcp_search_lib.validation import validate_search_query
 
@@ -26,6 +28,9 @@ logger = logging.getLogger("ra_mcp.search.tool")
 
 _VALID_SORT_VALUES = {"relevance", "timeAsc", "timeDesc", "alphaAsc", "alphaDesc"}
 
+# Historical spellings searched per term when search_transcribed(expand_spelling=True)
+_SPELLING_VARIANTS = 3
+
 # Swedish archival reference codes look like "SE/RA/420422", "SE/LLA/10933/F II a"
 # or "SE/O258G/GSA/1061": country "SE", a short institution code (letters and/or
 # digits — municipal archives like O258G contain digits), then an optional
@@ -109,7 +114,7 @@ def _validate_search_input(
             "('and' alone matches 1.6 million records), which floods the results with noise.",
             error_suggestions=[
                 "Terms are combined automatically — keyword='pest smitta' requires BOTH words in a document",
-                "There is no OR: run separate searches instead, one per alternative term",
+                "There is no OR: in search_transcribed pass the alternatives as variants (one merged result), elsewhere run separate searches",
                 "Fuzzy (term~1) and wildcards (troll*, st?ckholm) also work",
             ],
         )
@@ -144,6 +149,35 @@ def _validate_search_input(
     return None
 
 
+def _validate_variants(keywords: list[str], offset: int, limit: int, expanding: bool = False) -> str | None:
+    """Validate the variant keywords of a transcribed search. Returns an error string or None if valid.
+
+    The first keyword has been checked by _validate_search_input already; every
+    variant gets the same transcribed-text checks. Merging needs each variant's
+    first offset + limit records, so that window is bounded like a single page
+    (also when expanding spellings turns a single keyword into several).
+    """
+    if len(keywords) == 1 and not expanding:
+        return None
+    if len(keywords) > MAX_VARIANTS:
+        mark_span_error(f"too many variants: {len(keywords)}", error_type="validation")
+        return PlainTextFormatter().format_error_message(
+            f"At most {MAX_VARIANTS} terms (keyword plus variants) can be searched at once, got {len(keywords)}",
+            error_suggestions=["Keep the most likely spellings, or use fuzzy (term~1) to cover small differences"],
+        )
+    for variant in keywords[1:]:
+        validation_error = _validate_search_input(variant, offset, None, None, limit=limit, transcribed=True)
+        if validation_error:
+            return validation_error
+    if offset + limit > MAX_LIMIT:
+        mark_span_error(f"offset + limit must be <= {MAX_LIMIT} with variants", error_type="validation")
+        return PlainTextFormatter().format_error_message(
+            f"offset + limit must be <= {MAX_LIMIT} when searching with variants, got {offset + limit}",
+            error_suggestions=["Narrow the search with year_min/year_max, or search the variants one at a time"],
+        )
+    return None
+
+
 def register_search_tool(mcp: FastMCP) -> None:
     """Register the search tools with the MCP server."""
 
@@ -160,8 +194,10 @@ def register_search_tool(mcp: FastMCP) -> None:
             "Query syntax: space-separated terms are ALL required (pest smitta = documents containing both); "
             "wildcards (troll*, st?ckholm) and fuzzy (stockholm~1) work. "
             "Boolean operators do NOT exist — AND/OR/NOT are matched as literal words and flood the results; "
-            "for OR-logic run one search per alternative. Quoted phrases return 0 results on transcribed text — never quote. "
-            "Use fuzzy (~) for OCR/HTR errors and old Swedish variants (präst/prest, silver/silfver).\n"
+            "for OR-logic pass the alternatives in variants (keyword='präst', variants=['prest']): they are searched concurrently "
+            "and merged into one result, one entry per document. Quoted phrases return 0 results on transcribed text — never quote. "
+            "Use fuzzy (~) for OCR/HTR errors, and variants or expand_spelling=True for old Swedish spellings (präst/prest, silver/silfver). "
+            "year_histogram=True adds hit counts per decade, to see when a term occurs before paging through it.\n"
             "Paginate with offset (0, 50, 100...). Session dedup: re-calling returns stubs for already-seen documents."
         ),
     )
@@ -169,17 +205,38 @@ def register_search_tool(mcp: FastMCP) -> None:
         keyword: Annotated[
             str,
             Field(
-                description="Search terms — all terms must match (implicit AND). Wildcards (*, ?) and fuzzy (~1) supported; AND/OR/NOT and quoted phrases are NOT (use separate searches for OR; quotes always yield 0 here)."
+                description="Search terms — all terms must match (implicit AND). Wildcards (*, ?) and fuzzy (~1) supported; AND/OR/NOT and quoted phrases are NOT (pass OR alternatives in variants; quotes always yield 0 here)."
             ),
         ],
         offset: Annotated[int, Field(description="Pagination start position. Use 0 for first page, then 50, 100, etc.")],
         limit: Annotated[int, Field(description="Maximum documents to return per query.")] = 25,
         max_snippets_per_record: Annotated[int, Field(description="Maximum matching pages shown per document.", ge=1)] = 3,
-        max_response_tokens: Annotated[int, Field(description="Maximum tokens in response.", ge=1000)] = 15000,
+        max_response_tokens: Annotated[
+            int,
+            Field(description="Maximum tokens in response. Documents past it are left out whole, and the response gives the offset to continue from.", ge=1000),
+        ] = 15000,
         sort: Annotated[str, Field(description="Sort order: 'relevance', 'timeAsc', 'timeDesc', 'alphaAsc', 'alphaDesc'.")] = "relevance",
         year_min: Annotated[int | None, Field(description="Start year filter (e.g. 1700).")] = None,
         year_max: Annotated[int | None, Field(description="End year filter (e.g. 1750).")] = None,
         dedup: Annotated[bool, Field(description="Session deduplication. True compacts already-seen documents; False forces full results.")] = True,
+        variants: Annotated[
+            list[str] | None,
+            Field(
+                description=f"Alternative keywords matched as OR with keyword, e.g. spelling variants ['prest'] for keyword 'präst'. Searched concurrently and merged by document (max {MAX_VARIANTS} terms in total)."
+            ),
+        ] = None,
+        expand_spelling: Annotated[
+            bool,
+            Field(
+                description="Also search up to 3 historical spellings of each term (prest for präst, silfver for silver, qvinna for kvinna), the most frequent first, merged like variants."
+            ),
+        ] = False,
+        year_histogram: Annotated[
+            bool,
+            Field(
+                description="Also show how the keyword's hits are spread over time: hit counts per decade between year_min and year_max (default 1500-1999, wider buckets for long ranges), fetched concurrently with the search. Counts only keyword itself, not variants or expanded spellings."
+            ),
+        ] = False,
         research_context: Annotated[str | None, Field(description="Brief summary of the user's research goal. Used for telemetry only.")] = None,
         ctx: Context | None = None,
     ) -> str:
@@ -189,6 +246,10 @@ def register_search_tool(mcp: FastMCP) -> None:
         For metadata search, use search_metadata instead.
         """
         validation_error = _validate_search_input(keyword, offset, year_min, year_max, sort, limit, transcribed=True)
+        if validation_error:
+            return validation_error
+        keywords = [keyword, *(variants or [])]
+        validation_error = _validate_variants(keywords, offset, limit, expanding=expand_spelling)
         if validation_error:
             return validation_error
 
@@ -201,26 +262,39 @@ def register_search_tool(mcp: FastMCP) -> None:
             search_operations = SearchOperations(http_client=default_http_client)
             formatter = PlainTextFormatter()
 
-            logger.info("Executing transcribed text search for '%s'...", keyword)
+            logger.info("Executing transcribed text search for %s...", " / ".join(keywords))
             session_id = ctx.session_id if ctx is not None else None
-            search_result = await search_operations.search(
-                keyword=keyword,
-                transcribed_only=True,  # Always search transcribed text
-                only_digitised=True,  # Transcriptions only exist for digitised materials
-                offset=offset,
-                limit=limit,
-                max_snippets_per_record=max_snippets_per_record,
-                sort=sort,
-                year_min=year_min,
-                year_max=year_max,
-                research_context=research_context,
-                session_id=session_id,
+            search_result, histogram_block = await asyncio.gather(
+                search_operations.search_variants(
+                    keywords=keywords,
+                    spelling_variants=_SPELLING_VARIANTS if expand_spelling else 0,
+                    transcribed_only=True,  # Always search transcribed text
+                    only_digitised=True,  # Transcriptions only exist for digitised materials
+                    offset=offset,
+                    limit=limit,
+                    max_snippets_per_record=max_snippets_per_record,
+                    sort=sort,
+                    year_min=year_min,
+                    year_max=year_max,
+                    research_context=research_context,
+                    session_id=session_id,
+                ),
+                _year_histogram_block(
+                    search_operations,
+                    formatter,
+                    keyword,
+                    year_min,
+                    year_max,
+                    enabled=year_histogram,
+                    session_id=session_id,
+                    other_terms=bool(variants) or expand_spelling,
+                ),
             )
 
             # Load session state for dedup
-            seen: dict[str, list[int]] | None = None
-            if dedup and ctx is not None:
-                seen = await ctx.get_state("seen_search") or {}
+            seen: SeenPages | None = None
+            if dedup and session_id is not None:
+                seen = session_seen(session_id, "search")
                 logger.info("[search_transcribed] Dedup state loaded: %d documents previously seen", len(seen))
 
             logger.info("Formatting %d search results...", len(search_result.items))
@@ -228,19 +302,18 @@ def register_search_tool(mcp: FastMCP) -> None:
                 search_result,
                 maximum_documents_to_display=limit,
                 seen_pages=seen,
+                max_tokens=max_response_tokens,
             )
 
             # Update session state with only the documents actually scanned by the formatter
-            if dedup and ctx is not None:
-                updated = _update_seen_search_state(seen or {}, search_result, max_displayed=formatter.items_scanned)
-                await ctx.set_state("seen_search", updated)
-                logger.info("[search_transcribed] Dedup state saved: %d documents now tracked", len(updated))
+            if seen is not None:
+                _update_seen_search_state(seen, search_result, max_displayed=formatter.items_scanned)
+                logger.info("[search_transcribed] Dedup state updated: %d documents now tracked", len(seen))
 
-            formatted_results = _apply_token_limit_if_needed(formatted_results, max_response_tokens)
-            formatted_results = _append_pagination_info_if_needed(formatted_results, search_result, offset, limit)
+            formatted_results = _append_pagination_info_if_needed(formatted_results, search_result, offset, limit, formatter.items_omitted)
 
             logger.info("✓ Search completed successfully, returning results")
-            return formatted_results
+            return histogram_block + formatted_results
 
         except Exception as e:
             logger.error("✗ MCP search_transcribed failed: %s: %s", type(e).__name__, e, exc_info=True)
@@ -284,7 +357,10 @@ def register_search_tool(mcp: FastMCP) -> None:
         offset: Annotated[int, Field(description="Pagination start position. Use 0 for first page, then 50, 100, etc.")],
         only_digitised: Annotated[bool, Field(description="True = digitised materials only. False = all 2M+ records including non-digitised.")] = True,
         limit: Annotated[int, Field(description="Maximum documents to return per query.")] = 25,
-        max_response_tokens: Annotated[int, Field(description="Maximum tokens in response.", ge=1000)] = 15000,
+        max_response_tokens: Annotated[
+            int,
+            Field(description="Maximum tokens in response. Documents past it are left out whole, and the response gives the offset to continue from.", ge=1000),
+        ] = 15000,
         sort: Annotated[str, Field(description="Sort order: 'relevance', 'timeAsc', 'timeDesc', 'alphaAsc', 'alphaDesc'.")] = "relevance",
         year_min: Annotated[int | None, Field(description="Start year filter (e.g. 1700).")] = None,
         year_max: Annotated[int | None, Field(description="End year filter (e.g. 1750).")] = None,
@@ -342,9 +418,9 @@ def register_search_tool(mcp: FastMCP) -> None:
             )
 
             # Load session state for dedup
-            seen: dict[str, list[int]] | None = None
-            if dedup and ctx is not None:
-                seen = await ctx.get_state("seen_search") or {}
+            seen: SeenPages | None = None
+            if dedup and session_id is not None:
+                seen = session_seen(session_id, "search")
                 logger.info("[search_metadata] Dedup state loaded: %d documents previously seen", len(seen))
 
             logger.info("Formatting %d search results...", len(search_result.items))
@@ -352,16 +428,15 @@ def register_search_tool(mcp: FastMCP) -> None:
                 search_result,
                 maximum_documents_to_display=limit,
                 seen_pages=seen,
+                max_tokens=max_response_tokens,
             )
 
             # Update session state with only the documents actually scanned by the formatter
-            if dedup and ctx is not None:
-                updated = _update_seen_search_state(seen or {}, search_result, max_displayed=formatter.items_scanned)
-                await ctx.set_state("seen_search", updated)
-                logger.info("[search_metadata] Dedup state saved: %d documents now tracked", len(updated))
+            if seen is not None:
+                _update_seen_search_state(seen, search_result, max_displayed=formatter.items_scanned)
+                logger.info("[search_metadata] Dedup state updated: %d documents now tracked", len(seen))
 
-            formatted_results = _apply_token_limit_if_needed(formatted_results, max_response_tokens)
-            formatted_results = _append_pagination_info_if_needed(formatted_results, search_result, offset, limit)
+            formatted_results = _append_pagination_info_if_needed(formatted_results, search_result, offset, limit, formatter.items_omitted)
 
             logger.info("✓ Metadata search completed successfully, returning results")
             return formatted_results
@@ -381,12 +456,35 @@ def register_search_tool(mcp: FastMCP) -> None:
             )
 
 
-def _apply_token_limit_if_needed(formatted_results, max_response_tokens) -> str:
-    """Apply token limit to the formatted results if needed."""
-    estimated_tokens = len(formatted_results) // 4
-    if estimated_tokens > max_response_tokens:
-        return formatted_results[: max_response_tokens * 4] + "\n\n[Response truncated due to size limits]"
-    return formatted_results
+async def _year_histogram_block(
+    search_operations: SearchOperations,
+    formatter: PlainTextFormatter,
+    keyword: str,
+    year_min: int | None,
+    year_max: int | None,
+    *,
+    enabled: bool,
+    session_id: str | None,
+    other_terms: bool = False,
+) -> str:
+    """The formatted year histogram for *keyword* followed by a blank line, or "" when not *enabled*.
+
+    A failed histogram is reported in one line instead of failing the search it accompanies.
+    With *other_terms* (variants or expanded spellings in the search) the block says
+    that only *keyword* was counted: hits of several terms overlap, so their counts
+    cannot be added up per bucket.
+    """
+    if not enabled:
+        return ""
+    try:
+        histogram = await search_operations.year_histogram(keyword, year_min=year_min, year_max=year_max, session_id=session_id)
+    except Exception as e:
+        logger.warning("Year histogram for '%s' failed: %s: %s", keyword, type(e).__name__, e)
+        return f"📅 Year histogram unavailable: {e!s}\n\n"
+    block = formatter.format_year_histogram(histogram)
+    if other_terms:
+        block += f"\n   (counts '{keyword}' only, not the variants or spellings searched with it)"
+    return block + "\n\n"
 
 
 def _extract_unique_documents(search_hits) -> set[str]:
@@ -442,37 +540,33 @@ def _get_pagination_info(search_hits, total_hit_count, pagination_offset, result
     return pagination_metadata
 
 
-def _append_pagination_info_if_needed(formatted_results, search_result, offset, limit) -> str:
-    """Append pagination information to results if there are more results available."""
+def _append_pagination_info_if_needed(formatted_results, search_result, offset, limit, items_omitted: int = 0) -> str:
+    """Append pagination information to results if there are more results available.
+
+    Skipped when the formatter left documents out for the token budget; the
+    results then already end with the offset to continue from.
+    """
     pagination_info = _get_pagination_info(search_result.items, search_result.response.total_hits, offset, limit)
 
-    if pagination_info["has_more"]:
+    if pagination_info["has_more"] and not items_omitted:
         formatted_results += f"\n\n📊 **Pagination**: Showing documents {pagination_info['document_range_start']}-{pagination_info['document_range_end']}"
         formatted_results += f"\n💡 Use `offset={pagination_info['next_offset']}` to see the next {limit} documents"
 
     return formatted_results
 
 
-def _update_seen_search_state(seen: dict[str, list[int]], search_result, max_displayed: int) -> dict[str, list[int]]:
-    """Merge page numbers from search results into the seen-state dict.
+def _update_seen_search_state(seen: SeenPages, search_result, max_displayed: int) -> None:
+    """Record the pages of the displayed search results in the session's seen pages.
 
     Only tracks documents that were actually displayed (up to max_displayed),
     not all documents returned by the API. This prevents marking unseen
     documents as "seen" when the API returns more items than are shown.
 
-    For each document in the result, extracts page numbers from snippet page IDs
-    and merges them into the existing seen set for that reference code.
-    Documents without snippets (metadata-only) are recorded with an empty list.
+    For each document, the page numbers of its snippets are merged into what
+    the session has already seen of that reference code. Documents without
+    snippets (metadata-only) are recorded with no pages.
     """
     for document in search_result.items[:max_displayed]:
         ref_code = document.metadata.reference_code or document.id
-        existing = set(seen.get(ref_code, []))
-
-        if document.transcribed_text and document.transcribed_text.snippets:
-            for snippet in document.transcribed_text.snippets:
-                for page in snippet.pages:
-                    existing.add(page_id_to_number(page.id))
-        # Store as sorted list (JSON-serializable)
-        seen[ref_code] = sorted(existing)
-
-    return seen
+        snippets = document.transcribed_text.snippets if document.transcribed_text else None
+        seen.add(ref_code, (page_id_to_number(page.id) for snippet in snippets or () for page in snippet.pages))
@@ -6,6 +6,7 @@ SearchResult/SearchRecord pydantic models (from ra_mcp_search_lib.models),
 then assert on concrete substrings in the output.
 """
 
+from ra_mcp_common.seen_pages import SeenPages
 from ra_mcp_search_lib.models import (
     DocumentLinks,
     GenericReference,
@@ -16,6 +17,8 @@ from ra_mcp_search_lib.models import (
     SearchResult,
     Snippet,
     TranscribedText,
+    YearBucket,
+    YearHistogram,
 )
 from ra_mcp_search_mcp.formatter import PlainTextFormatter
 
@@ -347,3 +350,70 @@ def test_format_search_results_dedups_record_with_null_reference_code_by_id():
     assert "(1 previously shown document(s) omitted)" in out
     assert "Page _00005:" not in out
     assert "Document: None" not in out
+
+
+# --------------------------------------------------------------------------- #
+# format_search_results — token budget
+# --------------------------------------------------------------------------- #
+
+
+def test_format_search_results_stops_at_document_boundary_within_budget():
+    records = [_record(ref_code=f"SE/RA/BIG/{i}", snippets=[_snippet("trolldom " + "x" * 2000, ["_00001"])], num_total=1) for i in range(5)]
+    fmt = _fmt()
+    out = fmt.format_search_results(_result(records, keyword="trolldom", total_hits=5), max_tokens=1000)
+
+    assert "SE/RA/BIG/0" in out
+    assert "SE/RA/BIG/4" not in out
+    assert fmt.items_omitted > 0
+    shown = 5 - fmt.items_omitted
+    assert out.count("📚 Document:") == shown
+    assert f"{fmt.items_omitted} more documents not shown to stay within the response token budget" in out
+    assert f"use offset={shown} to continue from here" in out
+    assert "x" * 2000 in out  # the documents that are shown are complete
+
+
+def test_format_search_results_without_budget_shows_everything():
+    records = [_record(ref_code=f"SE/RA/BIG/{i}", snippets=[_snippet("trolldom " + "x" * 2000, ["_00001"])], num_total=1) for i in range(5)]
+    fmt = _fmt()
+    out = fmt.format_search_results(_result(records, keyword="trolldom", total_hits=5))
+    assert out.count("📚 Document:") == 5
+    assert fmt.items_omitted == 0
+
+
+def test_format_search_results_dedups_against_session_seen_pages():
+    seen = SeenPages()
+    seen.add("SE/RA/DUP3", [5])
+    snippets = [_snippet("trolldom old", ["_00005"]), _snippet("trolldom new", ["_00010"])]
+    out = _fmt().format_search_results(
+        _result([_record(ref_code="SE/RA/DUP3", snippets=snippets, num_total=2)], keyword="trolldom"),
+        seen_pages=seen,
+    )
+    assert "📖 New pages: 10" in out
+    assert "trolldom** old" not in out
+
+
+# --------------------------------------------------------------------------- #
+# format_year_histogram
+# --------------------------------------------------------------------------- #
+
+
+def test_format_year_histogram_trims_empty_edges_and_scales_bars():
+    counts = [(1600, 0), (1610, 5), (1620, 0), (1630, 20), (1640, 0)]
+    histogram = YearHistogram(
+        keyword="trolldom",
+        bucket_years=10,
+        buckets=[YearBucket(year_min=year, year_max=year + 9, hits=hits) for year, hits in counts],
+    )
+    lines = _fmt().format_year_histogram(histogram).split("\n")
+
+    assert lines[0].startswith("📅 Hits by year for 'trolldom' (10-year buckets")
+    assert lines[1:] == [
+        "   1610-1619:       5 █████",
+        "   1620-1629:       0",
+        "   1630-1639:      20 ████████████████████",
+    ]
+
+
+def test_format_year_histogram_without_hits():
+    histogram = YearHistogram(keyword="zzz", bucket_years=10, buckets=[YearBucket(year_min=1600, year_max=1609, hits=0)])
+    assert _fmt().format_year_histogram(histogram) == "📅 Hits by year for 'zzz': none between 1600 and 1609"
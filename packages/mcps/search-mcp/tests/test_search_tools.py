@@ -1,9 +1,21 @@
 """Tests for ra-mcp-search-mcp tools."""
 
+from unittest.mock import AsyncMock, patch
+
 import pytest
 from fastmcp import Client
 
-from ra_mcp_search_mcp.search_tool import _looks_like_boolean_query, _looks_like_reference_code, _validate_search_input
+from ra_mcp_common.http_client import HTTPClient
+from ra_mcp_search_lib.models import YearBucket, YearHistogram
+from ra_mcp_search_lib.search_operations import SearchOperations
+from ra_mcp_search_mcp.formatter import PlainTextFormatter
+from ra_mcp_search_mcp.search_tool import (
+    _looks_like_boolean_query,
+    _looks_like_reference_code,
+    _validate_search_input,
+    _validate_variants,
+    _year_histogram_block,
+)
 from ra_mcp_search_mcp.tools import search_mcp
 
 
@@ -171,3 +183,40 @@ def test_validate_search_input_rejects_reference_code_with_alternatives() -> Non
 
 def test_validate_search_input_accepts_normal_keyword() -> None:
     assert _validate_search_input("Wallenberg", offset=0, year_min=None, year_max=None) is None
+
+
+def test_validate_variants_checks_every_variant() -> None:
+    assert _validate_variants(["präst", "prest"], offset=0, limit=25) is None
+    error = _validate_variants(["präst", "prest OR präst"], offset=0, limit=25)
+    assert error is not None
+    assert "boolean" in error.lower()
+
+
+def test_validate_variants_bounds_the_fan_out() -> None:
+    error = _validate_variants([f"term{i}" for i in range(9)], offset=0, limit=25)
+    assert error is not None
+    assert "At most" in error
+    error = _validate_variants(["silver", "silfver"], offset=990, limit=25)
+    assert error is not None
+    assert "offset + limit" in error
+    # Expanding spellings turns one keyword into several, so the same window applies
+    assert _validate_variants(["silver"], offset=990, limit=25) is None
+    assert _validate_variants(["silver"], offset=990, limit=25, expanding=True) is not None
+
+
+async def test_year_histogram_block_is_optional_and_never_fails_the_search() -> None:
+    operations = SearchOperations(HTTPClient())
+    formatter = PlainTextFormatter()
+    histogram = YearHistogram(keyword="trolldom", bucket_years=10, buckets=[YearBucket(year_min=1660, year_max=1669, hits=3)])
+
+    assert await _year_histogram_block(operations, formatter, "trolldom", None, None, enabled=False, session_id=None) == ""
+    with patch.object(operations, "year_histogram", new_callable=AsyncMock, return_value=histogram):
+        block = await _year_histogram_block(operations, formatter, "trolldom", 1660, 1669, enabled=True, session_id=None)
+    assert block.startswith("📅 Hits by year for 'trolldom'") and block.endswith("\n\n")
+    assert "only" not in block
+    with patch.object(operations, "year_histogram", new_callable=AsyncMock, return_value=histogram):
+        block = await _year_histogram_block(operations, formatter, "trolldom", 1660, 1669, enabled=True, session_id=None, other_terms=True)
+    assert block.endswith("\n   (counts 'trolldom' only, not the variants or spellings searched with it)\n\n")
+    with patch.object(operations, "year_histogram", new_callable=AsyncMock, side_effect=ValueError("too many buckets")):
+        block = await _year_histogram_block(operations, formatter, "trolldom", 1000, 1999, enabled=True, session_id=None)
+    assert block == "📅 Year histogram unavailable: too many buckets\n\n"
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
 from ra_mcp_common.formatting import append_if, truncate_text
-from ra_mcp_dataset_lib import format_results
+from ra_mcp_dataset_lib import RenderRecord, format_results, register_display_renderers, render_records
+from ra_mcp_sj_lib.config import FIRA_TABLE, JUDA_TABLE
 from ra_mcp_sj_lib.search_operations import SearchResult
 
 
@@ -14,7 +16,7 @@ from ra_mcp_sj_lib.search_operations import SearchResult
 # ---------------------------------------------------------------------------
 
 
-def _format_juda_record(rec: dict[str, Any], lines: list[str]) -> None:
+def _format_juda_record(rec: Mapping[str, Any], lines: list[str]) -> None:
     """Format a single JUDA property record into lines."""
     lines.append(f"--- JUDA {rec.get('fbidnr', '?')} ---")
     append_if(lines, "Property", rec.get("fbtext", ""))
@@ -39,7 +41,7 @@ def format_juda_results(result: SearchResult) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _format_ritning_record(rec: dict[str, Any], lines: list[str]) -> None:
+def _format_ritning_record(rec: Mapping[str, Any], lines: list[str]) -> None:
     """Format a single drawing record into lines."""
     bnum = rec.get("bnum", "?")
     blad = rec.get("blad", "")
@@ -67,11 +69,18 @@ def format_ritningar_results(result: SearchResult) -> str:
     lines.append(f"Drawing search results for '{result.keyword}': showing {len(result.records)} of {result.total_hits} records (offset {result.offset})")
     lines.append("")
 
-    for rec in result.records:
-        _format_ritning_record(rec, lines)
+    render_records(result.records, _format_ritning_record, lines)
 
     next_offset = result.offset + result.limit
     if next_offset < result.total_hits:
         lines.append(f"More results available. Use offset={next_offset} to see the next page.")
 
     return "\n".join(lines)
+
+
+# Table name -> render_record for stored display text; see ra_mcp_dataset_lib.register_display_renderers.
+DISPLAY_RENDERERS: dict[str, RenderRecord] = {
+    JUDA_TABLE: _format_juda_record,
+    FIRA_TABLE: _format_ritning_record,
+}
+register_display_renderers(DISPLAY_RENDERERS)
@@ -2,24 +2,27 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
 from ra_mcp_common.formatting import append_if
+from ra_mcp_dataset_lib import RenderRecord, format_results, register_display_renderers
+from ra_mcp_sjomanshus_lib.config import LIGGARE_TABLE, MATRIKEL_TABLE
 from ra_mcp_sjomanshus_lib.search_operations import SearchResult
 
 
-def _format_name(rec: dict[str, Any]) -> str:
+def _format_name(rec: Mapping[str, Any]) -> str:
     """Build full name from foernamn, efternamn1, efternamn2."""
     return " ".join(p for p in [rec.get("foernamn", ""), rec.get("efternamn1", ""), rec.get("efternamn2", "")] if p)
 
 
-def _format_born(rec: dict[str, Any]) -> str:
+def _format_born(rec: Mapping[str, Any]) -> str:
     """Format birth date and parish."""
     parts = [p for p in [rec.get("foedelsedat", ""), rec.get("foedelsefoers", "")] if p]
     return ", ".join(parts) if parts else ""
 
 
-def _format_sjomanshus(rec: dict[str, Any]) -> str:
+def _format_sjomanshus(rec: Mapping[str, Any]) -> str:
     """Format seamen's house and registration number."""
     sh = rec.get("sjoemanshus", "")
     nr = rec.get("inskrivnr", "")
@@ -31,7 +34,7 @@ def _format_sjomanshus(rec: dict[str, Any]) -> str:
     return ", ".join(parts) if parts else ""
 
 
-def _format_archive(rec: dict[str, Any]) -> str:
+def _format_archive(rec: Mapping[str, Any]) -> str:
     """Format archive reference."""
     arkiv = rec.get("arkiv", "")
     arkivnr = rec.get("arkivnr", "")
@@ -50,7 +53,7 @@ def _format_place_date(place: str, date: str) -> str:
     return place or date
 
 
-def _format_ship(rec: dict[str, Any]) -> str:
+def _format_ship(rec: Mapping[str, Any]) -> str:
     """Format ship info: name (type), home port."""
     fartyg = rec.get("fartyg", "")
     typ = rec.get("typ", "")
@@ -63,7 +66,7 @@ def _format_ship(rec: dict[str, Any]) -> str:
     return ", ".join(parts) if parts else ""
 
 
-def _format_liggare_record(rec: dict[str, Any], lines: list[str]) -> None:
+def _format_liggare_record(rec: Mapping[str, Any], lines: list[str]) -> None:
     """Format a single Liggare record into lines."""
     lines.append(f"--- Liggare {rec.get('id', '?')} ---")
     append_if(lines, "Name", _format_name(rec))
@@ -98,29 +101,15 @@ def _format_liggare_record(rec: dict[str, Any], lines: list[str]) -> None:
 
 def format_liggare_results(result: SearchResult) -> str:
     """Format Liggare search results as plain text for MCP/LLM consumption."""
-    if not result.records:
-        if result.offset > 0:
-            return f"No more Liggare results for '{result.keyword}' at offset {result.offset}. Total found: {result.total_hits}"
-        return f"No Liggare results found for '{result.keyword}'."
-
-    lines: list[str] = []
-    lines.append(f"Liggare search results for '{result.keyword}': showing {len(result.records)} of {result.total_hits} records (offset {result.offset})")
-    lines.append("")
-
-    for rec in result.records:
-        _format_liggare_record(rec, lines)
-
-    next_offset = result.offset + result.limit
-    if next_offset < result.total_hits:
-        lines.append(f"More results available. Use offset={next_offset} to see the next page.")
-
-    lines.append("")
-    lines.append("Tip: Use view_document with the archive reference code (arkivnr) and page number to see the original record.")
-
-    return "\n".join(lines)
+    return format_results(
+        result,
+        label="Liggare",
+        render_record=_format_liggare_record,
+        tip="Tip: Use view_document with the archive reference code (arkivnr) and page number to see the original record.",
+    )
 
 
-def _format_matrikel_record(rec: dict[str, Any], lines: list[str]) -> None:
+def _format_matrikel_record(rec: Mapping[str, Any], lines: list[str]) -> None:
     """Format a single Matrikel record into lines."""
     lines.append(f"--- Matrikel {rec.get('id', '?')} ---")
     append_if(lines, "Name", _format_name(rec))
@@ -160,23 +149,17 @@ def _format_matrikel_record(rec: dict[str, Any], lines: list[str]) -> None:
 
 def format_matrikel_results(result: SearchResult) -> str:
     """Format Matrikel search results as plain text for MCP/LLM consumption."""
-    if not result.records:
-        if result.offset > 0:
-            return f"No more Matrikel results for '{result.keyword}' at offset {result.offset}. Total found: {result.total_hits}"
-        return f"No Matrikel results found for '{result.keyword}'."
-
-    lines: list[str] = []
-    lines.append(f"Matrikel search results for '{result.keyword}': showing {len(result.records)} of {result.total_hits} records (offset {result.offset})")
-    lines.append("")
-
-    for rec in result.records:
-        _format_matrikel_record(rec, lines)
-
-    next_offset = result.offset + result.limit
-    if next_offset < result.total_hits:
-        lines.append(f"More results available. Use offset={next_offset} to see the next page.")
-
-    lines.append("")
-    lines.append("Tip: Use view_document with the archive reference code (arkivnr) and page number to see the original record.")
-
-    return "\n".join(lines)
+    return format_results(
+        result,
+        label="Matrikel",
+        render_record=_format_matrikel_record,
+        tip="Tip: Use view_document with the archive reference code (arkivnr) and page number to see the original record.",
+    )
+
+
+# Table name -> render_record for stored display text; see ra_mcp_dataset_lib.register_display_renderers.
+DISPLAY_RENDERERS: dict[str, RenderRecord] = {
+    LIGGARE_TABLE: _format_liggare_record,
+    MATRIKEL_TABLE: _format_matrikel_record,
+}
+register_display_renderers(DISPLAY_RENDERERS)
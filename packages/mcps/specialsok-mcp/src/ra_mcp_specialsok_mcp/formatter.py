@@ -2,38 +2,21 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
 from ra_mcp_common.formatting import append_if, truncate_text
+from ra_mcp_dataset_lib import RenderRecord, format_results, register_display_renderers
+from ra_mcp_specialsok_lib.config import FANGRULLOR_TABLE, FLYGVAPEN_TABLE, KURHUSET_TABLE, PRESS_TABLE, VIDEO_TABLE
 from ra_mcp_specialsok_lib.search_operations import SearchResult
 
 
-def _format_header(dataset: str, result: SearchResult) -> list[str]:
-    """Build the standard header lines for a result set."""
-    if not result.records:
-        if result.offset > 0:
-            return [f"No more {dataset} results for '{result.keyword}' at offset {result.offset}. Total found: {result.total_hits}"]
-        return [f"No {dataset} results found for '{result.keyword}'."]
-
-    lines: list[str] = []
-    lines.append(f"{dataset} search results for '{result.keyword}': showing {len(result.records)} of {result.total_hits} records (offset {result.offset})")
-    lines.append("")
-    return lines
-
-
-def _format_footer(result: SearchResult, lines: list[str]) -> None:
-    """Append pagination hint if more results exist."""
-    next_offset = result.offset + result.limit
-    if next_offset < result.total_hits:
-        lines.append(f"More results available. Use offset={next_offset} to see the next page.")
-
-
 # ---------------------------------------------------------------------------
 # Flygvapenhaverier formatter
 # ---------------------------------------------------------------------------
 
 
-def _format_flygvapen_record(rec: dict[str, Any], lines: list[str]) -> None:
+def _format_flygvapen_record(rec: Mapping[str, Any], lines: list[str]) -> None:
     """Format a single Flygvapenhaverier record."""
     lines.append("--- Flygvapenhaveri ---")
     append_if(lines, "Date", rec.get("datum", ""))
@@ -55,14 +38,7 @@ def _format_flygvapen_record(rec: dict[str, Any], lines: list[str]) -> None:
 
 def format_flygvapen_results(result: SearchResult) -> str:
     """Format Flygvapenhaverier search results as plain text."""
-    lines = _format_header("Flygvapenhaverier", result)
-    if not result.records:
-        return "\n".join(lines)
-
-    for rec in result.records:
-        _format_flygvapen_record(rec, lines)
-    _format_footer(result, lines)
-    return "\n".join(lines)
+    return format_results(result, label="Flygvapenhaverier", render_record=_format_flygvapen_record)
 
 
 # ---------------------------------------------------------------------------
@@ -70,7 +46,7 @@ def format_flygvapen_results(result: SearchResult) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _format_fangrullor_record(rec: dict[str, Any], lines: list[str]) -> None:
+def _format_fangrullor_record(rec: Mapping[str, Any], lines: list[str]) -> None:
     """Format a single Fångrullor record."""
     lines.append("--- Fångrulle ---")
     name_parts = [rec.get("fornamn", ""), rec.get("efternamn", "")]
@@ -86,14 +62,7 @@ def _format_fangrullor_record(rec: dict[str, Any], lines: list[str]) -> None:
 
 def format_fangrullor_results(result: SearchResult) -> str:
     """Format Fångrullor search results as plain text."""
-    lines = _format_header("Fångrullor", result)
-    if not result.records:
-        return "\n".join(lines)
-
-    for rec in result.records:
-        _format_fangrullor_record(rec, lines)
-    _format_footer(result, lines)
-    return "\n".join(lines)
+    return format_results(result, label="Fångrullor", render_record=_format_fangrullor_record)
 
 
 # ---------------------------------------------------------------------------
@@ -101,7 +70,7 @@ def format_fangrullor_results(result: SearchResult) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _format_kurhuset_record(rec: dict[str, Any], lines: list[str]) -> None:
+def _format_kurhuset_record(rec: Mapping[str, Any], lines: list[str]) -> None:
     """Format a single Kurhuset record."""
     lines.append("--- Kurhuset patient ---")
     name_parts = [rec.get("fornamn", ""), rec.get("efternamn", "")]
@@ -132,14 +101,7 @@ def _format_kurhuset_record(rec: dict[str, Any], lines: list[str]) -> None:
 
 def format_kurhuset_results(result: SearchResult) -> str:
     """Format Kurhuset search results as plain text."""
-    lines = _format_header("Kurhuset", result)
-    if not result.records:
-        return "\n".join(lines)
-
-    for rec in result.records:
-        _format_kurhuset_record(rec, lines)
-    _format_footer(result, lines)
-    return "\n".join(lines)
+    return format_results(result, label="Kurhuset", render_record=_format_kurhuset_record)
 
 
 # ---------------------------------------------------------------------------
@@ -147,7 +109,7 @@ def format_kurhuset_results(result: SearchResult) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _format_press_record(rec: dict[str, Any], lines: list[str]) -> None:
+def _format_press_record(rec: Mapping[str, Any], lines: list[str]) -> None:
     """Format a single Presskonferens record."""
     lines.append("--- Presskonferens ---")
     append_if(lines, "Date", rec.get("datum", ""))
@@ -166,14 +128,7 @@ def _format_press_record(rec: dict[str, Any], lines: list[str]) -> None:
 
 def format_press_results(result: SearchResult) -> str:
     """Format Presskonferenser search results as plain text."""
-    lines = _format_header("Presskonferenser", result)
-    if not result.records:
-        return "\n".join(lines)
-
-    for rec in result.records:
-        _format_press_record(rec, lines)
-    _format_footer(result, lines)
-    return "\n".join(lines)
+    return format_results(result, label="Presskonferenser", render_record=_format_press_record)
 
 
 # ---------------------------------------------------------------------------
@@ -181,7 +136,7 @@ def format_press_results(result: SearchResult) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _format_video_record(rec: dict[str, Any], lines: list[str]) -> None:
+def _format_video_record(rec: Mapping[str, Any], lines: list[str]) -> None:
     """Format a single Videobutik record."""
     lines.append("--- Videobutik ---")
     append_if(lines, "Store", rec.get("butiksnamn", ""))
@@ -198,11 +153,15 @@ def _format_video_record(rec: dict[str, Any], lines: list[str]) -> None:
 
 def format_video_results(result: SearchResult) -> str:
     """Format Videobutiker search results as plain text."""
-    lines = _format_header("Videobutiker", result)
-    if not result.records:
-        return "\n".join(lines)
-
-    for rec in result.records:
-        _format_video_record(rec, lines)
-    _format_footer(result, lines)
-    return "\n".join(lines)
+    return format_results(result, label="Videobutiker", render_record=_format_video_record)
+
+
+# Table name -> render_record for stored display text; see ra_mcp_dataset_lib.register_display_renderers.
+DISPLAY_RENDERERS: dict[str, RenderRecord] = {
+    FLYGVAPEN_TABLE: _format_flygvapen_record,
+    FANGRULLOR_TABLE: _format_fangrullor_record,
+    KURHUSET_TABLE: _format_kurhuset_record,
+    PRESS_TABLE: _format_press_record,
+    VIDEO_TABLE: _format_video_record,
+}
+register_display_renderers(DISPLAY_RENDERERS)
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
 from ra_mcp_common.formatting import append_if
+from ra_mcp_dataset_lib import RenderRecord, format_results, register_display_renderers
+from ra_mcp_suffrage_lib.config import FKPR_TABLE, ROSTRATT_TABLE
 from ra_mcp_suffrage_lib.search_operations import SearchResult
 
 
-def _format_contribution(rec: dict[str, Any]) -> str:
+def _format_contribution(rec: Mapping[str, Any]) -> str:
     """Format monetary contribution from kr and öre."""
     kr = rec.get("bidrag_kr", "")
     ore = rec.get("bidrag_ore", "")
@@ -21,7 +24,7 @@ def _format_contribution(rec: dict[str, Any]) -> str:
     return ""
 
 
-def _format_rostratt_record(rec: dict[str, Any], lines: list[str]) -> None:
+def _format_rostratt_record(rec: Mapping[str, Any], lines: list[str]) -> None:
     """Format a single Rösträtt record into lines."""
     fornamn = rec.get("fornamn", "")
     efternamn = rec.get("efternamn", "")
@@ -51,31 +54,15 @@ def _format_rostratt_record(rec: dict[str, Any], lines: list[str]) -> None:
 
 def format_rostratt_results(result: SearchResult) -> str:
     """Format Rösträtt search results as plain text for MCP/LLM consumption."""
-    if not result.records:
-        if result.offset > 0:
-            return f"No more R\u00f6str\u00e4tt results for '{result.keyword}' at offset {result.offset}. Total found: {result.total_hits}"
-        return f"No R\u00f6str\u00e4tt results found for '{result.keyword}'."
-
-    lines: list[str] = []
-    lines.append(
-        f"R\u00f6str\u00e4tt search results for '{result.keyword}': showing {len(result.records)} of {result.total_hits} records (offset {result.offset})"
+    return format_results(
+        result,
+        label="R\u00f6str\u00e4tt",
+        render_record=_format_rostratt_record,
+        tip="Tip: Use view_bild with the bild_id to see the original petition page, or open the Source link directly.",
     )
-    lines.append("")
-
-    for rec in result.records:
-        _format_rostratt_record(rec, lines)
-
-    next_offset = result.offset + result.limit
-    if next_offset < result.total_hits:
-        lines.append(f"More results available. Use offset={next_offset} to see the next page.")
-
-    lines.append("")
-    lines.append("Tip: Use view_bild with the bild_id to see the original petition page, or open the Source link directly.")
-
-    return "\n".join(lines)
 
 
-def _format_fkpr_record(rec: dict[str, Any], lines: list[str]) -> None:
+def _format_fkpr_record(rec: Mapping[str, Any], lines: list[str]) -> None:
     """Format a single FKPR record into lines."""
     foernamn = rec.get("foernamn", "")
     efternamn = rec.get("efternamn", "")
@@ -99,23 +86,17 @@ def _format_fkpr_record(rec: dict[str, Any], lines: list[str]) -> None:
 
 def format_fkpr_results(result: SearchResult) -> str:
     """Format FKPR search results as plain text for MCP/LLM consumption."""
-    if not result.records:
-        if result.offset > 0:
-            return f"No more FKPR results for '{result.keyword}' at offset {result.offset}. Total found: {result.total_hits}"
-        return f"No FKPR results found for '{result.keyword}'."
-
-    lines: list[str] = []
-    lines.append(f"FKPR search results for '{result.keyword}': showing {len(result.records)} of {result.total_hits} records (offset {result.offset})")
-    lines.append("")
-
-    for rec in result.records:
-        _format_fkpr_record(rec, lines)
-
-    next_offset = result.offset + result.limit
-    if next_offset < result.total_hits:
-        lines.append(f"More results available. Use offset={next_offset} to see the next page.")
+    return format_results(
+        result,
+        label="FKPR",
+        render_record=_format_fkpr_record,
+        tip="Tip: Open the Source link to see the original membership register (login required for records < 110 years old).",
+    )
 
-    lines.append("")
-    lines.append("Tip: Open the Source link to see the original membership register (login required for records < 110 years old).")
 
-    return "\n".join(lines)
+# Table name -> render_record for stored display text; see ra_mcp_dataset_lib.register_display_renderers.
+DISPLAY_RENDERERS: dict[str, RenderRecord] = {
+    ROSTRATT_TABLE: _format_rostratt_record,
+    FKPR_TABLE: _format_fkpr_record,
+}
+register_display_renderers(DISPLAY_RENDERERS)
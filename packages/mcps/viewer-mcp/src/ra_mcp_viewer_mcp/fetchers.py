@@ -10,6 +10,7 @@ resize, or base64 through the tool-result channel.
 
 import asyncio
 import logging
+from collections import Counter
 from collections.abc import Callable, Coroutine
 
 import httpx
@@ -17,6 +18,10 @@ from fastmcp.telemetry import get_tracer
 from key_value.aio.stores.memory import MemoryStore
 
 from ra_mcp_browse_lib.url_generator import iiif_resize
+from ra_mcp_common.cache_registry import CacheStats, matching_keys, register_cache
+from ra_mcp_common.cassette import cassette_transport
+from ra_mcp_common.http_cache import http_cache_transport
+from ra_mcp_common.upstream import upstream_url
 from ra_mcp_xml.parser import detect_and_parse
 
 
@@ -27,16 +32,21 @@ _EMPTY_TEXT_LAYER: dict = {"textLines": [], "pageWidth": 0, "pageHeight": 0}
 
 _http = httpx.AsyncClient(
     http2=True,
-    transport=httpx.AsyncHTTPTransport(retries=1),
+    transport=http_cache_transport(cassette_transport(httpx.AsyncHTTPTransport(retries=1))),
     timeout=httpx.Timeout(connect=10, read=60, write=10, pool=5),
     follow_redirects=True,
     limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
 )
 
-_cache = MemoryStore(max_entries_per_collection=128)
-
 _COL_TEXT_LAYERS = "text_layers"
 _TTL_TEXT_LAYERS = 300
+_MAX_TEXT_LAYERS = 128
+
+_cache = MemoryStore(max_entries_per_collection=_MAX_TEXT_LAYERS)
+
+# Lookup counters for the admin cache report (see _text_layer_cache_stats)
+_lookups: Counter[str] = Counter()
+_key_hits: Counter[str] = Counter()
 
 # Inflight dedup — prevents duplicate HTTP requests for the same URL
 _inflight: dict[str, asyncio.Task] = {}
@@ -62,15 +72,36 @@ async def _dedup[T](key: str, factory: Callable[[], Coroutine[object, object, T]
 async def _cache_get(key: str, collection: str) -> dict | None:
     """Get from cache, returning None on cache miss or missing collection."""
     try:
-        return await _cache.get(key=key, collection=collection)
+        value = await _cache.get(key=key, collection=collection)
     except KeyError:
-        return None
+        value = None
+    _lookups["hit" if value is not None else "miss"] += 1
+    if value is not None:
+        _key_hits[key] += 1
+        if len(_key_hits) > 4 * _MAX_TEXT_LAYERS:
+            for stale_key, _ in _key_hits.most_common()[_MAX_TEXT_LAYERS:]:
+                del _key_hits[stale_key]
+    return value
+
+
+async def _text_layer_cache_stats() -> CacheStats:
+    keys = set(await _cache.keys(collection=_COL_TEXT_LAYERS, limit=_MAX_TEXT_LAYERS))
+    hottest = [{"key": key, "hits": hits} for key, hits in _key_hits.most_common() if key in keys][:10]
+    return CacheStats(entries=len(keys), hits=_lookups["hit"], misses=_lookups["miss"], top_keys=hottest)
+
+
+async def _invalidate_text_layers(pattern: str | None) -> int:
+    keys = matching_keys(await _cache.keys(collection=_COL_TEXT_LAYERS, limit=_MAX_TEXT_LAYERS), pattern)
+    return await _cache.delete_many(keys=keys, collection=_COL_TEXT_LAYERS) if keys else 0
+
+
+register_cache("viewer.text_layers", stats=_text_layer_cache_stats, invalidate=_invalidate_text_layers)
 
 
 async def fetch_xml_from_url(url: str) -> str:
     """Fetch XML (ALTO/PAGE) from a URL and return raw text."""
     logger.debug("Fetching XML: %s", url)
-    response = await _http.get(url, timeout=30.0)
+    response = await _http.get(upstream_url(url), timeout=30.0)
     response.raise_for_status()
     logger.debug("XML fetched: status=%d, length=%d", response.status_code, len(response.text))
     return response.text
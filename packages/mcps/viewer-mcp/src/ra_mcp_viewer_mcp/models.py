@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from ra_mcp_xml.models import TextLayer, TextLine  # Single source of truth
 
@@ -31,3 +31,8 @@ class ViewerState(BaseModel):
     document_info: str = ""  # markdown-formatted document metadata
     go_to_page: int = -1  # -1 = no navigation request, 0+ = jump to this page index
     request_fullscreen: bool = False
+
+    # Store revision and field values this state was loaded at; put_state writes with
+    # compare-and-set against them and re-applies its changes if the view moved on.
+    _revision: int = PrivateAttr(default=0)
+    _stored: dict = PrivateAttr(default_factory=dict)
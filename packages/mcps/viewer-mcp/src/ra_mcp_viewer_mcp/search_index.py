@@ -0,0 +1,167 @@
+"""
+Per-view token index behind ``search_all_pages``.
+
+The viewer's search box calls ``search_all_pages`` on every (debounced)
+keystroke with the same page list. Rather than re-reading and re-scanning
+every text layer each time, the first search over a page list fetches the
+text layers once and builds an inverted index — lowercased whitespace token
+→ page → line positions. Later searches are index lookups:
+
+- a one-word term is matched against the vocabulary (a line contains the
+  term exactly when one of its tokens does), and the postings of the matching
+  tokens give the lines;
+- a multi-word term intersects the lines of each of its words, then checks
+  the candidates against the full line text, so phrase results are exactly
+  those of a substring scan.
+
+Indexes are keyed by the page list (a view is its pages), kept in a small
+LRU and dropped after the view TTL, so memory is bounded by the number of
+recently searched views. An index built while some page failed to load is
+used for that search but not kept, so a transient fetch error is retried.
+"""
+
+import asyncio
+import hashlib
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from ra_mcp_common.cache_registry import CacheStats, key_matches, register_cache
+
+
+_TTL = 600  # seconds; matches the viewer state TTL (state._TTL)
+MAX_INDEXES = 16
+_MAX_MEMO_TERMS = 256
+
+
+@dataclass
+class SearchIndex:
+    """Inverted index over the text lines of one view's pages.
+
+    Attributes:
+        urls: Text layer URLs, in page order.
+        line_ids: Page index → the ids of its text lines, in reading order.
+        line_texts: Page index → the lowercased transcription of each line.
+        postings: Token → page index → positions (into ``line_ids``) of the lines containing it.
+        complete: False when some page could not be loaded.
+    """
+
+    urls: tuple[str, ...]
+    line_ids: dict[int, list[str]] = field(default_factory=dict)
+    line_texts: dict[int, list[str]] = field(default_factory=dict)
+    postings: dict[str, dict[int, list[int]]] = field(default_factory=dict)
+    complete: bool = True
+    _memo: dict[str, list[str]] = field(default_factory=dict, repr=False)
+
+    def add_page(self, page_index: int, text_layer: dict) -> None:
+        """Index the text lines of one parsed text layer."""
+        ids: list[str] = []
+        texts: list[str] = []
+        for position, line in enumerate(text_layer.get("textLines", [])):
+            text = line.get("transcription", "").lower()
+            ids.append(line.get("id", ""))
+            texts.append(text)
+            for token in set(text.split()):
+                self.postings.setdefault(token, {}).setdefault(page_index, []).append(position)
+        self.line_ids[page_index] = ids
+        self.line_texts[page_index] = texts
+
+    def _tokens_containing(self, word: str) -> list[str]:
+        tokens = self._memo.get(word)
+        if tokens is None:
+            tokens = [token for token in self.postings if word in token]
+            if len(self._memo) >= _MAX_MEMO_TERMS:
+                self._memo.pop(next(iter(self._memo)))
+            self._memo[word] = tokens
+        return tokens
+
+    def _lines_with(self, word: str) -> dict[int, set[int]]:
+        lines: dict[int, set[int]] = {}
+        for token in self._tokens_containing(word):
+            for page_index, positions in self.postings[token].items():
+                lines.setdefault(page_index, set()).update(positions)
+        return lines
+
+    def search(self, term: str) -> dict[int, list[str]]:
+        """Page index → ids of the lines whose transcription contains *term* (case-insensitive)."""
+        words = term.lower().split()
+        if not words:
+            return {}
+        candidates = self._lines_with(words[0])
+        for word in words[1:]:
+            other = self._lines_with(word)
+            candidates = {page: positions & other[page] for page, positions in candidates.items() if page in other}
+        if len(words) > 1:
+            needle = term.strip().lower()
+            candidates = {page: {i for i in positions if needle in self.line_texts[page][i]} for page, positions in candidates.items()}
+        return {page: [self.line_ids[page][i] for i in sorted(positions)] for page, positions in sorted(candidates.items()) if positions}
+
+
+_indexes: OrderedDict[str, tuple[float, SearchIndex]] = OrderedDict()
+_building: dict[str, asyncio.Task[SearchIndex]] = {}
+_lookups: Counter[str] = Counter()
+
+
+def index_key(urls: list[str]) -> str:
+    """Cache key for a page list."""
+    return hashlib.sha256("\n".join(urls).encode()).hexdigest()[:24]
+
+
+def _cached(key: str) -> SearchIndex | None:
+    entry = _indexes.get(key)
+    if entry is None:
+        return None
+    built_at, index = entry
+    if time.monotonic() - built_at > _TTL:
+        del _indexes[key]
+        return None
+    _indexes.move_to_end(key)
+    return index
+
+
+async def get_index(urls: list[str], build: Callable[[list[str]], Awaitable[SearchIndex]]) -> SearchIndex:
+    """The index for *urls*, building it with *build* on first use.
+
+    Concurrent first searches over the same pages share one build. It is
+    shielded, so a caller that is cancelled does not cancel it for the others.
+    """
+    key = index_key(urls)
+    index = _cached(key)
+    _lookups["hit" if index is not None else "miss"] += 1
+    if index is not None:
+        return index
+    if key not in _building:
+        _building[key] = asyncio.ensure_future(_build_and_cache(key, urls, build))
+    return await asyncio.shield(_building[key])
+
+
+async def _build_and_cache(key: str, urls: list[str], build: Callable[[list[str]], Awaitable[SearchIndex]]) -> SearchIndex:
+    """Build the index for *urls* and cache it if every page loaded."""
+    try:
+        index = await build(urls)
+    finally:
+        _building.pop(key, None)
+    if index.complete:
+        _indexes[key] = (time.monotonic(), index)
+        _indexes.move_to_end(key)
+        while len(_indexes) > MAX_INDEXES:
+            _indexes.popitem(last=False)
+            _lookups["eviction"] += 1
+    return index
+
+
+def _index_cache_stats() -> CacheStats:
+    top = [{"key": key, "pages": len(index.urls), "tokens": len(index.postings)} for key, (_, index) in reversed(_indexes.items())][:10]
+    return CacheStats(entries=len(_indexes), hits=_lookups["hit"], misses=_lookups["miss"], evictions=_lookups["eviction"], top_keys=top)
+
+
+def _invalidate_indexes(pattern: str | None) -> int:
+    """Drop indexes whose key or any of whose text layer URLs match *pattern*."""
+    stale = [key for key, (_, index) in _indexes.items() if key_matches(key, pattern) or any(key_matches(url, pattern) for url in index.urls)]
+    for key in stale:
+        del _indexes[key]
+    return len(stale)
+
+
+register_cache("viewer.search_index", stats=_index_cache_stats, invalidate=_invalidate_indexes)
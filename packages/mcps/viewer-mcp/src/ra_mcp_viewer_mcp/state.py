@@ -3,23 +3,43 @@
 Each view_document/view_document_urls call creates a unique ViewerState keyed
 by view_id. The View iframe polls get_viewer_state with its view_id to detect
 LLM-initiated changes (highlight, navigate). State auto-expires after TTL.
+
+States live in a ra_mcp_common.state_store backend: process memory by default,
+or the store named by RA_MCP_STATE_STORE so that every replica sees every view.
+Writes are compare-and-set on the store revision, so a poll consuming one-shot
+commands and a concurrent mutation tool never drop each other's changes.
 """
 
+import asyncio
+import contextlib
+import time
+import weakref
+
 from fastmcp.server.dependencies import get_context
 from key_value.aio.stores.memory import MemoryStore
 
+from ra_mcp_common.state_store import StateConflictError, StateStore, is_shared, state_backend
 from ra_mcp_viewer_mcp.models import ViewerState
 
 
 _COL = "viewer_state"
 _TTL = 600  # 10 min
-_store = MemoryStore(max_entries_per_collection=64)
+_CAS_ATTEMPTS = 5
+_ONE_SHOT = {"go_to_page": -1, "request_fullscreen": False}
+_RECHECK_SECONDS = 5.0  # long-poll re-read interval of a shared store, for writes made by another replica
+_store = StateStore(state_backend(lambda: MemoryStore(max_entries_per_collection=64)), _COL, ttl=_TTL)
 
 # "Active view" pointer, scoped per MCP session. Over the HTTP transport one process
 # serves many sessions; a single global would let one session's view_document hijack the
 # no-view_id mutation tools (viewer_go_to_page/set_highlight/navigate) of another session.
-# Keyed by session id; "" is the stdio / no-session bucket.
-_latest_view_by_session: dict[str, str] = {}
+# Keyed by session id in the same backend as the states (so it is shared across replicas
+# and expires with them); "" is the stdio / no-session bucket.
+_active_views = StateStore(_store.backend, "viewer_session", ttl=_TTL)
+
+
+# view_id → event the next put_state sets, so long-polling get_*_state calls wake at once.
+# Weak values: an entry lives only while a poll is waiting on it.
+_changes: weakref.WeakValueDictionary[str, asyncio.Event] = weakref.WeakValueDictionary()
 
 
 def _session_key() -> str:
@@ -29,11 +49,52 @@ def _session_key() -> str:
         return ""
 
 
+def _pointer_key(session: str) -> str:
+    return f"session:{session}"
+
+
+async def _active_view_id(session: str) -> str:
+    pointer = await _active_views.get(_pointer_key(session))
+    return pointer["view_id"] if pointer else ""
+
+
+def _from_store(value: dict, revision: int) -> ViewerState:
+    state = ViewerState.model_validate(value)
+    state._revision = revision
+    state._stored = value
+    return state
+
+
+async def _load(view_id: str) -> ViewerState | None:
+    entry = await _store.load(view_id)
+    return _from_store(entry.value, entry.revision) if entry is not None else None
+
+
 async def get_state(view_id: str) -> ViewerState:
-    data = await _store.get(key=view_id, collection=_COL)
-    if data:
-        return ViewerState.model_validate(data)
-    return ViewerState(view_id=view_id)
+    return await _load(view_id) or ViewerState(view_id=view_id)
+
+
+async def wait_for_change(view_id: str, since_version: int, timeout: float) -> None:
+    """Return once the view's version differs from *since_version*, the view is gone, or
+    *timeout* seconds have passed.
+
+    A put_state in this process wakes the wait immediately. Only with a shared
+    RA_MCP_STATE_STORE can another replica write, so only then is the store re-read,
+    every _RECHECK_SECONDS; in process memory the event is all there is to wait for.
+    """
+    recheck = _RECHECK_SECONDS if is_shared(_store.backend) else None
+    deadline = time.monotonic() + timeout
+    while True:
+        event = _changes.get(view_id)
+        if event is None:
+            event = _changes[view_id] = asyncio.Event()
+        # Read after taking the event, so a write between the two still wakes the wait.
+        state = await _load(view_id)
+        remaining = deadline - time.monotonic()
+        if state is None or state.version != since_version or remaining <= 0:
+            return
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(event.wait(), timeout=remaining if recheck is None else min(remaining, recheck))
 
 
 async def read_and_consume(view_id: str) -> ViewerState:
@@ -45,35 +106,36 @@ async def read_and_consume(view_id: str) -> ViewerState:
     The clear does NOT bump the version (so it can't re-trigger a poll), and the returned
     snapshot still carries the command values for this one delivery. Re-issuing the command
     re-sets the field and bumps the version, so it fires again.
+
+    The clear is compare-and-set: if a mutation lands in between, the state is re-read so
+    the mutation is neither overwritten nor its new command swallowed undelivered.
     """
-    data = await _store.get(key=view_id, collection=_COL)
-    if not data:
-        return ViewerState(view_id=view_id)
-    state = ViewerState.model_validate(data)
-    if state.go_to_page != -1 or state.request_fullscreen:
-        snapshot = state.model_copy()
-        state.go_to_page = -1
-        state.request_fullscreen = False
-        await _store.put(key=view_id, value=state.model_dump(), collection=_COL, ttl=_TTL)
-        return snapshot
+    for _ in range(_CAS_ATTEMPTS):
+        state = await _load(view_id)
+        if state is None:
+            return ViewerState(view_id=view_id)
+        if state.go_to_page == -1 and not state.request_fullscreen:
+            return state
+        if await _store.compare_and_set(view_id, state.model_dump() | _ONE_SHOT, revision=state._revision) is not None:
+            return state
+    # Lost every race to mutations: deliver the latest snapshot; the next poll clears it.
     return state
 
 
 async def get_active_state() -> ViewerState:
     """Get the current session's viewer state. Raises LookupError if no viewer is open."""
     session = _session_key()
-    view_id = _latest_view_by_session.get(session, "")
+    view_id = await _active_view_id(session)
     if not view_id:
         raise LookupError("No viewer is open.")
-    data = await _store.get(key=view_id, collection=_COL)
-    if not data:
+    state = await _load(view_id)
+    if state is None:
         # The view's stored state expired (TTL) or was evicted. Don't resurrect a blank
         # default here — a mutation tool would persist it and report false success. Drop
-        # the now-dangling session pointer (also keeps this dict from accumulating) and
-        # signal that no viewer is open.
-        _latest_view_by_session.pop(session, None)
+        # the now-dangling session pointer and signal that no viewer is open.
+        await _active_views.delete(_pointer_key(session))
         raise LookupError("No viewer is open.")
-    return ViewerState.model_validate(data)
+    return state
 
 
 async def require_state(view_id: str) -> ViewerState:
@@ -83,10 +145,10 @@ async def require_state(view_id: str) -> ViewerState:
     invents an empty state — so a mutation tool handed a stale/unknown view_id fails
     loudly instead of persisting a blank state and reporting false success.
     """
-    data = await _store.get(key=view_id, collection=_COL)
-    if not data:
+    state = await _load(view_id)
+    if state is None:
         raise LookupError("No viewer is open.")
-    return ViewerState.model_validate(data)
+    return state
 
 
 async def resolve_state(view_id: str | None) -> ViewerState:
@@ -104,9 +166,33 @@ async def resolve_state(view_id: str | None) -> ViewerState:
 
 
 async def put_state(state: ViewerState) -> dict:
-    """Bump version, persist, and track as this session's latest. Returns dict for structuredContent."""
-    state.version += 1
+    """Bump version, persist, and track as this session's latest. Returns dict for structuredContent.
+
+    The write is compare-and-set against the revision the state was loaded at. If the
+    view changed since (a poll consumed a command, another tool mutated it), the fields
+    this caller changed are re-applied on top of the latest stored state.
+
+    Raises:
+        StateConflictError: If the view kept changing for every attempt.
+    """
     data = state.model_dump()
-    await _store.put(key=state.view_id, value=data, collection=_COL, ttl=_TTL)
-    _latest_view_by_session[_session_key()] = state.view_id
+    changes = {field: value for field, value in data.items() if field != "version" and state._stored.get(field, ...) != value}
+    revision = state._revision
+    for _ in range(_CAS_ATTEMPTS):
+        data["version"] = max(state.version, data["version"]) + 1
+        new_revision = await _store.compare_and_set(state.view_id, data, revision=revision)
+        if new_revision is not None:
+            break
+        latest = await _store.load(state.view_id)
+        revision = latest.revision if latest is not None else 0
+        data = latest.value | changes if latest is not None else state.model_dump()
+    else:
+        raise StateConflictError(f"View {state.view_id} kept changing; try again.")
+
+    state.version = data["version"]
+    state._revision = new_revision
+    state._stored = data
+    if (event := _changes.pop(state.view_id, None)) is not None:
+        event.set()
+    await _active_views.put(_pointer_key(_session_key()), {"view_id": state.view_id})
     return data
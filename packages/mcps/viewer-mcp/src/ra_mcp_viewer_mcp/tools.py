@@ -19,13 +19,16 @@ from ra_mcp_viewer_mcp.fetchers import build_page_data, fetch_and_parse_text_lay
 from ra_mcp_viewer_mcp.formatter import build_summary, error_result, text_result
 from ra_mcp_viewer_mcp.models import ViewerState
 from ra_mcp_viewer_mcp.resolve import bild_resolve_document, browse_resolve_document, manifest_resolve_document, validate_url_pairs
-from ra_mcp_viewer_mcp.state import put_state, read_and_consume, resolve_state
+from ra_mcp_viewer_mcp.search_index import SearchIndex, get_index
+from ra_mcp_viewer_mcp.state import put_state, read_and_consume, resolve_state, wait_for_change
 
 
 logger = logging.getLogger("ra_mcp.viewer.tools")
 
 DIST_DIR = Path(__file__).parent / "dist"
 RESOURCE_URI = "ui://document-viewer/mcp-app.html"
+# Longest get_viewer_state long-poll; stays under common MCP host tool-call timeouts.
+MAX_WAIT_SECONDS = 55
 
 # Origins the sandboxed viewer iframe may load images from (IIIF scans + ALTO).
 # Declaring them lets the browser fetch size-bounded IIIF images directly rather
@@ -311,7 +314,15 @@ async def view_bild(
 )
 async def get_viewer_state(
     view_id: Annotated[str, Field(description="View ID from the initial tool result.")],
+    since_version: Annotated[int | None, Field(description="Version the viewer already shows; with wait_seconds, wait for a newer one.")] = None,
+    wait_seconds: Annotated[
+        float, Field(description="Long-poll: wait up to this many seconds for the state to move past since_version.", ge=0, le=MAX_WAIT_SECONDS)
+    ] = 0,
 ) -> ToolResult:
+    # Long-poll: answer as soon as a mutation bumps the version instead of the viewer
+    # re-polling every few seconds.
+    if since_version is not None and wait_seconds > 0:
+        await wait_for_change(view_id, since_version, wait_seconds)
     # read_and_consume clears one-shot commands (go_to_page/request_fullscreen) so the
     # client applies them exactly once and a later unrelated mutation can't re-fire them.
     state = await read_and_consume(view_id)
@@ -556,16 +567,43 @@ async def load_thumbnails(
     )
 
 
+async def _build_search_index(text_layer_urls: list[str]) -> SearchIndex:
+    """Fetch every page's text layer (6 at a time) and index its lines."""
+    index = SearchIndex(urls=tuple(text_layer_urls))
+    sem = asyncio.Semaphore(6)
+
+    async def _index_page(page_index: int, url: str) -> None:
+        if not url or not url.startswith(("http://", "https://")):
+            return
+        async with sem:
+            try:
+                text_layer = await fetch_and_parse_text_layer(url)
+            except Exception as e:
+                logger.warning("search_all_pages: failed to fetch page %d: %s", page_index, e)
+                index.complete = False
+                return
+        index.add_page(page_index, text_layer)
+
+    async with asyncio.TaskGroup() as tg:
+        for i, url in enumerate(text_layer_urls):
+            tg.create_task(_index_page(i, url))
+    return index
+
+
 @mcp.tool(
     name="search_all_pages",
-    description="Search for a term across all document pages. Returns match counts per page.",
+    description="Search for a term across all document pages. Returns match counts and matching line ids per page.",
     app=AppConfig(resource_uri=RESOURCE_URI, visibility=["app"]),  # AppConfig: pydantic populate_by_name
 )
 async def search_all_pages(
     text_layer_urls: Annotated[list[str], "List of text layer XML URLs to search across."],
     term: Annotated[str, "The search term to find in page transcriptions."],
 ) -> ToolResult:
-    """Search all pages concurrently and return per-page match counts."""
+    """Return per-page match counts and matching line ids.
+
+    The first search over a page list fetches and indexes every page (see
+    search_index); later searches over the same pages are index lookups.
+    """
     if not term or not term.strip():
         mark_span_error("No search term provided.", error_type="validation")
         return ToolResult(
@@ -573,33 +611,10 @@ async def search_all_pages(
             structured_content={"pageMatches": [], "totalMatches": 0},
         )
 
-    term_lower = term.strip().lower()
-    sem = asyncio.Semaphore(6)
-
-    async def _search_page(page_index: int, url: str) -> dict | None:
-        if not url or not url.startswith(("http://", "https://")):
-            return None
-        async with sem:
-            try:
-                text_layer = await fetch_and_parse_text_layer(url)
-            except Exception as e:
-                logger.warning("search_all_pages: failed to fetch page %d: %s", page_index, e)
-                return None
-            count = 0
-            for line in text_layer.get("textLines", []):
-                transcription = line.get("transcription", "")
-                if term_lower in transcription.lower():
-                    count += 1
-            if count > 0:
-                return {"pageIndex": page_index, "matchCount": count}
-            return None
-
-    async with asyncio.TaskGroup() as tg:
-        tasks = [tg.create_task(_search_page(i, url)) for i, url in enumerate(text_layer_urls)]
-
-    page_matches = [r for t in tasks if (r := t.result()) is not None]
-    page_matches.sort(key=lambda m: m["pageIndex"])
-    total_matches = sum(m["matchCount"] for m in page_matches)
+    index = await get_index(text_layer_urls, _build_search_index)
+    matches = index.search(term)
+    page_matches = [{"pageIndex": page_index, "matchCount": len(line_ids), "lineIds": line_ids} for page_index, line_ids in matches.items()]
+    total_matches = sum(len(line_ids) for line_ids in matches.values())
 
     pages_with_matches = len(page_matches)
     summary = f"Found {total_matches} match{'es' if total_matches != 1 else ''} across {pages_with_matches} page{'s' if pages_with_matches != 1 else ''}."
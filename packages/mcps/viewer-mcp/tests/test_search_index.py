@@ -0,0 +1,115 @@
+"""Tests for the per-view search index behind search_all_pages."""
+
+import asyncio
+from collections import OrderedDict
+
+import pytest
+
+import ra_mcp_viewer_mcp.search_index as _index_mod
+from ra_mcp_viewer_mcp.search_index import SearchIndex, get_index
+
+
+def _layer(*lines: str) -> dict:
+    return {"textLines": [{"id": f"l{n}", "transcription": text} for n, text in enumerate(lines)]}
+
+
+@pytest.fixture()
+def index() -> SearchIndex:
+    index = SearchIndex(urls=("a", "b"))
+    index.add_page(0, _layer("Anders Persson i Mommouth", "Kyrkoherde", "anders  persson"))
+    index.add_page(1, _layer("Persson, Anders", "Mommouth socken", "ANDERS PERSSONS änka"))
+    return index
+
+
+@pytest.mark.parametrize(
+    "term",
+    ["anders", "Mommouth", "son", "persson,", "anders persson", "s persson i mom", "änka", "Anders Persson i Mommouth", "nothing", "persson anders"],
+)
+def test_search_matches_a_substring_scan(index, term):
+    scan = {
+        page: [f"l{n}" for n, text in enumerate(texts) if term.lower() in text]
+        for page, texts in index.line_texts.items()
+        if any(term.lower() in text for text in texts)
+    }
+    assert index.search(term) == scan
+
+
+def test_one_word_searches_are_memoized(index):
+    assert index.search("anders") == index.search("ANDERS")
+    assert list(index._memo) == ["anders"]
+
+
+async def test_concurrent_first_searches_share_one_build(monkeypatch):
+    monkeypatch.setattr(_index_mod, "_indexes", OrderedDict())
+    builds = 0
+
+    async def build(urls: list[str]) -> SearchIndex:
+        nonlocal builds
+        builds += 1
+        await asyncio.sleep(0.01)
+        return SearchIndex(urls=tuple(urls))
+
+    first, second = await asyncio.gather(get_index(["a"], build), get_index(["a"], build))
+    assert first is second
+    assert await get_index(["a"], build) is first
+    assert builds == 1
+
+
+async def test_a_cancelled_search_does_not_cancel_the_shared_build(monkeypatch):
+    monkeypatch.setattr(_index_mod, "_indexes", OrderedDict())
+    builds = 0
+
+    async def build(urls: list[str]) -> SearchIndex:
+        nonlocal builds
+        builds += 1
+        await asyncio.sleep(0.05)
+        return SearchIndex(urls=tuple(urls))
+
+    first = asyncio.create_task(get_index(["a"], build))
+    second = asyncio.create_task(get_index(["a"], build))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    index = await second
+    assert first.cancelled()
+    assert await get_index(["a"], build) is index  # cached by the build itself
+    assert builds == 1
+
+
+async def test_indexes_are_bounded_and_expire(monkeypatch):
+    monkeypatch.setattr(_index_mod, "_indexes", OrderedDict())
+    monkeypatch.setattr(_index_mod, "MAX_INDEXES", 2)
+
+    async def build(urls: list[str]) -> SearchIndex:
+        return SearchIndex(urls=tuple(urls))
+
+    for url in ("a", "b", "c"):
+        await get_index([url], build)
+    assert [index.urls for _, index in _index_mod._indexes.values()] == [("b",), ("c",)]
+
+    monkeypatch.setattr(_index_mod, "_TTL", -1)
+    fresh = await get_index(["c"], build)
+    assert _index_mod._indexes[_index_mod.index_key(["c"])][1] is fresh
+    assert len(_index_mod._indexes) == 2
+
+
+async def test_incomplete_indexes_are_not_kept(monkeypatch):
+    monkeypatch.setattr(_index_mod, "_indexes", OrderedDict())
+
+    async def build(urls: list[str]) -> SearchIndex:
+        return SearchIndex(urls=tuple(urls), complete=False)
+
+    await get_index(["a"], build)
+    assert not _index_mod._indexes
+
+
+async def test_invalidating_a_text_layer_drops_indexes_that_contain_it(monkeypatch):
+    monkeypatch.setattr(_index_mod, "_indexes", OrderedDict())
+
+    async def build(urls: list[str]) -> SearchIndex:
+        return SearchIndex(urls=tuple(urls))
+
+    await get_index(["https://x/1.xml", "https://x/2.xml"], build)
+    await get_index(["https://y/1.xml"], build)
+    assert _index_mod._invalidate_indexes("https://x/2.xml") == 1
+    assert _index_mod._index_cache_stats().entries == 1
@@ -1,13 +1,18 @@
 """Integration tests for MCP tools using FastMCP's in-memory test client."""
 
+import asyncio
+from collections import OrderedDict
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastmcp import Client
+from key_value.aio.stores.memory import MemoryStore
 
+import ra_mcp_viewer_mcp.search_index as _index_mod
 import ra_mcp_viewer_mcp.state as _state_mod
 from ra_mcp_browse_lib.models import BrowseResult, PageContext
+from ra_mcp_common.state_store import StateStore
 from ra_mcp_viewer_mcp import viewer_mcp as mcp
 
 
@@ -15,10 +20,16 @@ FIXTURES = Path(__file__).resolve().parent / "fixtures"
 
 
 @pytest.fixture(autouse=True)
-def _reset_viewer_state():
-    _state_mod._latest_view_by_session.clear()
-    yield
-    _state_mod._latest_view_by_session.clear()
+def _reset_viewer_state(monkeypatch):
+    backend = MemoryStore()
+    monkeypatch.setattr(_state_mod, "_store", StateStore(backend, _state_mod._COL, ttl=_state_mod._TTL))
+    monkeypatch.setattr(_state_mod, "_active_views", StateStore(backend, "viewer_session", ttl=_state_mod._TTL))
+    monkeypatch.setattr(_index_mod, "_indexes", OrderedDict())
+
+
+def _lose_session_pointers() -> None:
+    """Forget every session's active-view pointer, as a transport without stable sessions does."""
+    _state_mod._active_views = StateStore(MemoryStore(), "viewer_session")
 
 
 FAKE_IMAGE_URL = "https://lbiiif.riksarkivet.se/arkis!R0001203_00007/full/1500,/0/default.jpg"
@@ -171,6 +182,22 @@ async def test_get_viewer_state_returns_version(mock_fetchers):
         assert result.structured_content["reference_code"] == "SE/RA/310187/1"
 
 
+async def test_get_viewer_state_long_poll_returns_on_change(mock_fetchers):
+    async with Client(mcp) as client:
+        doc = await client.call_tool("view_document", {"reference_code": "SE/RA/310187/1", "pages": "7"})
+        view_id = doc.structured_content["view_id"]
+        poll_args = {"view_id": view_id, "since_version": 1, "wait_seconds": 30}
+
+        poll = asyncio.create_task(client.call_tool("get_viewer_state", poll_args))
+        await asyncio.sleep(0.1)
+        assert not poll.done()  # nothing changed yet: the call is held open
+        await client.call_tool("viewer_set_highlight", {"highlight_term": "trolldom", "view_id": view_id})
+        result = await asyncio.wait_for(poll, timeout=2)
+
+    assert result.structured_content["version"] == 2
+    assert result.structured_content["highlight_term"] == "trolldom"
+
+
 async def test_get_viewer_state_updates_on_view_document_urls(mock_fetchers):
     async with Client(mcp) as client:
         doc = await client.call_tool(
@@ -322,7 +349,7 @@ async def test_resolve_state_prefers_view_id_over_session_pointer():
     from ra_mcp_viewer_mcp.state import get_active_state, put_state, require_state, resolve_state
 
     await put_state(ViewerState(view_id="vid-abc", image_urls=["u"]))
-    _state_mod._latest_view_by_session.clear()  # simulate the transport losing the session pointer
+    _lose_session_pointers()  # simulate the transport losing the session pointer
 
     with pytest.raises(LookupError):
         await get_active_state()  # the old path — reproduces "No viewer is open"
@@ -344,7 +371,7 @@ async def test_mutation_with_view_id_survives_session_loss(mock_fetchers):
         view_id = doc.structured_content["view_id"]
         assert f"view_id: {view_id}" in doc.content[0].text  # surfaced so the model can pass it back
 
-        _state_mod._latest_view_by_session.clear()  # deployed transport: pointer not shared across calls
+        _lose_session_pointers()  # deployed transport: pointer not shared across calls
 
         no_id = await client.call_tool("viewer_go_to_page", {"page": 1})
         assert "no viewer" in no_id.content[0].text.lower()  # reproduces the reported bug
@@ -360,7 +387,7 @@ async def test_set_highlight_with_view_id_survives_session_loss(mock_fetchers):
     async with Client(mcp) as client:
         doc = await client.call_tool("view_document", {"reference_code": "SE/RA/310187/1", "pages": "7"})
         view_id = doc.structured_content["view_id"]
-        _state_mod._latest_view_by_session.clear()
+        _lose_session_pointers()
 
         ok = await client.call_tool("viewer_set_highlight", {"highlight_term": "trolldom", "view_id": view_id})
         assert not ok.is_error
@@ -550,6 +577,20 @@ async def test_search_all_pages_returns_matches(mock_fetchers):
         assert m["matchCount"] > 0
 
 
+async def test_search_all_pages_indexes_pages_once(mock_fetchers, alto_text_layer):
+    """Repeat searches over the same pages are index lookups that return line ids to highlight."""
+    urls = ["https://example.com/alto1.xml", "https://example.com/alto2.xml"]
+    expected = [line["id"] for line in alto_text_layer["textLines"] if "mommouth" in line["transcription"].lower()]
+
+    async with Client(mcp) as client:
+        first = await client.call_tool("search_all_pages", {"text_layer_urls": urls, "term": "Mommouth"})
+        second = await client.call_tool("search_all_pages", {"text_layer_urls": urls, "term": "mommo"})
+
+    assert mock_fetchers["text_layer"].await_count == 2  # one fetch per page, for the first search only
+    assert first.structured_content == second.structured_content
+    assert [m["lineIds"] for m in first.structured_content["pageMatches"]] == [expected, expected]
+
+
 async def test_search_all_pages_no_matches(mock_fetchers):
     """Searching for a term not in the fixture should return zero matches."""
     async with Client(mcp) as client:
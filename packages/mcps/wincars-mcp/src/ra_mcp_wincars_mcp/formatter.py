@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
 from ra_mcp_common.formatting import append_if
+from ra_mcp_dataset_lib import RenderRecord, format_results, register_display_renderers
+from ra_mcp_wincars_lib.config import WINCARS_TABLE
 from ra_mcp_wincars_lib.models import TYP_DISPLAY
 from ra_mcp_wincars_lib.search_operations import SearchResult
 
@@ -15,7 +18,7 @@ _STATUS_DISPLAY: dict[str, str] = {
 }
 
 
-def _format_wincars_record(rec: dict[str, Any], lines: list[str]) -> None:
+def _format_wincars_record(rec: Mapping[str, Any], lines: list[str]) -> None:
     """Format a single Wincars record into lines."""
     nreg = rec.get("nreg", "?")
     lines.append(f"--- {nreg} ---")
@@ -58,23 +61,16 @@ def _format_wincars_record(rec: dict[str, Any], lines: list[str]) -> None:
 
 def format_wincars_results(result: SearchResult) -> str:
     """Format Wincars search results as plain text for MCP/LLM consumption."""
-    if not result.records:
-        if result.offset > 0:
-            return f"No more Wincars results for '{result.keyword}' at offset {result.offset}. Total found: {result.total_hits}"
-        return f"No Wincars results found for '{result.keyword}'."
+    return format_results(
+        result,
+        label="Wincars",
+        render_record=_format_wincars_record,
+        tip="Tip: Use view_document with the archive reference code to see the original registration card.",
+    )
 
-    lines: list[str] = []
-    lines.append(f"Wincars search results for '{result.keyword}': showing {len(result.records)} of {result.total_hits} records (offset {result.offset})")
-    lines.append("")
-
-    for rec in result.records:
-        _format_wincars_record(rec, lines)
-
-    next_offset = result.offset + result.limit
-    if next_offset < result.total_hits:
-        lines.append(f"More results available. Use offset={next_offset} to see the next page.")
 
-    lines.append("")
-    lines.append("Tip: Use view_document with the archive reference code to see the original registration card.")
-
-    return "\n".join(lines)
+# Table name -> render_record for stored display text; see ra_mcp_dataset_lib.register_display_renderers.
+DISPLAY_RENDERERS: dict[str, RenderRecord] = {
+    WINCARS_TABLE: _format_wincars_record,
+}
+register_display_renderers(DISPLAY_RENDERERS)
@@ -16,7 +16,9 @@ from urllib.request import urlopen
 
 import lancedb
 
+from ra_mcp_aktiebolag_lib.config import BOLAG_TABLE, STYRELSE_TABLE
 from ra_mcp_aktiebolag_lib.ingest import ingest_aktiebolag
+from ra_mcp_aktiebolag_mcp.formatter import DISPLAY_RENDERERS
 
 
 DEFAULT_OUTPUT = Path("data/aktiebolag")
@@ -71,7 +73,13 @@ def main() -> None:
         styrelse_path = _find_file(extracted, "STYRELSEMEDLEMMAR.txt")
 
         print(f"Ingesting Aktiebolag from {bolag_path} + {styrelse_path} ...")
-        bolag_table, styrelse_table = ingest_aktiebolag(db, bolag_path, styrelse_path)
+        bolag_table, styrelse_table = ingest_aktiebolag(
+            db,
+            bolag_path,
+            styrelse_path,
+            render_bolag=DISPLAY_RENDERERS[BOLAG_TABLE],
+            render_styrelse=DISPLAY_RENDERERS[STYRELSE_TABLE],
+        )
         print(f"  -> bolag: {bolag_table.count_rows()} rows")
         print(f"  -> styrelse: {styrelse_table.count_rows()} rows")
 
@@ -16,7 +16,9 @@ from urllib.request import urlopen
 
 import lancedb
 
+from ra_mcp_court_lib.config import DOMBOKSREGISTER_TABLE, MEDELSTAD_TABLE
 from ra_mcp_court_lib.ingest import ingest_domboksregister, ingest_medelstad
+from ra_mcp_court_mcp.formatter import DISPLAY_RENDERERS
 
 
 DEFAULT_OUTPUT = Path("data/court")
@@ -77,7 +79,7 @@ def main() -> None:
         paragraf_csv = _find_csv(extracted, "Paragraf.csv")
 
         print(f"Ingesting Domboksregister from {person_csv} + {paragraf_csv} ...")
-        domboks_table = ingest_domboksregister(db, person_csv, paragraf_csv)
+        domboks_table = ingest_domboksregister(db, person_csv, paragraf_csv, render_record=DISPLAY_RENDERERS[DOMBOKSREGISTER_TABLE])
         print(f"  -> {domboks_table.count_rows()} rows")
 
         # --- Medelstad ---
@@ -88,7 +90,7 @@ def main() -> None:
         maal_csv = _find_csv(extracted, "maal.csv")
 
         print(f"Ingesting Medelstad from {personposter_csv} + {maal_csv} ...")
-        medelstad_table = ingest_medelstad(db, personposter_csv, maal_csv)
+        medelstad_table = ingest_medelstad(db, personposter_csv, maal_csv, render_record=DISPLAY_RENDERERS[MEDELSTAD_TABLE])
         print(f"  -> {medelstad_table.count_rows()} rows")
 
     print(f"\nDone! Tables at: {output_path}")
@@ -16,7 +16,9 @@ from urllib.request import urlopen
 
 import lancedb
 
+from ra_mcp_dds_lib.config import DODA_TABLE, FODELSE_TABLE, VIGSEL_TABLE
 from ra_mcp_dds_lib.ingest import ingest_doda, ingest_fodelse, ingest_vigsel
+from ra_mcp_dds_mcp.formatter import DISPLAY_RENDERERS
 
 
 DEFAULT_OUTPUT = Path("data/dds")
@@ -69,7 +71,7 @@ def main() -> None:
         if fodelse_dir is None:
             fodelse_dir = download_and_extract_zip(FODELSE_ZIP_URL, tmp_path, "fodelse")
         print(f"Ingesting F\u00f6delse from {fodelse_dir} ...")
-        fodelse_table = ingest_fodelse(db, fodelse_dir)
+        fodelse_table = ingest_fodelse(db, fodelse_dir, render_record=DISPLAY_RENDERERS[FODELSE_TABLE])
         print(f"  \u2192 {fodelse_table.count_rows()} rows")
 
         # --- Döda table ---
@@ -77,7 +79,7 @@ def main() -> None:
         if doda_dir is None:
             doda_dir = download_and_extract_zip(DODA_ZIP_URL, tmp_path, "doda")
         print(f"Ingesting D\u00f6da from {doda_dir} ...")
-        doda_table = ingest_doda(db, doda_dir)
+        doda_table = ingest_doda(db, doda_dir, render_record=DISPLAY_RENDERERS[DODA_TABLE])
         print(f"  \u2192 {doda_table.count_rows()} rows")
 
         # --- Vigsel table ---
@@ -85,7 +87,7 @@ def main() -> None:
         if vigsel_dir is None:
             vigsel_dir = download_and_extract_zip(VIGSEL_ZIP_URL, tmp_path, "vigsel")
         print(f"Ingesting Vigsel from {vigsel_dir} ...")
-        vigsel_table = ingest_vigsel(db, vigsel_dir)
+        vigsel_table = ingest_vigsel(db, vigsel_dir, render_record=DISPLAY_RENDERERS[VIGSEL_TABLE])
         print(f"  \u2192 {vigsel_table.count_rows()} rows")
 
     print(f"\nDone! Tables at: {output_path}")
@@ -16,7 +16,9 @@ from urllib.request import urlopen
 
 import lancedb
 
+from ra_mcp_faltjagare_lib.config import FALTJAGARE_TABLE
 from ra_mcp_faltjagare_lib.ingest import ingest_faltjagare
+from ra_mcp_faltjagare_mcp.formatter import DISPLAY_RENDERERS
 
 
 DEFAULT_OUTPUT = Path("data/faltjagare")
@@ -62,7 +64,7 @@ def main() -> None:
         if csv_path is None:
             csv_path = download_faltjagare(tmp_path)
         print(f"Ingesting Fältjägare from {csv_path} ...")
-        table = ingest_faltjagare(db, csv_path)
+        table = ingest_faltjagare(db, csv_path, render_record=DISPLAY_RENDERERS[FALTJAGARE_TABLE])
         print(f"  \u2192 {table.count_rows()} rows")
 
     print(f"\nDone! Table at: {output_path}")
@@ -16,7 +16,9 @@ from urllib.request import urlopen
 
 import lancedb
 
+from ra_mcp_filmcensur_lib.config import FILMREG_TABLE
 from ra_mcp_filmcensur_lib.ingest import ingest_filmreg
+from ra_mcp_filmcensur_mcp.formatter import DISPLAY_RENDERERS
 
 
 DEFAULT_OUTPUT = Path("data/filmcensur")
@@ -64,7 +66,7 @@ def main() -> None:
         if filmreg_path is None:
             filmreg_path = download_filmreg(tmp_path)
         print(f"Ingesting Filmreg from {filmreg_path} ...")
-        filmreg_table = ingest_filmreg(db, filmreg_path)
+        filmreg_table = ingest_filmreg(db, filmreg_path, render_record=DISPLAY_RENDERERS[FILMREG_TABLE])
         print(f"  \u2192 {filmreg_table.count_rows()} rows")
 
     print(f"\nDone! Table at: {output_path}")
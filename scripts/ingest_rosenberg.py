@@ -15,7 +15,9 @@ from urllib.request import urlopen
 
 import lancedb
 
+from ra_mcp_rosenberg_lib.config import ROSENBERG_TABLE
 from ra_mcp_rosenberg_lib.ingest import ingest_rosenberg
+from ra_mcp_rosenberg_mcp.formatter import DISPLAY_RENDERERS
 
 
 DEFAULT_OUTPUT = Path("data/rosenberg")
@@ -52,7 +54,7 @@ def main() -> None:
         if csv_path is None:
             csv_path = download_rosenberg(tmp_path)
         print(f"Ingesting Rosenberg from {csv_path} ...")
-        table = ingest_rosenberg(db, csv_path)
+        table = ingest_rosenberg(db, csv_path, render_record=DISPLAY_RENDERERS[ROSENBERG_TABLE])
         print(f"  \u2192 {table.count_rows()} rows")
 
     print(f"\nDone! Table at: {output_path}")
@@ -15,7 +15,9 @@ from urllib.request import urlopen
 
 import lancedb
 
+from ra_mcp_sbl_lib.config import SBL_TABLE
 from ra_mcp_sbl_lib.ingest import ingest_sbl
+from ra_mcp_sbl_mcp.formatter import DISPLAY_RENDERERS
 
 
 DEFAULT_OUTPUT = Path("data/sbl")
@@ -53,7 +55,7 @@ def main() -> None:
             sbl_path = tmp_path / "sbl.csv"
             download_sbl(sbl_path)
         print(f"Ingesting SBL from {sbl_path} ...")
-        sbl_table = ingest_sbl(db, sbl_path)
+        sbl_table = ingest_sbl(db, sbl_path, render_record=DISPLAY_RENDERERS[SBL_TABLE])
         print(f"  → {sbl_table.count_rows()} rows")
 
     print(f"\nDone! Table at: {output_path}")
@@ -16,7 +16,9 @@ from urllib.request import urlopen
 
 import lancedb
 
+from ra_mcp_sj_lib.config import FIRA_TABLE, JUDA_TABLE
 from ra_mcp_sj_lib.ingest import ingest_juda, ingest_ritningar
+from ra_mcp_sj_mcp.formatter import DISPLAY_RENDERERS
 
 
 DEFAULT_OUTPUT = Path("data/sj")
@@ -81,7 +83,7 @@ def main() -> None:
         csv_dir = jda_files[0].parent
 
         print(f"Ingesting JUDA from {csv_dir} ...")
-        juda_table = ingest_juda(db, csv_dir)
+        juda_table = ingest_juda(db, csv_dir, render_record=DISPLAY_RENDERERS[JUDA_TABLE])
         print(f"  -> {juda_table.count_rows()} rows")
 
         # --- FIRA ---
@@ -130,7 +132,7 @@ def main() -> None:
                     pass
 
         print(f"Ingesting drawings from {fira_csv} + {sira_csv_dir} ...")
-        ritningar_table = ingest_ritningar(db, fira_csv, sira_csv_dir, dkod_path=dkod_path, sakg_path=sakg_path)
+        ritningar_table = ingest_ritningar(db, fira_csv, sira_csv_dir, dkod_path=dkod_path, sakg_path=sakg_path, render_record=DISPLAY_RENDERERS[FIRA_TABLE])
         print(f"  -> {ritningar_table.count_rows()} rows")
 
     print(f"\nDone! Tables at: {output_path}")
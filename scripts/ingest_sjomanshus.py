@@ -16,7 +16,9 @@ from urllib.request import urlopen
 
 import lancedb
 
+from ra_mcp_sjomanshus_lib.config import LIGGARE_TABLE, MATRIKEL_TABLE
 from ra_mcp_sjomanshus_lib.ingest import ingest_liggare, ingest_matrikel
+from ra_mcp_sjomanshus_mcp.formatter import DISPLAY_RENDERERS
 
 
 DEFAULT_OUTPUT = Path("data/sjomanshus")
@@ -79,12 +81,12 @@ def main() -> None:
 
         # Ingest Liggare
         print(f"Ingesting Liggare from {liggare_path} ...")
-        liggare_table = ingest_liggare(db, liggare_path)
+        liggare_table = ingest_liggare(db, liggare_path, render_record=DISPLAY_RENDERERS[LIGGARE_TABLE])
         print(f"  → {liggare_table.count_rows()} rows")
 
         # Ingest Matrikel
         print(f"Ingesting Matrikel from {matrikel_path} ...")
-        matrikel_table = ingest_matrikel(db, matrikel_path)
+        matrikel_table = ingest_matrikel(db, matrikel_path, render_record=DISPLAY_RENDERERS[MATRIKEL_TABLE])
         print(f"  → {matrikel_table.count_rows()} rows")
 
     print(f"\nDone! Tables at: {output_path}")
@@ -15,6 +15,7 @@ from urllib.request import urlopen
 
 import lancedb
 
+from ra_mcp_specialsok_lib.config import FANGRULLOR_TABLE, FLYGVAPEN_TABLE, KURHUSET_TABLE, PRESS_TABLE, VIDEO_TABLE
 from ra_mcp_specialsok_lib.ingest import (
     ingest_fangrullor,
     ingest_flygvapen,
@@ -22,6 +23,7 @@ from ra_mcp_specialsok_lib.ingest import (
     ingest_press,
     ingest_video,
 )
+from ra_mcp_specialsok_mcp.formatter import DISPLAY_RENDERERS
 
 
 DEFAULT_OUTPUT = Path("data/specialsok")
@@ -73,24 +75,24 @@ def main() -> None:
     db = lancedb.connect(output_path)
 
     datasets = [
-        ("Flygvapenhaverier", FLYGVAPEN_URL, ingest_flygvapen),
-        ("Fångrullor", FANGRULLOR_URL, ingest_fangrullor),
-        ("Kurhuset", KURHUSET_URL, ingest_kurhuset),
-        ("Presskonferenser", PRESS_URL, ingest_press),
-        ("Videobutiker", VIDEO_URL, ingest_video),
+        ("Flygvapenhaverier", FLYGVAPEN_URL, ingest_flygvapen, FLYGVAPEN_TABLE),
+        ("Fångrullor", FANGRULLOR_URL, ingest_fangrullor, FANGRULLOR_TABLE),
+        ("Kurhuset", KURHUSET_URL, ingest_kurhuset, KURHUSET_TABLE),
+        ("Presskonferenser", PRESS_URL, ingest_press, PRESS_TABLE),
+        ("Videobutiker", VIDEO_URL, ingest_video, VIDEO_TABLE),
     ]
 
     with tempfile.TemporaryDirectory() as tmp:
         tmp_path = Path(tmp)
 
-        for name, url, ingest_fn in datasets:
+        for name, url, ingest_fn, table_name in datasets:
             dataset_dir = tmp_path / name.lower()
             dataset_dir.mkdir()
             try:
                 extracted = _download_and_extract(url, dataset_dir)
                 csv_file = _find_csv(extracted)
                 print(f"Ingesting {name} from {csv_file} ...")
-                table = ingest_fn(db, csv_file)
+                table = ingest_fn(db, csv_file, render_record=DISPLAY_RENDERERS[table_name])
                 print(f"  -> {table.count_rows()} rows")
             except Exception as exc:
                 print(f"  ERROR ingesting {name}: {exc}")
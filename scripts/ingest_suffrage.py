@@ -16,7 +16,9 @@ from urllib.request import urlopen
 
 import lancedb
 
+from ra_mcp_suffrage_lib.config import FKPR_TABLE, ROSTRATT_TABLE
 from ra_mcp_suffrage_lib.ingest import ingest_fkpr, ingest_rostratt
+from ra_mcp_suffrage_mcp.formatter import DISPLAY_RENDERERS
 
 
 DEFAULT_OUTPUT = Path("data/suffrage")
@@ -77,7 +79,7 @@ def main() -> None:
         if rostratt_dir is None:
             rostratt_dir = download_and_extract_rostratt(tmp_path)
         print(f"Ingesting Rösträtt from {rostratt_dir} ...")
-        rostratt_table = ingest_rostratt(db, rostratt_dir)
+        rostratt_table = ingest_rostratt(db, rostratt_dir, render_record=DISPLAY_RENDERERS[ROSTRATT_TABLE])
         print(f"  \u2192 {rostratt_table.count_rows()} rows")
 
         # FKPR
@@ -85,7 +87,7 @@ def main() -> None:
         if fkpr_path is None:
             fkpr_path = download_fkpr(tmp_path)
         print(f"Ingesting FKPR from {fkpr_path} ...")
-        fkpr_table = ingest_fkpr(db, fkpr_path)
+        fkpr_table = ingest_fkpr(db, fkpr_path, render_record=DISPLAY_RENDERERS[FKPR_TABLE])
         print(f"  \u2192 {fkpr_table.count_rows()} rows")
 
     print(f"\nDone! Tables at: {output_path}")
@@ -16,7 +16,9 @@ from urllib.request import urlopen
 
 import lancedb
 
+from ra_mcp_wincars_lib.config import WINCARS_TABLE
 from ra_mcp_wincars_lib.ingest import ingest_wincars
+from ra_mcp_wincars_mcp.formatter import DISPLAY_RENDERERS
 
 
 DEFAULT_OUTPUT = Path("data/wincars")
@@ -65,7 +67,7 @@ def main() -> None:
             csv_dir = download_and_extract_zip(WINCARS_ZIP_URL, tmp_path)
 
         print(f"Ingesting Wincars from {csv_dir} ...")
-        table = ingest_wincars(db, csv_dir)
+        table = ingest_wincars(db, csv_dir, render_record=DISPLAY_RENDERERS[WINCARS_TABLE])
         print(f"  \u2192 {table.count_rows()} rows")
 
     print(f"\nDone! Table at: {output_path}")
@@ -6,11 +6,13 @@ and the CLI entry point.
 """
 
 from importlib.metadata import version
+from typing import TYPE_CHECKING
 
 
 __version__ = version("ra-mcp")
 
-from .server import main, main_server, run_server, setup_server
+if TYPE_CHECKING:
+    from .server import main, main_server, run_server, setup_server
 
 
 __all__ = [
@@ -19,3 +21,13 @@ __all__ = [
     "run_server",
     "setup_server",
 ]
+
+
+def __getattr__(name: str) -> object:
+    # Resolved on first access so that `ra search` / `ra browse` do not import
+    # the server (fastmcp and the module registry) just to load the package.
+    if name in __all__:
+        from . import server
+
+        return getattr(server, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
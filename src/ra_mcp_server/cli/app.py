@@ -73,6 +73,10 @@ def serve(
         typer.Option("--list-modules", help="List available modules and exit"),
     ] = False,
     verbose: Annotated[bool, typer.Option("-v", "--verbose", help="Enable verbose logging")] = False,
+    workers: Annotated[
+        int,
+        typer.Option(min=1, help="Server processes behind the HTTP port, with MCP session affinity and shared caches (needs --port)"),
+    ] = 1,
 ) -> None:
     """Start the MCP server.
 
@@ -84,6 +88,7 @@ def serve(
         ra serve --modules search,browse      # Start with only search and browse
         ra serve --list-modules               # List available modules
         ra serve --port 7860 --log            # HTTP server with API logging
+        ra serve --port 7860 --workers 4      # HTTP server with 4 worker processes
     """
     from ..server import AVAILABLE_MODULES, run_server
 
@@ -96,6 +101,10 @@ def serve(
         console.print()
         return
 
+    if workers > 1 and not port:
+        console.print("[red]--workers needs the HTTP transport: add --port[/red]")
+        raise typer.Exit(code=2)
+
     if log:
         os.environ["RA_MCP_LOG_API"] = "1"
         console.print("[dim]API logging enabled - check ra_mcp_api.log[/dim]")
@@ -108,7 +117,10 @@ def serve(
     if modules:
         console.print(f"[dim]Enabled modules: {modules}[/dim]")
 
-    run_server(http=port is not None, port=port or 7860, host=host, verbose=verbose, modules=modules)
+    if workers > 1:
+        console.print(f"[dim]Workers: {workers}[/dim]")
+
+    run_server(http=port is not None, port=port or 7860, host=host, verbose=verbose, modules=modules, workers=workers)
 
 
 @app.callback()
@@ -0,0 +1,300 @@
+"""
+Response cache for the idempotent search/browse tools.
+
+Wraps FastMCP's ``ResponseCachingMiddleware`` so that calls which differ only in
+ways the tool ignores share one cache entry. The cache key is built from
+normalized arguments; the tool itself still runs with the arguments as sent.
+
+Normalization:
+
+- telemetry-only arguments (``research_context``) are dropped,
+- omitted arguments are filled in from the tool's schema defaults,
+- string values have surrounding whitespace stripped and inner runs collapsed,
+- strings for parameters the schema documents as case-insensitive are casefolded,
+- keys are sorted.
+
+Calls whose ``dedup`` argument resolves to True depend on what the session has
+already been shown, so their key also carries the MCP session id: one session's
+stubs are never served to another.
+
+Expired entries can be served stale for a grace period while a background call
+refreshes them (stale-while-revalidate), and the hottest keys can be refreshed
+before they expire. Neither applies to session-keyed (dedup) calls: refreshing
+one would record pages as seen in a session that never saw them, so an expired
+dedup entry is a miss.
+
+Every lookup is counted per tool (``ra_mcp.response_cache.lookups`` with
+``cache.outcome`` = hit/stale/miss), so the hit ratio and stale serves can be
+followed per tool.
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+import mcp.types
+import pydantic_core
+from fastmcp.server.dependencies import get_access_token
+from fastmcp.server.middleware import CallNext, MiddlewareContext
+from fastmcp.server.middleware.caching import ONE_MB_IN_BYTES, CachableToolResult, ResponseCachingMiddleware
+from fastmcp.tools.base import ToolResult
+from key_value.aio.adapters.pydantic import PydanticAdapter
+from key_value.aio.protocols.key_value import AsyncEnumerateKeysProtocol, AsyncKeyValue
+from key_value.aio.wrappers.limit_size import LimitSizeWrapper
+
+from ra_mcp_common.cache_registry import CacheStats, matching_keys
+from ra_mcp_common.telemetry import get_meter
+from ra_mcp_server.tiered_store import TieredStore
+
+
+logger = logging.getLogger("ra_mcp.response_cache")
+
+_meter = get_meter("ra_mcp.response_cache")
+_lookup_counter = _meter.create_counter("ra_mcp.response_cache.lookups", unit="{lookup}", description="Response cache lookups per tool (hit, miss)")
+
+# Arguments that only feed logs/spans and never change a tool's output.
+TELEMETRY_ONLY_ARGUMENTS = frozenset({"research_context"})
+# Argument that makes a tool's output depend on the calling session's seen pages.
+SESSION_DEDUP_ARGUMENT = "dedup"
+
+_WHITESPACE = re.compile(r"\s+")
+
+_COLLECTION = "tools/call"
+# Per-key hit counts (for hot-key refresh and the admin report) are pruned past this size.
+_MAX_TRACKED_KEYS = 1024
+
+
+def _is_case_insensitive(spec: Mapping[str, Any] | None) -> bool:
+    """Whether a parameter's schema documents it as matched case-insensitively."""
+    return spec is not None and "case-insensitive" in spec.get("description", "").lower()
+
+
+def normalize_arguments(arguments: Mapping[str, Any] | None, schema: Mapping[str, Any] | None = None) -> dict[str, Any]:
+    """Canonical form of tool-call arguments, used only to build the cache key.
+
+    Args:
+        arguments: Arguments as sent by the client.
+        schema: The tool's JSON input schema, for defaults and case-insensitivity.
+            Without it only whitespace is normalized and telemetry arguments dropped.
+
+    Returns:
+        A new dict with sorted keys.
+    """
+    properties: Mapping[str, Any] = (schema or {}).get("properties", {})
+    normalized = {name: spec["default"] for name, spec in properties.items() if "default" in spec}
+    normalized.update(arguments or {})
+
+    canonical: dict[str, Any] = {}
+    for name in sorted(normalized):
+        if name in TELEMETRY_ONLY_ARGUMENTS:
+            continue
+        value = normalized[name]
+        if isinstance(value, str):
+            value = _WHITESPACE.sub(" ", value).strip()
+            if _is_case_insensitive(properties.get(name)):
+                value = value.casefold()
+        canonical[name] = value
+    return canonical
+
+
+def cache_key(tool_name: str, arguments: Mapping[str, Any], session_id: str | None = None) -> str:
+    """``<tool>:<digest>`` for a call, partitioned by the caller's access token (like FastMCP's own keys).
+
+    The tool-name prefix lets ``/admin/caches`` invalidate one tool with ``<tool>:*``.
+    A *session_id* further partitions the key to that session.
+    """
+    token = get_access_token()
+    partition = hashlib.sha256(token.token.encode()).hexdigest() if token is not None else "__anonymous__"
+    if session_id is not None:
+        partition = f"{partition}:{session_id}"
+    digest = hashlib.sha256(f"{partition}:{tool_name}:{pydantic_core.to_json(arguments, fallback=str).decode()}".encode()).hexdigest()
+    return f"{tool_name}:{digest}"
+
+
+def _dedup_session(context: MiddlewareContext[Any], arguments: Mapping[str, Any]) -> str | None:
+    """The calling session's id when the call dedups against it (``dedup`` resolves to True), else None."""
+    if arguments.get(SESSION_DEDUP_ARGUMENT) is not True or context.fastmcp_context is None:
+        return None
+    return context.fastmcp_context.session_id
+
+
+class NormalizingResponseCache(ResponseCachingMiddleware):
+    """``ResponseCachingMiddleware`` for *tools*, keyed on normalized arguments, with stale-while-revalidate.
+
+    An entry is fresh for ``ttl`` seconds and then stale for another
+    ``stale_ttl``. A stale entry is served at once while one background call
+    per key refreshes it; after that it is gone and the next call waits for
+    the tool. With ``refresh_top`` > 0 the most-hit keys are also refreshed
+    ahead of time: a fresh hit in the last ``refresh_ahead`` fraction of its
+    TTL starts the same background refresh.
+
+    Args:
+        cache_storage: Key-value store backing the cache.
+        tools: Names of the tools to cache; every other call passes straight through.
+        ttl: Seconds an entry is served as fresh.
+        stale_ttl: Seconds after ``ttl`` an entry may still be served while it is refreshed.
+        refresh_top: How many of the most-hit keys to refresh ahead of expiry (0 = off).
+        refresh_ahead: Fraction of ``ttl`` before expiry in which hot keys are refreshed.
+        max_item_size: Results larger than this (bytes, serialized) are not cached.
+    """
+
+    def __init__(
+        self,
+        cache_storage: AsyncKeyValue,
+        *,
+        tools: Iterable[str],
+        ttl: float,
+        stale_ttl: float = 0,
+        refresh_top: int = 0,
+        refresh_ahead: float = 0.2,
+        max_item_size: int = ONE_MB_IN_BYTES,
+    ):
+        self.tools = frozenset(tools)
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.refresh_top = refresh_top
+        self.refresh_ahead = refresh_ahead
+        # Tool calls are handled below; the base class still caches the list/read/get methods.
+        super().__init__(cache_storage=cache_storage, max_item_size=max_item_size)
+        self._calls: PydanticAdapter[CachableToolResult] = PydanticAdapter(
+            key_value=LimitSizeWrapper(key_value=cache_storage, max_size=max_item_size, raise_on_too_large=False),
+            pydantic_model=CachableToolResult,
+            default_collection=_COLLECTION,
+        )
+        self._storage = cache_storage
+        self._schemas: dict[str, Mapping[str, Any] | None] = {}
+        self._lookups: dict[str, Counter[str]] = {}
+        self._key_hits: Counter[str] = Counter()
+        self._key_labels: dict[str, str] = {}
+        self._refreshing: dict[str, asyncio.Task[None]] = {}
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mcp.types.CallToolRequestParams],
+        call_next: CallNext[mcp.types.CallToolRequestParams, ToolResult],
+    ) -> ToolResult:
+        tool_name = context.message.name
+        if tool_name not in self.tools:
+            return await call_next(context)
+
+        arguments = normalize_arguments(context.message.arguments, await self._schema(context))
+        session_id = _dedup_session(context, arguments)
+        key = cache_key(tool_name, arguments, session_id)
+        cached, remaining = await self._calls.ttl(key)
+        stale = remaining is not None and remaining <= self.stale_ttl
+        # A background refresh would replay a finished request in its session,
+        # recording pages as seen that nobody was shown; such calls run in the foreground.
+        if cached is None or (stale and session_id is not None):
+            self._count(tool_name, "miss")
+            result = await call_next(context)
+            await self._store(key, result)
+            return result
+
+        self._note_hit(key, f"{tool_name} {pydantic_core.to_json(arguments, fallback=str).decode()}")
+        if stale:
+            self._count(tool_name, "stale")
+            self._refresh(key, context, call_next)
+        else:
+            self._count(tool_name, "hit")
+            if session_id is None and remaining is not None and remaining - self.stale_ttl <= self.ttl * self.refresh_ahead and self._is_hot(key):
+                self._refresh(key, context, call_next)
+        return cached.unwrap()
+
+    async def _store(self, key: str, result: ToolResult) -> None:
+        await self._calls.put(key=key, value=CachableToolResult.wrap(result), ttl=self.ttl + self.stale_ttl)
+
+    def _refresh(
+        self,
+        key: str,
+        context: MiddlewareContext[mcp.types.CallToolRequestParams],
+        call_next: CallNext[mcp.types.CallToolRequestParams, ToolResult],
+    ) -> None:
+        """Re-run the tool for *key* in the background, unless a refresh is already running."""
+        if key in self._refreshing:
+            return
+
+        async def refresh() -> None:
+            try:
+                await self._store(key, await call_next(context))
+            except Exception as exc:
+                logger.warning("Background refresh of %s failed: %s: %s", context.message.name, type(exc).__name__, exc)
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.create_task(refresh())
+
+    def _is_hot(self, key: str) -> bool:
+        """Whether *key* is among the ``refresh_top`` most-hit keys."""
+        if self.refresh_top <= 0:
+            return False
+        return any(hot == key for hot, _ in self._key_hits.most_common(self.refresh_top))
+
+    def _note_hit(self, key: str, label: str) -> None:
+        """Count a hit on *key*, keeping only the hottest keys once too many are tracked."""
+        self._key_hits[key] += 1
+        self._key_labels[key] = label
+        if len(self._key_hits) > _MAX_TRACKED_KEYS:
+            self._key_hits = Counter(dict(self._key_hits.most_common(_MAX_TRACKED_KEYS // 4)))
+            self._key_labels = {k: self._key_labels[k] for k in self._key_hits}
+
+    async def wait_for_refreshes(self) -> None:
+        """Wait until every background refresh started so far has finished."""
+        while self._refreshing:
+            await asyncio.gather(*self._refreshing.values())
+
+    async def _schema(self, context: MiddlewareContext[Any]) -> Mapping[str, Any] | None:
+        """The input schema of the called tool, looked up once per tool name."""
+        name = context.message.name
+        if name not in self._schemas:
+            tool = await context.fastmcp_context.fastmcp.get_tool(name) if context.fastmcp_context is not None else None
+            self._schemas[name] = tool.parameters if tool is not None else None
+            if tool is None:
+                logger.debug("No schema for cached tool %s; keying without defaults", name)
+        return self._schemas[name]
+
+    def _count(self, tool_name: str, outcome: str) -> None:
+        self._lookups.setdefault(tool_name, Counter())[outcome] += 1
+        _lookup_counter.add(1, {"tool.name": tool_name, "cache.outcome": outcome})
+
+    def lookups(self, tool_name: str) -> dict[str, int]:
+        """Lookups for *tool_name* since startup by outcome: ``hit``, ``stale`` and ``miss``."""
+        counts = self._lookups.get(tool_name, Counter())
+        return {outcome: counts[outcome] for outcome in ("hit", "stale", "miss")}
+
+    def hit_ratio(self, tool_name: str) -> float | None:
+        """Fraction of *tool_name* lookups served from the cache (fresh or stale), or None before the first call."""
+        counts = self.lookups(tool_name)
+        total = sum(counts.values())
+        return (counts["hit"] + counts["stale"]) / total if total else None
+
+    # -- /admin/caches ----------------------------------------------------------
+
+    async def cache_stats(self) -> CacheStats:
+        """Registry snapshot: entries and tier counters from the store, lookups from this middleware."""
+        keys = await self._keys()
+        hits = sum(c["hit"] + c["stale"] for c in self._lookups.values())
+        misses = sum(c["miss"] for c in self._lookups.values())
+        top_keys = [{"key": key, "hits": n, "call": self._key_labels[key]} for key, n in self._key_hits.most_common(10)]
+        stats = CacheStats(entries=len(keys), hits=hits, misses=misses, top_keys=top_keys)
+        if isinstance(self._storage, TieredStore):
+            tiers = self._storage.statistics()
+            stats.bytes = sum(tier["bytes"] for tier in tiers.values())
+            stats.evictions = sum(tier["evictions"] for tier in tiers.values())
+        return stats
+
+    async def invalidate(self, pattern: str | None = None) -> int:
+        """Drop cached tool results whose key matches *pattern* (``<tool>:*`` for one tool)."""
+        keys = matching_keys(await self._keys(), pattern)
+        for key in keys:
+            self._key_hits.pop(key, None)
+            self._key_labels.pop(key, None)
+        return await self._storage.delete_many(keys=keys, collection=_COLLECTION) if keys else 0
+
+    async def _keys(self) -> list[str]:
+        if not isinstance(self._storage, AsyncEnumerateKeysProtocol):
+            return list(self._key_hits)
+        return await self._storage.keys(collection=_COLLECTION)
@@ -1,245 +1,181 @@
 import argparse
 import atexit
+import hmac
+import importlib
+import importlib.util
 import logging
 import os
 import sys
+import time
 from pathlib import Path
-from typing import cast
+from typing import Any, cast
 
 from fastmcp import FastMCP
 from fastmcp.server.providers import FastMCPProvider
 from fastmcp.server.providers.skills import SkillsDirectoryProvider
 from mcp.types import Icon
+from starlette.requests import Request
 from starlette.responses import FileResponse, JSONResponse
 
-from ra_mcp_browse_mcp.tools import browse_mcp
+from ra_mcp_common.cache_registry import cache_stats, invalidate_cache, register_cache, registered_caches
 from ra_mcp_common.settings import settings
-from ra_mcp_guide_mcp.tools import guide_mcp
-from ra_mcp_htr_mcp.tools import htr_mcp
-from ra_mcp_pdf_mcp import pdf_mcp
-
-# Import available modules (lazy imports handled in setup)
-from ra_mcp_search_mcp.tools import search_mcp
 from ra_mcp_server.telemetry import init_telemetry, shutdown_telemetry
-from ra_mcp_viewer_mcp import viewer_mcp
 
 
-# Registry of available modules
-AVAILABLE_MODULES = {
+# Registry of available modules. "server" is the import path of the module's
+# FastMCP instance ("package.module:attribute"); the module is only imported when
+# it is enabled (see load_module_server), so `ra serve --modules search` never
+# pays for lancedb, gradio_client or the Label Studio SDK.
+AVAILABLE_MODULES: dict[str, dict[str, Any]] = {
     "search": {
-        "server": search_mcp,
+        "server": "ra_mcp_search_mcp.tools:search_mcp",
         "description": "Search transcribed historical documents with advanced query syntax",
         "default": True,
     },
     "browse": {
-        "server": browse_mcp,
+        "server": "ra_mcp_browse_mcp.tools:browse_mcp",
         "description": "View full page transcriptions by reference code",
         "default": True,
     },
     "guide": {
-        "server": guide_mcp,
+        "server": "ra_mcp_guide_mcp.tools:guide_mcp",
         "description": "Access historical documentation and archival guides",
         "default": True,
     },
     "htr": {
-        "server": htr_mcp,
+        "server": "ra_mcp_htr_mcp.tools:htr_mcp",
         "description": "Transcribe handwritten documents using HTRflow",
         "default": True,
     },
     "viewer": {
-        "server": viewer_mcp,
+        "server": "ra_mcp_viewer_mcp:viewer_mcp",
         "description": "Interactive document viewer with zoomable images and text layer overlays",
         "default": True,
         "no_namespace": True,
     },
     "pdf": {
-        "server": pdf_mcp,
+        "server": "ra_mcp_pdf_mcp:pdf_mcp",
         "description": "Interactive PDF viewer with search, annotations, and PDF.js rendering",
         "default": True,
         "no_namespace": True,
     },
 }
 
-# label-mcp is optional (requires glibc for opencv-python-headless via label-studio-sdk)
-try:
-    from ra_mcp_label_mcp.tools import label_mcp
-
-    AVAILABLE_MODULES["label"] = {
-        "server": label_mcp,
+# Optional modules are listed when their package is installed. "requires" names
+# further packages that must be importable; lancedb has limited platform wheels
+# and the Label Studio SDK needs glibc (opencv-python-headless).
+_OPTIONAL_MODULES: dict[str, dict[str, Any]] = {
+    "label": {
+        "server": "ra_mcp_label_mcp.tools:label_mcp",
         "description": "Import pages to Label Studio for human annotation and feedback",
         "default": True,
-    }
-except ImportError:
-    pass
-
-# diplomatics-mcp is optional (requires lancedb which has limited platform wheels)
-try:
-    from ra_mcp_diplomatics_mcp import diplomatics_mcp
-
-    AVAILABLE_MODULES["diplomatics"] = {
-        "server": diplomatics_mcp,
+        "requires": ("label_studio_sdk",),
+    },
+    "diplomatics": {
+        "server": "ra_mcp_diplomatics_mcp:diplomatics_mcp",
         "description": "Search SDHK medieval charters and MPO parchment fragments",
         "default": True,
-    }
-except ImportError:
-    pass
-
-# sbl-mcp is optional (requires lancedb which has limited platform wheels)
-try:
-    from ra_mcp_sbl_mcp import sbl_mcp
-
-    AVAILABLE_MODULES["sbl"] = {
-        "server": sbl_mcp,
+        "requires": ("lancedb",),
+    },
+    "sbl": {
+        "server": "ra_mcp_sbl_mcp:sbl_mcp",
         "description": "Search Svenskt biografiskt lexikon (Swedish Biographical Lexicon)",
         "default": True,
         "no_namespace": True,
-    }
-except ImportError:
-    pass
-
-# sjomanshus-mcp is optional (requires lancedb which has limited platform wheels)
-try:
-    from ra_mcp_sjomanshus_mcp import sjomanshus_mcp
-
-    AVAILABLE_MODULES["sjomanshus"] = {
-        "server": sjomanshus_mcp,
+        "requires": ("lancedb",),
+    },
+    "sjomanshus": {
+        "server": "ra_mcp_sjomanshus_mcp:sjomanshus_mcp",
         "description": "Search Swedish seamen's house records (voyages and registrations)",
         "default": True,
-    }
-except ImportError:
-    pass
-
-# filmcensur-mcp is optional (requires lancedb which has limited platform wheels)
-try:
-    from ra_mcp_filmcensur_mcp import filmcensur_mcp
-
-    AVAILABLE_MODULES["filmcensur"] = {
-        "server": filmcensur_mcp,
+        "requires": ("lancedb",),
+    },
+    "filmcensur": {
+        "server": "ra_mcp_filmcensur_mcp:filmcensur_mcp",
         "description": "Search Swedish film censorship records 1911-2011 (60K films)",
         "default": True,
-    }
-except ImportError:
-    pass
-
-# rosenberg-mcp is optional (requires lancedb which has limited platform wheels)
-try:
-    from ra_mcp_rosenberg_mcp import rosenberg_mcp
-
-    AVAILABLE_MODULES["rosenberg"] = {
-        "server": rosenberg_mcp,
+        "requires": ("lancedb",),
+    },
+    "rosenberg": {
+        "server": "ra_mcp_rosenberg_mcp:rosenberg_mcp",
         "description": "Search Rosenberg's geographical lexicon of Sweden (66K historical places)",
         "default": True,
-    }
-except ImportError:
-    pass
-
-# court-mcp is optional (requires lancedb which has limited platform wheels)
-try:
-    from ra_mcp_court_mcp import court_mcp
-
-    AVAILABLE_MODULES["court"] = {
-        "server": court_mcp,
+        "requires": ("lancedb",),
+    },
+    "court": {
+        "server": "ra_mcp_court_mcp:court_mcp",
         "description": "Search Swedish court records (Domboksregister 1611-1730, Medelstad 1668-1750)",
         "default": True,
-    }
-except ImportError:
-    pass
-
-# aktiebolag-mcp is optional (requires lancedb which has limited platform wheels)
-try:
-    from ra_mcp_aktiebolag_mcp import aktiebolag_mcp
-
-    AVAILABLE_MODULES["aktiebolag"] = {
-        "server": aktiebolag_mcp,
+        "requires": ("lancedb",),
+    },
+    "aktiebolag": {
+        "server": "ra_mcp_aktiebolag_mcp:aktiebolag_mcp",
         "description": "Search Swedish joint-stock companies 1901-1935 (12.5K companies, 49K board members)",
         "default": True,
-    }
-except ImportError:
-    pass
-
-# faltjagare-mcp is optional (requires lancedb which has limited platform wheels)
-try:
-    from ra_mcp_faltjagare_mcp import faltjagare_mcp
-
-    AVAILABLE_MODULES["faltjagare"] = {
-        "server": faltjagare_mcp,
+        "requires": ("lancedb",),
+    },
+    "faltjagare": {
+        "server": "ra_mcp_faltjagare_mcp:faltjagare_mcp",
         "description": "Search Jämtland field regiment soldier records 1645-1901 (43K soldiers)",
         "default": True,
-    }
-except ImportError:
-    pass
-
-# suffrage-mcp is optional (requires lancedb which has limited platform wheels)
-try:
-    from ra_mcp_suffrage_mcp import suffrage_mcp
-
-    AVAILABLE_MODULES["suffrage"] = {
-        "server": suffrage_mcp,
+        "requires": ("lancedb",),
+    },
+    "suffrage": {
+        "server": "ra_mcp_suffrage_mcp:suffrage_mcp",
         "description": "Search women's suffrage records (Rösträtt petition 1913-1914, FKPR association 1911-1920)",
         "default": True,
-    }
-except ImportError:
-    pass
-
-# specialsok-mcp is optional (requires lancedb which has limited platform wheels)
-try:
-    from ra_mcp_specialsok_mcp import specialsok_mcp
-
-    AVAILABLE_MODULES["specialsok"] = {
-        "server": specialsok_mcp,
+        "requires": ("lancedb",),
+    },
+    "specialsok": {
+        "server": "ra_mcp_specialsok_mcp:specialsok_mcp",
         "description": "Search Specialsök datasets (flygvapen, fångrullor, kurhuset, press, video)",
         "default": True,
-    }
-except ImportError:
-    pass
-
-# dds-mcp is optional (requires lancedb which has limited platform wheels)
-try:
-    from ra_mcp_dds_mcp import dds_mcp
-
-    AVAILABLE_MODULES["dds"] = {
-        "server": dds_mcp,
+        "requires": ("lancedb",),
+    },
+    "dds": {
+        "server": "ra_mcp_dds_mcp:dds_mcp",
         "description": "Search Swedish church records (DDS) — births, deaths, marriages from 1600s-1900s (2.5M records)",
         "default": True,
-    }
-except ImportError:
-    pass
-
-# wincars-mcp is optional (requires lancedb which has limited platform wheels)
-try:
-    from ra_mcp_wincars_mcp import wincars_mcp
-
-    AVAILABLE_MODULES["wincars"] = {
-        "server": wincars_mcp,
+        "requires": ("lancedb",),
+    },
+    "wincars": {
+        "server": "ra_mcp_wincars_mcp:wincars_mcp",
         "description": "Search Norrland vehicle registration records 1916-1972 (1.5M vehicles across 5 counties)",
         "default": True,
-    }
-except ImportError:
-    pass
-
-# sj-mcp is optional (requires lancedb which has limited platform wheels)
-try:
-    from ra_mcp_sj_mcp import sj_mcp
-
-    AVAILABLE_MODULES["sj"] = {
-        "server": sj_mcp,
+        "requires": ("lancedb",),
+    },
+    "sj": {
+        "server": "ra_mcp_sj_mcp:sj_mcp",
         "description": "Search SJ railway records — properties (198K JUDA) and technical drawings (118K FIRA/SIRA)",
         "default": True,
-    }
-except ImportError:
-    pass
-
-# tora-mcp is optional
-try:
-    from ra_mcp_tora_mcp import tora_mcp
-
-    AVAILABLE_MODULES["tora"] = {
-        "server": tora_mcp,
+        "requires": ("lancedb",),
+    },
+    "tora": {
+        "server": "ra_mcp_tora_mcp:tora_mcp",
         "description": "Geocode historical Swedish places via TORA (51K settlements with coordinates)",
         "default": True,
-    }
-except ImportError:
-    pass
+    },
+}
+
+
+def _installed(config: dict[str, Any]) -> bool:
+    """Whether a module's package and its ``requires`` can be imported, without importing them."""
+    package = config["server"].split(":")[0].split(".")[0]
+    return all(importlib.util.find_spec(name) is not None for name in (package, *config.get("requires", ())))
+
+
+AVAILABLE_MODULES.update({name: config for name, config in _OPTIONAL_MODULES.items() if _installed(config)})
+
+
+def load_module_server(module_name: str) -> FastMCP:
+    """Import module *module_name* and return its FastMCP server.
+
+    Raises:
+        KeyError: If *module_name* is not in ``AVAILABLE_MODULES``.
+        ImportError: If the module or one of its dependencies cannot be imported.
+    """
+    module_path, _, attribute = AVAILABLE_MODULES[module_name]["server"].partition(":")
+    return cast(FastMCP, getattr(importlib.import_module(module_path), attribute))
 
 
 def setup_logging() -> logging.Logger:
@@ -439,42 +375,50 @@ def _add_response_cache(server: FastMCP) -> None:
     """Attach a scoped response cache for the idempotent search/browse tools.
 
     Off via ``RA_MCP_CACHE_ENABLED=false``. TTL from ``RA_MCP_CACHE_TTL`` (default
-    300s). Storage is in-memory unless ``RA_MCP_CACHE_DIR`` names a directory, in
-    which case a persistent DiskStore is used (survives restarts). Only
+    300s). Entries live in a memory LRU of ``RA_MCP_CACHE_MEMORY_MB`` (default 64);
+    when ``RA_MCP_CACHE_DIR`` names a directory, a disk tier of up to
+    ``RA_MCP_CACHE_DISK_MB`` (default 1024) sits behind it and survives restarts
+    (see :mod:`ra_mcp_server.tiered_store`). For ``RA_MCP_CACHE_STALE_TTL``
+    seconds after expiry (default 300) an entry is served stale while it is
+    refreshed in the background; ``RA_MCP_CACHE_REFRESH_TOP=N`` also refreshes
+    the N most-hit entries shortly before they expire. Only
     :data:`CACHEABLE_TOOLS` are cached — every stateful/App tool is untouched.
+    Keys are built from normalized arguments (see :mod:`ra_mcp_server.response_cache`).
     """
     if os.getenv("RA_MCP_CACHE_ENABLED", "true").strip().lower() in {"false", "0", "no"}:
         return
 
-    from fastmcp.server.middleware.caching import CallToolSettings, ResponseCachingMiddleware
+    from ra_mcp_server.response_cache import NormalizingResponseCache
+    from ra_mcp_server.tiered_store import TieredStore
 
     ttl = int(os.getenv("RA_MCP_CACHE_TTL", "300"))
     cache_dir = os.getenv("RA_MCP_CACHE_DIR")
-    if cache_dir:
-        from key_value.aio.stores.disk import DiskStore
-
-        storage = DiskStore(directory=cache_dir)
-    else:
-        from key_value.aio.stores.memory import MemoryStore
-
-        storage = MemoryStore()
+    storage = TieredStore(
+        memory_bytes=int(os.getenv("RA_MCP_CACHE_MEMORY_MB", "64")) << 20,
+        directory=cache_dir or None,
+        disk_bytes=int(os.getenv("RA_MCP_CACHE_DISK_MB", "1024")) << 20,
+    )
 
-    server.add_middleware(
-        ResponseCachingMiddleware(
-            cache_storage=storage,
-            call_tool_settings=CallToolSettings(included_tools=list(CACHEABLE_TOOLS), ttl=ttl),
-        )
+    response_cache = NormalizingResponseCache(
+        storage,
+        tools=CACHEABLE_TOOLS,
+        ttl=ttl,
+        stale_ttl=int(os.getenv("RA_MCP_CACHE_STALE_TTL", "300")),
+        refresh_top=int(os.getenv("RA_MCP_CACHE_REFRESH_TOP", "0")),
     )
-    logger.info("Response cache enabled (ttl=%ds, store=%s, tools=%d)", ttl, "disk" if cache_dir else "memory", len(CACHEABLE_TOOLS))
+    server.add_middleware(response_cache)
+    register_cache("response", stats=response_cache.cache_stats, invalidate=response_cache.invalidate)
+    logger.info("Response cache enabled (ttl=%ds, store=%s, tools=%d)", ttl, "memory+disk" if cache_dir else "memory", len(CACHEABLE_TOOLS))
 
 
 def setup_server(server: FastMCP, enabled_modules: list[str]) -> None:
     """Setup server composition using explicit providers.
 
-    Each module's FastMCP sub-server is wrapped in a FastMCPProvider and
-    registered with a namespace. This gives the same behaviour as mount()
-    while exposing the provider layer for future transforms and visibility
-    control.
+    Each enabled module is imported here (see ``load_module_server``) and its
+    FastMCP sub-server is wrapped in a FastMCPProvider and registered with a
+    namespace. This gives the same behaviour as mount() while exposing the
+    provider layer for future transforms and visibility control. A module that
+    fails to import is logged and skipped.
 
     Args:
         server: The FastMCP server instance to configure.
@@ -490,11 +434,16 @@ def setup_server(server: FastMCP, enabled_modules: list[str]) -> None:
             continue
 
         module_config = AVAILABLE_MODULES[module_name]
-        module_server = cast(FastMCP, module_config["server"])
+        started = time.perf_counter()
+        try:
+            module_server = load_module_server(module_name)
+        except ImportError as e:
+            logger.error("✗ Failed to import %s: %s", module_name, e)
+            continue
         try:
             namespace = "" if module_config.get("no_namespace") else module_name
             server.add_provider(FastMCPProvider(module_server), namespace=namespace)
-            logger.info("✓ Registered %s (namespace=%s)", module_server.name, namespace or "(none)")
+            logger.info("✓ Registered %s (namespace=%s, loaded in %.0f ms)", module_server.name, namespace or "(none)", (time.perf_counter() - started) * 1000)
             _mounted_modules.append(module_name)
         except Exception as e:
             logger.error("✗ Failed to register %s: %s", module_name, e)
@@ -534,6 +483,37 @@ def setup_custom_routes(server: FastMCP) -> None:
             return JSONResponse({"status": "ready", "modules": _mounted_modules})
         return JSONResponse({"status": "not ready", "modules": []}, status_code=503)
 
+    @server.custom_route("/admin/caches", methods=["GET"])
+    async def admin_caches(request: Request) -> JSONResponse:
+        if (denied := _check_admin(request)) is not None:
+            return denied
+        return JSONResponse({name: (await cache_stats(name)).as_dict() for name in registered_caches()})
+
+    @server.custom_route("/admin/caches/{name}", methods=["GET", "DELETE"])
+    async def admin_cache(request: Request) -> JSONResponse:
+        """One cache's statistics (GET), or invalidation (DELETE, optional ``?key=`` exact key or ``prefix*``)."""
+        if (denied := _check_admin(request)) is not None:
+            return denied
+        name = request.path_params["name"]
+        if name not in registered_caches():
+            return JSONResponse({"error": f"unknown cache {name!r}", "caches": registered_caches()}, status_code=404)
+        if request.method == "DELETE":
+            return JSONResponse({"cache": name, "removed": await invalidate_cache(name, request.query_params.get("key"))})
+        return JSONResponse((await cache_stats(name)).as_dict())
+
+
+def _check_admin(request: Request) -> JSONResponse | None:
+    """Reject admin requests unless ``RA_MCP_ADMIN_TOKEN`` is set and sent as a Bearer token.
+
+    Without a configured token the admin routes behave as if they did not exist.
+    """
+    if settings.admin_token is None:
+        return JSONResponse({"error": "not found"}, status_code=404)
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), settings.admin_token.get_secret_value().encode()):
+        return JSONResponse({"error": "unauthorized"}, status_code=401, headers={"WWW-Authenticate": "Bearer"})
+    return None
+
 
 def run_server(
     *,
@@ -542,6 +522,8 @@ def run_server(
     host: str = "0.0.0.0",
     verbose: bool = False,
     modules: str | None = None,
+    workers: int = 1,
+    uds: str | None = None,
 ) -> None:
     """Run the MCP server with the given configuration.
 
@@ -551,10 +533,9 @@ def run_server(
         host: Host for HTTP transport.
         verbose: Enable verbose logging.
         modules: Comma-separated list of modules to enable.
+        workers: Number of server processes behind the HTTP port (see ``ra_mcp_server.workers``).
+        uds: Listen on this Unix socket instead of host:port (used by the worker processes).
     """
-    init_telemetry()
-    atexit.register(shutdown_telemetry)
-
     global main_server
 
     if verbose:
@@ -562,6 +543,17 @@ def run_server(
         logging.getLogger().setLevel(logging.DEBUG)
         logger.debug("Verbose logging enabled")
 
+    if workers > 1:
+        if not http:
+            raise ValueError("Multiple workers need the HTTP transport")
+        from ra_mcp_server.workers import run_workers
+
+        run_workers(workers, host=host, port=port, modules=modules, verbose=verbose)
+        return
+
+    init_telemetry()
+    atexit.register(shutdown_telemetry)
+
     default_modules = [name for name, info in AVAILABLE_MODULES.items() if info["default"]]
     enabled_modules = [m.strip() for m in modules.split(",") if m.strip()] if modules else default_modules
 
@@ -571,7 +563,10 @@ def run_server(
     setup_custom_routes(main_server)
     setup_server(main_server, enabled_modules)
 
-    if http:
+    if http and uds:
+        logger.info("Starting Riksarkivet MCP HTTP/SSE server on unix:%s", uds)
+        main_server.run(transport="streamable-http", host=host, port=port, path="/mcp", uvicorn_config={"uds": uds})
+    elif http:
         logger.info("Starting Riksarkivet MCP HTTP/SSE server on http://%s:%d", host, port)
         main_server.run(transport="streamable-http", host=host, port=port, path="/mcp")
     else:
@@ -591,9 +586,11 @@ def main() -> None:
     parser.add_argument("--host", default="0.0.0.0", help="Host for HTTP transport (default: 0.0.0.0)")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
     parser.add_argument("--modules", type=str, default=None, help="Comma-separated list of modules to enable")
+    parser.add_argument("--workers", type=int, default=1, help="Server processes behind the HTTP port, with MCP session affinity (default: 1)")
+    parser.add_argument("--uds", default=None, help="Listen on this Unix socket instead of host:port")
     args = parser.parse_args()
 
-    run_server(http=args.http, port=args.port, host=args.host, verbose=args.verbose, modules=args.modules)
+    run_server(http=args.http, port=args.port, host=args.host, verbose=args.verbose, modules=args.modules, workers=args.workers, uds=args.uds)
 
 
 if __name__ == "__main__":
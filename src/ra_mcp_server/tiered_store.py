@@ -0,0 +1,233 @@
+"""
+Two-tier key-value store for the response cache.
+
+L1 is an in-process LRU bounded by the serialized size of its entries; L2 is an
+optional diskcache directory with its own byte limit (least-recently-used
+eviction, per-entry TTL). Writes go to both tiers, reads try L1 then L2, and an
+L2 hit is promoted into L1. Entries larger than the whole L1 budget live on disk
+only.
+
+Per tier it counts hits, misses and evictions (``ra_mcp.response_cache.tier.*``
+metrics plus :meth:`TieredStore.statistics`) and tracks the bytes held.
+
+L2 is SQLite plus files, so every L2 call runs in a worker thread, off the event
+loop. Its entry count and volume are read once after each write or delete and
+kept, which is what the eviction count and ``statistics`` are computed from.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Literal
+
+from diskcache import Cache
+from key_value.aio.stores.base import BaseEnumerateKeysStore, ManagedEntry
+
+from ra_mcp_common.telemetry import get_meter
+
+
+logger = logging.getLogger("ra_mcp.tiered_store")
+
+type Tier = Literal["l1", "l2"]
+
+_meter = get_meter("ra_mcp.response_cache")
+_lookup_counter = _meter.create_counter("ra_mcp.response_cache.tier.lookups", unit="{lookup}", description="Cache tier lookups (hit, miss)")
+_eviction_counter = _meter.create_counter("ra_mcp.response_cache.tier.evictions", unit="{entry}", description="Entries evicted from a cache tier")
+_bytes_counter = _meter.create_up_down_counter("ra_mcp.response_cache.tier.bytes", unit="By", description="Bytes held by a cache tier")
+
+
+def _compound_key(*, collection: str, key: str) -> str:
+    """The single key an entry is held under in both tiers: ``<collection>::<key>`` (py-key-value's own format)."""
+    return f"{collection}::{key}"
+
+
+@dataclass
+class TierStatistics:
+    """Counters for one tier since the store was created."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+class TieredStore(BaseEnumerateKeysStore):
+    """Byte-bounded memory LRU in front of an optional size-capped disk tier.
+
+    Args:
+        memory_bytes: L1 budget, measured as serialized entry size.
+        directory: L2 directory; ``None`` keeps the store memory-only.
+        disk_bytes: L2 size limit (diskcache ``size_limit``).
+        default_collection: Collection used when none is given.
+    """
+
+    def __init__(
+        self,
+        *,
+        memory_bytes: int,
+        directory: Path | str | None = None,
+        disk_bytes: int = 1 << 30,
+        default_collection: str | None = None,
+    ) -> None:
+        self.memory_bytes = memory_bytes
+        self._l1: OrderedDict[str, tuple[ManagedEntry, int]] = OrderedDict()
+        self._l1_bytes = 0
+        self._l2: Cache | None = None
+        self._l2_entries = 0
+        self._l2_bytes = 0
+        if directory is not None:
+            Path(directory).mkdir(parents=True, exist_ok=True)
+            l2 = Cache(directory=str(directory), size_limit=disk_bytes, eviction_policy="least-recently-used")
+            self._l2, self._l2_entries, self._l2_bytes = l2, len(l2), l2.volume()
+        self._stats: dict[Tier, TierStatistics] = {"l1": TierStatistics(), "l2": TierStatistics()}
+        super().__init__(default_collection=default_collection, stable_api=True)
+
+    # -- L1 -------------------------------------------------------------------
+
+    def _l1_get(self, combo_key: str) -> ManagedEntry | None:
+        cached = self._l1.get(combo_key)
+        if cached is None:
+            return None
+        entry, _ = cached
+        if entry.is_expired:
+            self._l1_drop(combo_key)
+            return None
+        self._l1.move_to_end(combo_key)
+        return entry
+
+    def _l1_put(self, combo_key: str, entry: ManagedEntry, size: int) -> None:
+        self._l1_drop(combo_key)
+        if size > self.memory_bytes:
+            return
+        while self._l1 and self._l1_bytes + size > self.memory_bytes:
+            self._l1_drop(next(iter(self._l1)))
+            self._count_evictions("l1", 1)
+        self._l1[combo_key] = (entry, size)
+        self._l1_bytes += size
+        _bytes_counter.add(size, {"cache.tier": "l1"})
+
+    def _l1_drop(self, combo_key: str) -> bool:
+        cached = self._l1.pop(combo_key, None)
+        if cached is None:
+            return False
+        self._l1_bytes -= cached[1]
+        _bytes_counter.add(-cached[1], {"cache.tier": "l1"})
+        return True
+
+    # -- L2 -------------------------------------------------------------------
+
+    def _l2_get(self, combo_key: str) -> tuple[ManagedEntry, int] | None:
+        if self._l2 is None:
+            return None
+        raw, expire_epoch = self._l2.get(combo_key, expire_time=True)
+        if not isinstance(raw, str):
+            return None
+        entry = self._serialization_adapter.load_json(json_str=raw)
+        if expire_epoch:
+            entry.expires_at = datetime.fromtimestamp(expire_epoch, tz=UTC)
+        return entry, len(raw.encode())
+
+    def _l2_put(self, combo_key: str, raw: str, ttl: float | None) -> None:
+        if self._l2 is None:
+            return
+        existed = combo_key in self._l2
+        self._l2.set(combo_key, raw, expire=ttl)
+        # diskcache culls expired and least-recently-used entries inside set(); infer how many went.
+        before = self._l2_entries
+        evicted = before + (0 if existed else 1) - self._l2_measure()
+        if evicted > 0:
+            self._count_evictions("l2", evicted)
+            logger.debug("Disk cache tier evicted %d entries (%d bytes held)", evicted, self._l2_bytes)
+
+    def _l2_delete(self, combo_key: str) -> bool:
+        if self._l2 is None or not self._l2.delete(combo_key):
+            return False
+        self._l2_measure()
+        return True
+
+    def _l2_keys(self) -> list[str]:
+        return [k for k in self._l2.iterkeys() if isinstance(k, str)] if self._l2 is not None else []
+
+    def _l2_measure(self) -> int:
+        """Re-read the L2 entry count and volume (one query each); return the count."""
+        if self._l2 is None:
+            return 0
+        entries, volume = len(self._l2), self._l2.volume()
+        _bytes_counter.add(volume - self._l2_bytes, {"cache.tier": "l2"})
+        self._l2_entries, self._l2_bytes = entries, volume
+        return entries
+
+    # -- BaseStore ------------------------------------------------------------
+
+    async def _get_managed_entry(self, *, collection: str, key: str) -> ManagedEntry | None:
+        combo_key = _compound_key(collection=collection, key=key)
+        if (entry := self._l1_get(combo_key)) is not None:
+            self._count_lookup("l1", hit=True)
+            return entry
+        self._count_lookup("l1", hit=False)
+        if self._l2 is None:
+            return None
+
+        found = await asyncio.to_thread(self._l2_get, combo_key)
+        self._count_lookup("l2", hit=found is not None)
+        if found is None:
+            return None
+        entry, size = found
+        self._l1_put(combo_key, entry, size)
+        return entry
+
+    async def _put_managed_entry(self, *, collection: str, key: str, managed_entry: ManagedEntry) -> None:
+        combo_key = _compound_key(collection=collection, key=key)
+        raw = self._serialization_adapter.dump_json(entry=managed_entry, key=key, collection=collection)
+        self._l1_put(combo_key, managed_entry, len(raw.encode()))
+        if self._l2 is not None:
+            await asyncio.to_thread(self._l2_put, combo_key, raw, managed_entry.ttl)
+
+    async def _delete_managed_entry(self, *, key: str, collection: str) -> bool:
+        combo_key = _compound_key(collection=collection, key=key)
+        deleted = self._l1_drop(combo_key)
+        if self._l2 is not None:
+            deleted = await asyncio.to_thread(self._l2_delete, combo_key) or deleted
+        return deleted
+
+    async def _get_collection_keys(self, *, collection: str, limit: int | None = None) -> list[str]:
+        prefix = _compound_key(collection=collection, key="")
+        combo_keys = dict.fromkeys(self._l1)
+        if self._l2 is not None:
+            combo_keys.update(dict.fromkeys(await asyncio.to_thread(self._l2_keys)))
+        keys = [combo_key.removeprefix(prefix) for combo_key in combo_keys if combo_key.startswith(prefix)]
+        return keys[:limit] if limit is not None else keys
+
+    # -- statistics -----------------------------------------------------------
+
+    def _count_lookup(self, tier: Tier, *, hit: bool) -> None:
+        stats = self._stats[tier]
+        if hit:
+            stats.hits += 1
+        else:
+            stats.misses += 1
+        _lookup_counter.add(1, {"cache.tier": tier, "cache.outcome": "hit" if hit else "miss"})
+
+    def _count_evictions(self, tier: Tier, count: int) -> None:
+        self._stats[tier].evictions += count
+        _eviction_counter.add(count, {"cache.tier": tier})
+
+    def statistics(self) -> dict[str, dict[str, Any]]:
+        """Hits, misses, evictions, entry count and bytes per tier (L2 only when configured)."""
+        self._stats["l1"].entries = len(self._l1)
+        self._stats["l1"].bytes = self._l1_bytes
+        tiers: dict[str, dict[str, Any]] = {"l1": asdict(self._stats["l1"])}
+        if self._l2 is not None:
+            self._stats["l2"].entries = self._l2_entries
+            self._stats["l2"].bytes = self._l2_bytes
+            tiers["l2"] = asdict(self._stats["l2"])
+        return tiers
+
+    def close(self) -> None:
+        """Close the disk tier."""
+        if self._l2 is not None:
+            self._l2.close()
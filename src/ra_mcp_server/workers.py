@@ -0,0 +1,319 @@
+"""
+Multi-process HTTP serving: ``ra serve --port P --workers N``.
+
+One FastMCP process handles ALTO parsing, LanceDB row conversion and formatting
+on a single core. In worker mode the parent process starts N full servers, each
+listening on its own Unix socket, and serves the public port with a small
+reverse proxy in front of them.
+
+Session affinity: MCP sessions live in the worker that created them, together
+with the session-scoped state the tools keep there (search and browse dedup in
+``ra_mcp_common.seen_pages``, viewer and PDF pointers). The proxy sends a request
+without an ``mcp-session-id`` header to the next worker in turn and remembers
+which worker answered with a new session id. Every later request carrying that
+id goes to the same worker. A ``DELETE`` that ends the session forgets it.
+Other routes (``/health``, ``/admin/caches``, ...) are spread round-robin, so
+the admin routes report and invalidate one worker's in-memory tiers only.
+
+Shared caches: unless they are already set, the workers get
+``RA_MCP_CACHE_DIR`` (the response cache's disk tier) and ``RA_MCP_HTTP_CACHE``
+(upstream responses, see ``ra_mcp_common.http_cache``) pointing into one
+runtime directory. A result computed or fetched by one worker is therefore
+served by all of them. Each worker keeps its own small in-memory LRU in front.
+``RA_MCP_STATE_STORE`` points the viewer/PDF/SBL view state at a shared SQLite
+file the same way, so a view stays reachable by its view_id from any worker.
+
+A worker that exits is restarted; the sessions it held are lost, and their
+clients get a 404 from the replacement and start a new session.
+
+Connections: an SSE stream or a 50 s viewer long-poll holds its connection to
+the worker for as long as it lasts, so the connections to a worker are not
+capped (``WORKER_LIMITS``); only the idle ones kept alive are. A request that
+still finds no connection within ``pool_timeout`` is answered 503 instead of
+waiting forever.
+"""
+
+import asyncio
+import contextlib
+import itertools
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from pathlib import Path
+
+import httpx
+from starlette.types import Receive, Scope, Send
+
+
+logger = logging.getLogger("ra_mcp.server.workers")
+
+SESSION_HEADER = "mcp-session-id"
+# Hop-by-hop headers are per connection and must not be forwarded (RFC 9110 §7.6.1).
+_HOP_BY_HOP = frozenset({"connection", "keep-alive", "proxy-connection", "te", "trailer", "transfer-encoding", "upgrade"})
+# Connections to one worker: any number open at once (each stream holds one), 32 idle kept alive.
+WORKER_LIMITS = httpx.Limits(max_connections=None, max_keepalive_connections=32)
+
+
+def worker_transport(socket: Path | str, *, limits: httpx.Limits = WORKER_LIMITS) -> httpx.AsyncHTTPTransport:
+    """Transport to the worker listening on the Unix socket *socket*."""
+    return httpx.AsyncHTTPTransport(uds=str(socket), limits=limits)
+
+
+class AffinityProxy:
+    """ASGI reverse proxy that pins each MCP session to the worker that created it.
+
+    Args:
+        upstreams: One transport per worker (:func:`worker_transport` in production); the
+            connection limits are the transport's.
+        max_sessions: Session → worker entries kept; the least recently used are forgotten first.
+        pool_timeout: Seconds a request waits for a connection to its worker before a 503.
+        on_shutdown: Awaited at ASGI lifespan shutdown, after the worker connections are closed.
+    """
+
+    def __init__(
+        self,
+        upstreams: Sequence[httpx.AsyncBaseTransport],
+        *,
+        max_sessions: int = 100_000,
+        pool_timeout: float = 10,
+        on_shutdown: Callable[[], Awaitable[None]] | None = None,
+    ) -> None:
+        if not upstreams:
+            raise ValueError("AffinityProxy needs at least one upstream")
+        # No read timeout: a GET on /mcp is a server-sent event stream that stays open.
+        timeout = httpx.Timeout(None, connect=10, pool=pool_timeout)
+        self._clients = [httpx.AsyncClient(transport=transport, base_url="http://worker", timeout=timeout) for transport in upstreams]
+        self._sessions: OrderedDict[str, int] = OrderedDict()
+        self._max_sessions = max_sessions
+        self._turn = itertools.cycle(range(len(upstreams)))
+        self._on_shutdown = on_shutdown
+
+    @property
+    def sessions(self) -> Mapping[str, int]:
+        """Known session ids and the index of the worker each is pinned to."""
+        return self._sessions
+
+    def worker_for(self, session_id: str | None) -> int:
+        """Index of the worker for a request carrying *session_id* (None = a new session)."""
+        if session_id is not None and (worker := self._sessions.get(session_id)) is not None:
+            self._sessions.move_to_end(session_id)
+            return worker
+        return next(self._turn)
+
+    def remember(self, session_id: str, worker: int) -> None:
+        """Pin *session_id* to *worker*."""
+        self._sessions[session_id] = worker
+        self._sessions.move_to_end(session_id)
+        while len(self._sessions) > self._max_sessions:
+            self._sessions.popitem(last=False)
+
+    def forget_worker(self, worker: int) -> None:
+        """Drop every session pinned to *worker* (it was restarted and lost them)."""
+        for session_id in [sid for sid, index in self._sessions.items() if index == worker]:
+            del self._sessions[session_id]
+
+    async def aclose(self) -> None:
+        """Close the connections to the workers."""
+        for client in self._clients:
+            await client.aclose()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            raise RuntimeError(f"AffinityProxy does not handle {scope['type']!r} connections")
+
+        headers = [(name.decode("latin-1"), value.decode("latin-1")) for name, value in scope["headers"]]
+        session_id = next((value for name, value in headers if name.lower() == SESSION_HEADER), None)
+        worker = self.worker_for(session_id)
+
+        body = bytearray()
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            body += message.get("body", b"")
+            if not message.get("more_body", False):
+                break
+
+        path = scope.get("raw_path") or scope["path"].encode()
+        url = path.decode("latin-1") + (f"?{scope['query_string'].decode('latin-1')}" if scope.get("query_string") else "")
+        client = self._clients[worker]
+        request = client.build_request(scope["method"], url, headers=[h for h in headers if h[0].lower() not in _HOP_BY_HOP], content=bytes(body))
+        try:
+            response = await client.send(request, stream=True)
+        except httpx.PoolTimeout:
+            logger.warning("Worker %d has no free connection", worker)
+            await _send_plain(send, 503, b"worker busy")
+            return
+        except httpx.TransportError as exc:
+            logger.warning("Worker %d unreachable: %s: %s", worker, type(exc).__name__, exc)
+            await _send_plain(send, 502, b"worker unavailable")
+            return
+
+        try:
+            if session_id is None and (new_session := response.headers.get(SESSION_HEADER)):
+                self.remember(new_session, worker)
+            elif session_id is not None and scope["method"] == "DELETE" and response.status_code < 300:
+                self._sessions.pop(session_id, None)
+            await _relay(response, receive, send)
+        finally:
+            await response.aclose()
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.aclose()
+                if self._on_shutdown is not None:
+                    await self._on_shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+async def _relay(response: httpx.Response, receive: Receive, send: Send) -> None:
+    """Stream *response* to the client, stopping early if the client goes away."""
+    headers = [(name, value) for name, value in response.headers.raw if name.decode("latin-1").lower() not in _HOP_BY_HOP]
+    await send({"type": "http.response.start", "status": response.status_code, "headers": headers})
+
+    async def stream() -> None:
+        async for chunk in response.aiter_raw():
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    async def disconnected() -> None:
+        while (await receive())["type"] != "http.disconnect":
+            pass
+
+    streaming = asyncio.create_task(stream())
+    watching = asyncio.create_task(disconnected())
+    _, pending = await asyncio.wait({streaming, watching}, return_when=asyncio.FIRST_COMPLETED)
+    for task in pending:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    if streaming.done() and not streaming.cancelled() and (exc := streaming.exception()) is not None:
+        raise exc
+
+
+async def _send_plain(send: Send, status: int, body: bytes) -> None:
+    await send({"type": "http.response.start", "status": status, "headers": [(b"content-type", b"text/plain")]})
+    await send({"type": "http.response.body", "body": body})
+
+
+def shared_cache_env(environ: Mapping[str, str], runtime_dir: Path) -> dict[str, str]:
+    """Worker environment: *environ* plus shared cache and view-state locations under *runtime_dir*, unless already set."""
+    env = dict(environ)
+    env.setdefault("RA_MCP_CACHE_DIR", str(runtime_dir / "response-cache"))
+    env.setdefault("RA_MCP_HTTP_CACHE", str(runtime_dir / "http-cache.sqlite"))
+    env.setdefault("RA_MCP_STATE_STORE", f"sqlite://{runtime_dir / 'state.sqlite'}")
+    return env
+
+
+def worker_command(socket: Path, *, host: str, modules: str | None, verbose: bool) -> list[str]:
+    """Command line of one worker: a single-process server on the Unix socket *socket*."""
+    command = [sys.executable, "-m", "ra_mcp_server.server", "--http", "--host", host, "--uds", str(socket)]
+    if modules:
+        command += ["--modules", modules]
+    if verbose:
+        command.append("--verbose")
+    return command
+
+
+class _Workers:
+    """The worker processes, restarted when one exits."""
+
+    def __init__(self, count: int, runtime_dir: Path, *, host: str, modules: str | None, verbose: bool) -> None:
+        self.runtime_dir = runtime_dir
+        self.sockets = [runtime_dir / f"worker-{index}.sock" for index in range(count)]
+        self._env = shared_cache_env(os.environ, runtime_dir)
+        self._commands = [worker_command(socket, host=host, modules=modules, verbose=verbose) for socket in self.sockets]
+        self._processes: list[subprocess.Popen[bytes]] = []
+        self._stopping = False
+
+    def start(self) -> None:
+        self._processes = [self._spawn(index) for index in range(len(self.sockets))]
+
+    def _spawn(self, index: int) -> subprocess.Popen[bytes]:
+        self.sockets[index].unlink(missing_ok=True)
+        process = subprocess.Popen(self._commands[index], env=self._env)  # noqa: S603 — our own interpreter and arguments
+        logger.info("Started worker %d (pid %d) on %s", index, process.pid, self.sockets[index])
+        return process
+
+    def wait_until_listening(self, timeout: float = 120) -> None:
+        """Block until every worker's socket exists.
+
+        Raises:
+            RuntimeError: If a worker exits or does not listen within *timeout* seconds.
+        """
+        deadline = time.monotonic() + timeout
+        while not all(socket.exists() for socket in self.sockets):
+            for index, process in enumerate(self._processes):
+                if process.poll() is not None:
+                    raise RuntimeError(f"Worker {index} exited with code {process.returncode} during startup")
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Workers did not start listening within {timeout:.0f}s")
+            time.sleep(0.1)
+
+    async def supervise(self, proxy: AffinityProxy, interval: float = 1.0) -> None:
+        """Restart workers that exit; their sessions are forgotten."""
+        while not self._stopping:
+            await asyncio.sleep(interval)
+            for index, process in enumerate(self._processes):
+                if process.poll() is not None and not self._stopping:
+                    logger.warning("Worker %d (pid %d) exited with code %d; restarting", index, process.pid, process.returncode)
+                    proxy.forget_worker(index)
+                    self._processes[index] = self._spawn(index)
+
+    def stop(self, timeout: float = 10) -> None:
+        """Terminate the workers (killing those that do not exit within *timeout*) and remove the runtime directory."""
+        self._stopping = True
+        for process in self._processes:
+            if process.poll() is None:
+                process.terminate()
+        for process in self._processes:
+            try:
+                process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        shutil.rmtree(self.runtime_dir, ignore_errors=True)
+
+
+def run_workers(workers: int, *, host: str, port: int, modules: str | None = None, verbose: bool = False) -> None:
+    """Serve ``host:port`` through an affinity proxy in front of *workers* server processes."""
+    import uvicorn
+
+    runtime_dir = Path(tempfile.mkdtemp(prefix="ra-mcp-workers-"))
+    pool = _Workers(workers, runtime_dir, host=host, modules=modules, verbose=verbose)
+    logger.info("Starting %d workers (shared caches under %s)", workers, runtime_dir)
+    try:
+        pool.start()
+        pool.wait_until_listening()
+        # uvicorn re-raises SIGINT/SIGTERM once it has shut down, which ends the process before
+        # the finally below runs, so the workers are stopped during the lifespan shutdown.
+        proxy = AffinityProxy(
+            [worker_transport(socket) for socket in pool.sockets],
+            on_shutdown=lambda: asyncio.to_thread(pool.stop),
+        )
+
+        async def serve() -> None:
+            supervisor = asyncio.create_task(pool.supervise(proxy))
+            try:
+                server = uvicorn.Server(uvicorn.Config(proxy, host=host, port=port, lifespan="on", log_level="debug" if verbose else "info"))
+                logger.info("Riksarkivet MCP proxy on http://%s:%d/mcp -> %d workers", host, port, workers)
+                await server.serve()
+            finally:
+                supervisor.cancel()
+
+        asyncio.run(serve())
+    finally:
+        pool.stop()
@@ -0,0 +1,67 @@
+"""Smoke test for the dataset search benchmark (benchmarks/dataset_search) at a tiny scale:
+the synthetic CSVs go through the real ingest functions, every query runs, the
+result document is deterministic in its data fingerprint, and compare flags a
+slowdown."""
+
+import copy
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+
+ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def bench(monkeypatch):
+    monkeypatch.syspath_prepend(str(ROOT))
+    from benchmarks.dataset_search import runner
+
+    return runner
+
+
+def test_run_builds_every_table_and_times_every_query(bench, tmp_path):
+    result = bench.run_benchmark(tmp_path / "db", scale=0.0005, repeat=2, warmup=0)
+    json.dumps(result)  # the document must serialise as written by `run`
+
+    assert set(result["tables"]) == set(bench.TABLE_NAMES)
+    assert result["tables"]["fodelse"]["rows"] == bench.rows_at_scale("fodelse", 0.0005)
+    assert set(result["queries"]) == {q.name for q in bench.QUERIES}
+    common = result["queries"]["fodelse.common_surname"]
+    assert common["total_hits"] > 0
+    assert common["returned"] == min(25, common["total_hits"])
+    assert common["search_ms"]["p50"] > 0
+    assert result["queries"]["fodelse.no_match"]["total_hits"] == 0
+
+
+def test_cached_tables_are_reused_and_rebuilds_are_deterministic(bench, tmp_path):
+    first = bench.build_tables(tmp_path / "a", scale=0.0005, seed=7, tables=["wincars"])
+    again = bench.build_tables(tmp_path / "a", scale=0.0005, seed=7, tables=["wincars"])
+    assert again == first  # reused: the build timings come from the manifest
+
+    query = next(q for q in bench.QUERIES if q.name == "wincars.common_make")
+    bench.build_tables(tmp_path / "b", scale=0.0005, seed=7, tables=["wincars"])
+    hits_a = bench.run_query(bench.lancedb.connect(tmp_path / "a"), query, repeat=1, warmup=0)["total_hits"]
+    hits_b = bench.run_query(bench.lancedb.connect(tmp_path / "b"), query, repeat=1, warmup=0)["total_hits"]
+    assert hits_a == hits_b > 0
+
+
+def test_compare_flags_slowdowns_beyond_threshold_and_floor(bench):
+    base: dict[str, Any] = {
+        "config": {"scale": 1.0, "seed": 1, "generator": 1, "display_text": True},
+        "queries": {
+            "fast": {"total_hits": 10, "search_ms": {"p50": 2.0, "p99": 3.0}},
+            "slow": {"total_hits": 10, "search_ms": {"p50": 20.0, "p99": 30.0}},
+        },
+    }
+    new = copy.deepcopy(base)
+    new["queries"]["fast"]["search_ms"]["p50"] = 2.4  # +20% but under the 0.5 ms floor
+    new["queries"]["slow"]["search_ms"]["p99"] = 40.0  # +33%: a regression
+    new["queries"]["slow"]["total_hits"] = 11
+
+    deltas, warnings = bench.compare(base, new)
+    regressed = [(d.name, d.metric) for d in deltas if d.regressed(0.15, 0.5)]
+    assert regressed == [("slow", "p99")]
+    assert warnings == ["slow: total_hits changed 10 -> 11"]
@@ -0,0 +1,45 @@
+"""The import-time benchmark (benchmarks/import_time): the ``-X importtime`` parser,
+and the guard itself — importing the server must not load the heavy dependencies
+that are meant to be imported on first use."""
+
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).parent.parent
+
+REPORT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 | _io
+import time:       300 |        300 |   encodings.aliases
+import time:       900 |       1200 | encodings
+noise from the program itself
+import time:      2000 |       2000 |     pyarrow.lib
+import time:       500 |       2500 |   pyarrow
+import time:      1000 |       3500 | ra_mcp_dataset_lib
+"""
+
+
+@pytest.fixture
+def bench(monkeypatch):
+    monkeypatch.syspath_prepend(str(ROOT))
+    from benchmarks import import_time
+
+    return import_time
+
+
+def test_parse_importtime_reads_depth_and_times(bench):
+    records = bench.parse_importtime(REPORT)
+    assert [r.name for r in records] == ["_io", "encodings.aliases", "encodings", "pyarrow.lib", "pyarrow", "ra_mcp_dataset_lib"]
+    assert records[1] == bench.ImportRecord("encodings.aliases", 300, 300, 1)
+    assert [r.depth for r in records] == [0, 1, 0, 2, 1, 0]
+    assert bench.total_ms(records) == pytest.approx(4.82)
+    assert bench.heavy_imports(records) == ["pyarrow"]
+
+
+def test_server_import_stays_free_of_heavy_dependencies(bench):
+    scenario = next(s for s in bench.SCENARIOS if s.name == "server.import")
+    result = bench.run_scenario(scenario, runs=1)
+    assert result["modules"] > 0
+    assert result["heavy_imports"] == []
@@ -0,0 +1,135 @@
+"""The mock upstream (benchmarks/mock_upstream): the real clients parse its responses
+when RA_MCP_UPSTREAM_URL points at it, faults are injected as configured, and the
+load generator drives an MCP server and summarises the calls."""
+
+from pathlib import Path
+
+import httpx
+import pytest
+from fastmcp import FastMCP
+
+from ra_mcp_browse_lib import BrowseOperations
+from ra_mcp_common.http_client import HTTPClient
+from ra_mcp_common.settings import settings
+from ra_mcp_iiif_lib import IIIFClient
+from ra_mcp_search_lib.search_client import SearchClient
+from ra_mcp_tora_lib.models import ToraPlace
+
+
+ROOT = Path(__file__).parent.parent
+MOCK = "http://mock-upstream"
+
+
+@pytest.fixture
+def mock(monkeypatch):
+    monkeypatch.syspath_prepend(str(ROOT))
+    from benchmarks.mock_upstream import app, load
+
+    return app, load
+
+
+@pytest.fixture
+def routed_client(mock, monkeypatch):
+    """An HTTPClient whose requests are routed to an in-process mock upstream."""
+    app, _ = mock
+    monkeypatch.setattr(settings, "upstream_url", MOCK)
+    client = HTTPClient(max_retries=1, backoff_base=0)
+    client._client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app.create_app()), base_url=MOCK)
+    return client
+
+
+async def test_search_and_browse_parse_mock_responses(routed_client):
+    response = await SearchClient(routed_client).search(transcribed_text="trolldom", limit=10)
+    assert response.total_hits > 0
+    assert 0 < len(response.items) <= 10
+    transcribed = response.items[0].transcribed_text
+    assert transcribed is not None
+    assert "<em>trolldom</em>" in transcribed.snippets[0].text
+
+    again = await SearchClient(routed_client).search(transcribed_text="trolldom", limit=10)
+    assert again.model_dump() == response.model_dump()  # deterministic in the request
+
+    reference_code = response.items[0].metadata.reference_code
+    assert reference_code is not None
+    result = await BrowseOperations(routed_client).browse_document(reference_code, "1-2")
+    assert result.manifest_id
+    assert [c.page_number for c in result.contexts] == [1, 2]
+
+
+async def test_no_match_and_manifest(mock, routed_client):
+    app, _ = mock
+    empty = await SearchClient(routed_client).search(text="nomatch", limit=10)
+    assert empty.total_hits == 0
+    assert empty.items == []
+
+    manifest = await IIIFClient(routed_client).fetch_manifest("https://lbiiif.riksarkivet.se/arkis!R0001203/manifest")
+    assert manifest is not None
+    assert len(manifest.canvases) == app.page_count_for("R0001203")
+    assert manifest.canvases[0].alto_url.endswith("/R000/R0001203/R0001203_00001.xml")
+
+
+async def test_alto_past_last_page_is_404_and_sparql_parses(mock):
+    app, _ = mock
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app.create_app()), base_url=MOCK) as http:
+        last = app.page_count_for("R0001203")
+        alto = "/sok.riksarkivet.se/dokument/alto/R000/R0001203/R0001203_{:05d}.xml"
+        assert (await http.get(alto.format(last))).status_code == 200
+        assert (await http.get(alto.format(last + 1))).status_code == 404
+
+        query = 'SELECT ?place WHERE { FILTER(LCASE(?name) = LCASE("Kerstinbo")) }'
+        data = (await http.post("/tora.entryscape.net/store/sparql", data={"query": query})).json()
+        places = [ToraPlace.from_sparql_binding(b) for b in data["results"]["bindings"]]
+        assert places
+        assert {p.name for p in places} == {"Kerstinbo"}
+
+
+async def test_injected_errors_and_recordings(mock, tmp_path):
+    app, _ = mock
+    recorded = tmp_path / "lbiiif.riksarkivet.se" / "collection" / "arkiv" / "R1"
+    recorded.parent.mkdir(parents=True)
+    recorded.write_text('{"id": "recorded", "items": []}')
+
+    failing = app.create_app(app.MockConfig(faults=app.Faults(error_rate=1.0, error_statuses=(429,))))
+    recording = app.create_app(app.MockConfig(recordings=tmp_path))
+    async with (
+        httpx.AsyncClient(transport=httpx.ASGITransport(app=failing), base_url=MOCK) as bad,
+        httpx.AsyncClient(transport=httpx.ASGITransport(app=recording), base_url=MOCK) as good,
+    ):
+        assert (await bad.get("/data.riksarkivet.se/api/records", params={"text": "x"})).status_code == 429
+        assert (await bad.get("/_mock/stats")).json()["errors"] == {"data.riksarkivet.se": 1}
+
+        assert (await good.get("/lbiiif.riksarkivet.se/collection/arkiv/R1")).json() == {"id": "recorded", "items": []}
+        assert (await good.get("/lbiiif.riksarkivet.se/collection/arkiv/R2")).json()["type"] == "Collection"
+
+
+def test_latency_spec(mock):
+    app, _ = mock
+    assert app.Latency.parse("120") == app.Latency(120.0, 0.0)
+    assert app.Latency.parse("120:0.5").sigma == 0.5
+
+
+async def test_load_generator_summarises_calls(mock):
+    _, load = mock
+    server = FastMCP("stub")
+
+    @server.tool
+    def search_transcribed(keyword: str, offset: int, dedup: bool = True) -> str:
+        if keyword == "nomatch":
+            raise ValueError("no hits")
+        return keyword
+
+    @server.tool
+    def search_metadata(keyword: str, offset: int, dedup: bool = True) -> str:
+        return keyword
+
+    result = await load.run_load(server, concurrency=3, requests=30, duration=None, mix={"search_transcribed": 1, "search_metadata": 1})
+
+    assert result["overall"]["calls"] == 30
+    assert set(result["tools"]) == {"search_transcribed", "search_metadata"}
+    assert sum(t["calls"] for t in result["tools"].values()) == 30
+    assert result["tools"]["search_metadata"]["errors"] == 0
+    assert result["overall"]["latency_ms"]["p50"] > 0
+    assert result["throughput_rps"] > 0
+
+    with pytest.raises(ValueError, match="Unknown tool"):
+        load.parse_mix("search_everything=1")
@@ -2,10 +2,15 @@
 stateful/App tools are not (caching them would break the viewer/pdf apps).
 """
 
-from fastmcp import Client, FastMCP
+import asyncio
+from typing import Annotated
+
+from fastmcp import Client, Context, FastMCP
 from fastmcp.server.middleware.caching import CallToolSettings, ResponseCachingMiddleware
 from key_value.aio.stores.memory import MemoryStore
+from pydantic import Field
 
+from ra_mcp_server.response_cache import NormalizingResponseCache, normalize_arguments
 from ra_mcp_server.server import CACHEABLE_TOOLS, create_server, setup_server
 
 
@@ -80,3 +85,188 @@ def test_allowlist_matches_the_readonly_search_rule():
 
     expected = asyncio.run(_names())
     assert set(CACHEABLE_TOOLS) == expected, f"allowlist drift: missing={expected - set(CACHEABLE_TOOLS)}, extra={set(CACHEABLE_TOOLS) - expected}"
+
+
+# ---------------------------------------------------------------------------
+# Key normalization
+# ---------------------------------------------------------------------------
+
+
+def _normalizing_server() -> tuple[FastMCP, dict[str, list], NormalizingResponseCache]:
+    """A cached search tool with defaults, a case-insensitive filter and a telemetry arg."""
+    calls: dict[str, list] = {"search_thing": []}
+    mcp = FastMCP("normalize-test")
+
+    @mcp.tool
+    def search_thing(
+        keyword: str,
+        offset: int = 0,
+        county: Annotated[str | None, Field(description="County filter (case-insensitive substring match).")] = None,
+        research_context: Annotated[str | None, Field(description="Telemetry only.")] = None,
+    ) -> str:
+        calls["search_thing"].append((keyword, offset, county, research_context))
+        return f"{keyword}|{offset}|{county}"
+
+    cache = NormalizingResponseCache(MemoryStore(), tools=["search_thing"], ttl=300)
+    mcp.add_middleware(cache)
+    return mcp, calls, cache
+
+
+def test_normalize_arguments():
+    schema = {
+        "properties": {
+            "keyword": {"type": "string"},
+            "offset": {"type": "integer", "default": 0},
+            "lan": {"anyOf": [{"type": "string"}, {"type": "null"}], "default": None, "description": "Län (Case-insensitive substring match)."},
+        }
+    }
+    assert normalize_arguments({"research_context": "x", "lan": " Uppsala  Län ", "keyword": "  pest   smitta\n"}, schema) == {
+        "keyword": "pest smitta",
+        "lan": "uppsala län",
+        "offset": 0,
+    }
+    assert list(normalize_arguments({"b": 1, "a": 2})) == ["a", "b"]
+    assert normalize_arguments({"keyword": "Stockholm"}, schema)["keyword"] == "Stockholm"  # not declared case-insensitive
+
+
+async def test_equivalent_calls_share_one_entry():
+    mcp, calls, cache = _normalizing_server()
+    async with Client(mcp) as c:
+        first = await c.call_tool("search_thing", {"keyword": "trolldom", "research_context": "witch trials"})
+        variants = [
+            {"keyword": " trolldom "},
+            {"keyword": "trolldom", "offset": 0},
+            {"offset": 0, "keyword": "trolldom", "county": None, "research_context": "another study"},
+        ]
+        for arguments in variants:
+            assert (await c.call_tool("search_thing", arguments)).content[0].text == first.content[0].text
+        await c.call_tool("search_thing", {"keyword": "trolldom", "county": " UPPSALA"})
+        await c.call_tool("search_thing", {"keyword": "trolldom", "county": "uppsala"})
+        await c.call_tool("search_thing", {"keyword": "Trolldom"})  # keyword case is significant
+
+    # The tool still sees the arguments as sent, telemetry included.
+    assert calls["search_thing"] == [("trolldom", 0, None, "witch trials"), ("trolldom", 0, " UPPSALA", None), ("Trolldom", 0, None, None)]
+    assert cache.lookups("search_thing") == {"hit": 4, "stale": 0, "miss": 3}
+    assert cache.hit_ratio("search_thing") == 4 / 7
+    assert cache.hit_ratio("get_state") is None
+
+
+def _dedup_server(ttl: float = 300, **cache_options) -> tuple[FastMCP, list[tuple[str, bool]], NormalizingResponseCache]:
+    """A cached search tool whose output depends on what the calling session has seen."""
+    calls: list[tuple[str, bool]] = []
+    seen: dict[str, set[str]] = {}
+    mcp = FastMCP("dedup-test")
+
+    @mcp.tool
+    def search_thing(keyword: str, ctx: Context, dedup: bool = True) -> str:
+        calls.append((ctx.session_id, dedup))
+        shown = seen.setdefault(ctx.session_id, set())
+        text = f"stub {keyword}" if dedup and keyword in shown else f"full {keyword}"
+        shown.add(keyword)
+        return text
+
+    cache = NormalizingResponseCache(MemoryStore(), tools=["search_thing"], ttl=ttl, **cache_options)
+    mcp.add_middleware(cache)
+    return mcp, calls, cache
+
+
+async def test_dedup_calls_are_cached_per_session():
+    mcp, calls, _ = _dedup_server()
+    async with Client(mcp) as first, Client(mcp) as second:
+        assert (await first.call_tool("search_thing", {"keyword": "pest"})).content[0].text == "full pest"
+        # Another session has seen nothing yet: it must not get the first session's entry.
+        assert (await second.call_tool("search_thing", {"keyword": "pest"})).content[0].text == "full pest"
+        assert (await second.call_tool("search_thing", {"keyword": "pest"})).content[0].text == "full pest"  # cached for this session
+        # Without dedup the output is the same for every session, so one entry is shared.
+        await first.call_tool("search_thing", {"keyword": "pest", "dedup": False})
+        await second.call_tool("search_thing", {"keyword": "pest", "dedup": False})
+
+    sessions = {session_id for session_id, _ in calls}
+    assert len(sessions) == 2
+    assert [dedup for _, dedup in calls] == [True, True, False]
+
+
+async def test_expired_dedup_entries_are_not_refreshed_in_the_background():
+    mcp, calls, cache = _dedup_server(ttl=0.1, stale_ttl=30, refresh_top=1, refresh_ahead=1)
+    async with Client(mcp) as c:
+        assert (await c.call_tool("search_thing", {"keyword": "pest"})).content[0].text == "full pest"
+        assert (await c.call_tool("search_thing", {"keyword": "pest"})).content[0].text == "full pest"  # fresh hit, hot key
+        await asyncio.sleep(0.15)
+        # Expired: the tool runs for this call, sees its own earlier page, and nothing replays behind it.
+        assert (await c.call_tool("search_thing", {"keyword": "pest"})).content[0].text == "stub pest"
+        await cache.wait_for_refreshes()
+
+    assert len(calls) == 2
+    assert cache.lookups("search_thing") == {"hit": 1, "stale": 0, "miss": 2}
+
+
+# ---------------------------------------------------------------------------
+# Stale-while-revalidate
+# ---------------------------------------------------------------------------
+
+
+def _slow_counter_server(ttl: float, **cache_options) -> tuple[FastMCP, dict[str, int], NormalizingResponseCache]:
+    calls = {"n": 0}
+    mcp = FastMCP("swr-test")
+
+    @mcp.tool
+    async def search_thing(q: str) -> str:
+        calls["n"] += 1
+        n = calls["n"]
+        await asyncio.sleep(0.05)
+        return f"{q}-{n}"
+
+    cache = NormalizingResponseCache(MemoryStore(), tools=["search_thing"], ttl=ttl, **cache_options)
+    mcp.add_middleware(cache)
+    return mcp, calls, cache
+
+
+async def test_expired_entry_is_served_stale_and_refreshed_once():
+    mcp, calls, cache = _slow_counter_server(ttl=0.1, stale_ttl=30)
+    async with Client(mcp) as c:
+        assert (await c.call_tool("search_thing", {"q": "a"})).content[0].text == "a-1"
+        await asyncio.sleep(0.15)
+        stale = await asyncio.gather(*(c.call_tool("search_thing", {"q": "a"}) for _ in range(3)))
+        assert {r.content[0].text for r in stale} == {"a-1"}  # served at once, not waiting for the tool
+        await cache.wait_for_refreshes()
+        assert (await c.call_tool("search_thing", {"q": "a"})).content[0].text == "a-2"
+
+    assert calls["n"] == 2  # one background refresh for three stale serves
+    assert cache.lookups("search_thing") == {"hit": 1, "stale": 3, "miss": 1}
+
+
+async def test_without_grace_an_expired_entry_is_a_miss():
+    mcp, _, cache = _slow_counter_server(ttl=0.1)
+    async with Client(mcp) as c:
+        await c.call_tool("search_thing", {"q": "a"})
+        await asyncio.sleep(0.15)
+        assert (await c.call_tool("search_thing", {"q": "a"})).content[0].text == "a-2"
+    assert cache.lookups("search_thing") == {"hit": 0, "stale": 0, "miss": 2}
+
+
+async def test_hot_keys_are_refreshed_ahead_of_expiry():
+    mcp, calls, cache = _slow_counter_server(ttl=0.4, refresh_top=1, refresh_ahead=0.5)
+    async with Client(mcp) as c:
+        await c.call_tool("search_thing", {"q": "hot"})
+        await c.call_tool("search_thing", {"q": "hot"})  # early hit: no refresh yet
+        await asyncio.sleep(0.25)
+        await c.call_tool("search_thing", {"q": "hot"})  # fresh hit inside the refresh-ahead window
+        await cache.wait_for_refreshes()
+        assert (await c.call_tool("search_thing", {"q": "hot"})).content[0].text == "hot-2"
+    assert calls["n"] == 2
+
+
+async def test_cache_stats_and_invalidation_by_tool_prefix():
+    mcp, calls, cache = _slow_counter_server(ttl=300)
+    async with Client(mcp) as c:
+        for q in ("a", "b", "a"):
+            await c.call_tool("search_thing", {"q": q})
+
+        stats = await cache.cache_stats()
+        assert (stats.entries, stats.hits, stats.misses) == (2, 1, 2)
+        assert stats.top_keys[0]["call"] == 'search_thing {"q":"a"}'
+        assert stats.top_keys[0]["key"].startswith("search_thing:")
+
+        assert await cache.invalidate("search_thing:*") == 2
+        await c.call_tool("search_thing", {"q": "a"})
+    assert calls["n"] == 3
@@ -1,6 +1,13 @@
 """Tests for ra-mcp root server composition."""
 
-from ra_mcp_server.server import AVAILABLE_MODULES
+import httpx
+import pytest
+from fastmcp import FastMCP
+from pydantic import SecretStr
+
+from ra_mcp_common.cache_registry import CacheStats, matching_keys, register_cache, unregister_cache
+from ra_mcp_common.settings import settings
+from ra_mcp_server.server import AVAILABLE_MODULES, load_module_server, setup_custom_routes
 
 
 def test_available_modules_has_search() -> None:
@@ -20,3 +27,62 @@ def test_all_default_modules_have_server_key() -> None:
         assert "server" in config, f"Module '{name}' missing 'server' key"
         assert "description" in config, f"Module '{name}' missing 'description' key"
         assert "default" in config, f"Module '{name}' missing 'default' key"
+
+
+def test_modules_are_registered_by_import_path() -> None:
+    from ra_mcp_guide_mcp.tools import guide_mcp
+
+    assert all(isinstance(config["server"], str) for config in AVAILABLE_MODULES.values())
+    assert load_module_server("guide") is guide_mcp
+    with pytest.raises(KeyError):
+        load_module_server("nope")
+
+
+# ---------------------------------------------------------------------------
+# /admin/caches
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+async def admin(monkeypatch):
+    """An HTTP client for a server with the custom routes and one registered test cache."""
+    entries = {"a": 1, "b:1": 2, "b:2": 3}
+
+    def invalidate(pattern: str | None) -> int:
+        keys = matching_keys(entries, pattern)
+        for key in keys:
+            del entries[key]
+        return len(keys)
+
+    register_cache("test.cache", stats=lambda: CacheStats(entries=len(entries), hits=3, misses=1), invalidate=invalidate)
+    monkeypatch.setattr(settings, "admin_token", SecretStr("s3cret"))
+    server = FastMCP("admin-test")
+    setup_custom_routes(server)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=server.http_app()), base_url="http://test") as client:
+        yield client, entries
+    unregister_cache("test.cache")
+
+
+async def test_admin_caches_requires_the_token(admin, monkeypatch):
+    client, _ = admin
+    assert (await client.get("/admin/caches")).status_code == 401
+    assert (await client.get("/admin/caches", headers={"Authorization": "Bearer wrong"})).status_code == 401
+
+    monkeypatch.setattr(settings, "admin_token", None)
+    assert (await client.get("/admin/caches", headers={"Authorization": "Bearer s3cret"})).status_code == 404
+
+
+async def test_admin_caches_reports_and_invalidates(admin):
+    client, entries = admin
+    auth = {"Authorization": "Bearer s3cret"}
+    load_module_server("pdf")
+
+    report = (await client.get("/admin/caches", headers=auth)).json()
+    assert report["test.cache"] == report["test.cache"] | {"entries": 3, "hit_ratio": 0.75}
+    assert "pdf.bytes" in report  # modules register their caches when they are loaded
+
+    removed = await client.delete("/admin/caches/test.cache", params={"key": "b:*"}, headers=auth)
+    assert removed.json() == {"cache": "test.cache", "removed": 2}
+    assert entries == {"a": 1}
+    assert (await client.get("/admin/caches/test.cache", headers=auth)).json()["entries"] == 1
+    assert (await client.get("/admin/caches/nope", headers=auth)).status_code == 404
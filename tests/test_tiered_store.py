@@ -0,0 +1,78 @@
+"""The two-tier response-cache store: byte-bounded memory LRU in front of a
+size-capped disk tier, with promotion of disk hits and per-tier statistics."""
+
+import asyncio
+
+from ra_mcp_server.tiered_store import TieredStore
+
+
+def _value(size: int) -> dict[str, str]:
+    return {"text": "x" * size}
+
+
+async def test_memory_tier_evicts_least_recently_used_by_bytes():
+    store = TieredStore(memory_bytes=3000)
+    for key in ("a", "b", "c"):
+        await store.put(key, _value(800))
+    await store.get("a")  # a is now most recently used
+    await store.put("d", _value(800))
+
+    assert await store.get("b") is None
+    assert await store.get("a") == _value(800)
+    stats = store.statistics()
+    assert set(stats) == {"l1"}
+    assert stats["l1"]["evictions"] == 1
+    assert stats["l1"]["entries"] == 3
+    assert 2400 < stats["l1"]["bytes"] <= 3000
+
+
+async def test_disk_hit_is_promoted_to_memory(tmp_path):
+    store = TieredStore(memory_bytes=1500, directory=tmp_path)
+    await store.put("a", _value(1000))
+    await store.put("b", _value(1000))  # pushes a out of L1; it stays on disk
+
+    assert await store.get("a") == _value(1000)  # L1 miss, L2 hit
+    assert await store.get("a") == _value(1000)  # promoted: L1 hit
+    stats = store.statistics()
+    assert stats["l1"] == stats["l1"] | {"hits": 1, "misses": 1, "evictions": 2}
+    assert stats["l2"] == stats["l2"] | {"hits": 1, "misses": 0, "entries": 2}
+    assert stats["l2"]["bytes"] > 0
+    store.close()
+
+
+async def test_disk_tier_survives_a_new_store_and_honours_ttl(tmp_path):
+    first = TieredStore(memory_bytes=10_000, directory=tmp_path)
+    await first.put("kept", _value(10))
+    await first.put("short", _value(10), ttl=0.05)
+    first.close()
+
+    second = TieredStore(memory_bytes=10_000, directory=tmp_path)
+    assert second.statistics()["l2"]["entries"] == 2  # counted when the directory is opened
+    await asyncio.sleep(0.1)
+    assert await second.get("kept") == _value(10)
+    assert await second.get("short") is None
+    second.close()
+
+
+async def test_oversized_entries_skip_memory_and_delete_clears_both(tmp_path):
+    store = TieredStore(memory_bytes=100, directory=tmp_path)
+    await store.put("big", _value(500))
+    assert store.statistics()["l1"]["entries"] == 0
+    assert await store.get("big") == _value(500)
+
+    assert await store.delete("big") is True
+    assert store.statistics()["l2"]["entries"] == 0
+    assert await store.get("big") is None
+    assert await store.delete("big") is False
+    store.close()
+
+
+async def test_disk_tier_is_size_capped(tmp_path):
+    entries = 40
+    store = TieredStore(memory_bytes=0, directory=tmp_path, disk_bytes=64 * 1024)
+    for i in range(entries):
+        await store.put(f"k{i}", _value(4096))
+    stats = store.statistics()["l2"]
+    assert stats["evictions"] > 0
+    assert stats["entries"] < entries
+    store.close()
@@ -0,0 +1,168 @@
+"""Multi-worker serving: the session-affinity proxy in front of the worker
+processes, and the environment that makes the workers share their caches."""
+
+import asyncio
+import contextlib
+import itertools
+from collections.abc import AsyncGenerator, AsyncIterator
+from pathlib import Path
+
+import httpx
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from ra_mcp_server.workers import SESSION_HEADER, AffinityProxy, shared_cache_env, worker_command, worker_transport
+
+
+def _fake_worker(name: str) -> Starlette:
+    """A worker that opens a session on requests without one and reports who answered."""
+    ids = itertools.count()
+
+    async def mcp(request: Request) -> Response:
+        if request.method == "DELETE":
+            return Response(status_code=204)
+        session = request.headers.get(SESSION_HEADER)
+        body = {"worker": name, "session": session, "echo": (await request.body()).decode(), "query": request.url.query}
+        headers = {} if session else {SESSION_HEADER: f"{name}-{next(ids)}"}
+        return JSONResponse(body, headers=headers)
+
+    return Starlette(routes=[Route("/mcp", mcp, methods=["GET", "POST", "DELETE"])])
+
+
+def _client(proxy: AffinityProxy) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=proxy), base_url="http://proxy")
+
+
+async def test_sessions_stick_to_the_worker_that_created_them():
+    proxy = AffinityProxy([httpx.ASGITransport(app=_fake_worker(name)) for name in ("w0", "w1")])
+    async with _client(proxy) as client:
+        opened = [await client.post("/mcp", content=b"initialize") for _ in range(4)]
+        assert [r.json()["worker"] for r in opened] == ["w0", "w1", "w0", "w1"]  # new sessions round-robin
+        sessions = [r.headers[SESSION_HEADER] for r in opened]
+        assert dict(proxy.sessions) == {"w0-0": 0, "w1-0": 1, "w0-1": 0, "w1-1": 1}
+
+        for session in sessions * 2:
+            reply = (await client.post("/mcp", content=b"tools/list", params={"n": "1"}, headers={SESSION_HEADER: session})).json()
+            assert reply == {"worker": session.split("-")[0], "session": session, "echo": "tools/list", "query": "n=1"}
+
+        assert (await client.delete("/mcp", headers={SESSION_HEADER: "w1-0"})).status_code == 204
+    assert "w1-0" not in proxy.sessions
+    await proxy.aclose()
+
+
+async def test_session_table_is_bounded_and_restarted_workers_lose_theirs():
+    proxy = AffinityProxy([httpx.ASGITransport(app=_fake_worker("w0"))] * 2, max_sessions=2)
+    for n, worker in enumerate((0, 1, 1)):
+        proxy.remember(f"s{n}", worker)
+    assert list(proxy.sessions) == ["s1", "s2"]
+
+    proxy.forget_worker(1)
+    assert dict(proxy.sessions) == {}
+    await proxy.aclose()
+
+
+async def test_unreachable_worker_answers_502(tmp_path):
+    proxy = AffinityProxy([httpx.AsyncHTTPTransport(uds=str(tmp_path / "missing.sock"))])
+    async with _client(proxy) as client:
+        response = await client.post("/mcp", content=b"{}")
+    assert response.status_code == 502
+    await proxy.aclose()
+
+
+def _streaming_worker(release: asyncio.Event) -> Starlette:
+    """A worker whose GET /mcp is an event stream held open until *release* is set."""
+
+    async def mcp(request: Request) -> Response:
+        if request.method == "POST":
+            return JSONResponse({"ok": True})
+
+        async def events() -> AsyncIterator[bytes]:
+            yield b"event: open\n\n"
+            await release.wait()
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return Starlette(routes=[Route("/mcp", mcp, methods=["GET", "POST"])])
+
+
+@contextlib.asynccontextmanager
+async def _serving(app, socket: Path) -> AsyncGenerator[None]:
+    server = uvicorn.Server(uvicorn.Config(app, uds=str(socket), lifespan="off", log_level="warning"))
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    try:
+        yield
+    finally:
+        server.should_exit = True
+        await task
+
+
+async def _open_streams(client: httpx.AsyncClient, count: int, stack: contextlib.AsyncExitStack) -> None:
+    for _ in range(count):
+        stream = await stack.enter_async_context(client.stream("GET", "/mcp"))
+        assert stream.status_code == 200
+
+
+async def test_open_streams_do_not_exhaust_the_worker_connections(tmp_path):
+    release = asyncio.Event()
+    streams = 110  # more than httpx's default pool of 100 connections
+    proxy = AffinityProxy([worker_transport(tmp_path / "worker.sock")], pool_timeout=1)
+    async with (
+        _serving(_streaming_worker(release), tmp_path / "worker.sock"),
+        _serving(proxy, tmp_path / "proxy.sock"),
+        httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(uds=str(tmp_path / "proxy.sock"), limits=httpx.Limits(max_connections=None)), base_url="http://proxy"
+        ) as client,
+        contextlib.AsyncExitStack() as stack,
+    ):
+        await _open_streams(client, streams, stack)
+        assert (await client.post("/mcp", content=b"{}")).status_code == 200
+        release.set()
+    await proxy.aclose()
+
+
+async def test_a_worker_without_a_free_connection_answers_503(tmp_path):
+    release = asyncio.Event()
+    proxy = AffinityProxy([worker_transport(tmp_path / "worker.sock", limits=httpx.Limits(max_connections=2))], pool_timeout=0.1)
+    async with (
+        _serving(_streaming_worker(release), tmp_path / "worker.sock"),
+        _serving(proxy, tmp_path / "proxy.sock"),
+        httpx.AsyncClient(transport=httpx.AsyncHTTPTransport(uds=str(tmp_path / "proxy.sock")), base_url="http://proxy") as client,
+        contextlib.AsyncExitStack() as stack,
+    ):
+        await _open_streams(client, 2, stack)
+        response = await client.post("/mcp", content=b"{}")
+        assert (response.status_code, response.text) == (503, "worker busy")
+        release.set()
+    await proxy.aclose()
+
+
+def test_workers_share_cache_locations_unless_configured():
+    env = shared_cache_env({"PATH": "/bin"}, Path("/run/ra"))
+    assert env == {
+        "PATH": "/bin",
+        "RA_MCP_CACHE_DIR": "/run/ra/response-cache",
+        "RA_MCP_HTTP_CACHE": "/run/ra/http-cache.sqlite",
+        "RA_MCP_STATE_STORE": "sqlite:///run/ra/state.sqlite",
+    }
+    assert shared_cache_env({"RA_MCP_CACHE_DIR": "/srv/cache"}, Path("/run/ra"))["RA_MCP_CACHE_DIR"] == "/srv/cache"
+
+
+def test_worker_command_serves_one_socket():
+    command = worker_command(Path("/run/ra/worker-0.sock"), host="0.0.0.0", modules="search,browse", verbose=True)
+    assert command[1:] == [
+        "-m",
+        "ra_mcp_server.server",
+        "--http",
+        "--host",
+        "0.0.0.0",
+        "--uds",
+        "/run/ra/worker-0.sock",
+        "--modules",
+        "search,browse",
+        "--verbose",
+    ]